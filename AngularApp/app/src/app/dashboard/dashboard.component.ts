@@ -38,6 +38,13 @@ export class DashboardComponent implements OnInit, AfterViewInit {
     category: [],
     purchases: []
   }
+  // Requests of the reports fetched together (see fetch_reports), the reports of
+  // the same arguments are shown from them
+  overall_reports: any = null
+  category_reports: any = {
+    query: null,
+    result: null
+  }
 
 
   constructor(private router: Router) {
@@ -208,22 +215,64 @@ export class DashboardComponent implements OnInit, AfterViewInit {
 
   }
 
-  async rep_server_load() {
-    let response = await fetch('/api/server_load_per_hour', {
+  async fetch_reports(names: string[], args: any = {}) {
+    // Several reports in one request, the server computes them concurrently
+    let query = new URLSearchParams({names: names.join(','), ...args})
+    let response = await fetch(`/api/reports?${query}`, {
       method: 'GET'
-    });
+    })
 
     let result = await response.json()
+    if (!response.ok)
+      throw new Error(result['error'])
+    return result
+  }
+
+  get_overall_reports() {
+    // Reports without arguments don't change while the dashboard is open
+    if (!this.overall_reports) {
+      this.overall_reports = this.fetch_reports(['server_load_per_hour', 'rep_actions_per_country']).catch((error) => {
+        this.overall_reports = null
+        throw error
+      })
+    }
+    return this.overall_reports
+  }
+
+  get_category_reports() {
+    let category = this.categories[this.category_index]
+    let k_select = document.getElementById("k_select")! as HTMLSelectElement
+    let k = 24 / (k_select.options[k_select.selectedIndex].value as unknown as number)
+    let item_select = document.getElementById("item_select")! as HTMLSelectElement
+    let item = item_select.selectedIndex > 0 ? item_select.options[item_select.selectedIndex].value : ''
+
+    // The reports of the item once it's chosen
+    let names = item ? ['rep_time_pattern', 'rep_pattern_view', 'rep_pattern_buy'] : ['rep_time_pattern']
+    let query = `${names}|${category}|${item}|${k}`
+    if (this.category_reports.query != query) {
+      this.category_reports = {
+        query: query,
+        result: this.fetch_reports(names, {category: category, item: item, k: k}).catch((error) => {
+          this.category_reports = {query: null, result: null}
+          throw error
+        })
+      }
+    }
+    return this.category_reports.result
+  }
+
+  async rep_server_load() {
+    let result = (await this.get_overall_reports())['server_load_per_hour']
+    if (result['error'])
+      return
     result['loaded'] = true;
     this.server_load_data = result;
   }
 
   async rep_actions_per_country() {
-    let response = await fetch('/api/rep_actions_per_country', {
-      method: 'GET'
-    })
-
-    let result = await response.json()
+    let result = (await this.get_overall_reports())['rep_actions_per_country']
+    if (result['error'])
+      return
     this.actions_per_country_data['country'] = Object.keys(result)
     this.actions_per_country_data['actions'] = Object.values(result)
   }
@@ -234,11 +283,9 @@ export class DashboardComponent implements OnInit, AfterViewInit {
       "date_2": (document.getElementById("rep1_date2") as HTMLSelectElement)!.value,
     }
 
-    let response = await fetch(`/api/rep_unpayed_carts?date_1=${query['date_1']}&date_2=${query['date_2']}`, {
-      method: 'GET',
-    });
-
-    let result = await response.json();
+    let result = (await this.fetch_reports(['rep_unpayed_carts'], query))['rep_unpayed_carts'];
+    if (result['error'])
+      return
     let res = {
       'list': result,
       'loaded': true
@@ -253,11 +300,9 @@ export class DashboardComponent implements OnInit, AfterViewInit {
       "date_2": (document.getElementById("rep2_date2") as HTMLSelectElement)!.value,
     }
 
-    let response = await fetch(`/api/rep_repeated_payments?date_1=${query['date_1']}&date_2=${query['date_2']}`, {
-      method: 'GET',
-    });
-
-    let result = await response.json();
+    let result = (await this.fetch_reports(['rep_repeated_payments'], query))['rep_repeated_payments'];
+    if (result['error'])
+      return
 
     let res = {
       ip_list: Object.keys(result['data']),
@@ -272,17 +317,9 @@ export class DashboardComponent implements OnInit, AfterViewInit {
 
   async rep_time_pattern() {
 
-    let category = this.categories[this.category_index]
-    let k_select = document.getElementById("k_select")! as HTMLSelectElement
-    let k = k_select.options[k_select.selectedIndex].value as unknown as number
-
-    k = 24 / k
-
-    let response = await fetch(`/api/rep_time_pattern?category=${category}&k=${k}`, {
-      method: 'GET',
-    });
-
-    let result = await response.json();
+    let result = (await this.get_category_reports())['rep_time_pattern']
+    if (result['error'])
+      return
 
     this.time_pattern['amount'] = []
     for (let amount of Object.values(result)) {
@@ -294,30 +331,18 @@ export class DashboardComponent implements OnInit, AfterViewInit {
 
   async rep_pattern_view() {
 
-    let category = this.categories[this.category_index]
-    let item_select = document.getElementById("item_select")! as HTMLSelectElement
-    let item = item_select.options[item_select.selectedIndex].value
-
-    let response = await fetch(`/api/rep_pattern_view?category=${category}&item=${item}`, {
-      method: 'GET'
-    })
-
-    let result = await response.json()
+    let result = (await this.get_category_reports())['rep_pattern_view']
+    if (result['error'])
+      return
     this.pattern_view['country'] = Object.keys(result)
     this.pattern_view['actions'] = Object.values(result)
   }
 
   async rep_pattern_buy() {
 
-    let category = this.categories[this.category_index]
-    let item_select = document.getElementById("item_select")! as HTMLSelectElement
-    let item = item_select.options[item_select.selectedIndex].value
-
-    let response = await fetch(`/api/rep_pattern_buy?category=${category}&item=${item}`, {
-      method: 'GET'
-    })
-
-    let result = await response.json()
+    let result = (await this.get_category_reports())['rep_pattern_buy']
+    if (result['error'])
+      return
     this.pattern_buy['category'] = Object.keys(result)
     this.pattern_buy['purchases'] = Object.values(result)
   }
@@ -41,10 +41,14 @@ export class UploadPageComponent implements OnInit, AfterViewInit {
         body: new FormData(formElement as HTMLFormElement)
       });
 
-      let result = await response.json();
+      // A refused upload has no job to wait for
+      let result = response.ok ? await response.json() : { "status": "failed" };
 
-      if (result["status"] == "ok") this.router.navigate(['dashboard']);
-      if (result["status"] == "wrong format") {
+      // Logs are ingested in background
+      if (result["status"] == "accepted") result = await this.wait_for_job(result["job_id"]);
+
+      if (result["status"] == "done") this.router.navigate(['dashboard']);
+      if (result["status"] == "failed") {
         this.warning_message.classList.remove('invisible')
         this.spinner.classList.add('invisible')
         this.enable_upload_button()
@@ -52,6 +56,22 @@ export class UploadPageComponent implements OnInit, AfterViewInit {
     }
   }
 
+  async wait_for_job(job_id: string) {
+    while (true) {
+      await new Promise(resolve => setTimeout(resolve, 1000));
+
+      let response = await fetch(`/api/jobs/${job_id}`, {
+        method: 'GET'
+      });
+
+      // Unknown job or failed request, the job is not waited for any more
+      if (!response.ok) return { "status": "failed" };
+
+      let job = await response.json();
+      if (job["status"] == "done" || job["status"] == "failed") return job;
+    }
+  }
+
   enable_upload_button() {
     this.upload_button.classList.remove('disabled')
   }
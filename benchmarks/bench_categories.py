@@ -0,0 +1,69 @@
+"""Time of collecting categories and goods against the number of distinct goods.
+
+Every goods is added to carts several times. With the set index the time per
+goods stays flat as the catalogue grows; the former list lookup is shown
+for the smaller catalogues.
+
+    python benchmarks/bench_categories.py [distinct goods, ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from log_parser import Item, LogRecord, Parser
+
+CATEGORIES = 10
+ADDS_PER_GOODS = 5
+# The list lookup is quadratic, larger catalogues take minutes
+LEGACY_LIMIT = 8000
+
+
+def goods_events(distinct):
+    pages = [
+        (str(goods_id), LogRecord(None, None, "127.0.0.1", (f"category_{goods_id % CATEGORIES}", f"item_{goods_id}"), None))
+        for goods_id in range(distinct)
+    ]
+    return pages * ADDS_PER_GOODS
+
+
+def legacy_add_goods(container, goods_id, previous_record):
+    category, name = previous_record.path[:2]
+    item = Item(name, goods_id)
+    if category not in container:
+        container[category] = []
+    if not (item in container[category]):
+        container[category].append(item)
+
+
+def measure(add, events):
+    started = time.perf_counter()
+    for goods_id, previous_record in events:
+        add(goods_id, previous_record)
+    return time.perf_counter() - started
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 2000, 4000, 8000, 16000, 32000, 64000]
+
+    print(f"{'goods':>8} {'set, s':>8} {'us/goods':>9} {'list, s':>8} {'us/goods':>9}")
+    for size in sizes:
+        events = goods_events(size)
+
+        parser = Parser()
+        parser.init_parser()
+        indexed = measure(parser.add_goods, events)
+
+        if size <= LEGACY_LIMIT:
+            container = dict()
+            legacy = measure(lambda goods_id, record: legacy_add_goods(container, goods_id, record), events)
+            legacy_columns = f"{legacy:>8.3f} {legacy / size * 1e6:>9.2f}"
+        else:
+            legacy_columns = f"{'-':>8} {'-':>9}"
+
+        print(f"{size:>8} {indexed:>8.3f} {indexed / size * 1e6:>9.2f} {legacy_columns}")
+
+
+if __name__ == '__main__':
+    main()
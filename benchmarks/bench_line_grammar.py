@@ -0,0 +1,55 @@
+"""Lines/sec of the anchored line grammar against the former per-step regexes.
+
+    python benchmarks/bench_line_grammar.py [lines]
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from log_parser import tokenize, query_params
+from synthetic_logs import generate_lines
+
+
+def legacy_classify(line):
+    # Regexes every line went through in the multi-pass Parser
+    ip = re.match(r'.*INFO: (.*) .*', line).group(1)
+    if ("cart" in line or "success" in line) and "pay?" not in line:
+        if re.match(r".*cart_id=(\d+)", line):
+            return ip, re.match(r".*\| (.*) \[.*goods_id=(\d+)&amount=(\d+)&cart_id=(\d+)", line).groups()
+        return ip, re.match(r".*\| (.*) \[.*_pay_(.*)/", line).groups()
+    return ip, re.match(r".*\| (.*) \[.*.com/(?!success_pay_)([^/ ]+)/([^/ \n]*)", line)
+
+
+def grammar_classify(line):
+    record = tokenize(line)
+    if record.query is not None and "goods_id=" in record.query:
+        return record, query_params(record.query)
+    return record, None
+
+
+def measure(classify, lines):
+    started = time.perf_counter()
+    for line in lines:
+        classify(line)
+    return len(lines) / (time.perf_counter() - started)
+
+
+def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    lines = list(generate_lines(lines=amount))
+
+    legacy = measure(legacy_classify, lines)
+    # The parser matches the grammar against the bytes of the file
+    grammar = measure(grammar_classify, [line.encode() for line in lines])
+
+    print(f"lines: {len(lines)}")
+    print(f"leading .* regexes: {legacy:12,.0f} lines/sec")
+    print(f"line grammar:       {grammar:12,.0f} lines/sec")
+    print(f"speedup:            {grammar / legacy:12.2f}x")
+
+
+if __name__ == '__main__':
+    main()
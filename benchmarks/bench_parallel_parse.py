@@ -0,0 +1,53 @@
+"""Parse time of a synthetic log by 1/2/4/8 worker processes.
+
+Every parallel result is checked to be identical to the serial Parser first.
+
+    python benchmarks/bench_parallel_parse.py [lines]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from log_parser import Parser
+from synthetic_logs import write_log
+
+RESULTS = (
+    "prepared_categories", "prepared_cart_requests", "prepared_carts_info",
+    "prepared_ip_list", "prepared_goods_requests", "end_offset"
+)
+
+
+def parse(filename, workers):
+    parser = Parser()
+    started = time.perf_counter()
+    parser.parse(filename, workers=workers)
+    return parser, time.perf_counter() - started
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        filename = os.path.join(directory, "logs.txt")
+        write_log(filename, lines=lines, users=lines // 50)
+
+        serial, serial_time = parse(filename, 1)
+        print(f"lines: {lines}, serial parse: {serial_time:.2f}s")
+        print(f"{'workers':>8} {'time, s':>8} {'speedup':>8}")
+
+        for workers in (1, 2, 4, 8):
+            sharded, elapsed = parse(filename, workers)
+            for result in RESULTS:
+                if getattr(sharded, result) != getattr(serial, result):
+                    raise AssertionError(f"{result} of {workers} workers differs from the serial parser")
+            print(f"{workers:>8} {elapsed:>8.2f} {serial_time / elapsed:>7.2f}x")
+
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Memory of the parsed records: the typed columns of the parser against the
+former lists of namedtuples holding every value as a string.
+
+    python benchmarks/bench_record_store.py [lines]
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from log_parser import Parser
+from synthetic_logs import write_log
+
+TABLES = ("cart_requests", "carts_info", "goods_requests")
+
+
+def legacy_footprint(table):
+    # Every record a namedtuple, every field a separate string parsed from the line
+    size = sys.getsizeof(list(range(len(table))))
+    for record in table:
+        values = tuple(None if value is None else str(value) for value in record)
+        size += sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values if value is not None)
+    return size
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "logs.txt")
+        write_log(filename, lines=lines, users=lines // 50)
+        file_size = os.path.getsize(filename)
+        parser = Parser()
+        parser.parse(filename)
+
+    footprint = parser.memory_footprint()
+    print(f"lines: {lines}, file: {file_size / 2 ** 20:.1f} MB")
+    print(f"{'records':>15} {'rows':>9} {'columns, MB':>12} {'namedtuples, MB':>16}")
+    legacy_total = 0
+    for name in TABLES:
+        table = getattr(parser, f"prepared_{name}")
+        legacy = legacy_footprint(table)
+        legacy_total += legacy
+        print(f"{name:>15} {len(table):>9} {footprint[name] / 2 ** 20:>12.1f} {legacy / 2 ** 20:>16.1f}")
+    print(f"{'strings':>15} {'':>9} {footprint['strings'] / 2 ** 20:>12.1f}")
+    total = sum(footprint.values())
+    print(f"{'total':>15} {'':>9} {total / 2 ** 20:>12.1f} {legacy_total / 2 ** 20:>16.1f}"
+          f"  ({legacy_total / total:.1f}x smaller)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Smoke run of the schema and the loads on SQLite, which the bulk loader fills by
+executemany inserts: creates the tables, loads the first part of a synthetic log,
+then appends the rest of it. The GeoLite2 database of the app is used.
+
+    python benchmarks/check_sqlite_load.py [lines]
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, func, select
+
+from database import Base, db
+from synthetic_logs import write_log
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    with tempfile.TemporaryDirectory() as directory:
+        db.engine = create_engine(f"sqlite:///{os.path.join(directory, 'logs.db')}", future=True)
+
+        log_path = os.path.join(directory, "logs.txt")
+        write_log(log_path, lines=lines, users=max(100, lines // 50))
+        with open(log_path, "rb") as file:
+            logs = file.readlines()
+        # The first part is loaded as a file of the same name, the whole file is appended
+        with open(log_path, "wb") as file:
+            file.writelines(logs[:len(logs) * 2 // 3])
+        db.init_db(log_path)
+        with open(log_path, "wb") as file:
+            file.writelines(logs)
+        db.init_db(log_path, append=True)
+
+        with db.engine.connect() as connection:
+            for table in Base.metadata.sorted_tables:
+                print(f"{table.name:>24} {connection.execute(select(func.count()).select_from(table)).scalar():>8}")
+        print(f"{len(db.rep_unpayed_carts('2018-08-01', '2018-08-02'))} carts not payed on 2018-08-01")
+        db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
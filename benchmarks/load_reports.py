@@ -0,0 +1,82 @@
+"""Load test of the report pages: every client gets all the reports either by
+one request per report (single) or by one /api/reports request (combined).
+
+    python benchmarks/load_reports.py [base_url] [clients] [rounds]
+
+Run the app with REPORT_CACHE_SIZE = 0 to measure the database rather than the cache.
+"""
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+DEFAULT_URL = "http://localhost:5000"
+
+ARGUMENTS = {
+    "date_1": "2018-08-01",
+    "date_2": "2018-08-10",
+    "category": "caviar",
+    "item": "black_caviar",
+    "k": 4
+}
+REPORTS = [
+    "rep_unpayed_carts",
+    "rep_repeated_payments",
+    "rep_pattern_buy",
+    "rep_pattern_view",
+    "rep_time_pattern",
+    "rep_actions_per_country",
+    "server_load_per_hour",
+]
+
+
+def single(session, base_url):
+    for report in REPORTS:
+        session.get(f"{base_url}/api/{report}", params=ARGUMENTS).raise_for_status()
+
+
+def combined(session, base_url):
+    session.get(f"{base_url}/api/reports", params=ARGUMENTS).raise_for_status()
+
+
+def client(fetch, base_url, rounds):
+    # Seconds to get all the reports, per round
+    timings = []
+    with requests.Session() as session:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fetch(session, base_url)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run(fetch, base_url, clients, rounds):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(clients) as executor:
+        results = list(executor.map(lambda _: client(fetch, base_url, rounds), range(clients)))
+    elapsed = time.perf_counter() - started
+
+    timings = sorted(timing for result in results for timing in result)
+    return {
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+        "pages_per_sec": len(timings) / elapsed
+    }
+
+
+def main():
+    base_url = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_URL
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    print(f"{clients} clients, {rounds} rounds of all {len(REPORTS)} reports each")
+    print(f"{'mode':>9} {'p50, ms':>9} {'p99, ms':>9} {'pages/sec':>10}")
+    for name, fetch in (("single", single), ("combined", combined)):
+        result = run(fetch, base_url, clients, rounds)
+        print(f"{name:>9} {result['p50_ms']:>9.1f} {result['p99_ms']:>9.1f} {result['pages_per_sec']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
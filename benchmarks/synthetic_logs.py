@@ -0,0 +1,115 @@
+"""Synthetic shop logs in the format of the uploaded logs.txt
+
+    python benchmarks/synthetic_logs.py logs.txt [--lines N] [--users N] [--carts N] [--goods N] [--days N]
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+
+CATALOGUE = {
+    "fresh_fish": ["tuna", "codfish", "herring", "salmon", "crucian"],
+    "canned_food": ["midii", "pate_of_tuna", "sprats"],
+    "caviar": ["squash_caviar", "black_caviar", "red_caviar"],
+    "frozen_fish": ["pollock", "hake", "mackerel"],
+    "semi_manufactures": ["fish_fingers", "crab_sticks", "fish_cakes"],
+}
+
+HOST = "https://all_to_the_bottom.com/"
+START = datetime(2018, 8, 1)
+
+
+def catalogue(goods=None):
+    """CATALOGUE, or that many goods spread over its categories, numbered names added to the real ones"""
+    if goods is None:
+        return CATALOGUE
+    names = {category: iter(items) for category, items in CATALOGUE.items()}
+    result = {category: [] for category in CATALOGUE}
+    for number in range(goods):
+        category = list(CATALOGUE)[number % len(CATALOGUE)]
+        result[category].append(next(names[category], f"{category}_{number}"))
+    return result
+
+
+def log_line(time, ip, path, rng=random):
+    request_id = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for _ in range(8))
+    return f"shop_api      | {time:%Y-%m-%d %H:%M:%S} [{request_id}] INFO: {ip} {HOST}{path}"
+
+
+def generate_lines(lines=100000, users=1000, seed=0, carts=None, goods=None, duration=None):
+    """Yields log lines of users browsing the catalogue, filling and paying carts.
+
+    carts is the amount of carts opened, spread evenly over the log; by default
+    every third visit of an item adds it to a cart. goods is the catalogue size
+    (see catalogue). duration, a timedelta, is the time the log spans; by
+    default lines are 0-3 seconds apart.
+    """
+    rng = random.Random(seed)
+    goods = [(category, item) for category, items in catalogue(goods).items() for item in items]
+    goods_ids = {pair: number for number, pair in enumerate(goods, start=1)}
+    ips = [f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+           for _ in range(users)]
+    open_carts = dict()
+    last_cart_id = 0
+    time = START
+    # Mean seconds between lines
+    step = duration.total_seconds() / lines if duration is not None else None
+
+    produced = 0
+    while produced < lines:
+        ip = rng.choice(ips)
+        category, item = rng.choice(goods)
+        goods_id = goods_ids[(category, item)]
+
+        batch = [f"{category}/", f"{category}/{item}/"]
+        if carts is None:
+            add_to_cart = rng.random() < 0.3
+        elif ip in open_carts:
+            add_to_cart = rng.random() < 0.3
+        else:
+            # A new cart once the carts opened fall behind the share of the log produced
+            add_to_cart = last_cart_id < carts * produced / lines
+        if add_to_cart:
+            if ip not in open_carts:
+                last_cart_id += 1
+                open_carts[ip] = last_cart_id
+            cart_id = open_carts[ip]
+            batch.append(f"cart?goods_id={goods_id}&amount={rng.randint(1, 5)}&cart_id={cart_id}")
+            if rng.random() < 0.3:
+                batch.append(f"pay?user_id={rng.randint(10 ** 11, 10 ** 12)}&cart_id={cart_id}")
+                batch.append(f"success_pay_{cart_id}/")
+                del open_carts[ip]
+
+        for path in batch:
+            if step is None:
+                time += timedelta(seconds=rng.randint(0, 3))
+            else:
+                time += timedelta(seconds=rng.uniform(0, 2 * step))
+            yield log_line(time, ip, path, rng)
+            produced += 1
+
+
+def write_log(filename, **kwargs):
+    with open(filename, "w") as file:
+        for line in generate_lines(**kwargs):
+            file.write(line + "\n")
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Writes a synthetic shop log")
+    arguments.add_argument("filename")
+    arguments.add_argument("--lines", type=int, default=100000)
+    arguments.add_argument("--users", type=int, default=1000)
+    arguments.add_argument("--carts", type=int, help="carts opened, by default every third item visit adds to one")
+    arguments.add_argument("--goods", type=int, help="catalogue size, by default the goods of the real logs")
+    arguments.add_argument("--days", type=float, help="time the log spans, by default lines are 0-3 seconds apart")
+    arguments.add_argument("--seed", type=int, default=0)
+    options = arguments.parse_args()
+
+    write_log(
+        options.filename, lines=options.lines, users=options.users, seed=options.seed, carts=options.carts,
+        goods=options.goods, duration=timedelta(days=options.days) if options.days is not None else None
+    )
+
+
+if __name__ == '__main__':
+    main()
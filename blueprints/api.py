@@ -1,47 +1,170 @@
 from flask import (
+    g,
     request,
     Blueprint,
     jsonify,
-    current_app
+    current_app,
+    json as flask_json
 )
-from src.database import db
+from src.backend import db
+from src.jobs import jobs
+from report_cache import report_cache
+from metrics import metrics
+from parse_cache import parse_cache
+from upload_stream import UploadStream
+from werkzeug.http import parse_options_header
+from werkzeug.sansio.multipart import Data, Epilogue, File, MultipartDecoder, NeedData
 from werkzeug.utils import secure_filename
 import os
 import json
-
-from src.database import db
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 
 bp = Blueprint('api', __name__)
 
+# Bytes of the uploaded file read at once
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@bp.before_request
+def start_timer():
+    g.request_started = time.perf_counter()
+
+
+@bp.after_request
+def record_latency(response):
+    metrics.observe_request(
+        request.endpoint, request.method, response.status_code, time.perf_counter() - g.request_started
+    )
+    return response
+
 
 @bp.post('/upload')
 def upload_logs():
+    # ?mode=append adds the new part of the logs to the loaded ones
+    append = request.args.get('mode') == 'append'
+    # Appending needs the size of the file before it's read, the export needs the whole file.
+    # A stream would wait for the ingestion running, with the request held, so the file is saved then
+    if (current_app.config['STREAM_UPLOADS'] and not append and current_app.config['SORTED_LOGS_DIR'] is None
+            and not jobs.busy()):
+        return stream_logs()
+
     file = request.files['file']
     if file:
         filename = secure_filename(file.filename)
-        upload_folder = current_app.config['UPLOAD_FOLDER']
-        upload_path = os.path.join(upload_folder, filename)
+        upload_path = incoming_path(filename)
+        file.save(upload_path)
+
+        # Logs are ingested in background, the client polls /jobs/<job_id>
+        job = jobs.submit(filename, ingest_logs, current_app._get_current_object(), upload_path, filename, append)
+        return jsonify({"status": "accepted", "job_id": job.id}), 202
+    return '', 403
 
+
+def incoming_path(filename):
+    """Path of an upload till its job ingests it. Unique, so an upload of the same name
+    doesn't overwrite the file of a job still queued
+    """
+    return os.path.join(current_app.config['UPLOAD_FOLDER'], f"{uuid.uuid4().hex}_{filename}")
+
+
+def stream_logs():
+    """Ingests the file of the multipart body while it's received: the request hands
+    the chunks to the ingestion job, which parses them as they come
+    """
+    events = multipart_events()
+    upload = next((event for event in events if isinstance(event, File) and event.name == 'file'), None)
+    if upload is None or not upload.filename:
+        return '', 403
+
+    filename = secure_filename(upload.filename)
+    upload_path = incoming_path(filename)
+    stream = UploadStream(upload_path if current_app.config['KEEP_UPLOADED_LOGS'] else None)
+    job = jobs.submit(
+        filename, ingest_logs, current_app._get_current_object(), upload_path, filename, False, stream
+    )
+    complete = False
+    try:
+        for event in events:
+            if isinstance(event, Data) and not stream.write(event.data):
+                # The ingestion has failed, the job tells why
+                break
+            if isinstance(event, Data) and not event.more_data:
+                complete = True
+                break
+    finally:
+        stream.finish(complete)
+    return jsonify({"status": "accepted", "job_id": job.id}), 202
+
+
+def multipart_events():
+    """Events of the multipart request body, decoded as the body is read"""
+    _, options = parse_options_header(request.headers.get('Content-Type', ''))
+    decoder = MultipartDecoder(options.get('boundary', '').encode())
+    while True:
+        event = decoder.next_event()
+        if isinstance(event, NeedData):
+            decoder.receive_data(request.stream.read(UPLOAD_CHUNK_SIZE) or None)
+        elif isinstance(event, Epilogue):
+            return
+        else:
+            yield event
+
+
+def ingest_logs(app, upload_path, filename, append, chunks=None, job=None):
+    try:
+        db.init_db(
+            upload_path, batch_size=app.config['INGEST_BATCH_SIZE'], job=job, append=append,
+            parse_workers=app.config['PARSE_WORKERS'], geoip_workers=app.config['GEOIP_WORKERS'],
+            export_dir=app.config['SORTED_LOGS_DIR'], export_gzip=app.config['SORTED_LOGS_GZIP'],
+            chunks=chunks, filename=filename
+        )
+    finally:
+        if chunks is not None:
+            # The request stops handing the rest of a failed upload
+            chunks.close()
         if os.path.exists(upload_path):
-            os.remove(upload_path)
+            if app.config['KEEP_UPLOADED_LOGS']:
+                # Under its own name, the upload ingested last replaces the previous one
+                os.replace(upload_path, os.path.join(app.config['UPLOAD_FOLDER'], filename))
+            else:
+                os.remove(upload_path)
 
-        file.save(upload_path)
 
-        try:
-            db.init_db(upload_path)
-            current_app.config['filename'] = filename
-        except:
-            return jsonify({"status": "wrong format"}), 200
+@bp.get('/jobs/<job_id>')
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return '', 404
+    return jsonify(job.to_dict()), 200
+
+
+@bp.get('/report_cache')
+def report_cache_stats():
+    return jsonify(report_cache.stats()), 200
+
+
+@bp.get('/parse_cache')
+def parse_cache_stats():
+    return jsonify(parse_cache.stats()), 200
 
-        return jsonify({"status": "ok"}), 200
-    return '', 403
+
+@bp.get('/metrics')
+def prometheus_metrics():
+    return current_app.response_class(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+@bp.get('/db_pool')
+def db_pool_stats():
+    return jsonify(db.pool_stats()), 200
 
 
 @bp.get('/uploaded_filename')
 def uploaded_filename():
     return jsonify({
-        "filename": current_app.config['filename']
+        "filename": db.last_ingested_file()
     }), 200
 
 
@@ -64,67 +187,37 @@ def check_db():
     return '', 204
 
 
-@bp.get('/rep_unpayed_carts')
-def rep_unpayed_carts():
-    s = request.args.get('date_1')
-    p = request.args.get('date_2')
-
-    response = db.rep_unpayed_carts(s, p)
-    return jsonify(response), 200
-
+# Reports by their responses, built from the query arguments
 
-@bp.get('/rep_repeated_payments')
-def rep_repeated_payments():
-    s = request.args.get('date_1')
-    p = request.args.get('date_2')
+def unpayed_carts(args):
+    return db.rep_unpayed_carts(args.get('date_1'), args.get('date_2'))
 
-    amount, data = db.rep_repeated_payments(s, p)
 
-    response = {
+def repeated_payments(args):
+    amount, data = db.rep_repeated_payments(args.get('date_1'), args.get('date_2'))
+    return {
         "amount": amount,
         "data": data
     }
-    return jsonify(response), 200
-
-
-@bp.get('/rep_pattern_buy')
-def rep_pattern_buy():
-    category = request.args.get('category')
-    item = request.args.get('item')
-
-    response = dict(db.rep_pattern_buy(category, item))
-
-    return json.dumps(response), 200
-
-
-@bp.get('/rep_pattern_view')
-def rep_pattern_view():
-    category = request.args.get('category')
-    item = request.args.get('item')
 
-    response = dict(db.rep_pattern_view(category, item))
 
-    return json.dumps(response), 200
+def pattern_buy(args):
+    return dict(db.rep_pattern_buy(args.get('category'), args.get('item')))
 
 
-@bp.get('/rep_time_pattern')
-def rep_time_pattern():
-    category = request.args.get('category')
-    k = request.args.get('k')
+def pattern_view(args):
+    return dict(db.rep_pattern_view(args.get('category'), args.get('item')))
 
-    response = dict(db.rep_time_pattern(category, k))
 
-    return jsonify(response), 200
+def time_pattern(args):
+    return dict(db.rep_time_pattern(args.get('category'), args.get('k')))
 
 
-@bp.get('/rep_actions_per_country')
-def rep_actions_per_country():
-    response = dict(db.rep_actions_per_country())
-    return json.dumps(response), 200
+def actions_per_country(args):
+    return dict(db.rep_actions_per_country())
 
 
-@bp.get('/server_load_per_hour')
-def rep_server_load_per_hour():
+def server_load_per_hour(args):
     avg, statistics = db.rep_server_load_per_hour()
     response = {"statistics": [], "avg": avg}
     for row in statistics:
@@ -136,4 +229,97 @@ def rep_server_load_per_hour():
                 'requests_amount': row[0]
             }
         )
-    return jsonify(response), 200
\ No newline at end of file
+    return response
+
+
+REPORTS = {
+    "rep_unpayed_carts": unpayed_carts,
+    "rep_repeated_payments": repeated_payments,
+    "rep_pattern_buy": pattern_buy,
+    "rep_pattern_view": pattern_view,
+    "rep_time_pattern": time_pattern,
+    "rep_actions_per_country": actions_per_country,
+    "server_load_per_hour": server_load_per_hour
+}
+
+# Query arguments the reports can't be built without
+REQUIRED_ARGUMENTS = {
+    "rep_unpayed_carts": ("date_1", "date_2"),
+    "rep_repeated_payments": ("date_1", "date_2"),
+    "rep_pattern_buy": ("category", "item"),
+    "rep_pattern_view": ("category",),
+    "rep_time_pattern": ("category", "k")
+}
+
+# Threads running the reports of /reports, each holds a pooled connection while it works
+report_executor = ThreadPoolExecutor(max_workers=len(REPORTS), thread_name_prefix="reports")
+
+
+@bp.get('/reports')
+def reports():
+    """Several reports in one response, computed concurrently by the report threads
+    while the request waits for them.
+
+    ?names=rep_unpayed_carts,rep_time_pattern (all by default)
+    with the arguments of these reports. A report failing to compute is
+    answered by {"error": message} in its place.
+    """
+    names = request.args.get('names')
+    names = names.split(',') if names else list(REPORTS)
+    unknown = [name for name in names if not (name in REPORTS)]
+    if unknown:
+        return jsonify({"error": f"Unknown reports: {', '.join(unknown)}"}), 400
+    missing = sorted({
+        argument for name in names for argument in REQUIRED_ARGUMENTS.get(name, ()) if not request.args.get(argument)
+    })
+    if missing:
+        return jsonify({"error": f"Missing arguments: {', '.join(missing)}"}), 400
+
+    args = request.args.copy()
+    futures = [report_executor.submit(REPORTS[name], args) for name in names]
+    results = []
+    for name, future in zip(names, futures):
+        try:
+            results.append(future.result())
+        except Exception as error:
+            current_app.logger.error("Report %s failed", name, exc_info=error)
+            # The log has the details, the statement of a failed query isn't sent to the client
+            results.append({"error": f"{type(error).__name__} in {name}"})
+    # Order of the reports' keys is kept, as by json.dumps of the single reports
+    response = flask_json.dumps(dict(zip(names, results)), sort_keys=False)
+    return current_app.response_class(response, mimetype='application/json'), 200
+
+
+@bp.get('/rep_unpayed_carts')
+def rep_unpayed_carts():
+    return jsonify(unpayed_carts(request.args)), 200
+
+
+@bp.get('/rep_repeated_payments')
+def rep_repeated_payments():
+    return jsonify(repeated_payments(request.args)), 200
+
+
+@bp.get('/rep_pattern_buy')
+def rep_pattern_buy():
+    return json.dumps(pattern_buy(request.args)), 200
+
+
+@bp.get('/rep_pattern_view')
+def rep_pattern_view():
+    return json.dumps(pattern_view(request.args)), 200
+
+
+@bp.get('/rep_time_pattern')
+def rep_time_pattern():
+    return jsonify(time_pattern(request.args)), 200
+
+
+@bp.get('/rep_actions_per_country')
+def rep_actions_per_country():
+    return json.dumps(actions_per_country(request.args)), 200
+
+
+@bp.get('/server_load_per_hour')
+def rep_server_load_per_hour():
+    return jsonify(server_load_per_hour(request.args)), 200
@@ -0,0 +1,25 @@
+class Backend:
+    """Database of the app chosen by DATABASE_BACKEND: "postgresql" or "memory".
+
+    Attributes are looked up in the chosen database, both have the interface
+    of database.PostgreSQL.
+    """
+
+    def __init__(self):
+        self.database = None
+
+    def init_app(self, app):
+        if app.config['DATABASE_BACKEND'] == 'memory':
+            # NumPy is needed only by this backend
+            from memory_db import MemoryDB
+            self.database = MemoryDB()
+        else:
+            from database import db
+            self.database = db
+        self.database.init_app(app)
+
+    def __getattr__(self, name):
+        return getattr(self.database, name)
+
+
+db = Backend()
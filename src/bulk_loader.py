@@ -0,0 +1,101 @@
+import csv
+import io
+import logging
+import time
+from itertools import islice
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Inserts supporting ON CONFLICT, used by upsert
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert
+}
+
+log = logging.getLogger(__name__)
+
+
+def batches(rows, size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+class BulkLoader:
+    """Streams rows into the tables by batches.
+
+    PostgreSQL tables are filled with COPY FROM STDIN through psycopg2,
+    other backends get executemany inserts of every batch.
+    """
+
+    def __init__(self, engine, batch_size=10000, progress=None):
+        self.engine = engine
+        self.batch_size = batch_size
+        # Anything with advance(rows), e.g. jobs.Job
+        self.progress = progress
+        # table name -> (rows, seconds)
+        self.stats = dict()
+
+    def load(self, table, columns, rows):
+        """Loads rows (tuples ordered as columns) into the table in one transaction."""
+        def write(connection, batch):
+            if connection.dialect.name == "postgresql":
+                self.copy_batch(connection, table, columns, batch)
+            else:
+                connection.execute(insert(table), [dict(zip(columns, row)) for row in batch])
+
+        return self.stream(table, rows, write)
+
+    def upsert(self, table, columns, rows, index_elements, update_columns=(), increment_columns=()):
+        """Like load, but rows conflicting on index_elements are skipped,
+        or only their update_columns are overwritten and increment_columns are added up.
+        """
+        def write(connection, batch):
+            stmt = UPSERT_INSERTS[connection.dialect.name](table)
+            if update_columns or increment_columns:
+                set_ = {column: stmt.excluded[column] for column in update_columns}
+                for column in increment_columns:
+                    set_[column] = table.c[column] + stmt.excluded[column]
+                stmt = stmt.on_conflict_do_update(index_elements=index_elements, set_=set_)
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+            connection.execute(stmt, [dict(zip(columns, row)) for row in batch])
+
+        return self.stream(table, rows, write)
+
+    def stream(self, table, rows, write):
+        started = time.perf_counter()
+        amount = 0
+
+        with self.engine.begin() as connection:
+            for batch in batches(rows, self.batch_size):
+                write(connection, batch)
+                amount += len(batch)
+                if self.progress is not None:
+                    self.progress.advance(len(batch))
+
+        elapsed = time.perf_counter() - started
+        self.stats[table.name] = (amount, elapsed)
+        log.debug("Loaded %d rows into %s in %.2fs (%.0f rows/sec)",
+                  amount, table.name, elapsed, amount / elapsed if elapsed else 0)
+        return amount
+
+    @staticmethod
+    def copy_batch(connection, table, columns, batch):
+        buffer = io.StringIO()
+        # None is written as an empty unquoted field, which is NULL for COPY csv
+        csv.writer(buffer).writerows(batch)
+        buffer.seek(0)
+
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import geoip2.database
+import geoip2.errors
+
+from bulk_loader import batches
+from log_parser import worker_context
+
+path_to_geoip2_db = os.path.join(os.getcwd(), 'static', 'GeoLite2-Country.mmdb')
+
+UNKNOWN_COUNTRY = 'Unknown'
+NOT_FOUND_COUNTRY = 'Internet Assigned Numbers Authority'
+
+
+def subnet_of(ip):
+    """/24 of IPv4 address as its first three octets, None for IPv6"""
+    if ':' in ip:
+        return None
+    return ip.rsplit('.', 1)[0]
+
+
+class CountryResolver:
+    """Looks up countries of ips in the GeoLite2 database mapped into memory.
+
+    Most networks of the database are /24 or wider, an answer for such network
+    is reused for the other ips of the /24 without a lookup.
+    """
+
+    def __init__(self, filename):
+        self.reader = geoip2.database.Reader(filename, mode=geoip2.database.MODE_MMAP)
+        # /24 -> country
+        self.subnets = dict()
+        self.lookups = 0
+
+    def close(self):
+        self.reader.close()
+
+    def country(self, ip):
+        subnet = subnet_of(ip)
+        if subnet in self.subnets:
+            return self.subnets[subnet]
+
+        self.lookups += 1
+        try:
+            response = self.reader.country(ip)
+            country = response.country.name or UNKNOWN_COUNTRY
+            network = response.traits.network
+        except geoip2.errors.AddressNotFoundError as e:
+            country = NOT_FOUND_COUNTRY
+            # Not given by older geoip2
+            network = getattr(e, 'network', None)
+
+        # Network of the ip holding its whole /24
+        if subnet is not None and network is not None and network.prefixlen <= 24:
+            self.subnets[subnet] = country
+        return country
+
+
+# Resolver of the worker process, see resolve
+worker_resolver = None
+
+
+def init_worker(filename):
+    global worker_resolver
+    worker_resolver = CountryResolver(filename)
+
+
+def resolve_batch(ips):
+    return [(ip, worker_resolver.country(ip)) for ip in ips]
+
+
+def resolve(filename, ips, batch_size=10000, workers=1):
+    """Yields (ip, country) of the ips, looked up by batches in that many processes.
+
+    Sorted ips keep the ones of a /24 in the same batch for the reuse by network.
+    """
+    ips = sorted(ips)
+    if workers > 1:
+        # Not forked from the threaded server, see Parser.parse_shards
+        with ProcessPoolExecutor(
+            workers, mp_context=worker_context(), initializer=init_worker, initargs=(filename,)
+        ) as executor:
+            for batch in executor.map(resolve_batch, batches(ips, batch_size)):
+                yield from batch
+        return
+
+    resolver = CountryResolver(filename)
+    try:
+        for batch in batches(ips, batch_size):
+            yield from ((ip, resolver.country(ip)) for ip in batch)
+    finally:
+        resolver.close()
+
+
+def build_epoch(filename):
+    """Build time of the database, countries resolved by an older one are stale"""
+    with geoip2.database.Reader(filename, mode=geoip2.database.MODE_MMAP) as reader:
+        return reader.metadata().build_epoch
@@ -0,0 +1,85 @@
+import hashlib
+import os
+
+from log_parser import parser
+from parse_cache import parse_cache
+
+# Bytes of the file hashed at once
+HASH_CHUNK_SIZE = 1024 * 1024
+# Bytes at the start and at the end of the loaded part of a file checked before appending to it
+WATERMARK_BLOCK_SIZE = 64 * 1024
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blocks_digest(head, tail):
+    digest = hashlib.sha256(head)
+    digest.update(tail)
+    return digest.hexdigest()
+
+
+def prefix_digest(path, size):
+    """sha256 of the first and the last block of the first size bytes of the file,
+    saved with the watermark to recognize the file appended to"""
+    with open(path, "rb") as file:
+        head = file.read(min(size, WATERMARK_BLOCK_SIZE))
+        file.seek(max(0, size - WATERMARK_BLOCK_SIZE))
+        tail = file.read(min(size, WATERMARK_BLOCK_SIZE))
+    return blocks_digest(head, tail)
+
+
+def watermark_digest(path, size, chunks=None):
+    """prefix_digest of the loaded file, chunks of a streamed one have it"""
+    return chunks.prefix_digest(size) if chunks is not None else prefix_digest(path, size)
+
+
+def continued_bytes(path, loaded_bytes, digest):
+    """Bytes of the file loaded before under its name, 0 if the file isn't their continuation:
+    a smaller file of the name or one starting or ending the loaded part by other bytes is new"""
+    if loaded_bytes is None or loaded_bytes > os.path.getsize(path):
+        return 0
+    # A watermark saved without the digest can't be checked
+    if digest is None or digest != prefix_digest(path, loaded_bytes):
+        return 0
+    return loaded_bytes
+
+
+def parse_logs(database, path, filename, append=False, job=None, workers=1, export_dir=None, export_gzip=False,
+               chunks=None):
+    """Parses the logs for init_db of either backend, returns the sha256 of the file (None when appending).
+
+    Appending parses the part of the file not loaded before under filename, with the
+    state of the users carried over. The file of the loaded dataset's digest is not
+    parsed: the caller compares the returned digest with it and loads nothing.
+    See PostgreSQL.init_db for the arguments.
+    """
+    start, state, digest = 0, (), None
+    if append:
+        start = continued_bytes(path, *database.get_watermark(filename))
+        state = database.get_user_state()
+    elif chunks is None:
+        # Of the file as it's read here, the cache can't get the records of other bytes
+        digest = file_digest(path)
+        if digest == database.dataset_digest():
+            return digest
+
+    database.set_stage("parsing")
+    # Only complete files are cached, the export needs the lines themselves
+    cached_digest = digest if not append and export_dir is None else None
+    # Open carts stay open till the next file when appending
+    parse_cache.parse(
+        parser, path, cached_digest, progress=job, start=start, state=state,
+        incomplete_tail=not append, workers=workers,
+        export_dir=export_dir, export_gzip=export_gzip, chunks=chunks
+    )
+    if chunks is not None and not append:
+        # The digest of a streamed upload is known once it's received. It isn't
+        # stored in the cache: streams are parsed before the digest could be looked up
+        digest = chunks.hexdigest()
+    return digest
@@ -0,0 +1,154 @@
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+# Seconds between saves of the progress of a running job
+SAVE_INTERVAL = 1
+
+
+class Job:
+    """Progress of one ingestion, updated by the worker and read by /api/jobs/<id>.
+
+    Stages: parsing, categories, carts, geoip, goods_requests, rollups, indexes.
+    The state is saved to the store, if any, for the other processes of the app.
+    """
+
+    def __init__(self, filename, store=None):
+        self.store = store
+        self.saved = 0
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        # queued -> running -> done | failed
+        self.status = "queued"
+        self.stage = None
+        self.error = None
+
+        self.created = time.time()
+        self.finished = None
+        self.stage_started = None
+        # Rows processed in the current stage and in all stages
+        self.rows = 0
+        self.total_rows = 0
+
+    def set_stage(self, stage):
+        self.stage = stage
+        self.stage_started = time.time()
+        self.rows = 0
+        self.save()
+
+    def advance(self, rows):
+        self.rows += rows
+        self.total_rows += rows
+        if time.time() - self.saved >= SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        self.saved = time.time()
+        if self.store is not None:
+            self.store.save_job(self.state())
+
+    def state(self):
+        """Fields of the job as saved by the store"""
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "created": self.created,
+            "finished": self.finished,
+            "stage_started": self.stage_started,
+            "rows": self.rows,
+            "total_rows": self.total_rows
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        job = cls(state["filename"])
+        for name, value in state.items():
+            setattr(job, name, value)
+        return job
+
+    def to_dict(self):
+        now = self.finished or time.time()
+        stage_elapsed = now - self.stage_started if self.stage_started else 0
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "stage": self.stage,
+            "rows": self.rows,
+            "total_rows": self.total_rows,
+            "rows_per_sec": round(self.rows / stage_elapsed) if stage_elapsed else 0,
+            "elapsed": round(now - self.created, 2),
+            "error": self.error
+        }
+
+
+class JobManager:
+    """Runs the ingestions of the process one at a time.
+
+    With a store (the database, see backend.Backend) the jobs are saved in it and
+    polled from any process of the app, and the ingestion lock of the store keeps
+    the processes from ingesting at the same time.
+    """
+    # Finished jobs kept for polling
+    history_size = 100
+
+    def __init__(self, store=None):
+        self.store = store
+        # Parser and database are shared, so uploads are ingested one at a time
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingestion")
+        self.jobs = dict()
+
+    def submit(self, filename, function, *args, **kwargs):
+        """Runs function(*args, job=job, **kwargs) in the background and returns the job."""
+        job = Job(filename, self.store)
+        job.save()
+        self.jobs[job.id] = job
+        self.forget_finished()
+
+        self.executor.submit(self.run, job, function, args, kwargs)
+        return job
+
+    def run(self, job, function, args, kwargs):
+        try:
+            # Queued till the ingestions of the other processes end
+            with self.store.ingestion_lock() if self.store is not None else nullcontext():
+                job.status = "running"
+                job.save()
+                function(*args, job=job, **kwargs)
+                job.status = "done"
+        except Exception as e:
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished = time.time()
+            job.save()
+
+    def get(self, job_id):
+        """The job of this process, or as saved by another one, None if it's unknown"""
+        job = self.jobs.get(job_id)
+        if job is None and self.store is not None:
+            state = self.store.load_job(job_id)
+            job = Job.from_state(state) if state is not None else None
+        return job
+
+    def busy(self):
+        """Whether an ingestion of this process is queued or running, or one of another process is running"""
+        if any(job.finished is None for job in self.jobs.values()):
+            return True
+        return self.store is not None and self.store.ingestion_locked()
+
+    def forget_finished(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished is not None]
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self.jobs[job_id]
+        if self.store is not None:
+            self.store.forget_jobs(self.history_size)
+
+
+jobs = JobManager()
@@ -1,183 +1,465 @@
+import gzip
+import logging
+import mmap
+import os
 import re
+from array import array
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
 
+from metrics import metrics
+from record_store import BIG_INTEGER, FLAG, INTEGER, TIMESTAMP, Strings, Table
 
-class Parser:
-    def init_parser(self):
-        self.logs = {
-            "ip_sorted": dict(),
-            "only_carts_ip_sorted": dict()
-        }
-        self.prepared_categories = dict()
-        self.prepared_cart_requests = []
-        self.prepared_carts_info = []
-        self.prepared_ip_list = []
-        self.prepared_goods_requests = []
-
-    def parse(self, filename):
-        self.init_parser()
-
-        self.read_logs(filename)
-        self.write_mod_logs()
-        self.prepare_categories()
-        self.prepare_carts_info()
-        self.prepare_cart_requests()
-        self.prepare_ip_list()
-        self.prepare_goods_requests()
+log = logging.getLogger(__name__)
+
+Item = namedtuple('Item', ['name', 'id'])
+Cart = namedtuple('Cart', ['ip', 'id', 'payed', 'payed_time'])
+CartRequest = namedtuple('CartRequest', ['datetime', 'goods_id', 'amount', 'cart_id'])
+GoodsRequest = namedtuple('GoodsRequest', ['ip', 'datetime', 'category', 'item'])
+# Value of payed for the cart the user came to the shard with, the cart is closed once it's known (see ShardParser)
+PENDING = -1
+
+LogRecord = namedtuple('LogRecord', ['datetime', 'request_id', 'ip', 'path', 'query'])
 
-    def read_logs(self, filename):
-        with open(filename, "r") as file:
-            logs = file.readlines()
+# shop_api      | 2018-08-01 00:01:35 [YQ4WUDJV] INFO: 121.165.118.201 https://all_to_the_bottom.com/cart?goods_id=3&amount=1&cart_id=1535
+LINE_GRAMMAR = re.compile(
+    rb"[^|\n]*\| (\d{4}-\d\d-\d\d \d\d:\d\d:\d\d) \[([^\]\n]*)\] INFO: (\S+) https?://[^/\s]+/([^?\s]*)(?:\?(\S*))?"
+)
 
-        ip_set = set()
 
-        # Grouping logs by ip - all logs
-        for line in logs:
-            regex = re.match(r'.*INFO: (.*) .*', line)
-            ip = regex.group(1)
+def worker_context():
+    """Context of the worker processes: forkserver, where the platform has it (not on Windows), else spawn"""
+    return get_context("forkserver" if "forkserver" in get_all_start_methods() else "spawn")
 
-            if not (ip in ip_set):
-                self.logs["ip_sorted"][ip] = []
-                ip_set.add(ip)
 
-            self.logs["ip_sorted"][ip].append(line)
+def tokenize(buffer, start=0, end=None):
+    """Splits the log line buffer[start:end] into LogRecord, returns None if the line has another format.
 
-        # Grouping logs by ip - only cart requests
-        for ip, requests_list in self.logs["ip_sorted"].items():
-            cart_requests = []
-            for line in requests_list:
-                if ("cart" in line or "success" in line) and "pay?" not in line:
-                    cart_requests.append(line)
-            self.logs["only_carts_ip_sorted"][ip] = cart_requests
-
-    def write_mod_logs(self):
-        text = ""
-        for val in self.logs["ip_sorted"].values():
-            for line in val:
-                text += line
-        with open("logs_sorted_by_ip.txt", "w") as file:
-            file.write(text)
-
-        text = ""
-        for val in self.logs["only_carts_ip_sorted"].values():
-            for line in val:
-                text += line
-        with open("logs_sorted_by_ip_only_carts.txt", "w") as file:
-            file.write(text)
-
-    def prepare_categories(self):
-        container = dict()
-        categories = set()
-
-        Item = namedtuple('good', ['name', 'id'])
-
-        previous_line = ""
-        for val in self.logs["ip_sorted"].values():
-            for line in val:
-                if "goods" in line:
-                    regex = re.match(r".*goods_id=(\d+).*", line)
-                    good_id = regex.group(1)
-
-                    regex = re.match(r".*\.com/([^/]+)/(.*)/", previous_line)
-                    category = regex.group(1)
-                    good = regex.group(2)
-
-                    item = Item(good, good_id)
-
-                    if category not in categories:
-                        categories.add(category)
-                        container[category] = []
-
-                    if not (item in container[category]):
-                        container[category].append(item)
-
-                previous_line = line
-
-        self.prepared_categories = container
-
-    def prepare_carts_info(self):
-        record = namedtuple('cart', ['ip', 'id', 'payed', 'payed_time'])
-
-        for ip, cart_requests in self.logs["only_carts_ip_sorted"].items():
-
-            previous_cart_row = None
-            for line in cart_requests:
-                regex = re.match(r".*cart_id=(\d+)", line)
-
-                attempt_to_add_goods = True if regex else False
-                attempt_to_pay_cart = False if regex else True
-
-                # It is either attempt_to_add_goods...
-                if attempt_to_add_goods is True:
-                    current_cart = regex.group(1)
-
-                # ... or attempt_to_pay_cart
-                if attempt_to_pay_cart:
-                    regex = re.match(r".*\| (.*) \[.*_pay_(.*)/", line)
-
-                    payed_time = regex.group(1)
-                    payed_cart_id = regex.group(2)
-
-                    payed_cart = record(ip, payed_cart_id, True, payed_time)
-
-                    self.prepared_carts_info.append(payed_cart)
-
-                    # Moving to the next cart
-                    previous_cart_row = None
-                    continue
-
-                # When shifted to next cart
-                if previous_cart_row is None:
-                    previous_cart_row = current_cart
-                    continue
-
-                # Skipping requests of this cart till the last one
-                if current_cart == previous_cart_row:
-                    continue
-
-                # Previous_cart was not payed by user, but new cart is created:
-                if current_cart != previous_cart_row:
-                    cart = record(ip, previous_cart_row, False, None)
-                    self.prepared_carts_info.append(cart)
-                    # Current cart has nothing to do with the previous cart that we've already added above.
-                    previous_cart_row = None
-
-            # User left the cart not payed and has not created the new one.
-            if previous_cart_row is not None:
-                self.prepared_carts_info.append(record(ip, previous_cart_row, False, None))
-
-    def prepare_cart_requests(self):
-        Request = namedtuple('cart_request', ['datetime', 'goods_id', 'amount', 'cart_id'])
-        for requests_list in self.logs["only_carts_ip_sorted"].values():
-            for line in requests_list:
-                regex = re.match(r".*\| (.*) \[.*goods_id=(\d+)&amount=(\d+)&cart_id=(\d+)", line)
-                if regex:
-                    datetime = regex.group(1)
-                    goods_id = regex.group(2)
-                    amount = regex.group(3)
-                    cart_id = regex.group(4)
+    The buffer is any bytes-like object, e.g. the mmap of the whole file: the line
+    is matched in place and only its fields are copied out.
+    Path is a tuple of the url segments, query is left as a raw string until
+    its parameters are needed (see query_params).
+    """
+    match = LINE_GRAMMAR.match(buffer, start, len(buffer) if end is None else end)
+    if match is None:
+        return None
 
-                    request = Request(datetime, goods_id, amount, cart_id)
-                    self.prepared_cart_requests.append(request)
+    datetime, request_id, ip, path, query = match.groups()
+    path = tuple(path.decode().strip("/").split("/")) if path else ()
+    return LogRecord(
+        datetime.decode(),
+        request_id.decode(),
+        ip.decode(),
+        path,
+        None if query is None else query.decode()
+    )
 
-    def prepare_ip_list(self):
-        for ip in self.logs["ip_sorted"].keys():
-            self.prepared_ip_list.append(ip)
 
-    def prepare_goods_requests(self):
-        Request = namedtuple('goods_request', ['ip', 'datetime', 'category', 'item'])
-        for ip, val in self.logs["ip_sorted"].items():
-            for line in val:
-                regex = re.match(r".*\| (.*) \[.*.com/(?!success_pay_)([^/ ]+)/([^/ \n]*)", line)
-                if not regex:
-                    continue
+def query_params(query):
+    params = dict()
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        params[key] = value
+    return params
 
-                datetime = regex.group(1)
-                category = regex.group(2)
-                item = regex.group(3)
 
-                request = Request(ip, datetime, category, item)
-                self.prepared_goods_requests.append(request)
+class Parser:
+    # Lines between progress reports
+    progress_every = 10000
+    # Buffer of the files written by write_mod_logs
+    export_buffer_size = 1024 * 1024
+
+    def init_parser(self, keep_offsets=False):
+        self.filename = None
+        # Offset right after the last parsed line
+        self.end_offset = 0
+        # Offsets of the lines grouped by ip, kept only to write sorted logs
+        self.line_offsets = dict() if keep_offsets else None
+
+        self.prepared_categories = dict()
+        # (category, item) pairs already in prepared_categories
+        self.known_goods = set()
+
+        # Strings of the records are dictionary-encoded, ips in the order they were met
+        self.ips = Strings()
+        self.categories = Strings()
+        self.items = Strings()
+        self.prepared_cart_requests = Table(CartRequest, TIMESTAMP, INTEGER, INTEGER, BIG_INTEGER)
+        self.prepared_carts_info = Table(Cart, self.ips, BIG_INTEGER, FLAG, TIMESTAMP)
+        self.prepared_goods_requests = Table(GoodsRequest, self.ips, TIMESTAMP, self.categories, self.items)
+
+        # State of each user while the file is being read
+        self.open_carts = dict()
+        self.previous_records = dict()
+
+    def parse(self, filename, progress=None, start=0, state=(), incomplete_tail=True, workers=1,
+              export_dir=None, export_gzip=False, chunks=None):
+        """Parses the log file, progress is anything with advance(lines), e.g. jobs.Job
+
+        start and state (see user_state) continue parsing of a file loaded before.
+        The last line without a line break is left for the next time
+        unless incomplete_tail is set.
+        With several workers the file is split into shards parsed by a process pool.
+        export_dir turns on the debug export of the logs grouped by ip (see write_mod_logs).
+        chunks, bytes of the file as they are received, are parsed instead of reading
+        the file, by one process and without the export.
+        """
+        if chunks is not None and export_dir is not None:
+            raise ValueError("The export reads the lines from the file, it can't be streamed")
+        self.init_parser(keep_offsets=export_dir is not None)
+        self.filename = filename
+        self.end_offset = start
+        self.restore_state(state)
+
+        if chunks is not None:
+            self.parse_stream(chunks, progress, start, incomplete_tail)
+        elif workers > 1:
+            self.parse_shards(filename, workers, progress, start, incomplete_tail)
+        else:
+            self.parse_lines(filename, progress, start, incomplete_tail)
+        self.close_carts()
+
+        if log.isEnabledFor(logging.DEBUG):
+            footprint = self.memory_footprint()
+            log.debug("Parsed records take %.1f MB: %s", sum(footprint.values()) / 2 ** 20,
+                      ", ".join(f"{name} {size / 2 ** 20:.1f} MB" for name, size in footprint.items()))
+
+        if export_dir is not None:
+            self.write_mod_logs(export_dir, export_gzip)
+
+    @property
+    def prepared_ip_list(self):
+        return self.ips.values
+
+    def memory_footprint(self):
+        """Bytes taken by the parsed records: arrays of the tables and the distinct strings"""
+        return {
+            "cart_requests": self.prepared_cart_requests.footprint(),
+            "carts_info": self.prepared_carts_info.footprint(),
+            "goods_requests": self.prepared_goods_requests.footprint(),
+            "strings": self.ips.footprint() + self.categories.footprint() + self.items.footprint()
+        }
+
+    @metrics.timed
+    def parse_lines(self, filename, progress=None, start=0, incomplete_tail=True, end=None):
+        lines = 0
+        with open(filename, "rb") as file:
+            # Empty file can't be mapped
+            if os.fstat(file.fileno()).st_size <= start:
+                return lines
+
+            # Lines stay in the mapping of the file, nothing but the fields is copied
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                # Every line is read and classified only once
+                for line_start, line_end in self.scan_lines(buffer, start, incomplete_tail, end):
+                    self.process_line(buffer, line_start, line_end)
+
+                    lines += 1
+                    if progress is not None and lines % self.progress_every == 0:
+                        progress.advance(self.progress_every)
+
+        if progress is not None:
+            progress.advance(lines % self.progress_every)
+        return lines
+
+    @metrics.timed
+    def parse_stream(self, chunks, progress=None, start=0, incomplete_tail=True):
+        lines = 0
+        skipped = 0
+        # Incomplete last line of the chunks so far
+        buffer = b""
+        for chunk in chunks:
+            if skipped < start:
+                cut = min(start - skipped, len(chunk))
+                skipped += cut
+                chunk = chunk[cut:]
+
+            buffer += chunk
+            position = 0
+            line_end = buffer.find(b"\n")
+            while line_end != -1:
+                self.process_line(buffer, position, line_end)
+                position = line_end + 1
+                line_end = buffer.find(b"\n", position)
+
+                lines += 1
+                if progress is not None and lines % self.progress_every == 0:
+                    progress.advance(self.progress_every)
+
+            buffer = buffer[position:]
+            self.end_offset += position
+
+        if incomplete_tail and buffer.strip():
+            self.process_line(buffer, 0, len(buffer))
+            self.end_offset += len(buffer)
+            lines += 1
+        if progress is not None:
+            progress.advance(lines % self.progress_every)
+        return lines
+
+    @metrics.timed
+    def parse_shards(self, filename, workers, progress=None, start=0, incomplete_tail=True):
+        ranges = shard_ranges(filename, start, workers)
+        # Forked from a thread of the server, a child could inherit a lock held by another
+        # thread (e.g. of the metrics) and never get it; forkserver and spawn children start clean
+        with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context()) as executor:
+            shards = [
+                executor.submit(
+                    parse_shard, filename, shard_start, shard_end, incomplete_tail, self.line_offsets is not None
+                )
+                for shard_start, shard_end in ranges
+            ]
+            # Shards are merged in the order of the file
+            for future in shards:
+                shard = future.result()
+                self.merge_shard(shard)
+                if progress is not None:
+                    progress.advance(shard.lines)
+
+    def merge_shard(self, shard):
+        """Adds results of the next shard, resolving what depended on the previous ones."""
+        # Codes of the shard's strings in this parser
+        ips = array("i", map(self.ips.encode, shard.ips.values))
+        categories = array("i", map(self.categories.encode, shard.categories.values))
+        items = array("i", map(self.items.encode, shard.items.values))
+
+        if self.line_offsets is not None:
+            for ip, offsets in shard.line_offsets.items():
+                if not (ip in self.line_offsets):
+                    self.line_offsets[ip] = array("q")
+                self.line_offsets[ip].extend(offsets)
+
+        for ip, goods_id, known, previous_record in shard.goods_events:
+            if not known:
+                previous_record = self.previous_records.get(ip)
+            self.add_goods(goods_id, previous_record)
+
+        carts = shard.prepared_carts_info.columns
+        for ip, cart_id, payed, payed_time in zip(carts["ip"], carts["id"], carts["payed"], carts["payed_time"]):
+            if payed == PENDING:
+                self.close_previous_cart(shard.ips.values[ip], cart_id)
+            else:
+                self.prepared_carts_info.append_encoded(ips[ip], cart_id, payed, payed_time)
+
+        self.prepared_cart_requests.extend(shard.prepared_cart_requests)
+        self.prepared_goods_requests.extend(
+            shard.prepared_goods_requests,
+            codes={"ip": ips, "category": categories, "item": items}
+        )
+
+        self.open_carts.update(shard.open_carts)
+        self.previous_records.update(shard.previous_records)
+        self.end_offset = shard.end_offset
+
+    def scan_lines(self, buffer, start=0, incomplete_tail=True, end=None):
+        """Yields (start, end) offsets of the lines of the buffer from start till end."""
+        end = len(buffer) if end is None else end
+        position = start
+        while position < end:
+            line_end = buffer.find(b"\n", position, end)
+            if line_end == -1:
+                if incomplete_tail and buffer[position:end].strip():
+                    yield position, end
+                    self.end_offset = end
+                return
+
+            yield position, line_end
+            position = line_end + 1
+            self.end_offset = position
+
+    def restore_state(self, state):
+        for ip, open_cart_id, last_category, last_item in state:
+            if open_cart_id is not None:
+                self.open_carts[ip] = int(open_cart_id)
+            if last_category is not None:
+                path = (last_category, last_item) if last_item else (last_category,)
+                self.previous_records[ip] = LogRecord(None, None, ip, path, None)
+
+    def user_state(self):
+        """Yields (ip, open_cart_id, last_category, last_item) of every user known to the parser."""
+        for ip in self.open_carts.keys() | self.previous_records.keys():
+            open_cart_id = self.open_carts.get(ip)
+            record = self.previous_records.get(ip)
+
+            last_category = last_item = None
+            # Only pages matter for the next line, not cart or pay requests
+            if record is not None and record.query is None and record.path:
+                last_category = record.path[0]
+                last_item = record.path[1] if len(record.path) > 1 else None
+
+            yield ip, open_cart_id, last_category, last_item
+
+    def process_line(self, buffer, start, end):
+        record = tokenize(buffer, start, end)
+        if record is None:
+            raise ValueError(f"Unexpected log line at offset {start}: {buffer[start:end]!r}")
+        ip = record.ip
+        self.ips.encode(ip)
+
+        if self.line_offsets is not None:
+            if not (ip in self.line_offsets):
+                self.line_offsets[ip] = array("q")
+            self.line_offsets[ip].append(start)
+
+        path = record.path
+        if record.query is not None:
+            # "pay?" requests do not change the carts
+            if "goods_id=" in record.query:
+                self.add_to_cart(record)
+        elif not path:
+            # Main page
+            pass
+        elif path[0].startswith("success_pay_"):
+            self.pay_cart(record)
+        else:
+            self.add_goods_request(record)
+
+        self.previous_records[ip] = record
+
+    def add_to_cart(self, record):
+        ip = record.ip
+        params = query_params(record.query)
+        goods_id = int(params["goods_id"])
+        cart_id = int(params["cart_id"])
+
+        self.prepared_cart_requests.append(record.datetime, goods_id, params["amount"], cart_id)
+
+        # Item page is always requested right before adding the item to the cart
+        self.add_category(ip, goods_id)
+
+        # Previous cart was not payed by user, but new cart is created
+        self.close_previous_cart(ip, cart_id)
+        self.open_carts[ip] = cart_id
+
+    def pay_cart(self, record):
+        ip = record.ip
+        payed_cart_id = int(record.path[0][len("success_pay_"):])
+
+        self.close_previous_cart(ip, payed_cart_id)
+        self.prepared_carts_info.append(ip, payed_cart_id, True, record.datetime)
+
+        # Moving to the next cart
+        self.open_carts[ip] = None
+
+    def close_previous_cart(self, ip, cart_id):
+        previous_cart = self.open_carts.get(ip)
+        if previous_cart is not None and previous_cart != cart_id:
+            self.prepared_carts_info.append(ip, previous_cart, False, None)
+
+    @metrics.timed
+    def close_carts(self):
+        # Users left the carts not payed and have not created new ones.
+        for ip, cart_id in self.open_carts.items():
+            if cart_id is not None:
+                self.prepared_carts_info.append(ip, cart_id, False, None)
+
+    def add_category(self, ip, goods_id):
+        self.add_goods(goods_id, self.previous_records.get(ip))
+
+    def add_goods(self, goods_id, previous_record):
+        # Goods added to the cart once again without visiting its page
+        if previous_record is None or previous_record.query is not None or len(previous_record.path) < 2:
+            return
+
+        category, name = previous_record.path[:2]
+        item = Item(name, goods_id)
+
+        # Lists keep the order goods were first seen in, the set makes the check constant-time
+        if (category, item) in self.known_goods:
+            return
+        self.known_goods.add((category, item))
+
+        container = self.prepared_categories
+        if not (category in container):
+            container[category] = []
+        container[category].append(item)
+
+    def add_goods_request(self, record):
+        path = record.path
+        category = path[0]
+        item = path[1] if len(path) > 1 else ""
+
+        self.prepared_goods_requests.append(record.ip, record.datetime, category, item)
+
+    def open_export(self, path, compress):
+        if compress:
+            return gzip.open(path + ".gz", "wb", compresslevel=6)
+        return open(path, "wb", buffering=self.export_buffer_size)
+
+    @metrics.timed
+    def write_mod_logs(self, export_dir, compress=False):
+        """Debug export: writes the parsed lines grouped by ip, all of them and only cart ones,
+        into export_dir (gzip-compressed if compress is set).
+        """
+        if not self.line_offsets:
+            return
+
+        os.makedirs(export_dir, exist_ok=True)
+        with open(self.filename, "rb") as source, \
+                mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as buffer, \
+                self.open_export(os.path.join(export_dir, "logs_sorted_by_ip.txt"), compress) as sorted_logs, \
+                self.open_export(os.path.join(export_dir, "logs_sorted_by_ip_only_carts.txt"), compress) as only_carts:
+            for offsets in self.line_offsets.values():
+                for offset in offsets:
+                    end = buffer.find(b"\n", offset)
+                    line = buffer[offset:len(buffer) if end == -1 else end].rstrip(b"\r") + b"\n"
+
+                    sorted_logs.write(line)
+                    if (b"cart" in line or b"success" in line) and b"pay?" not in line:
+                        only_carts.write(line)
+
+
+class ShardParser(Parser):
+    """Parses a byte range of the file not knowing the state users come to it with.
+
+    Whatever depends on that state is left for Parser.merge_shard: the first cart
+    event of every user becomes a PENDING cart, and goods seen before the first
+    page of the user in the shard are resolved with the page of the previous shards.
+    """
+
+    def init_parser(self, keep_offsets=False):
+        super().init_parser(keep_offsets)
+        # (ip, goods_id, previous record is known, previous record) in order of the lines
+        self.goods_events = []
+        self.lines = 0
+
+    def parse_range(self, filename, start, end, incomplete_tail=True, keep_offsets=False):
+        self.init_parser(keep_offsets)
+        self.filename = filename
+        self.end_offset = start
+        self.lines = self.parse_lines(filename, start=start, incomplete_tail=incomplete_tail, end=end)
+
+    def add_category(self, ip, goods_id):
+        self.goods_events.append((ip, goods_id, ip in self.previous_records, self.previous_records.get(ip)))
+
+    def close_previous_cart(self, ip, cart_id):
+        if ip in self.open_carts:
+            super().close_previous_cart(ip, cart_id)
+        else:
+            self.prepared_carts_info.append(ip, cart_id, PENDING, None)
+
+
+def parse_shard(filename, start, end, incomplete_tail=True, keep_offsets=False):
+    shard = ShardParser()
+    shard.parse_range(filename, start, end, incomplete_tail, keep_offsets)
+    return shard
+
+
+def shard_ranges(filename, start, shards):
+    """Splits the file from start into (start, end) byte ranges of whole lines."""
+    size = os.path.getsize(filename)
+    bounds = [start]
+    with open(filename, "rb") as file:
+        for i in range(1, shards):
+            # The shard begins after the line break found from the middle of the file
+            file.seek(max(start + (size - start) * i // shards - 1, 0))
+            file.readline()
+            bound = file.tell()
+            if bounds[-1] < bound < size:
+                bounds.append(bound)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
 
 
 parser = Parser()
@@ -0,0 +1,397 @@
+import os
+from contextlib import nullcontext
+
+import numpy as np
+
+import geoip
+from log_parser import parser
+from ingestion import parse_logs, watermark_digest
+from metrics import metrics
+from record_store import Strings
+
+
+def empty_table(**dtypes):
+    return {column: np.empty(0, dtype) for column, dtype in dtypes.items()}
+
+
+def append_rows(table, columns):
+    for column, values in columns.items():
+        table[column] = np.concatenate([table[column], values])
+
+
+def timestamps(column):
+    # Seconds since the epoch of the parsed records, their NULL is NaT
+    return np.frombuffer(column, np.int64).astype('datetime64[s]')
+
+
+def by_count(codes, names):
+    """(name, count) of the codes, the most frequent first, like GROUP BY ... ORDER BY count DESC"""
+    counts = np.bincount(codes, minlength=len(names))
+    order = np.argsort(-counts, kind='stable')
+    return [(names[code], int(counts[code])) for code in order if counts[code]]
+
+
+def encode_all(strings, values):
+    """Codes of the values in the record_store.Strings, the values not met are added"""
+    return np.fromiter((strings.encode(value) for value in values), np.int32)
+
+
+def recode(strings, parsed, column):
+    """Codes of the strings for a column encoded by the parser's parsed strings"""
+    codes = encode_all(strings, parsed.values)
+    return codes[np.frombuffer(column, np.int32)]
+
+
+class MemoryDB:
+    """The loaded logs as NumPy columns in memory, with the interface of database.PostgreSQL.
+
+    Ips, categories and countries are dictionary-encoded, the reports are vectorized
+    group-bys over the codes. Nothing is kept when the process exits.
+    """
+
+    def __init__(self):
+        # Job of the running ingestion (see jobs.py), reports stages and processed rows
+        self.job = None
+        # ip -> country, kept when the dataset is recreated like the geoip_cache table
+        self.countries = dict()
+        self.clear()
+
+    def init_app(self, app):
+        pass
+
+    def pool_stats(self):
+        # No connections to pool
+        return {}
+
+    # The logs are in the memory of the process, so are the jobs ingesting them:
+    # only the jobs manager of the process knows them
+
+    def ingestion_lock(self):
+        return nullcontext()
+
+    def ingestion_locked(self):
+        return False
+
+    def save_job(self, state):
+        pass
+
+    def load_job(self, job_id):
+        return None
+
+    def forget_jobs(self, keep):
+        pass
+
+    def clear(self):
+        self.ips = Strings()
+        self.country_names = Strings()
+        # Country code of every ip code, -1 if the ip is not resolved
+        self.ip_country = np.empty(0, np.int32)
+        self.categories = Strings()
+        # goods id -> (name, category code) and (category, name) -> goods id
+        self.goods = dict()
+        self.goods_ids = dict()
+        # Category code of every goods id, -1 for unknown goods
+        self.goods_category = np.empty(0, np.int32)
+
+        self.cart_info = empty_table(id='int64', ip='int32', payed='bool', payed_time='datetime64[s]')
+        # cart id -> row of cart_info, and the rows by cart id for the vectorized lookups
+        self.cart_rows = dict()
+        self.cart_order = np.empty(0, np.int64)
+        self.cart_requests = empty_table(datetime='datetime64[s]', goods_id='int32', amount='int16', cart_id='int64')
+        self.goods_requests = empty_table(ip='int32', datetime='datetime64[s]', category_id='int32', goods_id='int32')
+
+        # filename -> (bytes of the file loaded, their ingestion.prefix_digest), in the order of the loads
+        self.watermarks = dict()
+        self.user_state = []
+        # sha256 of the file loaded without appending, None after appended logs
+        self.digest = None
+
+    def init_db(self, path_to_logs_file, batch_size=10000, job=None, append=False, parse_workers=1,
+                export_dir=None, export_gzip=False, geoip_workers=1, chunks=None, filename=None):
+        """Loads the logs file, see PostgreSQL.init_db for the arguments"""
+        self.job = job
+        filename = filename or os.path.basename(path_to_logs_file)
+        digest = parse_logs(
+            self, path_to_logs_file, filename, append, job, parse_workers, export_dir, export_gzip, chunks
+        )
+        if not append and digest is not None and digest == self.digest:
+            return
+
+        # The loaded logs are replaced only now, the reports use them while the logs are parsed
+        if not append:
+            self.clear()
+
+        self.set_stage("categories")
+        self.fill_categories()
+        self.set_stage("carts")
+        self.fill_carts_info()
+        self.fill_cart_requests()
+        self.set_stage("geoip")
+        self.fill_ip_country(geoip.path_to_geoip2_db, batch_size, geoip_workers)
+        self.set_stage("goods_requests")
+        self.fill_goods_requests()
+
+        self.user_state = list(parser.user_state())
+        # Moved to the end, the logs loaded last are the last ones
+        self.watermarks.pop(filename, None)
+        self.watermarks[filename] = (
+            parser.end_offset, watermark_digest(path_to_logs_file, parser.end_offset, chunks)
+        )
+        self.digest = None if append else digest
+
+    def dataset_digest(self):
+        return self.digest
+
+    def get_watermark(self, filename):
+        return self.watermarks.get(filename, (None, None))
+
+    def last_ingested_file(self):
+        return next(reversed(self.watermarks), None)
+
+    def get_user_state(self):
+        return self.user_state
+
+    def set_stage(self, stage):
+        if self.job is not None:
+            self.job.set_stage(stage)
+
+    def advance(self, rows):
+        if self.job is not None:
+            self.job.advance(rows)
+
+    @metrics.timed
+    def fill_categories(self):
+        for category, goods in parser.prepared_categories.items():
+            category_id = self.categories.encode(category)
+            for item in goods:
+                goods_id = int(item.id)
+                if not (goods_id in self.goods):
+                    self.goods[goods_id] = (item.name, category_id)
+                    self.goods_ids[(category, item.name)] = goods_id
+
+        self.goods_category = np.full(max(self.goods, default=-1) + 1, -1, np.int32)
+        for goods_id, (name, category_id) in self.goods.items():
+            self.goods_category[goods_id] = category_id
+
+    @metrics.timed
+    def fill_carts_info(self):
+        carts = self.cart_info
+        parsed = parser.prepared_carts_info.columns
+        payed = np.frombuffer(parsed["payed"], np.int8).astype(bool)
+        payed_time = timestamps(parsed["payed_time"])
+
+        # cart id -> position of the parsed cart, the last one wins like the upsert
+        new_carts = dict()
+        for position, cart_id in enumerate(parsed["id"]):
+            row = self.cart_rows.get(cart_id)
+            if row is None:
+                new_carts[cart_id] = position
+            else:
+                # Carts left open by the previous logs may be payed in these ones
+                carts["payed"][row] = payed[position]
+                carts["payed_time"][row] = payed_time[position]
+
+        for row, cart_id in enumerate(new_carts, start=len(carts["id"])):
+            self.cart_rows[cart_id] = row
+        positions = np.fromiter(new_carts.values(), np.int64, len(new_carts))
+        append_rows(carts, {
+            "id": np.fromiter(new_carts, np.int64, len(new_carts)),
+            "ip": recode(self.ips, parser.ips, parsed["ip"])[positions],
+            "payed": payed[positions],
+            "payed_time": payed_time[positions]
+        })
+        self.cart_order = np.argsort(carts["id"])
+        self.advance(len(parser.prepared_carts_info))
+
+    @metrics.timed
+    def fill_cart_requests(self):
+        requests = parser.prepared_cart_requests.columns
+        append_rows(self.cart_requests, {
+            "datetime": timestamps(requests["datetime"]),
+            "goods_id": np.frombuffer(requests["goods_id"], np.int32),
+            "amount": np.frombuffer(requests["amount"], np.int32).astype(np.int16),
+            "cart_id": np.frombuffer(requests["cart_id"], np.int64)
+        })
+        self.advance(len(parser.prepared_cart_requests))
+
+    @metrics.timed
+    def fill_ip_country(self, filename, batch_size=10000, workers=1):
+        new_ips = [ip for ip in parser.prepared_ip_list if self.country_of(ip) < 0]
+        unseen_ips = [ip for ip in new_ips if not (ip in self.countries)]
+        self.countries.update(geoip.resolve(filename, unseen_ips, batch_size, workers))
+
+        codes = encode_all(self.ips, new_ips)
+        self.grow_ip_country()
+        self.ip_country[codes] = [self.country_names.encode(self.countries[ip]) for ip in new_ips]
+        self.advance(len(new_ips))
+
+    def country_of(self, ip):
+        code = self.ips.get(ip)
+        return self.ip_country[code] if 0 <= code < len(self.ip_country) else -1
+
+    def grow_ip_country(self):
+        # Ips met after the last resolving are not resolved
+        missing = np.full(len(self.ips) - len(self.ip_country), -1, np.int32)
+        self.ip_country = np.concatenate([self.ip_country, missing])
+
+    @metrics.timed
+    def fill_goods_requests(self):
+        requests = parser.prepared_goods_requests.columns
+        categories = np.frombuffer(requests["category"], np.int32)
+        items = np.frombuffer(requests["item"], np.int32)
+        # Goods id of every distinct (category, item) pair of the parser's codes
+        pairs, pair_codes = np.unique(
+            categories.astype(np.int64) * len(parser.items) + items, return_inverse=True
+        )
+        goods_ids = np.fromiter(
+            (
+                self.goods_ids.get((parser.categories.values[pair // len(parser.items)],
+                                    parser.items.values[pair % len(parser.items)]), -1)
+                for pair in pairs.tolist()
+            ),
+            np.int32, len(pairs)
+        )
+        category_ids = np.fromiter(
+            (self.categories.get(category) for category in parser.categories.values),
+            np.int32, len(parser.categories)
+        )
+        append_rows(self.goods_requests, {
+            "ip": recode(self.ips, parser.ips, requests["ip"]),
+            "datetime": timestamps(requests["datetime"]),
+            "category_id": category_ids[categories],
+            "goods_id": goods_ids[pair_codes.reshape(-1)]
+        })
+        self.grow_ip_country()
+        self.advance(len(parser.prepared_goods_requests))
+
+    def check_db(self):
+        return len(self.categories) > 0
+
+    def cart_values(self, column, cart_ids, missing):
+        """Column of cart_info for the cart ids, missing for the carts not in cart_info"""
+        ids = self.cart_info["id"]
+        values = np.full(len(cart_ids), missing, self.cart_info[column].dtype)
+        if len(ids):
+            positions = np.searchsorted(ids, cart_ids, sorter=self.cart_order)
+            rows = self.cart_order[np.minimum(positions, len(ids) - 1)]
+            found = ids[rows] == cart_ids
+            values[found] = self.cart_info[column][rows[found]]
+        return values
+
+    def category_of_goods(self, goods_ids):
+        known = (goods_ids >= 0) & (goods_ids < len(self.goods_category))
+        return np.where(known, self.goods_category[np.where(known, goods_ids, 0)], -1)
+
+    # Сколько брошенных (не оплаченных) корзин имеется за определенный период?
+    @metrics.timed
+    def rep_unpayed_carts(self, s, p):
+        requests = self.cart_requests
+        in_period = (np.datetime64(s) < requests["datetime"]) & (requests["datetime"] < np.datetime64(p))
+        carts = np.unique(requests["cart_id"][in_period])
+        # Carts missing in cart_info are dropped as by the join
+        return carts[~self.cart_values("payed", carts, True)].tolist()
+
+    # Какое количество пользователей совершали повторные покупки за определенный период?
+    @metrics.timed
+    def rep_repeated_payments(self, s, p):
+        carts = self.cart_info
+        payed_time = carts["payed_time"]
+        payed = carts["payed"] & (np.datetime64(s) < payed_time) & (payed_time < np.datetime64(p))
+        payments = np.bincount(carts["ip"][payed], minlength=len(self.ips))
+
+        data = {self.ips.values[ip]: int(payments[ip] - 1) for ip in np.flatnonzero(payments > 1)}
+        amount = sum(data.values()) if data else None
+        return amount, data
+
+    # Товары из какой категории чаще всего покупают совместно с товаром из заданной категории?
+    @metrics.timed
+    def rep_pattern_buy(self, category, item):
+        goods_id = self.goods_ids.get((category, item))
+        if goods_id is None:
+            return []
+
+        requests = self.cart_requests
+        payed = self.cart_values("payed", requests["cart_id"], False)
+        carts = np.unique(requests["cart_id"][payed & (requests["goods_id"] == goods_id)])
+
+        other_goods = payed & (requests["goods_id"] != goods_id) & np.isin(requests["cart_id"], carts)
+        categories = self.category_of_goods(requests["goods_id"][other_goods])
+        known = categories >= 0
+        # Every cart counts once per category
+        categories_count = max(len(self.categories), 1)
+        carts_categories = np.unique(requests["cart_id"][other_goods][known] * categories_count + categories[known])
+        return by_count(carts_categories % categories_count, self.categories.values)
+
+    # Посетители из какой страны чаще всего интересуются товарами из определенных категорий?
+    @metrics.timed
+    def rep_pattern_view(self, category, item):
+        category_id = self.categories.get(category)
+        if category_id < 0:
+            return []
+
+        requests = self.goods_requests
+        viewed = requests["category_id"] == category_id
+        if item:
+            goods = [goods_id for goods_id, (name, _) in self.goods.items() if name == item]
+            viewed &= np.isin(requests["goods_id"], goods)
+
+        countries = self.ip_country[requests["ip"][viewed]]
+        return by_count(countries[countries >= 0], self.country_names.values)
+
+    # В какое время суток чаще всего просматривают определенную категорию товаров?
+    @metrics.timed
+    def rep_time_pattern(self, category, k):
+        category_id = self.categories.get(category)
+        if category_id < 0:
+            return []
+
+        requests = self.goods_requests
+        viewed = requests["datetime"][requests["category_id"] == category_id]
+        hours = (viewed.astype('datetime64[h]') - viewed.astype('datetime64[D]')).astype(int)
+
+        intervals, views = np.unique(np.floor(hours / float(k)), return_counts=True)
+        return [(float(interval), int(count)) for interval, count in zip(intervals, views)]
+
+    # Посетители из какой страны совершают больше всего действий на сайте?
+    @metrics.timed
+    def rep_actions_per_country(self):
+        cart_ips = self.cart_values("ip", self.cart_requests["cart_id"], -1)
+        ips = np.concatenate([cart_ips[cart_ips >= 0], self.goods_requests["ip"]])
+        countries = self.ip_country[ips]
+        return by_count(countries[countries >= 0], self.country_names.values)
+
+    # Какая нагрузка (число запросов) на сайт за астрономический час?
+    @metrics.timed
+    def rep_server_load_per_hour(self):
+        requests = np.concatenate([self.cart_requests["datetime"], self.goods_requests["datetime"]])
+        hours, counts = np.unique(requests.astype('datetime64[h]'), return_counts=True)
+
+        days = hours.astype('datetime64[D]')
+        months = hours.astype('datetime64[M]')
+        statistics = zip(
+            counts.tolist(),
+            ((days - months).astype(int) + 1).tolist(),
+            (hours - days).astype(int).tolist(),
+            (months.astype(int) % 12 + 1).tolist()
+        )
+        # Parts of the date are floats as date_part gives them
+        statistics = [(count, float(day), float(hour), float(month)) for count, day, hour, month in statistics]
+        avg = float(counts.mean()) if len(counts) else None
+        return avg, statistics
+
+    @metrics.timed
+    def overall_statistic(self):
+        resolved = self.ip_country[self.ip_country >= 0]
+        return {
+            "unique_users": len(resolved),
+            "items_views": len(self.goods_requests["ip"]),
+            "payed_carts": int(self.cart_info["payed"].sum()),
+            "countries": len(np.unique(resolved))
+        }
+
+    @metrics.timed
+    def get_categories(self):
+        response = {}
+        for name, category_id in self.goods.values():
+            response.setdefault(self.categories.values[category_id], []).append(name)
+        return response
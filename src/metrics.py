@@ -0,0 +1,164 @@
+import logging
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+
+slow_query_log = logging.getLogger("slow_queries")
+
+# Operation the queries of the current thread or task are made for, see Metrics.timed
+current_operation = ContextVar("current_operation", default="other")
+
+STEP_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 1800)
+QUERY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def label_text(names, values, extra=()):
+    labels = [f'{name}="{value}"' for name, value in zip(names, values)] + list(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.lock = Lock()
+        self.values = dict()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{label_text(self.labels, key)} {value}")
+        return lines
+
+
+class Histogram:
+    """Counts of the observed values by upper bounds of the buckets, with their sum"""
+
+    def __init__(self, name, help, labels=(), buckets=QUERY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self.lock = Lock()
+        # labels -> [counts per bucket and +Inf, sum]
+        self.values = dict()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self.lock:
+            counts = self.values.get(key)
+            if counts is None:
+                counts = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            counts[0][bisect_left(self.buckets, value)] += 1
+            counts[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for key, (counts, total) in sorted(self.values.items()):
+                # Buckets are cumulative in the exposition format
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), counts):
+                    cumulative += count
+                    bucket = label_text(self.labels, key, [f'le="{bound}"'])
+                    lines.append(f"{self.name}_bucket{bucket} {cumulative}")
+                lines.append(f"{self.name}_sum{label_text(self.labels, key)} {total}")
+                lines.append(f"{self.name}_count{label_text(self.labels, key)} {cumulative}")
+        return lines
+
+
+class Metrics:
+    """Timings of the ingestion steps, the queries and the api requests,
+    exported in the Prometheus text format.
+
+    Queries are labeled by the step or report they are made for, queries
+    taking slow_query_seconds or more are logged.
+    """
+
+    def __init__(self, slow_query_seconds=None):
+        self.slow_query_seconds = slow_query_seconds
+
+        self.operation_seconds = Histogram(
+            "logs_operation_seconds", "Time of the ingestion steps and the reports", ("operation",), STEP_BUCKETS
+        )
+        self.query_seconds = Histogram(
+            "logs_db_query_seconds", "Time of the database queries by operation", ("operation",), QUERY_BUCKETS
+        )
+        self.query_rows = Counter(
+            "logs_db_query_rows_total", "Rows returned or changed by the queries by operation", ("operation",)
+        )
+        self.slow_queries = Counter(
+            "logs_db_slow_queries_total", "Queries taking slow_query_seconds or more by operation", ("operation",)
+        )
+        self.request_seconds = Histogram(
+            "logs_http_request_seconds", "Latency of the api requests", ("endpoint", "method", "status"),
+            REQUEST_BUCKETS
+        )
+
+    def timed(self, function):
+        """Decorator recording the time of the step or report, its queries are labeled by its name"""
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            token = current_operation.set(function.__name__)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.operation_seconds.observe(time.perf_counter() - started, operation=function.__name__)
+                current_operation.reset(token)
+        return wrapper
+
+    def instrument_engine(self, engine):
+        # The parser uses the timers without the database
+        from sqlalchemy import event
+
+        event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self.after_cursor_execute)
+        event.listen(engine, "handle_error", self.handle_error)
+
+    @staticmethod
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        connection.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @staticmethod
+    def handle_error(context):
+        # The failed query has no after_cursor_execute
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+    def after_cursor_execute(self, connection, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - connection.info["query_started"].pop()
+        operation = current_operation.get()
+        self.query_seconds.observe(elapsed, operation=operation)
+        # -1 when the driver doesn't know it
+        if cursor.rowcount > 0:
+            self.query_rows.inc(cursor.rowcount, operation=operation)
+
+        if self.slow_query_seconds is not None and elapsed >= self.slow_query_seconds:
+            self.slow_queries.inc(operation=operation)
+            slow_query_log.warning("%.3fs in %s: %s", elapsed, operation, " ".join(statement.split()))
+
+    def observe_request(self, endpoint, method, status, seconds):
+        self.request_seconds.observe(seconds, endpoint=endpoint, method=method, status=status)
+
+    def render(self):
+        lines = []
+        for metric in (
+            self.operation_seconds, self.query_seconds, self.query_rows, self.slow_queries, self.request_seconds
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
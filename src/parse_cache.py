@@ -0,0 +1,155 @@
+import json
+import os
+import sys
+from array import array
+
+from log_parser import Item
+
+# Format of the files, files of another one are parsed again
+MAGIC = b"parsed-logs 1\n"
+SUFFIX = ".parsed"
+TABLES = ("cart_requests", "carts_info", "goods_requests")
+STRINGS = ("ips", "categories", "items")
+
+
+def write_dataset(file, parser):
+    """Writes the parsed records: a JSON header, then the bytes of every column and string dictionary.
+
+    Columns are the arrays of the tables as they are, strings are joined by
+    line breaks, which ips, categories and goods never contain.
+    """
+    strings = {name: "\n".join(getattr(parser, name).values).encode() for name in STRINGS}
+    tables = {name: getattr(parser, f"prepared_{name}").columns for name in TABLES}
+    header = {
+        "byteorder": sys.byteorder,
+        "end_offset": parser.end_offset,
+        "categories": {
+            category: [[item.name, item.id] for item in goods] for category, goods in parser.prepared_categories.items()
+        },
+        "state": list(parser.user_state()),
+        "strings": {name: [len(getattr(parser, name)), len(data)] for name, data in strings.items()},
+        "tables": {
+            name: {column: [values.typecode, len(values)] for column, values in columns.items()}
+            for name, columns in tables.items()
+        }
+    }
+
+    file.write(MAGIC)
+    file.write(json.dumps(header).encode() + b"\n")
+    for data in strings.values():
+        file.write(data)
+    for columns in tables.values():
+        for values in columns.values():
+            values.tofile(file)
+
+
+def read_dataset(file, parser, filename):
+    """Restores the parser as if it had parsed filename, False if the file is of another format"""
+    if file.readline() != MAGIC:
+        return False
+    header = json.loads(file.readline())
+    if header["byteorder"] != sys.byteorder:
+        return False
+
+    parser.init_parser()
+    parser.filename = filename
+    parser.end_offset = header["end_offset"]
+    for category, goods in header["categories"].items():
+        parser.prepared_categories[category] = [Item(name, goods_id) for name, goods_id in goods]
+        parser.known_goods.update((category, item) for item in parser.prepared_categories[category])
+    parser.restore_state(header["state"])
+
+    for name, (amount, size) in header["strings"].items():
+        strings = getattr(parser, name)
+        for value in file.read(size).decode().split("\n") if amount else ():
+            strings.encode(value)
+    for name, columns in header["tables"].items():
+        table = getattr(parser, f"prepared_{name}")
+        for column, (typecode, length) in columns.items():
+            values = array(typecode)
+            values.fromfile(file, length)
+            table.columns[column] = values
+    return True
+
+
+class ParseCache:
+    """Parsed logs stored under the sha256 of the file, so the same upload isn't parsed again.
+
+    The least recently used files are removed while all of them take more
+    than max_bytes. directory None turns the cache off.
+    """
+
+    def __init__(self, directory=None, max_bytes=1024 ** 3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path(self, digest):
+        return os.path.join(self.directory, digest + SUFFIX)
+
+    def load(self, digest, parser, filename):
+        """Fills the parser from the cache, False if the logs of the digest are not there"""
+        if self.directory is None or digest is None:
+            return False
+        try:
+            with open(self.path(digest), "rb") as file:
+                loaded = read_dataset(file, parser, filename)
+        except FileNotFoundError:
+            loaded = False
+
+        if loaded:
+            self.hits += 1
+            # Recently used files are evicted last
+            os.utime(self.path(digest))
+        else:
+            self.misses += 1
+        return loaded
+
+    def parse(self, parser, filename, digest, **arguments):
+        """parser.parse(filename, **arguments), the records are taken from the cache or stored in it.
+
+        Only complete parses of a file may be cached, digest None parses without the cache.
+        """
+        if self.load(digest, parser, filename):
+            return
+        parser.parse(filename, **arguments)
+        self.store(digest, parser)
+
+    def store(self, digest, parser):
+        if self.directory is None or digest is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Renamed when complete, a failed write leaves no truncated entry
+        temporary = self.path(digest) + ".tmp"
+        with open(temporary, "wb") as file:
+            write_dataset(file, parser)
+        os.replace(temporary, self.path(digest))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SUFFIX):
+                status = entry.stat()
+                entries.append((status.st_mtime, status.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes
+        }
+
+
+parse_cache = ParseCache()
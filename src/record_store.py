@@ -0,0 +1,159 @@
+import sys
+from array import array
+from calendar import timegm
+from datetime import datetime, timedelta
+from time import strptime
+
+EPOCH = datetime(1970, 1, 1)
+# Stored for missing timestamps, NaT of numpy's datetime64
+NULL_TIMESTAMP = -2 ** 63
+
+
+class Column:
+    """Type of a table column: typecode of its array and conversion of the values"""
+    # Values are stored as they are
+    converts = False
+
+    def __init__(self, typecode):
+        self.typecode = typecode
+
+    def encode(self, value):
+        return value
+
+    def decode(self, value):
+        return value
+
+
+class Integer(Column):
+    # Ids and amounts come as strings from the query
+    def encode(self, value):
+        return int(value)
+
+
+class Flag(Column):
+    converts = True
+
+    def __init__(self):
+        super().__init__('b')
+
+    def decode(self, value):
+        return bool(value)
+
+
+class Timestamp(Column):
+    """"YYYY-MM-DD HH:MM:SS" of the logs as seconds since the epoch, decoded to naive datetime"""
+    converts = True
+
+    def __init__(self):
+        super().__init__('q')
+        # Seconds of the days met, only the time of the day is computed for every value
+        self.days = dict()
+
+    def encode(self, value):
+        if value is None:
+            return NULL_TIMESTAMP
+        day = self.days.get(value[:10])
+        if day is None:
+            day = self.days[value[:10]] = timegm(strptime(value[:10], "%Y-%m-%d"))
+        return day + int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+
+    def decode(self, value):
+        return None if value == NULL_TIMESTAMP else EPOCH + timedelta(seconds=value)
+
+
+class Strings(Column):
+    """Dictionary encoding: the column holds codes, every distinct string is kept once"""
+    converts = True
+
+    def __init__(self):
+        super().__init__('i')
+        # Strings in the order they were met, the code is the index
+        self.values = []
+        self.codes = dict()
+
+    def __len__(self):
+        return len(self.values)
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, value):
+        return self.values[value]
+
+    def get(self, value):
+        """Code of the value, -1 if it was not met"""
+        return self.codes.get(value, -1)
+
+    def footprint(self):
+        return sys.getsizeof(self.values) + sys.getsizeof(self.codes) + sum(map(sys.getsizeof, self.values))
+
+
+INTEGER = Integer('i')
+BIG_INTEGER = Integer('q')
+FLAG = Flag()
+TIMESTAMP = Timestamp()
+
+
+class Table:
+    """Records of row_type (a namedtuple) kept as a typed array per field.
+
+    Iterating gives the decoded records, rows(...) the decoded values of some
+    columns for the bulk loaders, and columns the raw arrays.
+    """
+
+    def __init__(self, row_type, *types):
+        self.row_type = row_type
+        self.types = dict(zip(row_type._fields, types))
+        self.columns = {name: array(column.typecode) for name, column in self.types.items()}
+
+    def __len__(self):
+        return len(next(iter(self.columns.values())))
+
+    def __iter__(self):
+        return map(self.row_type._make, self.rows(*self.row_type._fields))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            table = Table(self.row_type, *self.types.values())
+            table.columns = {name: column[index] for name, column in self.columns.items()}
+            return table
+        return self.row_type(*(
+            self.types[name].decode(column[index]) for name, column in self.columns.items()
+        ))
+
+    def __eq__(self, other):
+        return isinstance(other, Table) and self.row_type == other.row_type and list(self) == list(other)
+
+    def append(self, *values):
+        for column, column_type, value in zip(self.columns.values(), self.types.values(), values):
+            column.append(column_type.encode(value))
+
+    def append_encoded(self, *values):
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+
+    def extend(self, other, codes=None):
+        """Appends the rows of other table, codes maps its string codes to the ones
+        of this table: {column: array of the new code by the old one}
+        """
+        codes = codes or dict()
+        for name, column in self.columns.items():
+            if name in codes:
+                column.extend(map(codes[name].__getitem__, other.columns[name]))
+            else:
+                column.extend(other.columns[name])
+
+    def rows(self, *names):
+        """Yields tuples of the decoded values of the columns"""
+        return zip(*(
+            map(self.types[name].decode, self.columns[name]) if self.types[name].converts else self.columns[name]
+            for name in names
+        ))
+
+    def footprint(self):
+        """Bytes of the arrays, the strings of dictionary-encoded columns are not counted"""
+        return sum(map(sys.getsizeof, self.columns.values()))
@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+
+class ReportCache:
+    """LRU cache of report results with time-to-live.
+
+    Entries are stored with the version of the dataset they were computed on
+    and are stale as soon as ingestion changes the version.
+    """
+
+    def __init__(self, max_size=256, ttl=600):
+        self.max_size = max_size
+        # Seconds, None keeps entries till the dataset changes
+        self.ttl = ttl
+
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, version):
+        """Returns (found, value)."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry_version, stored_at, value = entry
+                expired = self.ttl is not None and time.monotonic() - stored_at > self.ttl
+                if entry_version == version and not expired:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.entries[key]
+
+            self.misses += 1
+            return False, None
+
+    def put(self, key, version, value):
+        with self.lock:
+            self.entries[key] = (version, time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl
+        }
+
+    def cached(self, method):
+        """Caches the results of the report method by its name and arguments.
+
+        The object the method belongs to provides dataset_version(),
+        nothing is cached while it's None.
+        """
+        @wraps(method)
+        def wrapper(db, *args):
+            version = db.dataset_version()
+            if version is None:
+                return method(db, *args)
+
+            key = (method.__name__,) + args
+            found, value = self.get(key, version)
+            if not found:
+                value = method(db, *args)
+                self.put(key, version, value)
+            return value
+
+        return wrapper
+
+
+report_cache = ReportCache()
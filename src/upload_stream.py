@@ -0,0 +1,85 @@
+import hashlib
+from queue import Empty, Full, Queue
+
+from ingestion import WATERMARK_BLOCK_SIZE, blocks_digest
+
+# Put after the last chunk of a complete and of a broken off upload
+END = object()
+INTERRUPTED = object()
+
+
+class UploadStream:
+    """Chunks of an upload handed from the request receiving it to the ingestion job.
+
+    The request writes the chunks as they arrive and the job parses them as
+    they come, so parsing overlaps the transfer. The queue is bounded: a request
+    ahead of the parser waits for it. The request also hashes the content and
+    optionally keeps the raw file at path.
+    """
+
+    def __init__(self, path=None, max_chunks=64):
+        self.queue = Queue(max_chunks)
+        self.sha256 = hashlib.sha256()
+        # The first block and the last bytes of the upload for the digest of its watermark,
+        # two blocks of them, the unparsed blank tail isn't in the watermark
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.size = 0
+        self.file = open(path, "wb") if path is not None else None
+        # Set by the job once it stops reading, the rest of the upload is not needed
+        self.closed = False
+
+    def write(self, chunk):
+        """Passes the chunk to the job, False if the job doesn't read any more"""
+        self.sha256.update(chunk)
+        if len(self.head) < WATERMARK_BLOCK_SIZE:
+            self.head += chunk[:WATERMARK_BLOCK_SIZE - len(self.head)]
+        self.tail += chunk
+        del self.tail[:-2 * WATERMARK_BLOCK_SIZE]
+        self.size += len(chunk)
+        if self.file is not None:
+            self.file.write(chunk)
+        return self.put(chunk)
+
+    def finish(self, complete=True):
+        """End of the upload, not complete if the request broke off: the job fails then"""
+        if self.file is not None:
+            self.file.close()
+        self.put(END if complete else INTERRUPTED)
+
+    def put(self, chunk):
+        while not self.closed:
+            try:
+                self.queue.put(chunk, timeout=1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def close(self):
+        self.closed = True
+
+    def __iter__(self):
+        while not self.closed:
+            try:
+                chunk = self.queue.get(timeout=1)
+            except Empty:
+                continue
+            if chunk is END:
+                return
+            if chunk is INTERRUPTED:
+                raise IOError("The upload was interrupted")
+            yield chunk
+
+    def prefix_digest(self, size):
+        """ingestion.prefix_digest of the upload, None if the last block of the first size bytes is gone"""
+        tail_start = max(0, size - WATERMARK_BLOCK_SIZE)
+        kept_from = self.size - len(self.tail)
+        if tail_start < kept_from:
+            return None
+        tail = self.tail[tail_start - kept_from:size - kept_from]
+        return blocks_digest(bytes(self.head[:min(size, WATERMARK_BLOCK_SIZE)]), bytes(tail))
+
+    def hexdigest(self):
+        """sha256 of the upload, complete once the chunks are all read"""
+        return self.sha256.hexdigest()
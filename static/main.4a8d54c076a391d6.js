@@ -1 +1 @@
-"use strict";var fk=Object.defineProperty,hk=Object.defineProperties,pk=Object.getOwnPropertyDescriptors,dC=Object.getOwnPropertySymbols,gk=Object.prototype.hasOwnProperty,mk=Object.prototype.propertyIsEnumerable,fC=(Y,Ae,Ke)=>Ae in Y?fk(Y,Ae,{enumerable:!0,configurable:!0,writable:!0,value:Ke}):Y[Ae]=Ke,P=(Y,Ae)=>{for(var Ke in Ae||(Ae={}))gk.call(Ae,Ke)&&fC(Y,Ke,Ae[Ke]);if(dC)for(var Ke of dC(Ae))mk.call(Ae,Ke)&&fC(Y,Ke,Ae[Ke]);return Y},lt=(Y,Ae)=>hk(Y,pk(Ae));(self.webpackChunkapp=self.webpackChunkapp||[]).push([[179],{240:()=>{function Y(e){return"function"==typeof e}function Ae(e){const n=e(r=>{Error.call(r),r.stack=(new Error).stack});return n.prototype=Object.create(Error.prototype),n.prototype.constructor=n,n}const Ke=Ae(e=>function(n){e(this),this.message=n?`${n.length} errors occurred during unsubscription:\n${n.map((r,o)=>`${o+1}) ${r.toString()}`).join("\n  ")}`:"",this.name="UnsubscriptionError",this.errors=n});function Vo(e,t){if(e){const n=e.indexOf(t);0<=n&&e.splice(n,1)}}class Et{constructor(t){this.initialTeardown=t,this.closed=!1,this._parentage=null,this._teardowns=null}unsubscribe(){let t;if(!this.closed){this.closed=!0;const{_parentage:n}=this;if(n)if(this._parentage=null,Array.isArray(n))for(const i of n)i.remove(this);else n.remove(this);const{initialTeardown:r}=this;if(Y(r))try{r()}catch(i){t=i instanceof Ke?i.errors:[i]}const{_teardowns:o}=this;if(o){this._teardowns=null;for(const i of o)try{If(i)}catch(s){t=null!=t?t:[],s instanceof Ke?t=[...t,...s.errors]:t.push(s)}}if(t)throw new Ke(t)}}add(t){var n;if(t&&t!==this)if(this.closed)If(t);else{if(t instanceof Et){if(t.closed||t._hasParent(this))return;t._addParent(this)}(this._teardowns=null!==(n=this._teardowns)&&void 0!==n?n:[]).push(t)}}_hasParent(t){const{_parentage:n}=this;return n===t||Array.isArray(n)&&n.includes(t)}_addParent(t){const{_parentage:n}=this;this._parentage=Array.isArray(n)?(n.push(t),n):n?[n,t]:t}_removeParent(t){const{_parentage:n}=this;n===t?this._parentage=null:Array.isArray(n)&&Vo(n,t)}remove(t){const{_teardowns:n}=this;n&&Vo(n,t),t instanceof Et&&t._removeParent(this)}}Et.EMPTY=(()=>{const e=new Et;return e.closed=!0,e})();const wf=Et.EMPTY;function bf(e){return e instanceof Et||e&&"closed"in e&&Y(e.remove)&&Y(e.add)&&Y(e.unsubscribe)}function If(e){Y(e)?e():e.unsubscribe()}const Yn={onUnhandledError:null,onStoppedNotification:null,Promise:void 0,useDeprecatedSynchronousErrorHandling:!1,useDeprecatedNextContext:!1},ss={setTimeout(...e){const{delegate:t}=ss;return((null==t?void 0:t.setTimeout)||setTimeout)(...e)},clearTimeout(e){const{delegate:t}=ss;return((null==t?void 0:t.clearTimeout)||clearTimeout)(e)},delegate:void 0};function Tf(e){ss.setTimeout(()=>{const{onUnhandledError:t}=Yn;if(!t)throw e;t(e)})}function as(){}const hC=au("C",void 0,void 0);function au(e,t,n){return{kind:e,value:t,error:n}}let Zn=null;function us(e){if(Yn.useDeprecatedSynchronousErrorHandling){const t=!Zn;if(t&&(Zn={errorThrown:!1,error:null}),e(),t){const{errorThrown:n,error:r}=Zn;if(Zn=null,n)throw r}}else e()}class uu extends Et{constructor(t){super(),this.isStopped=!1,t?(this.destination=t,bf(t)&&t.add(this)):this.destination=yC}static create(t,n,r){return new lu(t,n,r)}next(t){this.isStopped?du(au("N",t,void 0),this):this._next(t)}error(t){this.isStopped?du(au("E",void 0,t),this):(this.isStopped=!0,this._error(t))}complete(){this.isStopped?du(hC,this):(this.isStopped=!0,this._complete())}unsubscribe(){this.closed||(this.isStopped=!0,super.unsubscribe(),this.destination=null)}_next(t){this.destination.next(t)}_error(t){try{this.destination.error(t)}finally{this.unsubscribe()}}_complete(){try{this.destination.complete()}finally{this.unsubscribe()}}}class lu extends uu{constructor(t,n,r){let o;if(super(),Y(t))o=t;else if(t){let i;({next:o,error:n,complete:r}=t),this&&Yn.useDeprecatedNextContext?(i=Object.create(t),i.unsubscribe=()=>this.unsubscribe()):i=t,o=null==o?void 0:o.bind(i),n=null==n?void 0:n.bind(i),r=null==r?void 0:r.bind(i)}this.destination={next:o?cu(o):as,error:cu(null!=n?n:Sf),complete:r?cu(r):as}}}function cu(e,t){return(...n)=>{try{e(...n)}catch(r){Yn.useDeprecatedSynchronousErrorHandling?function(e){Yn.useDeprecatedSynchronousErrorHandling&&Zn&&(Zn.errorThrown=!0,Zn.error=e)}(r):Tf(r)}}}function Sf(e){throw e}function du(e,t){const{onStoppedNotification:n}=Yn;n&&ss.setTimeout(()=>n(e,t))}const yC={closed:!0,next:as,error:Sf,complete:as},fu="function"==typeof Symbol&&Symbol.observable||"@@observable";function Jn(e){return e}let fe=(()=>{class e{constructor(n){n&&(this._subscribe=n)}lift(n){const r=new e;return r.source=this,r.operator=n,r}subscribe(n,r,o){const i=function(e){return e&&e instanceof uu||function(e){return e&&Y(e.next)&&Y(e.error)&&Y(e.complete)}(e)&&bf(e)}(n)?n:new lu(n,r,o);return us(()=>{const{operator:s,source:a}=this;i.add(s?s.call(i,a):a?this._subscribe(i):this._trySubscribe(i))}),i}_trySubscribe(n){try{return this._subscribe(n)}catch(r){n.error(r)}}forEach(n,r){return new(r=Af(r))((o,i)=>{let s;s=this.subscribe(a=>{try{n(a)}catch(u){i(u),null==s||s.unsubscribe()}},i,o)})}_subscribe(n){var r;return null===(r=this.source)||void 0===r?void 0:r.subscribe(n)}[fu](){return this}pipe(...n){return function(e){return 0===e.length?Jn:1===e.length?e[0]:function(n){return e.reduce((r,o)=>o(r),n)}}(n)(this)}toPromise(n){return new(n=Af(n))((r,o)=>{let i;this.subscribe(s=>i=s,s=>o(s),()=>r(i))})}}return e.create=t=>new e(t),e})();function Af(e){var t;return null!==(t=null!=e?e:Yn.Promise)&&void 0!==t?t:Promise}const vC=Ae(e=>function(){e(this),this.name="ObjectUnsubscribedError",this.message="object unsubscribed"});let pn=(()=>{class e extends fe{constructor(){super(),this.closed=!1,this.observers=[],this.isStopped=!1,this.hasError=!1,this.thrownError=null}lift(n){const r=new Rf(this,this);return r.operator=n,r}_throwIfClosed(){if(this.closed)throw new vC}next(n){us(()=>{if(this._throwIfClosed(),!this.isStopped){const r=this.observers.slice();for(const o of r)o.next(n)}})}error(n){us(()=>{if(this._throwIfClosed(),!this.isStopped){this.hasError=this.isStopped=!0,this.thrownError=n;const{observers:r}=this;for(;r.length;)r.shift().error(n)}})}complete(){us(()=>{if(this._throwIfClosed(),!this.isStopped){this.isStopped=!0;const{observers:n}=this;for(;n.length;)n.shift().complete()}})}unsubscribe(){this.isStopped=this.closed=!0,this.observers=null}get observed(){var n;return(null===(n=this.observers)||void 0===n?void 0:n.length)>0}_trySubscribe(n){return this._throwIfClosed(),super._trySubscribe(n)}_subscribe(n){return this._throwIfClosed(),this._checkFinalizedStatuses(n),this._innerSubscribe(n)}_innerSubscribe(n){const{hasError:r,isStopped:o,observers:i}=this;return r||o?wf:(i.push(n),new Et(()=>Vo(i,n)))}_checkFinalizedStatuses(n){const{hasError:r,thrownError:o,isStopped:i}=this;r?n.error(o):i&&n.complete()}asObservable(){const n=new fe;return n.source=this,n}}return e.create=(t,n)=>new Rf(t,n),e})();class Rf extends pn{constructor(t,n){super(),this.destination=t,this.source=n}next(t){var n,r;null===(r=null===(n=this.destination)||void 0===n?void 0:n.next)||void 0===r||r.call(n,t)}error(t){var n,r;null===(r=null===(n=this.destination)||void 0===n?void 0:n.error)||void 0===r||r.call(n,t)}complete(){var t,n;null===(n=null===(t=this.destination)||void 0===t?void 0:t.complete)||void 0===n||n.call(t)}_subscribe(t){var n,r;return null!==(r=null===(n=this.source)||void 0===n?void 0:n.subscribe(t))&&void 0!==r?r:wf}}function xf(e){return Y(null==e?void 0:e.lift)}function ke(e){return t=>{if(xf(t))return t.lift(function(n){try{return e(n,this)}catch(r){this.error(r)}});throw new TypeError("Unable to lift unknown Observable type")}}class Le extends uu{constructor(t,n,r,o,i){super(t),this.onFinalize=i,this._next=n?function(s){try{n(s)}catch(a){t.error(a)}}:super._next,this._error=o?function(s){try{o(s)}catch(a){t.error(a)}finally{this.unsubscribe()}}:super._error,this._complete=r?function(){try{r()}catch(s){t.error(s)}finally{this.unsubscribe()}}:super._complete}unsubscribe(){var t;const{closed:n}=this;super.unsubscribe(),!n&&(null===(t=this.onFinalize)||void 0===t||t.call(this))}}function ae(e,t){return ke((n,r)=>{let o=0;n.subscribe(new Le(r,i=>{r.next(e.call(t,i,o++))}))})}function Xn(e){return this instanceof Xn?(this.v=e,this):new Xn(e)}function wC(e,t,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var o,r=n.apply(e,t||[]),i=[];return o={},s("next"),s("throw"),s("return"),o[Symbol.asyncIterator]=function(){return this},o;function s(f){r[f]&&(o[f]=function(h){return new Promise(function(m,_){i.push([f,h,m,_])>1||a(f,h)})})}function a(f,h){try{!function(f){f.value instanceof Xn?Promise.resolve(f.value.v).then(l,c):d(i[0][2],f)}(r[f](h))}catch(m){d(i[0][3],m)}}function l(f){a("next",f)}function c(f){a("throw",f)}function d(f,h){f(h),i.shift(),i.length&&a(i[0][0],i[0][1])}}function bC(e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var n,t=e[Symbol.asyncIterator];return t?t.call(e):(e=function(e){var t="function"==typeof Symbol&&Symbol.iterator,n=t&&e[t],r=0;if(n)return n.call(e);if(e&&"number"==typeof e.length)return{next:function(){return e&&r>=e.length&&(e=void 0),{value:e&&e[r++],done:!e}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}(e),n={},r("next"),r("throw"),r("return"),n[Symbol.asyncIterator]=function(){return this},n);function r(i){n[i]=e[i]&&function(s){return new Promise(function(a,u){!function(i,s,a,u){Promise.resolve(u).then(function(l){i({value:l,done:a})},s)}(a,u,(s=e[i](s)).done,s.value)})}}}const Of=e=>e&&"number"==typeof e.length&&"function"!=typeof e;function kf(e){return Y(null==e?void 0:e.then)}function Lf(e){return Y(e[fu])}function Vf(e){return Symbol.asyncIterator&&Y(null==e?void 0:e[Symbol.asyncIterator])}function jf(e){return new TypeError(`You provided ${null!==e&&"object"==typeof e?"an invalid object":`'${e}'`} where a stream was expected. You can provide an Observable, Promise, ReadableStream, Array, AsyncIterable, or Iterable.`)}const Bf="function"==typeof Symbol&&Symbol.iterator?Symbol.iterator:"@@iterator";function Uf(e){return Y(null==e?void 0:e[Bf])}function Hf(e){return wC(this,arguments,function*(){const n=e.getReader();try{for(;;){const{value:r,done:o}=yield Xn(n.read());if(o)return yield Xn(void 0);yield yield Xn(r)}}finally{n.releaseLock()}})}function $f(e){return Y(null==e?void 0:e.getReader)}function gn(e){if(e instanceof fe)return e;if(null!=e){if(Lf(e))return function(e){return new fe(t=>{const n=e[fu]();if(Y(n.subscribe))return n.subscribe(t);throw new TypeError("Provided object does not correctly implement Symbol.observable")})}(e);if(Of(e))return function(e){return new fe(t=>{for(let n=0;n<e.length&&!t.closed;n++)t.next(e[n]);t.complete()})}(e);if(kf(e))return function(e){return new fe(t=>{e.then(n=>{t.closed||(t.next(n),t.complete())},n=>t.error(n)).then(null,Tf)})}(e);if(Vf(e))return qf(e);if(Uf(e))return function(e){return new fe(t=>{for(const n of e)if(t.next(n),t.closed)return;t.complete()})}(e);if($f(e))return function(e){return qf(Hf(e))}(e)}throw jf(e)}function qf(e){return new fe(t=>{(function(e,t){var n,r,o,i;return function(e,t,n,r){return new(n||(n=Promise))(function(i,s){function a(c){try{l(r.next(c))}catch(d){s(d)}}function u(c){try{l(r.throw(c))}catch(d){s(d)}}function l(c){c.done?i(c.value):function(i){return i instanceof n?i:new n(function(s){s(i)})}(c.value).then(a,u)}l((r=r.apply(e,t||[])).next())})}(this,void 0,void 0,function*(){try{for(n=bC(e);!(r=yield n.next()).done;)if(t.next(r.value),t.closed)return}catch(s){o={error:s}}finally{try{r&&!r.done&&(i=n.return)&&(yield i.call(n))}finally{if(o)throw o.error}}t.complete()})})(e,t).catch(n=>t.error(n))})}function mn(e,t,n,r=0,o=!1){const i=t.schedule(function(){n(),o?e.add(this.schedule(null,r)):this.unsubscribe()},r);if(e.add(i),!o)return i}function Re(e,t,n=1/0){return Y(t)?Re((r,o)=>ae((i,s)=>t(r,i,o,s))(gn(e(r,o))),n):("number"==typeof t&&(n=t),ke((r,o)=>function(e,t,n,r,o,i,s,a){const u=[];let l=0,c=0,d=!1;const f=()=>{d&&!u.length&&!l&&t.complete()},h=_=>l<r?m(_):u.push(_),m=_=>{l++;let y=!1;gn(n(_,c++)).subscribe(new Le(t,v=>{t.next(v)},()=>{y=!0},void 0,()=>{if(y)try{for(l--;u.length&&l<r;){const v=u.shift();m(v)}f()}catch(v){t.error(v)}}))};return e.subscribe(new Le(t,h,()=>{d=!0,f()})),()=>{}}(r,o,e,n)))}function jo(e=1/0){return Re(Jn,e)}const yn=new fe(e=>e.complete());function pu(e){return e[e.length-1]}function Bo(e){return function(e){return e&&Y(e.schedule)}(pu(e))?e.pop():void 0}function Wf(e,t=0){return ke((n,r)=>{n.subscribe(new Le(r,o=>mn(r,e,()=>r.next(o),t),()=>mn(r,e,()=>r.complete(),t),o=>mn(r,e,()=>r.error(o),t)))})}function Gf(e,t=0){return ke((n,r)=>{r.add(e.schedule(()=>n.subscribe(r),t))})}function zf(e,t){if(!e)throw new Error("Iterable cannot be null");return new fe(n=>{mn(n,t,()=>{const r=e[Symbol.asyncIterator]();mn(n,t,()=>{r.next().then(o=>{o.done?n.complete():n.next(o.value)})},0,!0)})})}function Ve(e,t){return t?function(e,t){if(null!=e){if(Lf(e))return function(e,t){return gn(e).pipe(Gf(t),Wf(t))}(e,t);if(Of(e))return function(e,t){return new fe(n=>{let r=0;return t.schedule(function(){r===e.length?n.complete():(n.next(e[r++]),n.closed||this.schedule())})})}(e,t);if(kf(e))return function(e,t){return gn(e).pipe(Gf(t),Wf(t))}(e,t);if(Vf(e))return zf(e,t);if(Uf(e))return function(e,t){return new fe(n=>{let r;return mn(n,t,()=>{r=e[Bf](),mn(n,t,()=>{let o,i;try{({value:o,done:i}=r.next())}catch(s){return void n.error(s)}i?n.complete():n.next(o)},0,!0)}),()=>Y(null==r?void 0:r.return)&&r.return()})}(e,t);if($f(e))return function(e,t){return zf(Hf(e),t)}(e,t)}throw jf(e)}(e,t):gn(e)}function ls(e){return e<=0?()=>yn:ke((t,n)=>{let r=0;t.subscribe(new Le(n,o=>{++r<=e&&(n.next(o),e<=r&&n.complete())}))})}function gu(e,t,...n){return!0===t?(e(),null):!1===t?null:t(...n).pipe(ls(1)).subscribe(()=>e())}function te(e){for(let t in e)if(e[t]===te)return t;throw Error("Could not find renamed property on target object.")}function $(e){if("string"==typeof e)return e;if(Array.isArray(e))return"["+e.map($).join(", ")+"]";if(null==e)return""+e;if(e.overriddenName)return`${e.overriddenName}`;if(e.name)return`${e.name}`;const t=e.toString();if(null==t)return""+t;const n=t.indexOf("\n");return-1===n?t:t.substring(0,n)}function yu(e,t){return null==e||""===e?null===t?"":t:null==t||""===t?e:e+" "+t}const GC=te({__forward_ref__:te});function _u(e){return e.__forward_ref__=_u,e.toString=function(){return $(this())},e}function M(e){return function(e){return"function"==typeof e&&e.hasOwnProperty(GC)&&e.__forward_ref__===_u}(e)?e():e}class er extends Error{constructor(t,n){super(function(e,t){return`${e?`NG0${e}: `:""}${t}`}(t,n)),this.code=t}}function L(e){return"string"==typeof e?e:null==e?"":String(e)}function Ye(e){return"function"==typeof e?e.name||e.toString():"object"==typeof e&&null!=e&&"function"==typeof e.type?e.type.name||e.type.toString():L(e)}function cs(e,t){const n=t?` in ${t}`:"";throw new er("201",`No provider for ${Ye(e)} found${n}`)}function dt(e,t){null==e&&function(e,t,n,r){throw new Error(`ASSERTION ERROR: ${e}`+(null==r?"":` [Expected=> ${n} ${r} ${t} <=Actual]`))}(t,e,null,"!=")}function q(e){return{token:e.token,providedIn:e.providedIn||null,factory:e.factory,value:void 0}}function Dn(e){return{providers:e.providers||[],imports:e.imports||[]}}function vn(e){return Kf(e,ds)||Kf(e,Zf)}function Kf(e,t){return e.hasOwnProperty(t)?e[t]:null}function Yf(e){return e&&(e.hasOwnProperty(vu)||e.hasOwnProperty(XC))?e[vu]:null}const ds=te({\u0275prov:te}),vu=te({\u0275inj:te}),Zf=te({ngInjectableDef:te}),XC=te({ngInjectorDef:te});var R=(()=>((R=R||{})[R.Default=0]="Default",R[R.Host=1]="Host",R[R.Self=2]="Self",R[R.SkipSelf=4]="SkipSelf",R[R.Optional=8]="Optional",R))();let Cu;function Pn(e){const t=Cu;return Cu=e,t}function Jf(e,t,n){const r=vn(e);return r&&"root"==r.providedIn?void 0===r.value?r.value=r.factory():r.value:n&R.Optional?null:void 0!==t?t:void cs($(e),"Injector")}function Fn(e){return{toString:e}.toString()}var wt=(()=>((wt=wt||{})[wt.OnPush=0]="OnPush",wt[wt.Default=1]="Default",wt))(),ft=(()=>{return(e=ft||(ft={}))[e.Emulated=0]="Emulated",e[e.None=2]="None",e[e.ShadowDom=3]="ShadowDom",ft;var e})();const tE="undefined"!=typeof globalThis&&globalThis,nE="undefined"!=typeof window&&window,rE="undefined"!=typeof self&&"undefined"!=typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&self,X=tE||"undefined"!=typeof global&&global||nE||rE,Mr={},ne=[],fs=te({\u0275cmp:te}),Eu=te({\u0275dir:te}),wu=te({\u0275pipe:te}),Xf=te({\u0275mod:te}),Cn=te({\u0275fac:te}),Uo=te({__NG_ELEMENT_ID__:te});let oE=0;function Ar(e){return Fn(()=>{const n={},r={type:e.type,providersResolver:null,decls:e.decls,vars:e.vars,factory:null,template:e.template||null,consts:e.consts||null,ngContentSelectors:e.ngContentSelectors,hostBindings:e.hostBindings||null,hostVars:e.hostVars||0,hostAttrs:e.hostAttrs||null,contentQueries:e.contentQueries||null,declaredInputs:n,inputs:null,outputs:null,exportAs:e.exportAs||null,onPush:e.changeDetection===wt.OnPush,directiveDefs:null,pipeDefs:null,selectors:e.selectors||ne,viewQuery:e.viewQuery||null,features:e.features||null,data:e.data||{},encapsulation:e.encapsulation||ft.Emulated,id:"c",styles:e.styles||ne,_:null,setInput:null,schemas:e.schemas||null,tView:null},o=e.directives,i=e.features,s=e.pipes;return r.id+=oE++,r.inputs=rh(e.inputs,n),r.outputs=rh(e.outputs),i&&i.forEach(a=>a(r)),r.directiveDefs=o?()=>("function"==typeof o?o():o).map(eh):null,r.pipeDefs=s?()=>("function"==typeof s?s():s).map(th):null,r})}function eh(e){return He(e)||function(e){return e[Eu]||null}(e)}function th(e){return function(e){return e[wu]||null}(e)}const nh={};function tr(e){return Fn(()=>{const t={type:e.type,bootstrap:e.bootstrap||ne,declarations:e.declarations||ne,imports:e.imports||ne,exports:e.exports||ne,transitiveCompileScopes:null,schemas:e.schemas||null,id:e.id||null};return null!=e.id&&(nh[e.id]=e.type),t})}function rh(e,t){if(null==e)return Mr;const n={};for(const r in e)if(e.hasOwnProperty(r)){let o=e[r],i=o;Array.isArray(o)&&(i=o[1],o=o[0]),n[o]=r,t&&(t[o]=i)}return n}const Ue=Ar;function He(e){return e[fs]||null}function bt(e,t){const n=e[Xf]||null;if(!n&&!0===t)throw new Error(`Type ${$(e)} does not have '\u0275mod' property.`);return n}const B=11;function en(e){return Array.isArray(e)&&"object"==typeof e[1]}function Vt(e){return Array.isArray(e)&&!0===e[1]}function Tu(e){return 0!=(8&e.flags)}function ms(e){return 2==(2&e.flags)}function ys(e){return 1==(1&e.flags)}function jt(e){return null!==e.template}function cE(e){return 0!=(512&e[2])}function sr(e,t){return e.hasOwnProperty(Cn)?e[Cn]:null}class ih{constructor(t,n,r){this.previousValue=t,this.currentValue=n,this.firstChange=r}isFirstChange(){return this.firstChange}}function sh(e){return e.type.prototype.ngOnChanges&&(e.setInput=pE),hE}function hE(){const e=uh(this),t=null==e?void 0:e.current;if(t){const n=e.previous;if(n===Mr)e.previous=t;else for(let r in t)n[r]=t[r];e.current=null,this.ngOnChanges(t)}}function pE(e,t,n,r){const o=uh(e)||function(e,t){return e[ah]=t}(e,{previous:Mr,current:null}),i=o.current||(o.current={}),s=o.previous,a=this.declaredInputs[n],u=s[a];i[a]=new ih(u&&u.currentValue,t,s===Mr),e[r]=t}const ah="__ngSimpleChanges__";function uh(e){return e[ah]||null}const lh="http://www.w3.org/2000/svg";let Au;function he(e){return!!e.listen}const dh={createRenderer:(e,t)=>void 0!==Au?Au:"undefined"!=typeof document?document:void 0};function _e(e){for(;Array.isArray(e);)e=e[0];return e}function St(e,t){return _e(t[e.index])}function xu(e,t){return e.data[t]}function pt(e,t){const n=t[e];return en(n)?n:n[0]}function Nu(e){return 128==(128&e[2])}function kn(e,t){return null==t?null:e[t]}function hh(e){e[18]=0}function Pu(e,t){e[5]+=t;let n=e,r=e[3];for(;null!==r&&(1===t&&1===n[5]||-1===t&&0===n[5]);)r[5]+=t,n=r,r=r[3]}const F={lFrame:Ch(null),bindingsEnabled:!0,isInCheckNoChangesMode:!1};function ph(){return F.bindingsEnabled}function C(){return F.lFrame.lView}function Z(){return F.lFrame.tView}function Ee(){let e=gh();for(;null!==e&&64===e.type;)e=e.parent;return e}function gh(){return F.lFrame.currentTNode}function tn(e,t){const n=F.lFrame;n.currentTNode=e,n.isParent=t}function Fu(){return F.lFrame.isParent}function Ds(){return F.isInCheckNoChangesMode}function vs(e){F.isInCheckNoChangesMode=e}function Or(){return F.lFrame.bindingIndex++}function RE(e,t){const n=F.lFrame;n.bindingIndex=n.bindingRootIndex=e,ku(t)}function ku(e){F.lFrame.currentDirectiveIndex=e}function Vu(e){F.lFrame.currentQueryIndex=e}function NE(e){const t=e[1];return 2===t.type?t.declTNode:1===t.type?e[6]:null}function Dh(e,t,n){if(n&R.SkipSelf){let o=t,i=e;for(;!(o=o.parent,null!==o||n&R.Host||(o=NE(i),null===o||(i=i[15],10&o.type))););if(null===o)return!1;t=o,e=i}const r=F.lFrame=vh();return r.currentTNode=t,r.lView=e,!0}function Cs(e){const t=vh(),n=e[1];F.lFrame=t,t.currentTNode=n.firstChild,t.lView=e,t.tView=n,t.contextLView=e,t.bindingIndex=n.bindingStartIndex,t.inI18n=!1}function vh(){const e=F.lFrame,t=null===e?null:e.child;return null===t?Ch(e):t}function Ch(e){const t={currentTNode:null,isParent:!0,lView:null,tView:null,selectedIndex:-1,contextLView:null,elementDepthCount:0,currentNamespace:null,currentDirectiveIndex:-1,bindingRootIndex:-1,bindingIndex:-1,currentQueryIndex:0,parent:e,child:null,inI18n:!1};return null!==e&&(e.child=t),t}function Eh(){const e=F.lFrame;return F.lFrame=e.parent,e.currentTNode=null,e.lView=null,e}const wh=Eh;function Es(){const e=Eh();e.isParent=!0,e.tView=null,e.selectedIndex=-1,e.contextLView=null,e.elementDepthCount=0,e.currentDirectiveIndex=-1,e.currentNamespace=null,e.bindingRootIndex=-1,e.bindingIndex=-1,e.currentQueryIndex=0}function Je(){return F.lFrame.selectedIndex}function Ln(e){F.lFrame.selectedIndex=e}function ju(){F.lFrame.currentNamespace=lh}function Bu(){F.lFrame.currentNamespace=null}function ws(e,t){for(let n=t.directiveStart,r=t.directiveEnd;n<r;n++){const i=e.data[n].type.prototype,{ngAfterContentInit:s,ngAfterContentChecked:a,ngAfterViewInit:u,ngAfterViewChecked:l,ngOnDestroy:c}=i;s&&(e.contentHooks||(e.contentHooks=[])).push(-n,s),a&&((e.contentHooks||(e.contentHooks=[])).push(n,a),(e.contentCheckHooks||(e.contentCheckHooks=[])).push(n,a)),u&&(e.viewHooks||(e.viewHooks=[])).push(-n,u),l&&((e.viewHooks||(e.viewHooks=[])).push(n,l),(e.viewCheckHooks||(e.viewCheckHooks=[])).push(n,l)),null!=c&&(e.destroyHooks||(e.destroyHooks=[])).push(n,c)}}function bs(e,t,n){bh(e,t,3,n)}function Is(e,t,n,r){(3&e[2])===n&&bh(e,t,n,r)}function Uu(e,t){let n=e[2];(3&n)===t&&(n&=2047,n+=1,e[2]=n)}function bh(e,t,n,r){const i=null!=r?r:-1,s=t.length-1;let a=0;for(let u=void 0!==r?65535&e[18]:0;u<s;u++)if("number"==typeof t[u+1]){if(a=t[u],null!=r&&a>=r)break}else t[u]<0&&(e[18]+=65536),(a<i||-1==i)&&(jE(e,n,t,u),e[18]=(4294901760&e[18])+u+2),u++}function jE(e,t,n,r){const o=n[r]<0,i=n[r+1],a=e[o?-n[r]:n[r]];if(o){if(e[2]>>11<e[18]>>16&&(3&e[2])===t){e[2]+=2048;try{i.call(a)}finally{}}}else try{i.call(a)}finally{}}class Go{constructor(t,n,r){this.factory=t,this.resolving=!1,this.canSeeViewProviders=n,this.injectImpl=r}}function Ts(e,t,n){const r=he(e);let o=0;for(;o<n.length;){const i=n[o];if("number"==typeof i){if(0!==i)break;o++;const s=n[o++],a=n[o++],u=n[o++];r?e.setAttribute(t,a,u,s):t.setAttributeNS(s,a,u)}else{const s=i,a=n[++o];$u(s)?r&&e.setProperty(t,s,a):r?e.setAttribute(t,s,a):t.setAttribute(s,a),o++}}return o}function Ih(e){return 3===e||4===e||6===e}function $u(e){return 64===e.charCodeAt(0)}function Ss(e,t){if(null!==t&&0!==t.length)if(null===e||0===e.length)e=t.slice();else{let n=-1;for(let r=0;r<t.length;r++){const o=t[r];"number"==typeof o?n=o:0===n||Th(e,n,o,null,-1===n||2===n?t[++r]:null)}}return e}function Th(e,t,n,r,o){let i=0,s=e.length;if(-1===t)s=-1;else for(;i<e.length;){const a=e[i++];if("number"==typeof a){if(a===t){s=-1;break}if(a>t){s=i-1;break}}}for(;i<e.length;){const a=e[i];if("number"==typeof a)break;if(a===n){if(null===r)return void(null!==o&&(e[i+1]=o));if(r===e[i+1])return void(e[i+2]=o)}i++,null!==r&&i++,null!==o&&i++}-1!==s&&(e.splice(s,0,t),i=s+1),e.splice(i++,0,n),null!==r&&e.splice(i++,0,r),null!==o&&e.splice(i++,0,o)}function Sh(e){return-1!==e}function kr(e){return 32767&e}function Lr(e,t){let n=function(e){return e>>16}(e),r=t;for(;n>0;)r=r[15],n--;return r}let qu=!0;function Ms(e){const t=qu;return qu=e,t}let WE=0;function Qo(e,t){const n=Gu(e,t);if(-1!==n)return n;const r=t[1];r.firstCreatePass&&(e.injectorIndex=t.length,Wu(r.data,e),Wu(t,null),Wu(r.blueprint,null));const o=As(e,t),i=e.injectorIndex;if(Sh(o)){const s=kr(o),a=Lr(o,t),u=a[1].data;for(let l=0;l<8;l++)t[i+l]=a[s+l]|u[s+l]}return t[i+8]=o,i}function Wu(e,t){e.push(0,0,0,0,0,0,0,0,t)}function Gu(e,t){return-1===e.injectorIndex||e.parent&&e.parent.injectorIndex===e.injectorIndex||null===t[e.injectorIndex+8]?-1:e.injectorIndex}function As(e,t){if(e.parent&&-1!==e.parent.injectorIndex)return e.parent.injectorIndex;let n=0,r=null,o=t;for(;null!==o;){const i=o[1],s=i.type;if(r=2===s?i.declTNode:1===s?o[6]:null,null===r)return-1;if(n++,o=o[15],-1!==r.injectorIndex)return r.injectorIndex|n<<16}return-1}function Rs(e,t,n){!function(e,t,n){let r;"string"==typeof n?r=n.charCodeAt(0)||0:n.hasOwnProperty(Uo)&&(r=n[Uo]),null==r&&(r=n[Uo]=WE++);const o=255&r;t.data[e+(o>>5)]|=1<<o}(e,t,n)}function Rh(e,t,n){if(n&R.Optional)return e;cs(t,"NodeInjector")}function xh(e,t,n,r){if(n&R.Optional&&void 0===r&&(r=null),0==(n&(R.Self|R.Host))){const o=e[9],i=Pn(void 0);try{return o?o.get(t,r,n&R.Optional):Jf(t,r,n&R.Optional)}finally{Pn(i)}}return Rh(r,t,n)}function Nh(e,t,n,r=R.Default,o){if(null!==e){const i=function(e){if("string"==typeof e)return e.charCodeAt(0)||0;const t=e.hasOwnProperty(Uo)?e[Uo]:void 0;return"number"==typeof t?t>=0?255&t:QE:t}(n);if("function"==typeof i){if(!Dh(t,e,r))return r&R.Host?Rh(o,n,r):xh(t,n,r,o);try{const s=i(r);if(null!=s||r&R.Optional)return s;cs(n)}finally{wh()}}else if("number"==typeof i){let s=null,a=Gu(e,t),u=-1,l=r&R.Host?t[16][6]:null;for((-1===a||r&R.SkipSelf)&&(u=-1===a?As(e,t):t[a+8],-1!==u&&Oh(r,!1)?(s=t[1],a=kr(u),t=Lr(u,t)):a=-1);-1!==a;){const c=t[1];if(Fh(i,a,c.data)){const d=KE(a,t,n,s,r,l);if(d!==Ph)return d}u=t[a+8],-1!==u&&Oh(r,t[1].data[a+8]===l)&&Fh(i,a,t)?(s=c,a=kr(u),t=Lr(u,t)):a=-1}}}return xh(t,n,r,o)}const Ph={};function QE(){return new Vr(Ee(),C())}function KE(e,t,n,r,o,i){const s=t[1],a=s.data[e+8],c=function(e,t,n,r,o){const i=e.providerIndexes,s=t.data,a=1048575&i,u=e.directiveStart,c=i>>20,f=o?a+c:e.directiveEnd;for(let h=r?a:a+c;h<f;h++){const m=s[h];if(h<u&&n===m||h>=u&&m.type===n)return h}if(o){const h=s[u];if(h&&jt(h)&&h.type===n)return u}return null}(a,s,n,null==r?ms(a)&&qu:r!=s&&0!=(3&a.type),o&R.Host&&i===a);return null!==c?Ko(t,s,c,a):Ph}function Ko(e,t,n,r){let o=e[n];const i=t.data;if(function(e){return e instanceof Go}(o)){const s=o;s.resolving&&function(e,t){throw new er("200",`Circular dependency in DI detected for ${e}`)}(Ye(i[n]));const a=Ms(s.canSeeViewProviders);s.resolving=!0;const u=s.injectImpl?Pn(s.injectImpl):null;Dh(e,r,R.Default);try{o=e[n]=s.factory(void 0,i,e,r),t.firstCreatePass&&n>=r.directiveStart&&function(e,t,n){const{ngOnChanges:r,ngOnInit:o,ngDoCheck:i}=t.type.prototype;if(r){const s=sh(t);(n.preOrderHooks||(n.preOrderHooks=[])).push(e,s),(n.preOrderCheckHooks||(n.preOrderCheckHooks=[])).push(e,s)}o&&(n.preOrderHooks||(n.preOrderHooks=[])).push(0-e,o),i&&((n.preOrderHooks||(n.preOrderHooks=[])).push(e,i),(n.preOrderCheckHooks||(n.preOrderCheckHooks=[])).push(e,i))}(n,i[n],t)}finally{null!==u&&Pn(u),Ms(a),s.resolving=!1,wh()}}return o}function Fh(e,t,n){return!!(n[t+(e>>5)]&1<<e)}function Oh(e,t){return!(e&R.Self||e&R.Host&&t)}class Vr{constructor(t,n){this._tNode=t,this._lView=n}get(t,n,r){return Nh(this._tNode,this._lView,t,r,n)}}const Br="__parameters__";function ur(e,t,n){return Fn(()=>{const r=function(e){return function(...n){if(e){const r=e(...n);for(const o in r)this[o]=r[o]}}}(t);function o(...i){if(this instanceof o)return r.apply(this,i),this;const s=new o(...i);return a.annotation=s,a;function a(u,l,c){const d=u.hasOwnProperty(Br)?u[Br]:Object.defineProperty(u,Br,{value:[]})[Br];for(;d.length<=c;)d.push(null);return(d[c]=d[c]||[]).push(s),u}}return n&&(o.prototype=Object.create(n.prototype)),o.prototype.ngMetadataName=e,o.annotationCls=o,o})}class J{constructor(t,n){this._desc=t,this.ngMetadataName="InjectionToken",this.\u0275prov=void 0,"number"==typeof n?this.__NG_ELEMENT_ID__=n:void 0!==n&&(this.\u0275prov=q({token:this,providedIn:n.providedIn||"root",factory:n.factory}))}toString(){return`InjectionToken ${this._desc}`}}const ew=new J("AnalyzeForEntryComponents");function nn(e,t){e.forEach(n=>Array.isArray(n)?nn(n,t):t(n))}function Ns(e,t,n){t>=e.length?e.push(n):e.splice(t,0,n)}function lr(e,t){return t>=e.length-1?e.pop():e.splice(t,1)[0]}const ti={},Ju="__NG_DI_FLAG__",$r="ngTempTokenPath",cw=/\n/gm,Xu="__source",el=te({provide:String,useValue:te});let ni;function qr(e){const t=ni;return ni=e,t}function fw(e,t=R.Default){if(void 0===ni)throw new Error("inject() must be called from an injection context");return null===ni?Jf(e,void 0,t):ni.get(e,t&R.Optional?null:void 0,t)}function A(e,t=R.Default){return(Cu||fw)(M(e),t)}function cr(e){const t=[];for(let n=0;n<e.length;n++){const r=M(e[n]);if(Array.isArray(r)){if(0===r.length)throw new Error("Arguments array must have arguments.");let o,i=R.Default;for(let s=0;s<r.length;s++){const a=r[s],u=hw(a);"number"==typeof u?-1===u?o=a.token:i|=u:o=a}t.push(A(o,i))}else t.push(A(r))}return t}function ri(e,t){return e[Ju]=t,e.prototype[Ju]=t,e}function hw(e){return e[Ju]}function Bh(e,t,n,r){const o=e[$r];throw t[Xu]&&o.unshift(t[Xu]),e.message=function(e,t,n,r=null){e=e&&"\n"===e.charAt(0)&&"\u0275"==e.charAt(1)?e.substr(2):e;let o=$(t);if(Array.isArray(t))o=t.map($).join(" -> ");else if("object"==typeof t){let i=[];for(let s in t)if(t.hasOwnProperty(s)){let a=t[s];i.push(s+":"+("string"==typeof a?JSON.stringify(a):$(a)))}o=`{${i.join(", ")}}`}return`${n}${r?"("+r+")":""}[${o}]: ${e.replace(cw,"\n  ")}`}("\n"+e.message,o,n,r),e.ngTokenPath=o,e[$r]=null,e}const Wr=ri(ur("Inject",e=>({token:e})),-1),at=ri(ur("Optional"),8),Bn=ri(ur("SkipSelf"),4),ip="__ngContext__";function qe(e,t){e[ip]=t}function cl(e){const t=function(e){return e[ip]||null}(e);return t?Array.isArray(t)?t:t.lView:null}function js(e){return e.ngOriginalError}function sb(e,...t){e.error(...t)}class fr{constructor(){this._console=console}handleError(t){const n=this._findOriginalError(t),r=this._findContext(t),o=(e=t)&&e.ngErrorLogger||sb;var e;o(this._console,"ERROR",t),n&&o(this._console,"ORIGINAL ERROR",n),r&&o(this._console,"ERROR CONTEXT",r)}_findContext(t){return t?t.ngDebugContext||this._findContext(js(t)):null}_findOriginalError(t){let n=t&&js(t);for(;n&&js(n);)n=js(n);return n||null}}const pp=(()=>("undefined"!=typeof requestAnimationFrame&&requestAnimationFrame||setTimeout).bind(X))();function sn(e){return e instanceof Function?e():e}var yt=(()=>((yt=yt||{})[yt.Important=1]="Important",yt[yt.DashCase=2]="DashCase",yt))();function hl(e,t){return undefined(e,t)}function li(e){const t=e[3];return Vt(t)?t[3]:t}function pl(e){return Dp(e[13])}function gl(e){return Dp(e[4])}function Dp(e){for(;null!==e&&!Vt(e);)e=e[4];return e}function Kr(e,t,n,r,o){if(null!=r){let i,s=!1;Vt(r)?i=r:en(r)&&(s=!0,r=r[0]);const a=_e(r);0===e&&null!==n?null==o?Ip(t,n,a):hr(t,n,a,o||null,!0):1===e&&null!==n?hr(t,n,a,o||null,!0):2===e?function(e,t,n){const r=Us(e,t);r&&function(e,t,n,r){he(e)?e.removeChild(t,n,r):t.removeChild(n)}(e,r,t,n)}(t,a,s):3===e&&t.destroyNode(a),null!=i&&function(e,t,n,r,o){const i=n[7];i!==_e(n)&&Kr(t,e,r,i,o);for(let a=10;a<n.length;a++){const u=n[a];ci(u[1],u,e,t,r,i)}}(t,e,i,n,o)}}function yl(e,t,n){return he(e)?e.createElement(t,n):null===n?e.createElement(t):e.createElementNS(n,t)}function Cp(e,t){const n=e[9],r=n.indexOf(t),o=t[3];1024&t[2]&&(t[2]&=-1025,Pu(o,-1)),n.splice(r,1)}function _l(e,t){if(e.length<=10)return;const n=10+t,r=e[n];if(r){const o=r[17];null!==o&&o!==e&&Cp(o,r),t>0&&(e[n-1][4]=r[4]);const i=lr(e,10+t);!function(e,t){ci(e,t,t[B],2,null,null),t[0]=null,t[6]=null}(r[1],r);const s=i[19];null!==s&&s.detachView(i[1]),r[3]=null,r[4]=null,r[2]&=-129}return r}function Ep(e,t){if(!(256&t[2])){const n=t[B];he(n)&&n.destroyNode&&ci(e,t,n,3,null,null),function(e){let t=e[13];if(!t)return Dl(e[1],e);for(;t;){let n=null;if(en(t))n=t[13];else{const r=t[10];r&&(n=r)}if(!n){for(;t&&!t[4]&&t!==e;)en(t)&&Dl(t[1],t),t=t[3];null===t&&(t=e),en(t)&&Dl(t[1],t),n=t&&t[4]}t=n}}(t)}}function Dl(e,t){if(!(256&t[2])){t[2]&=-129,t[2]|=256,function(e,t){let n;if(null!=e&&null!=(n=e.destroyHooks))for(let r=0;r<n.length;r+=2){const o=t[n[r]];if(!(o instanceof Go)){const i=n[r+1];if(Array.isArray(i))for(let s=0;s<i.length;s+=2){const a=o[i[s]],u=i[s+1];try{u.call(a)}finally{}}else try{i.call(o)}finally{}}}}(e,t),function(e,t){const n=e.cleanup,r=t[7];let o=-1;if(null!==n)for(let i=0;i<n.length-1;i+=2)if("string"==typeof n[i]){const s=n[i+1],a="function"==typeof s?s(t):_e(t[s]),u=r[o=n[i+2]],l=n[i+3];"boolean"==typeof l?a.removeEventListener(n[i],u,l):l>=0?r[o=l]():r[o=-l].unsubscribe(),i+=2}else{const s=r[o=n[i+1]];n[i].call(s)}if(null!==r){for(let i=o+1;i<r.length;i++)r[i]();t[7]=null}}(e,t),1===t[1].type&&he(t[B])&&t[B].destroy();const n=t[17];if(null!==n&&Vt(t[3])){n!==t[3]&&Cp(n,t);const r=t[19];null!==r&&r.detachView(e)}}}function wp(e,t,n){return function(e,t,n){let r=t;for(;null!==r&&40&r.type;)r=(t=r).parent;if(null===r)return n[0];if(2&r.flags){const o=e.data[r.directiveStart].encapsulation;if(o===ft.None||o===ft.Emulated)return null}return St(r,n)}(e,t.parent,n)}function hr(e,t,n,r,o){he(e)?e.insertBefore(t,n,r,o):t.insertBefore(n,r,o)}function Ip(e,t,n){he(e)?e.appendChild(t,n):t.appendChild(n)}function Tp(e,t,n,r,o){null!==r?hr(e,t,n,r,o):Ip(e,t,n)}function Us(e,t){return he(e)?e.parentNode(t):t.parentNode}let Ap=function(e,t,n){return 40&e.type?St(e,n):null};function Hs(e,t,n,r){const o=wp(e,r,t),i=t[B],a=function(e,t,n){return Ap(e,t,n)}(r.parent||t[6],r,t);if(null!=o)if(Array.isArray(n))for(let u=0;u<n.length;u++)Tp(i,o,n[u],a,!1);else Tp(i,o,n,a,!1)}function $s(e,t){if(null!==t){const n=t.type;if(3&n)return St(t,e);if(4&n)return Cl(-1,e[t.index]);if(8&n){const r=t.child;if(null!==r)return $s(e,r);{const o=e[t.index];return Vt(o)?Cl(-1,o):_e(o)}}if(32&n)return hl(t,e)()||_e(e[t.index]);{const r=xp(e,t);return null!==r?Array.isArray(r)?r[0]:$s(li(e[16]),r):$s(e,t.next)}}return null}function xp(e,t){return null!==t?e[16][6].projection[t.projection]:null}function Cl(e,t){const n=10+e+1;if(n<t.length){const r=t[n],o=r[1].firstChild;if(null!==o)return $s(r,o)}return t[7]}function El(e,t,n,r,o,i,s){for(;null!=n;){const a=r[n.index],u=n.type;if(s&&0===t&&(a&&qe(_e(a),r),n.flags|=4),64!=(64&n.flags))if(8&u)El(e,t,n.child,r,o,i,!1),Kr(t,e,o,a,i);else if(32&u){const l=hl(n,r);let c;for(;c=l();)Kr(t,e,o,c,i);Kr(t,e,o,a,i)}else 16&u?Pp(e,t,r,n,o,i):Kr(t,e,o,a,i);n=s?n.projectionNext:n.next}}function ci(e,t,n,r,o,i){El(n,r,e.firstChild,t,o,i,!1)}function Pp(e,t,n,r,o,i){const s=n[16],u=s[6].projection[r.projection];if(Array.isArray(u))for(let l=0;l<u.length;l++)Kr(t,e,o,u[l],i);else El(e,t,u,s[3],o,i,!0)}function Fp(e,t,n){he(e)?e.setAttribute(t,"style",n):t.style.cssText=n}function wl(e,t,n){he(e)?""===n?e.removeAttribute(t,"class"):e.setAttribute(t,"class",n):t.className=n}function Op(e,t,n){let r=e.length;for(;;){const o=e.indexOf(t,n);if(-1===o)return o;if(0===o||e.charCodeAt(o-1)<=32){const i=t.length;if(o+i===r||e.charCodeAt(o+i)<=32)return o}n=o+1}}const kp="ng-template";function Nb(e,t,n){let r=0;for(;r<e.length;){let o=e[r++];if(n&&"class"===o){if(o=e[r],-1!==Op(o.toLowerCase(),t,0))return!0}else if(1===o){for(;r<e.length&&"string"==typeof(o=e[r++]);)if(o.toLowerCase()===t)return!0;return!1}}return!1}function Lp(e){return 4===e.type&&e.value!==kp}function Pb(e,t,n){return t===(4!==e.type||n?e.value:kp)}function Fb(e,t,n){let r=4;const o=e.attrs||[],i=function(e){for(let t=0;t<e.length;t++)if(Ih(e[t]))return t;return e.length}(o);let s=!1;for(let a=0;a<t.length;a++){const u=t[a];if("number"!=typeof u){if(!s)if(4&r){if(r=2|1&r,""!==u&&!Pb(e,u,n)||""===u&&1===t.length){if(Bt(r))return!1;s=!0}}else{const l=8&r?u:t[++a];if(8&r&&null!==e.attrs){if(!Nb(e.attrs,l,n)){if(Bt(r))return!1;s=!0}continue}const d=Ob(8&r?"class":u,o,Lp(e),n);if(-1===d){if(Bt(r))return!1;s=!0;continue}if(""!==l){let f;f=d>i?"":o[d+1].toLowerCase();const h=8&r?f:null;if(h&&-1!==Op(h,l,0)||2&r&&l!==f){if(Bt(r))return!1;s=!0}}}}else{if(!s&&!Bt(r)&&!Bt(u))return!1;if(s&&Bt(u))continue;s=!1,r=u|1&r}}return Bt(r)||s}function Bt(e){return 0==(1&e)}function Ob(e,t,n,r){if(null===t)return-1;let o=0;if(r||!n){let i=!1;for(;o<t.length;){const s=t[o];if(s===e)return o;if(3===s||6===s)i=!0;else{if(1===s||2===s){let a=t[++o];for(;"string"==typeof a;)a=t[++o];continue}if(4===s)break;if(0===s){o+=4;continue}}o+=i?1:2}return-1}return function(e,t){let n=e.indexOf(4);if(n>-1)for(n++;n<e.length;){const r=e[n];if("number"==typeof r)return-1;if(r===t)return n;n++}return-1}(t,e)}function Vp(e,t,n=!1){for(let r=0;r<t.length;r++)if(Fb(e,t[r],n))return!0;return!1}function jp(e,t){return e?":not("+t.trim()+")":t}function Bb(e){let t=e[0],n=1,r=2,o="",i=!1;for(;n<e.length;){let s=e[n];if("string"==typeof s)if(2&r){const a=e[++n];o+="["+s+(a.length>0?'="'+a+'"':"")+"]"}else 8&r?o+="."+s:4&r&&(o+=" "+s);else""!==o&&!Bt(s)&&(t+=jp(i,o),o=""),r=s,i=i||!Bt(r);n++}return""!==o&&(t+=jp(i,o)),t}const V={};function z(e){Bp(Z(),C(),Je()+e,Ds())}function Bp(e,t,n,r){if(!r)if(3==(3&t[2])){const i=e.preOrderCheckHooks;null!==i&&bs(t,i,n)}else{const i=e.preOrderHooks;null!==i&&Is(t,i,0,n)}Ln(n)}function Zp(e,t){const n=e.contentQueries;if(null!==n)for(let r=0;r<n.length;r+=2){const o=n[r],i=n[r+1];if(-1!==i){const s=e.data[i];Vu(o),s.contentQueries(2,t[i],i)}}}function di(e,t,n,r,o,i,s,a,u,l){const c=t.blueprint.slice();return c[0]=o,c[2]=140|r,hh(c),c[3]=c[15]=e,c[8]=n,c[10]=s||e&&e[10],c[B]=a||e&&e[B],c[12]=u||e&&e[12]||null,c[9]=l||e&&e[9]||null,c[6]=i,c[16]=2==t.type?e[16]:c,c}function Yr(e,t,n,r,o){let i=e.data[t];if(null===i)i=function(e,t,n,r,o){const i=gh(),s=Fu(),u=e.data[t]=function(e,t,n,r,o,i){return{type:n,index:r,insertBeforeIndex:null,injectorIndex:t?t.injectorIndex:-1,directiveStart:-1,directiveEnd:-1,directiveStylingLast:-1,propertyBindings:null,flags:0,providerIndexes:0,value:o,attrs:i,mergedAttrs:null,localNames:null,initialInputs:void 0,inputs:null,outputs:null,tViews:null,next:null,projectionNext:null,child:null,parent:t,projection:null,styles:null,stylesWithoutHost:null,residualStyles:void 0,classes:null,classesWithoutHost:null,residualClasses:void 0,classBindings:0,styleBindings:0}}(0,s?i:i&&i.parent,n,t,r,o);return null===e.firstChild&&(e.firstChild=u),null!==i&&(s?null==i.child&&null!==u.parent&&(i.child=u):null===i.next&&(i.next=u)),u}(e,t,n,r,o),F.lFrame.inI18n&&(i.flags|=64);else if(64&i.type){i.type=n,i.value=r,i.attrs=o;const s=function(){const e=F.lFrame,t=e.currentTNode;return e.isParent?t:t.parent}();i.injectorIndex=null===s?-1:s.injectorIndex}return tn(i,!0),i}function Zr(e,t,n,r){if(0===n)return-1;const o=t.length;for(let i=0;i<n;i++)t.push(r),e.blueprint.push(r),e.data.push(null);return o}function fi(e,t,n){Cs(t);try{const r=e.viewQuery;null!==r&&ql(1,r,n);const o=e.template;null!==o&&Jp(e,t,o,1,n),e.firstCreatePass&&(e.firstCreatePass=!1),e.staticContentQueries&&Zp(e,t),e.staticViewQueries&&ql(2,e.viewQuery,n);const i=e.components;null!==i&&function(e,t){for(let n=0;n<t.length;n++)w0(e,t[n])}(t,i)}catch(r){throw e.firstCreatePass&&(e.incompleteFirstPass=!0,e.firstCreatePass=!1),r}finally{t[2]&=-5,Es()}}function Jr(e,t,n,r){const o=t[2];if(256==(256&o))return;Cs(t);const i=Ds();try{hh(t),function(e){F.lFrame.bindingIndex=e}(e.bindingStartIndex),null!==n&&Jp(e,t,n,2,r);const s=3==(3&o);if(!i)if(s){const l=e.preOrderCheckHooks;null!==l&&bs(t,l,null)}else{const l=e.preOrderHooks;null!==l&&Is(t,l,0,null),Uu(t,0)}if(function(e){for(let t=pl(e);null!==t;t=gl(t)){if(!t[2])continue;const n=t[9];for(let r=0;r<n.length;r++){const o=n[r],i=o[3];0==(1024&o[2])&&Pu(i,1),o[2]|=1024}}}(t),function(e){for(let t=pl(e);null!==t;t=gl(t))for(let n=10;n<t.length;n++){const r=t[n],o=r[1];Nu(r)&&Jr(o,r,o.template,r[8])}}(t),null!==e.contentQueries&&Zp(e,t),!i)if(s){const l=e.contentCheckHooks;null!==l&&bs(t,l)}else{const l=e.contentHooks;null!==l&&Is(t,l,1),Uu(t,1)}!function(e,t){const n=e.hostBindingOpCodes;if(null!==n)try{for(let r=0;r<n.length;r++){const o=n[r];if(o<0)Ln(~o);else{const i=o,s=n[++r],a=n[++r];RE(s,i),a(2,t[i])}}}finally{Ln(-1)}}(e,t);const a=e.components;null!==a&&function(e,t){for(let n=0;n<t.length;n++)E0(e,t[n])}(t,a);const u=e.viewQuery;if(null!==u&&ql(2,u,r),!i)if(s){const l=e.viewCheckHooks;null!==l&&bs(t,l)}else{const l=e.viewHooks;null!==l&&Is(t,l,2),Uu(t,2)}!0===e.firstUpdatePass&&(e.firstUpdatePass=!1),i||(t[2]&=-73),1024&t[2]&&(t[2]&=-1025,Pu(t[3],-1))}finally{Es()}}function n0(e,t,n,r){const o=t[10],i=!Ds(),s=function(e){return 4==(4&e[2])}(t);try{i&&!s&&o.begin&&o.begin(),s&&fi(e,t,r),Jr(e,t,n,r)}finally{i&&!s&&o.end&&o.end()}}function Jp(e,t,n,r,o){const i=Je(),s=2&r;try{Ln(-1),s&&t.length>20&&Bp(e,t,20,Ds()),n(r,o)}finally{Ln(i)}}function kl(e,t,n){!ph()||(function(e,t,n,r){const o=n.directiveStart,i=n.directiveEnd;e.firstCreatePass||Qo(n,t),qe(r,t);const s=n.initialInputs;for(let a=o;a<i;a++){const u=e.data[a],l=jt(u);l&&y0(t,n,u);const c=Ko(t,e,a,n);qe(c,t),null!==s&&_0(0,a-o,c,u,0,s),l&&(pt(n.index,t)[8]=c)}}(e,t,n,St(n,t)),128==(128&n.flags)&&function(e,t,n){const r=n.directiveStart,o=n.directiveEnd,s=n.index,a=F.lFrame.currentDirectiveIndex;try{Ln(s);for(let u=r;u<o;u++){const l=e.data[u],c=t[u];ku(u),(null!==l.hostBindings||0!==l.hostVars||null!==l.hostAttrs)&&ag(l,c)}}finally{Ln(-1),ku(a)}}(e,t,n))}function Ll(e,t,n=St){const r=t.localNames;if(null!==r){let o=t.index+1;for(let i=0;i<r.length;i+=2){const s=r[i+1],a=-1===s?n(t,e):e[s];e[o++]=a}}}function eg(e){const t=e.tView;return null===t||t.incompleteFirstPass?e.tView=zs(1,null,e.template,e.decls,e.vars,e.directiveDefs,e.pipeDefs,e.viewQuery,e.schemas,e.consts):t}function zs(e,t,n,r,o,i,s,a,u,l){const c=20+r,d=c+o,f=function(e,t){const n=[];for(let r=0;r<t;r++)n.push(r<e?null:V);return n}(c,d),h="function"==typeof l?l():l;return f[1]={type:e,blueprint:f,template:n,queries:null,viewQuery:a,declTNode:t,data:f.slice().fill(null,c),bindingStartIndex:c,expandoStartIndex:d,hostBindingOpCodes:null,firstCreatePass:!0,firstUpdatePass:!0,staticViewQueries:!1,staticContentQueries:!1,preOrderHooks:null,preOrderCheckHooks:null,contentHooks:null,contentCheckHooks:null,viewHooks:null,viewCheckHooks:null,destroyHooks:null,cleanup:null,contentQueries:null,components:null,directiveRegistry:"function"==typeof i?i():i,pipeRegistry:"function"==typeof s?s():s,firstChild:null,schemas:u,consts:h,incompleteFirstPass:!1}}function og(e,t,n){for(let r in e)if(e.hasOwnProperty(r)){const o=e[r];(n=null===n?{}:n).hasOwnProperty(r)?n[r].push(t,o):n[r]=[t,o]}return n}function Vl(e,t,n,r){let o=!1;if(ph()){const i=function(e,t,n){const r=e.directiveRegistry;let o=null;if(r)for(let i=0;i<r.length;i++){const s=r[i];Vp(n,s.selectors,!1)&&(o||(o=[]),Rs(Qo(n,t),e,s.type),jt(s)?(ug(e,n),o.unshift(s)):o.push(s))}return o}(e,t,n),s=null===r?null:{"":-1};if(null!==i){o=!0,lg(n,e.data.length,i.length);for(let c=0;c<i.length;c++){const d=i[c];d.providersResolver&&d.providersResolver(d)}let a=!1,u=!1,l=Zr(e,t,i.length,null);for(let c=0;c<i.length;c++){const d=i[c];n.mergedAttrs=Ss(n.mergedAttrs,d.hostAttrs),cg(e,n,t,l,d),m0(l,d,s),null!==d.contentQueries&&(n.flags|=8),(null!==d.hostBindings||null!==d.hostAttrs||0!==d.hostVars)&&(n.flags|=128);const f=d.type.prototype;!a&&(f.ngOnChanges||f.ngOnInit||f.ngDoCheck)&&((e.preOrderHooks||(e.preOrderHooks=[])).push(n.index),a=!0),!u&&(f.ngOnChanges||f.ngDoCheck)&&((e.preOrderCheckHooks||(e.preOrderCheckHooks=[])).push(n.index),u=!0),l++}!function(e,t){const r=t.directiveEnd,o=e.data,i=t.attrs,s=[];let a=null,u=null;for(let l=t.directiveStart;l<r;l++){const c=o[l],d=c.inputs,f=null===i||Lp(t)?null:D0(d,i);s.push(f),a=og(d,l,a),u=og(c.outputs,l,u)}null!==a&&(a.hasOwnProperty("class")&&(t.flags|=16),a.hasOwnProperty("style")&&(t.flags|=32)),t.initialInputs=s,t.inputs=a,t.outputs=u}(e,n)}s&&function(e,t,n){if(t){const r=e.localNames=[];for(let o=0;o<t.length;o+=2){const i=n[t[o+1]];if(null==i)throw new er("301",`Export of name '${t[o+1]}' not found!`);r.push(t[o],i)}}}(n,r,s)}return n.mergedAttrs=Ss(n.mergedAttrs,n.attrs),o}function sg(e,t,n,r,o,i){const s=i.hostBindings;if(s){let a=e.hostBindingOpCodes;null===a&&(a=e.hostBindingOpCodes=[]);const u=~t.index;(function(e){let t=e.length;for(;t>0;){const n=e[--t];if("number"==typeof n&&n<0)return n}return 0})(a)!=u&&a.push(u),a.push(r,o,s)}}function ag(e,t){null!==e.hostBindings&&e.hostBindings(1,t)}function ug(e,t){t.flags|=2,(e.components||(e.components=[])).push(t.index)}function m0(e,t,n){if(n){if(t.exportAs)for(let r=0;r<t.exportAs.length;r++)n[t.exportAs[r]]=e;jt(t)&&(n[""]=e)}}function lg(e,t,n){e.flags|=1,e.directiveStart=t,e.directiveEnd=t+n,e.providerIndexes=t}function cg(e,t,n,r,o){e.data[r]=o;const i=o.factory||(o.factory=sr(o.type)),s=new Go(i,jt(o),null);e.blueprint[r]=s,n[r]=s,sg(e,t,0,r,Zr(e,n,o.hostVars,V),o)}function y0(e,t,n){const r=St(t,e),o=eg(n),i=e[10],s=Qs(e,di(e,o,null,n.onPush?64:16,r,t,i,i.createRenderer(r,n),null,null));e[t.index]=s}function _0(e,t,n,r,o,i){const s=i[t];if(null!==s){const a=r.setInput;for(let u=0;u<s.length;){const l=s[u++],c=s[u++],d=s[u++];null!==a?r.setInput(n,d,l,c):n[c]=d}}}function D0(e,t){let n=null,r=0;for(;r<t.length;){const o=t[r];if(0!==o)if(5!==o){if("number"==typeof o)break;e.hasOwnProperty(o)&&(null===n&&(n=[]),n.push(o,e[o],t[r+1])),r+=2}else r+=2;else r+=4}return n}function dg(e,t,n,r){return new Array(e,!0,!1,t,null,0,r,n,null,null)}function E0(e,t){const n=pt(t,e);if(Nu(n)){const r=n[1];80&n[2]?Jr(r,n,r.template,n[8]):n[5]>0&&Bl(n)}}function Bl(e){for(let r=pl(e);null!==r;r=gl(r))for(let o=10;o<r.length;o++){const i=r[o];if(1024&i[2]){const s=i[1];Jr(s,i,s.template,i[8])}else i[5]>0&&Bl(i)}const n=e[1].components;if(null!==n)for(let r=0;r<n.length;r++){const o=pt(n[r],e);Nu(o)&&o[5]>0&&Bl(o)}}function w0(e,t){const n=pt(t,e),r=n[1];(function(e,t){for(let n=t.length;n<e.blueprint.length;n++)t.push(e.blueprint[n])})(r,n),fi(r,n,n[8])}function Qs(e,t){return e[13]?e[14][4]=t:e[13]=t,e[14]=t,t}function Ul(e){for(;e;){e[2]|=64;const t=li(e);if(cE(e)&&!t)return e;e=t}return null}function $l(e,t,n){const r=t[10];r.begin&&r.begin();try{Jr(e,t,e.template,n)}catch(o){throw mg(t,o),o}finally{r.end&&r.end()}}function fg(e){!function(e){for(let t=0;t<e.components.length;t++){const n=e.components[t],r=cl(n),o=r[1];n0(o,r,o.template,n)}}(e[8])}function ql(e,t,n){Vu(0),t(e,n)}const M0=(()=>Promise.resolve(null))();function hg(e){return e[7]||(e[7]=[])}function pg(e){return e.cleanup||(e.cleanup=[])}function mg(e,t){const n=e[9],r=n?n.get(fr,null):null;r&&r.handleError(t)}function yg(e,t,n,r,o){for(let i=0;i<n.length;){const s=n[i++],a=n[i++],u=t[s],l=e.data[s];null!==l.setInput?l.setInput(u,o,r,a):u[a]=o}}function In(e,t,n){const r=function(e,t){return _e(t[e])}(t,e);!function(e,t,n){he(e)?e.setValue(t,n):t.textContent=n}(e[B],r,n)}function Ks(e,t,n){let r=n?e.styles:null,o=n?e.classes:null,i=0;if(null!==t)for(let s=0;s<t.length;s++){const a=t[s];"number"==typeof a?i=a:1==i?o=yu(o,a):2==i&&(r=yu(r,a+": "+t[++s]+";"))}n?e.styles=r:e.stylesWithoutHost=r,n?e.classes=o:e.classesWithoutHost=o}const hi=new J("INJECTOR",-1);class _g{get(t,n=ti){if(n===ti){const r=new Error(`NullInjectorError: No provider for ${$(t)}!`);throw r.name="NullInjectorError",r}return n}}const pi=new J("Set Injector scope."),gi={},x0={};let Wl;function Dg(){return void 0===Wl&&(Wl=new _g),Wl}function vg(e,t=null,n=null,r){return new P0(e,n,t||Dg(),r)}class P0{constructor(t,n,r,o=null){this.parent=r,this.records=new Map,this.injectorDefTypes=new Set,this.onDestroy=new Set,this._destroyed=!1;const i=[];n&&nn(n,a=>this.processProvider(a,t,n)),nn([t],a=>this.processInjectorType(a,[],i)),this.records.set(hi,Xr(void 0,this));const s=this.records.get(pi);this.scope=null!=s?s.value:null,this.source=o||("object"==typeof t?null:$(t))}get destroyed(){return this._destroyed}destroy(){this.assertNotDestroyed(),this._destroyed=!0;try{this.onDestroy.forEach(t=>t.ngOnDestroy())}finally{this.records.clear(),this.onDestroy.clear(),this.injectorDefTypes.clear()}}get(t,n=ti,r=R.Default){this.assertNotDestroyed();const o=qr(this),i=Pn(void 0);try{if(!(r&R.SkipSelf)){let a=this.records.get(t);if(void 0===a){const u=("function"==typeof(e=t)||"object"==typeof e&&e instanceof J)&&vn(t);a=u&&this.injectableDefInScope(u)?Xr(Gl(t),gi):null,this.records.set(t,a)}if(null!=a)return this.hydrate(t,a)}return(r&R.Self?Dg():this.parent).get(t,n=r&R.Optional&&n===ti?null:n)}catch(s){if("NullInjectorError"===s.name){if((s[$r]=s[$r]||[]).unshift($(t)),o)throw s;return Bh(s,t,"R3InjectorError",this.source)}throw s}finally{Pn(i),qr(o)}var e}_resolveInjectorDefTypes(){this.injectorDefTypes.forEach(t=>this.get(t))}toString(){const t=[];return this.records.forEach((r,o)=>t.push($(o))),`R3Injector[${t.join(", ")}]`}assertNotDestroyed(){if(this._destroyed)throw new Error("Injector has already been destroyed.")}processInjectorType(t,n,r){if(!(t=M(t)))return!1;let o=Yf(t);const i=null==o&&t.ngModule||void 0,s=void 0===i?t:i,a=-1!==r.indexOf(s);if(void 0!==i&&(o=Yf(i)),null==o)return!1;if(null!=o.imports&&!a){let c;r.push(s);try{nn(o.imports,d=>{this.processInjectorType(d,n,r)&&(void 0===c&&(c=[]),c.push(d))})}finally{}if(void 0!==c)for(let d=0;d<c.length;d++){const{ngModule:f,providers:h}=c[d];nn(h,m=>this.processProvider(m,f,h||ne))}}this.injectorDefTypes.add(s);const u=sr(s)||(()=>new s);this.records.set(s,Xr(u,gi));const l=o.providers;if(null!=l&&!a){const c=t;nn(l,d=>this.processProvider(d,c,l))}return void 0!==i&&void 0!==t.providers}processProvider(t,n,r){let o=eo(t=M(t))?t:M(t&&t.provide);const i=(e=t,Eg(e)?Xr(void 0,e.useValue):Xr(function(e,t,n){let r;if(eo(e)){const o=M(e);return sr(o)||Gl(o)}if(Eg(e))r=()=>M(e.useValue);else if(function(e){return!(!e||!e.useFactory)}(e))r=()=>e.useFactory(...cr(e.deps||[]));else if(function(e){return!(!e||!e.useExisting)}(e))r=()=>A(M(e.useExisting));else{const o=M(e&&(e.useClass||e.provide));if(!function(e){return!!e.deps}(e))return sr(o)||Gl(o);r=()=>new o(...cr(e.deps))}return r}(e),gi));var e;if(eo(t)||!0!==t.multi)this.records.get(o);else{let s=this.records.get(o);s||(s=Xr(void 0,gi,!0),s.factory=()=>cr(s.multi),this.records.set(o,s)),o=t,s.multi.push(t)}this.records.set(o,i)}hydrate(t,n){return n.value===gi&&(n.value=x0,n.value=n.factory()),"object"==typeof n.value&&n.value&&null!==(e=n.value)&&"object"==typeof e&&"function"==typeof e.ngOnDestroy&&this.onDestroy.add(n.value),n.value;var e}injectableDefInScope(t){if(!t.providedIn)return!1;const n=M(t.providedIn);return"string"==typeof n?"any"===n||n===this.scope:this.injectorDefTypes.has(n)}}function Gl(e){const t=vn(e),n=null!==t?t.factory:sr(e);if(null!==n)return n;if(e instanceof J)throw new Error(`Token ${$(e)} is missing a \u0275prov definition.`);if(e instanceof Function)return function(e){const t=e.length;if(t>0){const r=function(e,t){const n=[];for(let r=0;r<e;r++)n.push(t);return n}(t,"?");throw new Error(`Can't resolve all parameters for ${$(e)}: (${r.join(", ")}).`)}const n=function(e){const t=e&&(e[ds]||e[Zf]);if(t){const n=function(e){if(e.hasOwnProperty("name"))return e.name;const t=(""+e).match(/^function\s*([^\s(]+)/);return null===t?"":t[1]}(e);return console.warn(`DEPRECATED: DI is instantiating a token "${n}" that inherits its @Injectable decorator but does not provide one itself.\nThis will become an error in a future version of Angular. Please add @Injectable() to the "${n}" class.`),t}return null}(e);return null!==n?()=>n.factory(e):()=>new e}(e);throw new Error("unreachable")}function Xr(e,t,n=!1){return{factory:e,value:t,multi:n?[]:void 0}}function Eg(e){return null!==e&&"object"==typeof e&&el in e}function eo(e){return"function"==typeof e}const wg=function(e,t,n){return function(e,t=null,n=null,r){const o=vg(e,t,n,r);return o._resolveInjectorDefTypes(),o}({name:n},t,e,n)};let re=(()=>{class e{static create(n,r){return Array.isArray(n)?wg(n,r,""):wg(n.providers,n.parent,n.name||"")}}return e.THROW_IF_NOT_FOUND=ti,e.NULL=new _g,e.\u0275prov=q({token:e,providedIn:"any",factory:()=>A(hi)}),e.__NG_ELEMENT_ID__=-1,e})();function eI(e,t){ws(cl(e)[1],Ee())}let Ys=null;function to(){if(!Ys){const e=X.Symbol;if(e&&e.iterator)Ys=e.iterator;else{const t=Object.getOwnPropertyNames(Map.prototype);for(let n=0;n<t.length;++n){const r=t[n];"entries"!==r&&"size"!==r&&Map.prototype[r]===Map.prototype.entries&&(Ys=r)}}}return Ys}function yi(e){return!!Xl(e)&&(Array.isArray(e)||!(e instanceof Map)&&to()in e)}function Xl(e){return null!==e&&("function"==typeof e||"object"==typeof e)}function We(e,t,n){return!Object.is(e[t],n)&&(e[t]=n,!0)}function oo(e,t,n,r,o,i){const a=function(e,t,n,r){const o=We(e,t,n);return We(e,t+1,r)||o}(e,F.lFrame.bindingIndex,n,o);return function(e){const t=F.lFrame,n=t.bindingIndex;t.bindingIndex=t.bindingIndex+e}(2),a?t+L(n)+r+L(o)+i:V}function Ge(e,t,n,r,o,i,s,a){const u=C(),l=Z(),c=e+20,d=l.firstCreatePass?function(e,t,n,r,o,i,s,a,u){const l=t.consts,c=Yr(t,e,4,s||null,kn(l,a));Vl(t,n,c,kn(l,u)),ws(t,c);const d=c.tViews=zs(2,c,r,o,i,t.directiveRegistry,t.pipeRegistry,null,t.schemas,l);return null!==t.queries&&(t.queries.template(t,c),d.queries=t.queries.embeddedTView(c)),c}(c,l,u,t,n,r,o,i,s):l.data[c];tn(d,!1);const f=u[B].createComment("");Hs(l,u,f,d),qe(f,u),Qs(u,u[c]=dg(f,u,f,d)),ys(d)&&kl(l,u,d),null!=s&&Ll(u,d,a)}function S(e,t=R.Default){const n=C();return null===n?A(e,t):Nh(Ee(),n,M(e),t)}function ic(){throw new Error("invalid")}function be(e,t,n){const r=C();return We(r,Or(),t)&&function(e,t,n,r,o,i,s,a){const u=St(t,n);let c,l=t.inputs;!a&&null!=l&&(c=l[r])?(yg(e,n,c,r,o),ms(t)&&function(e,t){const n=pt(t,e);16&n[2]||(n[2]|=64)}(n,t.index)):3&t.type&&(r=function(e){return"class"===e?"className":"for"===e?"htmlFor":"formaction"===e?"formAction":"innerHtml"===e?"innerHTML":"readonly"===e?"readOnly":"tabindex"===e?"tabIndex":e}(r),o=null!=s?s(o,t.value||"",r):o,he(i)?i.setProperty(u,r,o):$u(r)||(u.setProperty?u.setProperty(r,o):u[r]=o))}(Z(),function(){const e=F.lFrame;return xu(e.tView,e.selectedIndex)}(),r,e,t,r[B],n,!1),be}function sc(e,t,n,r,o){const s=o?"class":"style";yg(e,n,t.inputs[s],s,r)}function p(e,t,n,r){const o=C(),i=Z(),s=20+e,a=o[B],u=o[s]=yl(a,t,F.lFrame.currentNamespace),l=i.firstCreatePass?function(e,t,n,r,o,i,s){const a=t.consts,l=Yr(t,e,2,o,kn(a,i));return Vl(t,n,l,kn(a,s)),null!==l.attrs&&Ks(l,l.attrs,!1),null!==l.mergedAttrs&&Ks(l,l.mergedAttrs,!0),null!==t.queries&&t.queries.elementStart(t,l),l}(s,i,o,0,t,n,r):i.data[s];tn(l,!0);const c=l.mergedAttrs;null!==c&&Ts(a,u,c);const d=l.classes;null!==d&&wl(a,u,d);const f=l.styles;null!==f&&Fp(a,u,f),64!=(64&l.flags)&&Hs(i,o,u,l),0===F.lFrame.elementDepthCount&&qe(u,o),F.lFrame.elementDepthCount++,ys(l)&&(kl(i,o,l),function(e,t,n){if(Tu(t)){const o=t.directiveEnd;for(let i=t.directiveStart;i<o;i++){const s=e.data[i];s.contentQueries&&s.contentQueries(1,n[i],i)}}}(i,l,o)),null!==r&&Ll(o,l)}function g(){let e=Ee();Fu()?F.lFrame.isParent=!1:(e=e.parent,tn(e,!1));const t=e;F.lFrame.elementDepthCount--;const n=Z();n.firstCreatePass&&(ws(n,e),Tu(e)&&n.queries.elementEnd(e)),null!=t.classesWithoutHost&&function(e){return 0!=(16&e.flags)}(t)&&sc(n,t,C(),t.classesWithoutHost,!0),null!=t.stylesWithoutHost&&function(e){return 0!=(32&e.flags)}(t)&&sc(n,t,C(),t.stylesWithoutHost,!1)}function Ne(e,t,n,r){p(e,t,n,r),g()}function Xs(e){return!!e&&"function"==typeof e.then}const ac=function(e){return!!e&&"function"==typeof e.subscribe};function Ie(e,t,n,r){const o=C(),i=Z(),s=Ee();return function(e,t,n,r,o,i,s,a){const u=ys(r),c=e.firstCreatePass&&pg(e),d=t[8],f=hg(t);let h=!0;if(3&r.type||a){const y=St(r,t),v=a?a(y):y,D=f.length,I=a?T=>a(_e(T[r.index])):r.index;if(he(n)){let T=null;if(!a&&u&&(T=function(e,t,n,r){const o=e.cleanup;if(null!=o)for(let i=0;i<o.length-1;i+=2){const s=o[i];if(s===n&&o[i+1]===r){const a=t[7],u=o[i+2];return a.length>u?a[u]:null}"string"==typeof s&&(i+=2)}return null}(e,t,o,r.index)),null!==T)(T.__ngLastListenerFn__||T).__ngNextListenerFn__=i,T.__ngLastListenerFn__=i,h=!1;else{i=uc(r,t,d,i,!1);const j=n.listen(v,o,i);f.push(i,j),c&&c.push(o,I,D,D+1)}}else i=uc(r,t,d,i,!0),v.addEventListener(o,i,s),f.push(i),c&&c.push(o,I,D,s)}else i=uc(r,t,d,i,!1);const m=r.outputs;let _;if(h&&null!==m&&(_=m[o])){const y=_.length;if(y)for(let v=0;v<y;v+=2){const Me=t[_[v]][_[v+1]].subscribe(i),kt=f.length;f.push(i,Me),c&&c.push(o,r.index,kt,-(kt+1))}}}(i,o,o[B],s,e,t,!!n,r),Ie}function hm(e,t,n,r){try{return!1!==n(r)}catch(o){return mg(e,o),!1}}function uc(e,t,n,r,o){return function i(s){if(s===Function)return r;const a=2&e.flags?pt(e.index,t):t;0==(32&t[2])&&Ul(a);let u=hm(t,0,r,s),l=i.__ngNextListenerFn__;for(;l;)u=hm(t,0,l,s)&&u,l=l.__ngNextListenerFn__;return o&&!1===u&&(s.preventDefault(),s.returnValue=!1),u}}function Dt(e=1){return function(e){return(F.lFrame.contextLView=function(e,t){for(;e>0;)t=t[15],e--;return t}(e,F.lFrame.contextLView))[8]}(e)}function E(e,t=""){const n=C(),r=Z(),o=e+20,i=r.firstCreatePass?Yr(r,o,1,t,null):r.data[o],s=n[o]=function(e,t){return he(e)?e.createText(t):e.createTextNode(t)}(n[B],t);Hs(r,n,s,i),tn(i,!1)}function Pe(e){return gr("",e,""),Pe}function gr(e,t,n){const r=C(),o=function(e,t,n,r){return We(e,Or(),n)?t+L(n)+r:V}(r,e,t,n);return o!==V&&In(r,Je(),o),gr}function dc(e,t,n,r,o){const i=C(),s=oo(i,e,t,n,r,o);return s!==V&&In(i,Je(),s),dc}const mr=void 0;var T1=["en",[["a","p"],["AM","PM"],mr],[["AM","PM"],mr,mr],[["S","M","T","W","T","F","S"],["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],["Su","Mo","Tu","We","Th","Fr","Sa"]],mr,[["J","F","M","A","M","J","J","A","S","O","N","D"],["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],["January","February","March","April","May","June","July","August","September","October","November","December"]],mr,[["B","A"],["BC","AD"],["Before Christ","Anno Domini"]],0,[6,0],["M/d/yy","MMM d, y","MMMM d, y","EEEE, MMMM d, y"],["h:mm a","h:mm:ss a","h:mm:ss a z","h:mm:ss a zzzz"],["{1}, {0}",mr,"{1} 'at' {0}",mr],[".",",",";","%","+","-","E","\xd7","\u2030","\u221e","NaN",":"],["#,##0.###","#,##0%","\xa4#,##0.00","#E0"],"USD","$","US Dollar",{},"ltr",function(e){const n=Math.floor(Math.abs(e)),r=e.toString().replace(/^[^.]*\.?/,"").length;return 1===n&&0===r?1:5}];let po={};function ry(e){return e in po||(po[e]=X.ng&&X.ng.common&&X.ng.common.locales&&X.ng.common.locales[e]),po[e]}var b=(()=>((b=b||{})[b.LocaleId=0]="LocaleId",b[b.DayPeriodsFormat=1]="DayPeriodsFormat",b[b.DayPeriodsStandalone=2]="DayPeriodsStandalone",b[b.DaysFormat=3]="DaysFormat",b[b.DaysStandalone=4]="DaysStandalone",b[b.MonthsFormat=5]="MonthsFormat",b[b.MonthsStandalone=6]="MonthsStandalone",b[b.Eras=7]="Eras",b[b.FirstDayOfWeek=8]="FirstDayOfWeek",b[b.WeekendRange=9]="WeekendRange",b[b.DateFormat=10]="DateFormat",b[b.TimeFormat=11]="TimeFormat",b[b.DateTimeFormat=12]="DateTimeFormat",b[b.NumberSymbols=13]="NumberSymbols",b[b.NumberFormats=14]="NumberFormats",b[b.CurrencyCode=15]="CurrencyCode",b[b.CurrencySymbol=16]="CurrencySymbol",b[b.CurrencyName=17]="CurrencyName",b[b.Currencies=18]="Currencies",b[b.Directionality=19]="Directionality",b[b.PluralCase=20]="PluralCase",b[b.ExtraData=21]="ExtraData",b))();const ta="en-US";let oy=ta;class Ay{}const xy="ngComponent";class MT{resolveComponentFactory(t){throw function(e){const t=Error(`No component factory found for ${$(e)}. Did you add it to @NgModule.entryComponents?`);return t[xy]=e,t}(t)}}let yr=(()=>{class e{}return e.NULL=new MT,e})();function sa(...e){}function mo(e,t){return new vt(St(e,t))}const xT=function(){return mo(Ee(),C())};let vt=(()=>{class e{constructor(n){this.nativeElement=n}}return e.__NG_ELEMENT_ID__=xT,e})();class aa{}let Dc=(()=>{class e{}return e.\u0275prov=q({token:e,providedIn:"root",factory:()=>null}),e})();class la{constructor(t){this.full=t,this.major=t.split(".")[0],this.minor=t.split(".")[1],this.patch=t.split(".").slice(2).join(".")}}const Py=new la("13.0.1"),yo={};function ca(e,t,n,r,o=!1){for(;null!==n;){const i=t[n.index];if(null!==i&&r.push(_e(i)),Vt(i))for(let a=10;a<i.length;a++){const u=i[a],l=u[1].firstChild;null!==l&&ca(u[1],u,l,r)}const s=n.type;if(8&s)ca(e,t,n.child,r);else if(32&s){const a=hl(n,t);let u;for(;u=a();)r.push(u)}else if(16&s){const a=xp(t,n);if(Array.isArray(a))r.push(...a);else{const u=li(t[16]);ca(u[1],u,a,r,!0)}}n=o?n.projectionNext:n.next}return r}class bi{constructor(t,n){this._lView=t,this._cdRefInjectingView=n,this._appRef=null,this._attachedToViewContainer=!1}get rootNodes(){const t=this._lView,n=t[1];return ca(n,t,n.firstChild,[])}get context(){return this._lView[8]}set context(t){this._lView[8]=t}get destroyed(){return 256==(256&this._lView[2])}destroy(){if(this._appRef)this._appRef.detachView(this);else if(this._attachedToViewContainer){const t=this._lView[3];if(Vt(t)){const n=t[8],r=n?n.indexOf(this):-1;r>-1&&(_l(t,r),lr(n,r))}this._attachedToViewContainer=!1}Ep(this._lView[1],this._lView)}onDestroy(t){!function(e,t,n,r){const o=hg(t);null===n?o.push(r):(o.push(n),e.firstCreatePass&&pg(e).push(r,o.length-1))}(this._lView[1],this._lView,null,t)}markForCheck(){Ul(this._cdRefInjectingView||this._lView)}detach(){this._lView[2]&=-129}reattach(){this._lView[2]|=128}detectChanges(){$l(this._lView[1],this._lView,this.context)}checkNoChanges(){!function(e,t,n){vs(!0);try{$l(e,t,n)}finally{vs(!1)}}(this._lView[1],this._lView,this.context)}attachToViewContainerRef(){if(this._appRef)throw new Error("This view is already attached directly to the ApplicationRef!");this._attachedToViewContainer=!0}detachFromAppRef(){var t;this._appRef=null,ci(this._lView[1],t=this._lView,t[B],2,null,null)}attachToAppRef(t){if(this._attachedToViewContainer)throw new Error("This view is already attached to a ViewContainer!");this._appRef=t}}class kT extends bi{constructor(t){super(t),this._view=t}detectChanges(){fg(this._view)}checkNoChanges(){!function(e){vs(!0);try{fg(e)}finally{vs(!1)}}(this._view)}get context(){return null}}class Fy extends yr{constructor(t){super(),this.ngModule=t}resolveComponentFactory(t){const n=He(t);return new vc(n,this.ngModule)}}function Oy(e){const t=[];for(let n in e)e.hasOwnProperty(n)&&t.push({propName:e[n],templateName:n});return t}const VT=new J("SCHEDULER_TOKEN",{providedIn:"root",factory:()=>pp});class vc extends Ay{constructor(t,n){super(),this.componentDef=t,this.ngModule=n,this.componentType=t.type,this.selector=t.selectors.map(Bb).join(","),this.ngContentSelectors=t.ngContentSelectors?t.ngContentSelectors:[],this.isBoundToModule=!!n}get inputs(){return Oy(this.componentDef.inputs)}get outputs(){return Oy(this.componentDef.outputs)}create(t,n,r,o){const i=(o=o||this.ngModule)?function(e,t){return{get:(n,r,o)=>{const i=e.get(n,yo,o);return i!==yo||r===yo?i:t.get(n,r,o)}}}(t,o.injector):t,s=i.get(aa,dh),a=i.get(Dc,null),u=s.createRenderer(null,this.componentDef),l=this.componentDef.selectors[0][0]||"div",c=r?function(e,t,n){if(he(e))return e.selectRootElement(t,n===ft.ShadowDom);let r="string"==typeof t?e.querySelector(t):t;return r.textContent="",r}(u,r,this.componentDef.encapsulation):yl(s.createRenderer(null,this.componentDef),l,function(e){const t=e.toLowerCase();return"svg"===t?lh:"math"===t?"http://www.w3.org/1998/MathML/":null}(l)),d=this.componentDef.onPush?576:528,f=function(e,t){return{components:[],scheduler:e||pp,clean:M0,playerHandler:t||null,flags:0}}(),h=zs(0,null,null,1,0,null,null,null,null,null),m=di(null,h,f,d,null,null,s,u,a,i);let _,y;Cs(m);try{const v=function(e,t,n,r,o,i){const s=n[1];n[20]=e;const u=Yr(s,20,2,"#host",null),l=u.mergedAttrs=t.hostAttrs;null!==l&&(Ks(u,l,!0),null!==e&&(Ts(o,e,l),null!==u.classes&&wl(o,e,u.classes),null!==u.styles&&Fp(o,e,u.styles)));const c=r.createRenderer(e,t),d=di(n,eg(t),null,t.onPush?64:16,n[20],u,r,c,i||null,null);return s.firstCreatePass&&(Rs(Qo(u,n),s,t.type),ug(s,u),lg(u,n.length,1)),Qs(n,d),n[20]=d}(c,this.componentDef,m,s,u);if(c)if(r)Ts(u,c,["ng-version",Py.full]);else{const{attrs:D,classes:I}=function(e){const t=[],n=[];let r=1,o=2;for(;r<e.length;){let i=e[r];if("string"==typeof i)2===o?""!==i&&t.push(i,e[++r]):8===o&&n.push(i);else{if(!Bt(o))break;o=i}r++}return{attrs:t,classes:n}}(this.componentDef.selectors[0]);D&&Ts(u,c,D),I&&I.length>0&&wl(u,c,I.join(" "))}if(y=xu(h,20),void 0!==n){const D=y.projection=[];for(let I=0;I<this.ngContentSelectors.length;I++){const T=n[I];D.push(null!=T?Array.from(T):null)}}_=function(e,t,n,r,o){const i=n[1],s=function(e,t,n){const r=Ee();e.firstCreatePass&&(n.providersResolver&&n.providersResolver(n),cg(e,r,t,Zr(e,t,1,null),n));const o=Ko(t,e,r.directiveStart,r);qe(o,t);const i=St(r,t);return i&&qe(i,t),o}(i,n,t);if(r.components.push(s),e[8]=s,o&&o.forEach(u=>u(s,t)),t.contentQueries){const u=Ee();t.contentQueries(1,s,u.directiveStart)}const a=Ee();return!i.firstCreatePass||null===t.hostBindings&&null===t.hostAttrs||(Ln(a.index),sg(n[1],a,0,a.directiveStart,a.directiveEnd,t),ag(t,s)),s}(v,this.componentDef,m,f,[eI]),fi(h,m,null)}finally{Es()}return new UT(this.componentType,_,mo(y,m),m,y)}}class UT extends class{}{constructor(t,n,r,o,i){super(),this.location=r,this._rootLView=o,this._tNode=i,this.instance=n,this.hostView=this.changeDetectorRef=new kT(o),this.componentType=t}get injector(){return new Vr(this._tNode,this._rootLView)}destroy(){this.hostView.destroy()}onDestroy(t){this.hostView.onDestroy(t)}}class dn{}class ky{}const _o=new Map;class Vy extends dn{constructor(t,n){super(),this._parent=n,this._bootstrapComponents=[],this.injector=this,this.destroyCbs=[],this.componentFactoryResolver=new Fy(this);const r=bt(t);this._bootstrapComponents=sn(r.bootstrap),this._r3Injector=vg(t,n,[{provide:dn,useValue:this},{provide:yr,useValue:this.componentFactoryResolver}],$(t)),this._r3Injector._resolveInjectorDefTypes(),this.instance=this.get(t)}get(t,n=re.THROW_IF_NOT_FOUND,r=R.Default){return t===re||t===dn||t===hi?this:this._r3Injector.get(t,n,r)}destroy(){const t=this._r3Injector;!t.destroyed&&t.destroy(),this.destroyCbs.forEach(n=>n()),this.destroyCbs=null}onDestroy(t){this.destroyCbs.push(t)}}class Ec extends ky{constructor(t){super(),this.moduleType=t,null!==bt(t)&&function(e){const t=new Set;!function n(r){const o=bt(r,!0),i=o.id;null!==i&&(function(e,t,n){if(t&&t!==n)throw new Error(`Duplicate module registered for ${e} - ${$(t)} vs ${$(t.name)}`)}(i,_o.get(i),r),_o.set(i,r));const s=sn(o.imports);for(const a of s)t.has(a)||(t.add(a),n(a))}(e)}(t)}create(t){return new Vy(this.moduleType,t)}}function wc(e){return t=>{setTimeout(e,void 0,t)}}const tt=class extends pn{constructor(t=!1){super(),this.__isAsync=t}emit(t){super.next(t)}subscribe(t,n,r){var u,l,c;let o=t,i=n||(()=>null),s=r;if(t&&"object"==typeof t){const d=t;o=null==(u=d.next)?void 0:u.bind(d),i=null==(l=d.error)?void 0:l.bind(d),s=null==(c=d.complete)?void 0:c.bind(d)}this.__isAsync&&(i=wc(i),o&&(o=wc(o)),s&&(s=wc(s)));const a=super.subscribe({next:o,error:i,complete:s});return t instanceof Et&&t.add(a),a}};Symbol;const cS=function(){return e=Ee(),t=C(),4&e.type?new fS(t,e,mo(e,t)):null;var e,t};let Sn=(()=>{class e{}return e.__NG_ELEMENT_ID__=cS,e})();const dS=Sn,fS=class extends dS{constructor(t,n,r){super(),this._declarationLView=t,this._declarationTContainer=n,this.elementRef=r}createEmbeddedView(t){const n=this._declarationTContainer.tViews,r=di(this._declarationLView,n,t,16,null,n.declTNode,null,null,null,null);r[17]=this._declarationLView[this._declarationTContainer.index];const i=this._declarationLView[19];return null!==i&&(r[19]=i.createEmbeddedView(n)),fi(n,r,t),new bi(r)}};const gS=function(){return function(e,t){let n;const r=t[e.index];if(Vt(r))n=r;else{let o;if(8&e.type)o=_e(r);else{const i=t[B];o=i.createComment("");const s=St(e,t);hr(i,Us(i,s),o,function(e,t){return he(e)?e.nextSibling(t):t.nextSibling}(i,s),!1)}t[e.index]=n=dg(r,t,o,e),Qs(t,n)}return new qy(n,e,t)}(Ee(),C())};let Wt=(()=>{class e{}return e.__NG_ELEMENT_ID__=gS,e})();const yS=Wt,qy=class extends yS{constructor(t,n,r){super(),this._lContainer=t,this._hostTNode=n,this._hostLView=r}get element(){return mo(this._hostTNode,this._hostLView)}get injector(){return new Vr(this._hostTNode,this._hostLView)}get parentInjector(){const t=As(this._hostTNode,this._hostLView);if(Sh(t)){const n=Lr(t,this._hostLView),r=kr(t);return new Vr(n[1].data[r+8],n)}return new Vr(null,this._hostLView)}clear(){for(;this.length>0;)this.remove(this.length-1)}get(t){const n=Wy(this._lContainer);return null!==n&&n[t]||null}get length(){return this._lContainer.length-10}createEmbeddedView(t,n,r){const o=t.createEmbeddedView(n||{});return this.insert(o,r),o}createComponent(t,n,r,o,i){const s=t&&!("function"==typeof t);let a;if(s)a=n;else{const d=n||{};a=d.index,r=d.injector,o=d.projectableNodes,i=d.ngModuleRef}const u=s?t:new vc(He(t)),l=r||this.parentInjector;if(!i&&null==u.ngModule&&l){const d=l.get(dn,null);d&&(i=d)}const c=u.create(l,o,void 0,i);return this.insert(c.hostView,a),c}insert(t,n){const r=t._lView,o=r[1];if(Vt(r[3])){const c=this.indexOf(t);if(-1!==c)this.detach(c);else{const d=r[3],f=new qy(d,d[6],d[3]);f.detach(f.indexOf(t))}}const i=this._adjustIndex(n),s=this._lContainer;!function(e,t,n,r){const o=10+r,i=n.length;r>0&&(n[o-1][4]=t),r<i-10?(t[4]=n[o],Ns(n,10+r,t)):(n.push(t),t[4]=null),t[3]=n;const s=t[17];null!==s&&n!==s&&function(e,t){const n=e[9];t[16]!==t[3][3][16]&&(e[2]=!0),null===n?e[9]=[t]:n.push(t)}(s,t);const a=t[19];null!==a&&a.insertView(e),t[2]|=128}(o,r,s,i);const a=Cl(i,s),u=r[B],l=Us(u,s[7]);return null!==l&&function(e,t,n,r,o,i){r[0]=o,r[6]=t,ci(e,r,n,1,o,i)}(o,s[6],u,r,l,a),t.attachToViewContainerRef(),Ns(bc(s),i,t),t}move(t,n){return this.insert(t,n)}indexOf(t){const n=Wy(this._lContainer);return null!==n?n.indexOf(t):-1}remove(t){const n=this._adjustIndex(t,-1),r=_l(this._lContainer,n);r&&(lr(bc(this._lContainer),n),Ep(r[1],r))}detach(t){const n=this._adjustIndex(t,-1),r=_l(this._lContainer,n);return r&&null!=lr(bc(this._lContainer),n)?new bi(r):null}_adjustIndex(t,n=0){return null==t?this.length+n:t}};function Wy(e){return e[8]}function bc(e){return e[8]||(e[8]=[])}const Mi=new J("Application Initializer");let vo=(()=>{class e{constructor(n){this.appInits=n,this.resolve=sa,this.reject=sa,this.initialized=!1,this.done=!1,this.donePromise=new Promise((r,o)=>{this.resolve=r,this.reject=o})}runInitializers(){if(this.initialized)return;const n=[],r=()=>{this.done=!0,this.resolve()};if(this.appInits)for(let o=0;o<this.appInits.length;o++){const i=this.appInits[o]();if(Xs(i))n.push(i);else if(ac(i)){const s=new Promise((a,u)=>{i.subscribe({complete:a,error:u})});n.push(s)}}Promise.all(n).then(()=>{r()}).catch(o=>{this.reject(o)}),0===n.length&&r(),this.initialized=!0}}return e.\u0275fac=function(n){return new(n||e)(A(Mi,8))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const Ai=new J("AppId"),eM={provide:Ai,useFactory:function(){return`${Vc()}${Vc()}${Vc()}`},deps:[]};function Vc(){return String.fromCharCode(97+Math.floor(25*Math.random()))}const g_=new J("Platform Initializer"),jc=new J("Platform ID"),m_=new J("appBootstrapListener");let ga=(()=>{class e{log(n){console.log(n)}warn(n){console.warn(n)}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const $n=new J("LocaleId"),y_=new J("DefaultCurrencyCode");class nM{constructor(t,n){this.ngModuleFactory=t,this.componentFactories=n}}const Bc=function(e){return new Ec(e)},rM=Bc,oM=function(e){return Promise.resolve(Bc(e))},D_=function(e){const t=Bc(e),r=sn(bt(e).declarations).reduce((o,i)=>{const s=He(i);return s&&o.push(new vc(s)),o},[]);return new nM(t,r)},iM=D_,sM=function(e){return Promise.resolve(D_(e))};let ma=(()=>{class e{constructor(){this.compileModuleSync=rM,this.compileModuleAsync=oM,this.compileModuleAndAllComponentsSync=iM,this.compileModuleAndAllComponentsAsync=sM}clearCache(){}clearCacheFor(n){}getModuleId(n){}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const lM=(()=>Promise.resolve(0))();function Uc(e){"undefined"==typeof Zone?lM.then(()=>{e&&e.apply(null,null)}):Zone.current.scheduleMicroTask("scheduleMicrotask",e)}class De{constructor({enableLongStackTrace:t=!1,shouldCoalesceEventChangeDetection:n=!1,shouldCoalesceRunChangeDetection:r=!1}){if(this.hasPendingMacrotasks=!1,this.hasPendingMicrotasks=!1,this.isStable=!0,this.onUnstable=new tt(!1),this.onMicrotaskEmpty=new tt(!1),this.onStable=new tt(!1),this.onError=new tt(!1),"undefined"==typeof Zone)throw new Error("In this configuration Angular requires Zone.js");Zone.assertZonePatched();const o=this;o._nesting=0,o._outer=o._inner=Zone.current,Zone.TaskTrackingZoneSpec&&(o._inner=o._inner.fork(new Zone.TaskTrackingZoneSpec)),t&&Zone.longStackTraceZoneSpec&&(o._inner=o._inner.fork(Zone.longStackTraceZoneSpec)),o.shouldCoalesceEventChangeDetection=!r&&n,o.shouldCoalesceRunChangeDetection=r,o.lastRequestAnimationFrameId=-1,o.nativeRequestAnimationFrame=function(){let e=X.requestAnimationFrame,t=X.cancelAnimationFrame;if("undefined"!=typeof Zone&&e&&t){const n=e[Zone.__symbol__("OriginalDelegate")];n&&(e=n);const r=t[Zone.__symbol__("OriginalDelegate")];r&&(t=r)}return{nativeRequestAnimationFrame:e,nativeCancelAnimationFrame:t}}().nativeRequestAnimationFrame,function(e){const t=()=>{!function(e){e.isCheckStableRunning||-1!==e.lastRequestAnimationFrameId||(e.lastRequestAnimationFrameId=e.nativeRequestAnimationFrame.call(X,()=>{e.fakeTopEventTask||(e.fakeTopEventTask=Zone.root.scheduleEventTask("fakeTopEventTask",()=>{e.lastRequestAnimationFrameId=-1,$c(e),e.isCheckStableRunning=!0,Hc(e),e.isCheckStableRunning=!1},void 0,()=>{},()=>{})),e.fakeTopEventTask.invoke()}),$c(e))}(e)};e._inner=e._inner.fork({name:"angular",properties:{isAngularZone:!0},onInvokeTask:(n,r,o,i,s,a)=>{try{return v_(e),n.invokeTask(o,i,s,a)}finally{(e.shouldCoalesceEventChangeDetection&&"eventTask"===i.type||e.shouldCoalesceRunChangeDetection)&&t(),C_(e)}},onInvoke:(n,r,o,i,s,a,u)=>{try{return v_(e),n.invoke(o,i,s,a,u)}finally{e.shouldCoalesceRunChangeDetection&&t(),C_(e)}},onHasTask:(n,r,o,i)=>{n.hasTask(o,i),r===o&&("microTask"==i.change?(e._hasPendingMicrotasks=i.microTask,$c(e),Hc(e)):"macroTask"==i.change&&(e.hasPendingMacrotasks=i.macroTask))},onHandleError:(n,r,o,i)=>(n.handleError(o,i),e.runOutsideAngular(()=>e.onError.emit(i)),!1)})}(o)}static isInAngularZone(){return!0===Zone.current.get("isAngularZone")}static assertInAngularZone(){if(!De.isInAngularZone())throw new Error("Expected to be in Angular Zone, but it is not!")}static assertNotInAngularZone(){if(De.isInAngularZone())throw new Error("Expected to not be in Angular Zone, but it is!")}run(t,n,r){return this._inner.run(t,n,r)}runTask(t,n,r,o){const i=this._inner,s=i.scheduleEventTask("NgZoneEvent: "+o,t,dM,sa,sa);try{return i.runTask(s,n,r)}finally{i.cancelTask(s)}}runGuarded(t,n,r){return this._inner.runGuarded(t,n,r)}runOutsideAngular(t){return this._outer.run(t)}}const dM={};function Hc(e){if(0==e._nesting&&!e.hasPendingMicrotasks&&!e.isStable)try{e._nesting++,e.onMicrotaskEmpty.emit(null)}finally{if(e._nesting--,!e.hasPendingMicrotasks)try{e.runOutsideAngular(()=>e.onStable.emit(null))}finally{e.isStable=!0}}}function $c(e){e.hasPendingMicrotasks=!!(e._hasPendingMicrotasks||(e.shouldCoalesceEventChangeDetection||e.shouldCoalesceRunChangeDetection)&&-1!==e.lastRequestAnimationFrameId)}function v_(e){e._nesting++,e.isStable&&(e.isStable=!1,e.onUnstable.emit(null))}function C_(e){e._nesting--,Hc(e)}class pM{constructor(){this.hasPendingMicrotasks=!1,this.hasPendingMacrotasks=!1,this.isStable=!0,this.onUnstable=new tt,this.onMicrotaskEmpty=new tt,this.onStable=new tt,this.onError=new tt}run(t,n,r){return t.apply(n,r)}runGuarded(t,n,r){return t.apply(n,r)}runOutsideAngular(t){return t()}runTask(t,n,r,o){return t.apply(n,r)}}let qc=(()=>{class e{constructor(n){this._ngZone=n,this._pendingCount=0,this._isZoneStable=!0,this._didWork=!1,this._callbacks=[],this.taskTrackingZone=null,this._watchAngularEvents(),n.run(()=>{this.taskTrackingZone="undefined"==typeof Zone?null:Zone.current.get("TaskTrackingZone")})}_watchAngularEvents(){this._ngZone.onUnstable.subscribe({next:()=>{this._didWork=!0,this._isZoneStable=!1}}),this._ngZone.runOutsideAngular(()=>{this._ngZone.onStable.subscribe({next:()=>{De.assertNotInAngularZone(),Uc(()=>{this._isZoneStable=!0,this._runCallbacksIfReady()})}})})}increasePendingRequestCount(){return this._pendingCount+=1,this._didWork=!0,this._pendingCount}decreasePendingRequestCount(){if(this._pendingCount-=1,this._pendingCount<0)throw new Error("pending async requests below zero");return this._runCallbacksIfReady(),this._pendingCount}isStable(){return this._isZoneStable&&0===this._pendingCount&&!this._ngZone.hasPendingMacrotasks}_runCallbacksIfReady(){if(this.isStable())Uc(()=>{for(;0!==this._callbacks.length;){let n=this._callbacks.pop();clearTimeout(n.timeoutId),n.doneCb(this._didWork)}this._didWork=!1});else{let n=this.getPendingTasks();this._callbacks=this._callbacks.filter(r=>!r.updateCb||!r.updateCb(n)||(clearTimeout(r.timeoutId),!1)),this._didWork=!0}}getPendingTasks(){return this.taskTrackingZone?this.taskTrackingZone.macroTasks.map(n=>({source:n.source,creationLocation:n.creationLocation,data:n.data})):[]}addCallback(n,r,o){let i=-1;r&&r>0&&(i=setTimeout(()=>{this._callbacks=this._callbacks.filter(s=>s.timeoutId!==i),n(this._didWork,this.getPendingTasks())},r)),this._callbacks.push({doneCb:n,timeoutId:i,updateCb:o})}whenStable(n,r,o){if(o&&!this.taskTrackingZone)throw new Error('Task tracking zone is required when passing an update callback to whenStable(). Is "zone.js/plugins/task-tracking" loaded?');this.addCallback(n,r,o),this._runCallbacksIfReady()}getPendingRequestCount(){return this._pendingCount}findProviders(n,r,o){return[]}}return e.\u0275fac=function(n){return new(n||e)(A(De))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),E_=(()=>{class e{constructor(){this._applications=new Map,Wc.addToWindow(this)}registerApplication(n,r){this._applications.set(n,r)}unregisterApplication(n){this._applications.delete(n)}unregisterAllApplications(){this._applications.clear()}getTestability(n){return this._applications.get(n)||null}getAllTestabilities(){return Array.from(this._applications.values())}getAllRootElements(){return Array.from(this._applications.keys())}findTestabilityInTree(n,r=!0){return Wc.findTestabilityInTree(this,n,r)}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class gM{addToWindow(t){}findTestabilityInTree(t,n,r){return null}}let Wc=new gM,w_=!0,b_=!1;let Gt;const T_=new J("AllowMultipleToken");class Gc{constructor(t,n){this.name=t,this.token=n}}function S_(e,t,n=[]){const r=`Platform: ${t}`,o=new J(r);return(i=[])=>{let s=M_();if(!s||s.injector.get(T_,!1))if(e)e(n.concat(i).concat({provide:o,useValue:!0}));else{const a=n.concat(i).concat({provide:o,useValue:!0},{provide:pi,useValue:"platform"});!function(e){if(Gt&&!Gt.destroyed&&!Gt.injector.get(T_,!1))throw new Error("There can be only one platform. Destroy the previous one to create a new one.");Gt=e.get(A_);const t=e.get(g_,null);t&&t.forEach(n=>n())}(re.create({providers:a,name:r}))}return function(e){const t=M_();if(!t)throw new Error("No platform exists!");if(!t.injector.get(e,null))throw new Error("A platform with a different configuration has been created. Please destroy it first.");return t}(o)}}function M_(){return Gt&&!Gt.destroyed?Gt:null}let A_=(()=>{class e{constructor(n){this._injector=n,this._modules=[],this._destroyListeners=[],this._destroyed=!1}bootstrapModuleFactory(n,r){const a=function(e,t){let n;return n="noop"===e?new pM:("zone.js"===e?void 0:e)||new De({enableLongStackTrace:(b_=!0,w_),shouldCoalesceEventChangeDetection:!!(null==t?void 0:t.ngZoneEventCoalescing),shouldCoalesceRunChangeDetection:!!(null==t?void 0:t.ngZoneRunCoalescing)}),n}(r?r.ngZone:void 0,{ngZoneEventCoalescing:r&&r.ngZoneEventCoalescing||!1,ngZoneRunCoalescing:r&&r.ngZoneRunCoalescing||!1}),u=[{provide:De,useValue:a}];return a.run(()=>{const l=re.create({providers:u,parent:this.injector,name:n.moduleType.name}),c=n.create(l),d=c.injector.get(fr,null);if(!d)throw new Error("No ErrorHandler. Is platform module (BrowserModule) included?");return a.runOutsideAngular(()=>{const f=a.onError.subscribe({next:h=>{d.handleError(h)}});c.onDestroy(()=>{zc(this._modules,c),f.unsubscribe()})}),function(e,t,n){try{const r=n();return Xs(r)?r.catch(o=>{throw t.runOutsideAngular(()=>e.handleError(o)),o}):r}catch(r){throw t.runOutsideAngular(()=>e.handleError(r)),r}}(d,a,()=>{const f=c.injector.get(vo);return f.runInitializers(),f.donePromise.then(()=>(function(e){dt(e,"Expected localeId to be defined"),"string"==typeof e&&(oy=e.toLowerCase().replace(/_/g,"-"))}(c.injector.get($n,ta)||ta),this._moduleDoBootstrap(c),c))})})}bootstrapModule(n,r=[]){const o=R_({},r);return function(e,t,n){const r=new Ec(n);return Promise.resolve(r)}(0,0,n).then(i=>this.bootstrapModuleFactory(i,o))}_moduleDoBootstrap(n){const r=n.injector.get(Co);if(n._bootstrapComponents.length>0)n._bootstrapComponents.forEach(o=>r.bootstrap(o));else{if(!n.instance.ngDoBootstrap)throw new Error(`The module ${$(n.instance.constructor)} was bootstrapped, but it does not declare "@NgModule.bootstrap" components nor a "ngDoBootstrap" method. Please define one of these.`);n.instance.ngDoBootstrap(r)}this._modules.push(n)}onDestroy(n){this._destroyListeners.push(n)}get injector(){return this._injector}destroy(){if(this._destroyed)throw new Error("The platform has already been destroyed!");this._modules.slice().forEach(n=>n.destroy()),this._destroyListeners.forEach(n=>n()),this._destroyed=!0}get destroyed(){return this._destroyed}}return e.\u0275fac=function(n){return new(n||e)(A(re))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function R_(e,t){return Array.isArray(t)?t.reduce(R_,e):P(P({},e),t)}let Co=(()=>{class e{constructor(n,r,o,i,s){this._zone=n,this._injector=r,this._exceptionHandler=o,this._componentFactoryResolver=i,this._initStatus=s,this._bootstrapListeners=[],this._views=[],this._runningTick=!1,this._stable=!0,this.componentTypes=[],this.components=[],this._onMicrotaskEmptySubscription=this._zone.onMicrotaskEmpty.subscribe({next:()=>{this._zone.run(()=>{this.tick()})}});const a=new fe(l=>{this._stable=this._zone.isStable&&!this._zone.hasPendingMacrotasks&&!this._zone.hasPendingMicrotasks,this._zone.runOutsideAngular(()=>{l.next(this._stable),l.complete()})}),u=new fe(l=>{let c;this._zone.runOutsideAngular(()=>{c=this._zone.onStable.subscribe(()=>{De.assertNotInAngularZone(),Uc(()=>{!this._stable&&!this._zone.hasPendingMacrotasks&&!this._zone.hasPendingMicrotasks&&(this._stable=!0,l.next(!0))})})});const d=this._zone.onUnstable.subscribe(()=>{De.assertInAngularZone(),this._stable&&(this._stable=!1,this._zone.runOutsideAngular(()=>{l.next(!1)}))});return()=>{c.unsubscribe(),d.unsubscribe()}});this.isStable=function(...e){const t=Bo(e),n=function(e,t){return"number"==typeof pu(e)?e.pop():1/0}(e),r=e;return r.length?1===r.length?gn(r[0]):jo(n)(Ve(r,t)):yn}(a,u.pipe(function(e={}){const{connector:t=(()=>new pn),resetOnError:n=!0,resetOnComplete:r=!0,resetOnRefCountZero:o=!0}=e;return i=>{let s=null,a=null,u=null,l=0,c=!1,d=!1;const f=()=>{null==a||a.unsubscribe(),a=null},h=()=>{f(),s=u=null,c=d=!1},m=()=>{const _=s;h(),null==_||_.unsubscribe()};return ke((_,y)=>{l++,!d&&!c&&f();const v=u=null!=u?u:t();y.add(()=>{l--,0===l&&!d&&!c&&(a=gu(m,o))}),v.subscribe(y),s||(s=new lu({next:D=>v.next(D),error:D=>{d=!0,f(),a=gu(h,n,D),v.error(D)},complete:()=>{c=!0,f(),a=gu(h,r),v.complete()}}),Ve(_).subscribe(s))})(i)}}()))}bootstrap(n,r){if(!this._initStatus.done)throw new Error("Cannot bootstrap as there are still asynchronous initializers running. Bootstrap components in the `ngDoBootstrap` method of the root module.");let o;o=n instanceof Ay?n:this._componentFactoryResolver.resolveComponentFactory(n),this.componentTypes.push(o.componentType);const i=function(e){return e.isBoundToModule}(o)?void 0:this._injector.get(dn),a=o.create(re.NULL,[],r||o.selector,i),u=a.location.nativeElement,l=a.injector.get(qc,null),c=l&&a.injector.get(E_);return l&&c&&c.registerApplication(u,l),a.onDestroy(()=>{this.detachView(a.hostView),zc(this.components,a),c&&c.unregisterApplication(u)}),this._loadComponent(a),a}tick(){if(this._runningTick)throw new Error("ApplicationRef.tick is called recursively");try{this._runningTick=!0;for(let n of this._views)n.detectChanges()}catch(n){this._zone.runOutsideAngular(()=>this._exceptionHandler.handleError(n))}finally{this._runningTick=!1}}attachView(n){const r=n;this._views.push(r),r.attachToAppRef(this)}detachView(n){const r=n;zc(this._views,r),r.detachFromAppRef()}_loadComponent(n){this.attachView(n.hostView),this.tick(),this.components.push(n),this._injector.get(m_,[]).concat(this._bootstrapListeners).forEach(o=>o(n))}ngOnDestroy(){this._views.slice().forEach(n=>n.destroy()),this._onMicrotaskEmptySubscription.unsubscribe()}get viewCount(){return this._views.length}}return e.\u0275fac=function(n){return new(n||e)(A(De),A(re),A(fr),A(yr),A(vo))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function zc(e,t){const n=e.indexOf(t);n>-1&&e.splice(n,1)}const RM=function(e){return function(e,t,n){if(ms(e)&&!n){const r=pt(e.index,t);return new bi(r,r)}return 47&e.type?new bi(t[16],t):null}(Ee(),C(),16==(16&e))};let Kc=(()=>{class e{}return e.__NG_ELEMENT_ID__=RM,e})();class L_{constructor(){}supports(t){return yi(t)}create(t){return new $M(t)}}const HM=(e,t)=>t;class $M{constructor(t){this.length=0,this._linkedRecords=null,this._unlinkedRecords=null,this._previousItHead=null,this._itHead=null,this._itTail=null,this._additionsHead=null,this._additionsTail=null,this._movesHead=null,this._movesTail=null,this._removalsHead=null,this._removalsTail=null,this._identityChangesHead=null,this._identityChangesTail=null,this._trackByFn=t||HM}forEachItem(t){let n;for(n=this._itHead;null!==n;n=n._next)t(n)}forEachOperation(t){let n=this._itHead,r=this._removalsHead,o=0,i=null;for(;n||r;){const s=!r||n&&n.currentIndex<j_(r,o,i)?n:r,a=j_(s,o,i),u=s.currentIndex;if(s===r)o--,r=r._nextRemoved;else if(n=n._next,null==s.previousIndex)o++;else{i||(i=[]);const l=a-o,c=u-o;if(l!=c){for(let f=0;f<l;f++){const h=f<i.length?i[f]:i[f]=0,m=h+f;c<=m&&m<l&&(i[f]=h+1)}i[s.previousIndex]=c-l}}a!==u&&t(s,a,u)}}forEachPreviousItem(t){let n;for(n=this._previousItHead;null!==n;n=n._nextPrevious)t(n)}forEachAddedItem(t){let n;for(n=this._additionsHead;null!==n;n=n._nextAdded)t(n)}forEachMovedItem(t){let n;for(n=this._movesHead;null!==n;n=n._nextMoved)t(n)}forEachRemovedItem(t){let n;for(n=this._removalsHead;null!==n;n=n._nextRemoved)t(n)}forEachIdentityChange(t){let n;for(n=this._identityChangesHead;null!==n;n=n._nextIdentityChange)t(n)}diff(t){if(null==t&&(t=[]),!yi(t))throw new Error(`Error trying to diff '${$(t)}'. Only arrays and iterables are allowed`);return this.check(t)?this:null}onDestroy(){}check(t){this._reset();let o,i,s,n=this._itHead,r=!1;if(Array.isArray(t)){this.length=t.length;for(let a=0;a<this.length;a++)i=t[a],s=this._trackByFn(a,i),null!==n&&Object.is(n.trackById,s)?(r&&(n=this._verifyReinsertion(n,i,s,a)),Object.is(n.item,i)||this._addIdentityChange(n,i)):(n=this._mismatch(n,i,s,a),r=!0),n=n._next}else o=0,function(e,t){if(Array.isArray(e))for(let n=0;n<e.length;n++)t(e[n]);else{const n=e[to()]();let r;for(;!(r=n.next()).done;)t(r.value)}}(t,a=>{s=this._trackByFn(o,a),null!==n&&Object.is(n.trackById,s)?(r&&(n=this._verifyReinsertion(n,a,s,o)),Object.is(n.item,a)||this._addIdentityChange(n,a)):(n=this._mismatch(n,a,s,o),r=!0),n=n._next,o++}),this.length=o;return this._truncate(n),this.collection=t,this.isDirty}get isDirty(){return null!==this._additionsHead||null!==this._movesHead||null!==this._removalsHead||null!==this._identityChangesHead}_reset(){if(this.isDirty){let t;for(t=this._previousItHead=this._itHead;null!==t;t=t._next)t._nextPrevious=t._next;for(t=this._additionsHead;null!==t;t=t._nextAdded)t.previousIndex=t.currentIndex;for(this._additionsHead=this._additionsTail=null,t=this._movesHead;null!==t;t=t._nextMoved)t.previousIndex=t.currentIndex;this._movesHead=this._movesTail=null,this._removalsHead=this._removalsTail=null,this._identityChangesHead=this._identityChangesTail=null}}_mismatch(t,n,r,o){let i;return null===t?i=this._itTail:(i=t._prev,this._remove(t)),null!==(t=null===this._unlinkedRecords?null:this._unlinkedRecords.get(r,null))?(Object.is(t.item,n)||this._addIdentityChange(t,n),this._reinsertAfter(t,i,o)):null!==(t=null===this._linkedRecords?null:this._linkedRecords.get(r,o))?(Object.is(t.item,n)||this._addIdentityChange(t,n),this._moveAfter(t,i,o)):t=this._addAfter(new qM(n,r),i,o),t}_verifyReinsertion(t,n,r,o){let i=null===this._unlinkedRecords?null:this._unlinkedRecords.get(r,null);return null!==i?t=this._reinsertAfter(i,t._prev,o):t.currentIndex!=o&&(t.currentIndex=o,this._addToMoves(t,o)),t}_truncate(t){for(;null!==t;){const n=t._next;this._addToRemovals(this._unlink(t)),t=n}null!==this._unlinkedRecords&&this._unlinkedRecords.clear(),null!==this._additionsTail&&(this._additionsTail._nextAdded=null),null!==this._movesTail&&(this._movesTail._nextMoved=null),null!==this._itTail&&(this._itTail._next=null),null!==this._removalsTail&&(this._removalsTail._nextRemoved=null),null!==this._identityChangesTail&&(this._identityChangesTail._nextIdentityChange=null)}_reinsertAfter(t,n,r){null!==this._unlinkedRecords&&this._unlinkedRecords.remove(t);const o=t._prevRemoved,i=t._nextRemoved;return null===o?this._removalsHead=i:o._nextRemoved=i,null===i?this._removalsTail=o:i._prevRemoved=o,this._insertAfter(t,n,r),this._addToMoves(t,r),t}_moveAfter(t,n,r){return this._unlink(t),this._insertAfter(t,n,r),this._addToMoves(t,r),t}_addAfter(t,n,r){return this._insertAfter(t,n,r),this._additionsTail=null===this._additionsTail?this._additionsHead=t:this._additionsTail._nextAdded=t,t}_insertAfter(t,n,r){const o=null===n?this._itHead:n._next;return t._next=o,t._prev=n,null===o?this._itTail=t:o._prev=t,null===n?this._itHead=t:n._next=t,null===this._linkedRecords&&(this._linkedRecords=new V_),this._linkedRecords.put(t),t.currentIndex=r,t}_remove(t){return this._addToRemovals(this._unlink(t))}_unlink(t){null!==this._linkedRecords&&this._linkedRecords.remove(t);const n=t._prev,r=t._next;return null===n?this._itHead=r:n._next=r,null===r?this._itTail=n:r._prev=n,t}_addToMoves(t,n){return t.previousIndex===n||(this._movesTail=null===this._movesTail?this._movesHead=t:this._movesTail._nextMoved=t),t}_addToRemovals(t){return null===this._unlinkedRecords&&(this._unlinkedRecords=new V_),this._unlinkedRecords.put(t),t.currentIndex=null,t._nextRemoved=null,null===this._removalsTail?(this._removalsTail=this._removalsHead=t,t._prevRemoved=null):(t._prevRemoved=this._removalsTail,this._removalsTail=this._removalsTail._nextRemoved=t),t}_addIdentityChange(t,n){return t.item=n,this._identityChangesTail=null===this._identityChangesTail?this._identityChangesHead=t:this._identityChangesTail._nextIdentityChange=t,t}}class qM{constructor(t,n){this.item=t,this.trackById=n,this.currentIndex=null,this.previousIndex=null,this._nextPrevious=null,this._prev=null,this._next=null,this._prevDup=null,this._nextDup=null,this._prevRemoved=null,this._nextRemoved=null,this._nextAdded=null,this._nextMoved=null,this._nextIdentityChange=null}}class WM{constructor(){this._head=null,this._tail=null}add(t){null===this._head?(this._head=this._tail=t,t._nextDup=null,t._prevDup=null):(this._tail._nextDup=t,t._prevDup=this._tail,t._nextDup=null,this._tail=t)}get(t,n){let r;for(r=this._head;null!==r;r=r._nextDup)if((null===n||n<=r.currentIndex)&&Object.is(r.trackById,t))return r;return null}remove(t){const n=t._prevDup,r=t._nextDup;return null===n?this._head=r:n._nextDup=r,null===r?this._tail=n:r._prevDup=n,null===this._head}}class V_{constructor(){this.map=new Map}put(t){const n=t.trackById;let r=this.map.get(n);r||(r=new WM,this.map.set(n,r)),r.add(t)}get(t,n){const o=this.map.get(t);return o?o.get(t,n):null}remove(t){const n=t.trackById;return this.map.get(n).remove(t)&&this.map.delete(n),t}get isEmpty(){return 0===this.map.size}clear(){this.map.clear()}}function j_(e,t,n){const r=e.previousIndex;if(null===r)return r;let o=0;return n&&r<n.length&&(o=n[r]),r+t+o}class B_{constructor(){}supports(t){return t instanceof Map||Xl(t)}create(){return new GM}}class GM{constructor(){this._records=new Map,this._mapHead=null,this._appendAfter=null,this._previousMapHead=null,this._changesHead=null,this._changesTail=null,this._additionsHead=null,this._additionsTail=null,this._removalsHead=null,this._removalsTail=null}get isDirty(){return null!==this._additionsHead||null!==this._changesHead||null!==this._removalsHead}forEachItem(t){let n;for(n=this._mapHead;null!==n;n=n._next)t(n)}forEachPreviousItem(t){let n;for(n=this._previousMapHead;null!==n;n=n._nextPrevious)t(n)}forEachChangedItem(t){let n;for(n=this._changesHead;null!==n;n=n._nextChanged)t(n)}forEachAddedItem(t){let n;for(n=this._additionsHead;null!==n;n=n._nextAdded)t(n)}forEachRemovedItem(t){let n;for(n=this._removalsHead;null!==n;n=n._nextRemoved)t(n)}diff(t){if(t){if(!(t instanceof Map||Xl(t)))throw new Error(`Error trying to diff '${$(t)}'. Only maps and objects are allowed`)}else t=new Map;return this.check(t)?this:null}onDestroy(){}check(t){this._reset();let n=this._mapHead;if(this._appendAfter=null,this._forEach(t,(r,o)=>{if(n&&n.key===o)this._maybeAddToChanges(n,r),this._appendAfter=n,n=n._next;else{const i=this._getOrCreateRecordForKey(o,r);n=this._insertBeforeOrAppend(n,i)}}),n){n._prev&&(n._prev._next=null),this._removalsHead=n;for(let r=n;null!==r;r=r._nextRemoved)r===this._mapHead&&(this._mapHead=null),this._records.delete(r.key),r._nextRemoved=r._next,r.previousValue=r.currentValue,r.currentValue=null,r._prev=null,r._next=null}return this._changesTail&&(this._changesTail._nextChanged=null),this._additionsTail&&(this._additionsTail._nextAdded=null),this.isDirty}_insertBeforeOrAppend(t,n){if(t){const r=t._prev;return n._next=t,n._prev=r,t._prev=n,r&&(r._next=n),t===this._mapHead&&(this._mapHead=n),this._appendAfter=t,t}return this._appendAfter?(this._appendAfter._next=n,n._prev=this._appendAfter):this._mapHead=n,this._appendAfter=n,null}_getOrCreateRecordForKey(t,n){if(this._records.has(t)){const o=this._records.get(t);this._maybeAddToChanges(o,n);const i=o._prev,s=o._next;return i&&(i._next=s),s&&(s._prev=i),o._next=null,o._prev=null,o}const r=new zM(t);return this._records.set(t,r),r.currentValue=n,this._addToAdditions(r),r}_reset(){if(this.isDirty){let t;for(this._previousMapHead=this._mapHead,t=this._previousMapHead;null!==t;t=t._next)t._nextPrevious=t._next;for(t=this._changesHead;null!==t;t=t._nextChanged)t.previousValue=t.currentValue;for(t=this._additionsHead;null!=t;t=t._nextAdded)t.previousValue=t.currentValue;this._changesHead=this._changesTail=null,this._additionsHead=this._additionsTail=null,this._removalsHead=null}}_maybeAddToChanges(t,n){Object.is(n,t.currentValue)||(t.previousValue=t.currentValue,t.currentValue=n,this._addToChanges(t))}_addToAdditions(t){null===this._additionsHead?this._additionsHead=this._additionsTail=t:(this._additionsTail._nextAdded=t,this._additionsTail=t)}_addToChanges(t){null===this._changesHead?this._changesHead=this._changesTail=t:(this._changesTail._nextChanged=t,this._changesTail=t)}_forEach(t,n){t instanceof Map?t.forEach(n):Object.keys(t).forEach(r=>n(t[r],r))}}class zM{constructor(t){this.key=t,this.previousValue=null,this.currentValue=null,this._nextPrevious=null,this._next=null,this._prev=null,this._nextAdded=null,this._nextRemoved=null,this._nextChanged=null}}function U_(){return new Ri([new L_])}let Ri=(()=>{class e{constructor(n){this.factories=n}static create(n,r){if(null!=r){const o=r.factories.slice();n=n.concat(o)}return new e(n)}static extend(n){return{provide:e,useFactory:r=>e.create(n,r||U_()),deps:[[e,new Bn,new at]]}}find(n){const r=this.factories.find(o=>o.supports(n));if(null!=r)return r;throw new Error(`Cannot find a differ supporting object '${n}' of type '${function(e){return e.name||typeof e}(n)}'`)}}return e.\u0275prov=q({token:e,providedIn:"root",factory:U_}),e})();function H_(){return new Eo([new B_])}let Eo=(()=>{class e{constructor(n){this.factories=n}static create(n,r){if(r){const o=r.factories.slice();n=n.concat(o)}return new e(n)}static extend(n){return{provide:e,useFactory:r=>e.create(n,r||H_()),deps:[[e,new Bn,new at]]}}find(n){const r=this.factories.find(o=>o.supports(n));if(r)return r;throw new Error(`Cannot find a differ supporting object '${n}'`)}}return e.\u0275prov=q({token:e,providedIn:"root",factory:H_}),e})();const KM=[new B_],ZM=new Ri([new L_]),JM=new Eo(KM),XM=S_(null,"core",[{provide:jc,useValue:"unknown"},{provide:A_,deps:[re]},{provide:E_,deps:[]},{provide:ga,deps:[]}]),oA=[{provide:Co,useClass:Co,deps:[De,re,fr,yr,vo]},{provide:VT,deps:[De],useFactory:function(e){let t=[];return e.onStable.subscribe(()=>{for(;t.length;)t.pop()()}),function(n){t.push(n)}}},{provide:vo,useClass:vo,deps:[[new at,Mi]]},{provide:ma,useClass:ma,deps:[]},eM,{provide:Ri,useFactory:function(){return ZM},deps:[]},{provide:Eo,useFactory:function(){return JM},deps:[]},{provide:$n,useFactory:function(e){return e||"undefined"!=typeof $localize&&$localize.locale||ta},deps:[[new Wr($n),new at,new Bn]]},{provide:y_,useValue:"USD"}];let sA=(()=>{class e{constructor(n){}}return e.\u0275fac=function(n){return new(n||e)(A(Co))},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({providers:oA}),e})(),Ra=null;function Gn(){return Ra}const je=new J("DocumentToken");let Er=(()=>{class e{historyGo(n){throw new Error("Not implemented")}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:function(){return A(TD)},providedIn:"platform"}),e})();const ex=new J("Location Initialized");let TD=(()=>{class e extends Er{constructor(n){super(),this._doc=n,this._init()}_init(){this.location=window.location,this._history=window.history}getBaseHrefFromDOM(){return Gn().getBaseHref(this._doc)}onPopState(n){const r=Gn().getGlobalEventTarget(this._doc,"window");return r.addEventListener("popstate",n,!1),()=>r.removeEventListener("popstate",n)}onHashChange(n){const r=Gn().getGlobalEventTarget(this._doc,"window");return r.addEventListener("hashchange",n,!1),()=>r.removeEventListener("hashchange",n)}get href(){return this.location.href}get protocol(){return this.location.protocol}get hostname(){return this.location.hostname}get port(){return this.location.port}get pathname(){return this.location.pathname}get search(){return this.location.search}get hash(){return this.location.hash}set pathname(n){this.location.pathname=n}pushState(n,r,o){SD()?this._history.pushState(n,r,o):this.location.hash=o}replaceState(n,r,o){SD()?this._history.replaceState(n,r,o):this.location.hash=o}forward(){this._history.forward()}back(){this._history.back()}historyGo(n=0){this._history.go(n)}getState(){return this._history.state}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:function(){return new TD(A(je))},providedIn:"platform"}),e})();function SD(){return!!window.history.pushState}function Ed(e,t){if(0==e.length)return t;if(0==t.length)return e;let n=0;return e.endsWith("/")&&n++,t.startsWith("/")&&n++,2==n?e+t.substring(1):1==n?e+t:e+"/"+t}function MD(e){const t=e.match(/#|\?|$/),n=t&&t.index||e.length;return e.slice(0,n-("/"===e[n-1]?1:0))+e.slice(n)}function An(e){return e&&"?"!==e[0]?"?"+e:e}let Mo=(()=>{class e{historyGo(n){throw new Error("Not implemented")}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:function(){return function(e){const t=A(je).location;return new AD(A(Er),t&&t.origin||"")}()},providedIn:"root"}),e})();const wd=new J("appBaseHref");let AD=(()=>{class e extends Mo{constructor(n,r){if(super(),this._platformLocation=n,this._removeListenerFns=[],null==r&&(r=this._platformLocation.getBaseHrefFromDOM()),null==r)throw new Error("No base href set. Please provide a value for the APP_BASE_HREF token or add a base element to the document.");this._baseHref=r}ngOnDestroy(){for(;this._removeListenerFns.length;)this._removeListenerFns.pop()()}onPopState(n){this._removeListenerFns.push(this._platformLocation.onPopState(n),this._platformLocation.onHashChange(n))}getBaseHref(){return this._baseHref}prepareExternalUrl(n){return Ed(this._baseHref,n)}path(n=!1){const r=this._platformLocation.pathname+An(this._platformLocation.search),o=this._platformLocation.hash;return o&&n?`${r}${o}`:r}pushState(n,r,o,i){const s=this.prepareExternalUrl(o+An(i));this._platformLocation.pushState(n,r,s)}replaceState(n,r,o,i){const s=this.prepareExternalUrl(o+An(i));this._platformLocation.replaceState(n,r,s)}forward(){this._platformLocation.forward()}back(){this._platformLocation.back()}historyGo(n=0){var r,o;null==(o=(r=this._platformLocation).historyGo)||o.call(r,n)}}return e.\u0275fac=function(n){return new(n||e)(A(Er),A(wd,8))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),rx=(()=>{class e extends Mo{constructor(n,r){super(),this._platformLocation=n,this._baseHref="",this._removeListenerFns=[],null!=r&&(this._baseHref=r)}ngOnDestroy(){for(;this._removeListenerFns.length;)this._removeListenerFns.pop()()}onPopState(n){this._removeListenerFns.push(this._platformLocation.onPopState(n),this._platformLocation.onHashChange(n))}getBaseHref(){return this._baseHref}path(n=!1){let r=this._platformLocation.hash;return null==r&&(r="#"),r.length>0?r.substring(1):r}prepareExternalUrl(n){const r=Ed(this._baseHref,n);return r.length>0?"#"+r:r}pushState(n,r,o,i){let s=this.prepareExternalUrl(o+An(i));0==s.length&&(s=this._platformLocation.pathname),this._platformLocation.pushState(n,r,s)}replaceState(n,r,o,i){let s=this.prepareExternalUrl(o+An(i));0==s.length&&(s=this._platformLocation.pathname),this._platformLocation.replaceState(n,r,s)}forward(){this._platformLocation.forward()}back(){this._platformLocation.back()}historyGo(n=0){var r,o;null==(o=(r=this._platformLocation).historyGo)||o.call(r,n)}}return e.\u0275fac=function(n){return new(n||e)(A(Er),A(wd,8))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),bd=(()=>{class e{constructor(n,r){this._subject=new tt,this._urlChangeListeners=[],this._platformStrategy=n;const o=this._platformStrategy.getBaseHref();this._platformLocation=r,this._baseHref=MD(RD(o)),this._platformStrategy.onPopState(i=>{this._subject.emit({url:this.path(!0),pop:!0,state:i.state,type:i.type})})}path(n=!1){return this.normalize(this._platformStrategy.path(n))}getState(){return this._platformLocation.getState()}isCurrentPathEqualTo(n,r=""){return this.path()==this.normalize(n+An(r))}normalize(n){return e.stripTrailingSlash(function(e,t){return e&&t.startsWith(e)?t.substring(e.length):t}(this._baseHref,RD(n)))}prepareExternalUrl(n){return n&&"/"!==n[0]&&(n="/"+n),this._platformStrategy.prepareExternalUrl(n)}go(n,r="",o=null){this._platformStrategy.pushState(o,"",n,r),this._notifyUrlChangeListeners(this.prepareExternalUrl(n+An(r)),o)}replaceState(n,r="",o=null){this._platformStrategy.replaceState(o,"",n,r),this._notifyUrlChangeListeners(this.prepareExternalUrl(n+An(r)),o)}forward(){this._platformStrategy.forward()}back(){this._platformStrategy.back()}historyGo(n=0){var r,o;null==(o=(r=this._platformStrategy).historyGo)||o.call(r,n)}onUrlChange(n){this._urlChangeListeners.push(n),this._urlChangeSubscription||(this._urlChangeSubscription=this.subscribe(r=>{this._notifyUrlChangeListeners(r.url,r.state)}))}_notifyUrlChangeListeners(n="",r){this._urlChangeListeners.forEach(o=>o(n,r))}subscribe(n,r,o){return this._subject.subscribe({next:n,error:r,complete:o})}}return e.normalizeQueryParams=An,e.joinWithSlash=Ed,e.stripTrailingSlash=MD,e.\u0275fac=function(n){return new(n||e)(A(Mo),A(Er))},e.\u0275prov=q({token:e,factory:function(){return new bd(A(Mo),A(Er))},providedIn:"root"}),e})();function RD(e){return e.replace(/\/index.html$/,"")}var ve=(()=>((ve=ve||{})[ve.Zero=0]="Zero",ve[ve.One=1]="One",ve[ve.Two=2]="Two",ve[ve.Few=3]="Few",ve[ve.Many=4]="Many",ve[ve.Other=5]="Other",ve))();const fx=function(e){return function(e){const t=function(e){return e.toLowerCase().replace(/_/g,"-")}(e);let n=ry(t);if(n)return n;const r=t.split("-")[0];if(n=ry(r),n)return n;if("en"===r)return T1;throw new Error(`Missing locale data for the locale "${e}".`)}(e)[b.PluralCase]};class Ba{}let Ux=(()=>{class e extends Ba{constructor(n){super(),this.locale=n}getPluralCategory(n,r){switch(fx(r||this.locale)(n)){case ve.Zero:return"zero";case ve.One:return"one";case ve.Two:return"two";case ve.Few:return"few";case ve.Many:return"many";default:return"other"}}}return e.\u0275fac=function(n){return new(n||e)(A($n))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class Wx{constructor(t,n,r,o){this.$implicit=t,this.ngForOf=n,this.index=r,this.count=o}get first(){return 0===this.index}get last(){return this.index===this.count-1}get even(){return this.index%2==0}get odd(){return!this.even}}let jD=(()=>{class e{constructor(n,r,o){this._viewContainer=n,this._template=r,this._differs=o,this._ngForOf=null,this._ngForOfDirty=!0,this._differ=null}set ngForOf(n){this._ngForOf=n,this._ngForOfDirty=!0}set ngForTrackBy(n){this._trackByFn=n}get ngForTrackBy(){return this._trackByFn}set ngForTemplate(n){n&&(this._template=n)}ngDoCheck(){if(this._ngForOfDirty){this._ngForOfDirty=!1;const n=this._ngForOf;if(!this._differ&&n)try{this._differ=this._differs.find(n).create(this.ngForTrackBy)}catch(r){throw new Error(`Cannot find a differ supporting object '${n}' of type '${function(e){return e.name||typeof e}(n)}'. NgFor only supports binding to Iterables such as Arrays.`)}}if(this._differ){const n=this._differ.diff(this._ngForOf);n&&this._applyChanges(n)}}_applyChanges(n){const r=[];n.forEachOperation((o,i,s)=>{if(null==o.previousIndex){const a=this._viewContainer.createEmbeddedView(this._template,new Wx(null,this._ngForOf,-1,-1),null===s?void 0:s),u=new BD(o,a);r.push(u)}else if(null==s)this._viewContainer.remove(null===i?void 0:i);else if(null!==i){const a=this._viewContainer.get(i);this._viewContainer.move(a,s);const u=new BD(o,a);r.push(u)}});for(let o=0;o<r.length;o++)this._perViewChange(r[o].view,r[o].record);for(let o=0,i=this._viewContainer.length;o<i;o++){const s=this._viewContainer.get(o);s.context.index=o,s.context.count=i,s.context.ngForOf=this._ngForOf}n.forEachIdentityChange(o=>{this._viewContainer.get(o.currentIndex).context.$implicit=o.item})}_perViewChange(n,r){n.context.$implicit=r.item}static ngTemplateContextGuard(n,r){return!0}}return e.\u0275fac=function(n){return new(n||e)(S(Wt),S(Sn),S(Ri))},e.\u0275dir=Ue({type:e,selectors:[["","ngFor","","ngForOf",""]],inputs:{ngForOf:"ngForOf",ngForTrackBy:"ngForTrackBy",ngForTemplate:"ngForTemplate"}}),e})();class BD{constructor(t,n){this.record=t,this.view=n}}let UD=(()=>{class e{constructor(n,r){this._viewContainer=n,this._context=new zx,this._thenTemplateRef=null,this._elseTemplateRef=null,this._thenViewRef=null,this._elseViewRef=null,this._thenTemplateRef=r}set ngIf(n){this._context.$implicit=this._context.ngIf=n,this._updateView()}set ngIfThen(n){HD("ngIfThen",n),this._thenTemplateRef=n,this._thenViewRef=null,this._updateView()}set ngIfElse(n){HD("ngIfElse",n),this._elseTemplateRef=n,this._elseViewRef=null,this._updateView()}_updateView(){this._context.$implicit?this._thenViewRef||(this._viewContainer.clear(),this._elseViewRef=null,this._thenTemplateRef&&(this._thenViewRef=this._viewContainer.createEmbeddedView(this._thenTemplateRef,this._context))):this._elseViewRef||(this._viewContainer.clear(),this._thenViewRef=null,this._elseTemplateRef&&(this._elseViewRef=this._viewContainer.createEmbeddedView(this._elseTemplateRef,this._context)))}static ngTemplateContextGuard(n,r){return!0}}return e.\u0275fac=function(n){return new(n||e)(S(Wt),S(Sn))},e.\u0275dir=Ue({type:e,selectors:[["","ngIf",""]],inputs:{ngIf:"ngIf",ngIfThen:"ngIfThen",ngIfElse:"ngIfElse"}}),e})();class zx{constructor(){this.$implicit=null,this.ngIf=null}}function HD(e,t){if(t&&!t.createEmbeddedView)throw new Error(`${e} must be a TemplateRef, but received '${$(t)}'.`)}let vN=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({providers:[{provide:Ba,useClass:Ux}]}),e})();let bN=(()=>{class e{}return e.\u0275prov=q({token:e,providedIn:"root",factory:()=>new IN(A(je),window)}),e})();class IN{constructor(t,n){this.document=t,this.window=n,this.offset=()=>[0,0]}setOffset(t){this.offset=Array.isArray(t)?()=>t:t}getScrollPosition(){return this.supportsScrolling()?[this.window.pageXOffset,this.window.pageYOffset]:[0,0]}scrollToPosition(t){this.supportsScrolling()&&this.window.scrollTo(t[0],t[1])}scrollToAnchor(t){if(!this.supportsScrolling())return;const n=function(e,t){const n=e.getElementById(t)||e.getElementsByName(t)[0];if(n)return n;if("function"==typeof e.createTreeWalker&&e.body&&(e.body.createShadowRoot||e.body.attachShadow)){const r=e.createTreeWalker(e.body,NodeFilter.SHOW_ELEMENT);let o=r.currentNode;for(;o;){const i=o.shadowRoot;if(i){const s=i.getElementById(t)||i.querySelector(`[name="${t}"]`);if(s)return s}o=r.nextNode()}}return null}(this.document,t);n&&(this.scrollToElement(n),this.attemptFocus(n))}setHistoryScrollRestoration(t){if(this.supportScrollRestoration()){const n=this.window.history;n&&n.scrollRestoration&&(n.scrollRestoration=t)}}scrollToElement(t){const n=t.getBoundingClientRect(),r=n.left+this.window.pageXOffset,o=n.top+this.window.pageYOffset,i=this.offset();this.window.scrollTo(r-i[0],o-i[1])}attemptFocus(t){return t.focus(),this.document.activeElement===t}supportScrollRestoration(){try{if(!this.supportsScrolling())return!1;const t=GD(this.window.history)||GD(Object.getPrototypeOf(this.window.history));return!(!t||!t.writable&&!t.set)}catch(t){return!1}}supportsScrolling(){try{return!!this.window&&!!this.window.scrollTo&&"pageXOffset"in this.window}catch(t){return!1}}}function GD(e){return Object.getOwnPropertyDescriptor(e,"scrollRestoration")}class Ld extends class extends class{}{constructor(){super(...arguments),this.supportsDOMEvents=!0}}{static makeCurrent(){var e;e=new Ld,Ra||(Ra=e)}onAndCancel(t,n,r){return t.addEventListener(n,r,!1),()=>{t.removeEventListener(n,r,!1)}}dispatchEvent(t,n){t.dispatchEvent(n)}remove(t){t.parentNode&&t.parentNode.removeChild(t)}createElement(t,n){return(n=n||this.getDefaultDocument()).createElement(t)}createHtmlDocument(){return document.implementation.createHTMLDocument("fakeTitle")}getDefaultDocument(){return document}isElementNode(t){return t.nodeType===Node.ELEMENT_NODE}isShadowRoot(t){return t instanceof DocumentFragment}getGlobalEventTarget(t,n){return"window"===n?window:"document"===n?t:"body"===n?t.body:null}getBaseHref(t){const n=(qi=qi||document.querySelector("base"),qi?qi.getAttribute("href"):null);return null==n?null:function(e){Ua=Ua||document.createElement("a"),Ua.setAttribute("href",e);const t=Ua.pathname;return"/"===t.charAt(0)?t:`/${t}`}(n)}resetBaseElement(){qi=null}getUserAgent(){return window.navigator.userAgent}getCookie(t){return function(e,t){t=encodeURIComponent(t);for(const n of e.split(";")){const r=n.indexOf("="),[o,i]=-1==r?[n,""]:[n.slice(0,r),n.slice(r+1)];if(o.trim()===t)return decodeURIComponent(i)}return null}(document.cookie,t)}}let Ua,qi=null;const zD=new J("TRANSITION_ID"),NN=[{provide:Mi,useFactory:function(e,t,n){return()=>{n.get(vo).donePromise.then(()=>{const r=Gn(),o=t.querySelectorAll(`style[ng-transition="${e}"]`);for(let i=0;i<o.length;i++)r.remove(o[i])})}},deps:[zD,je,re],multi:!0}];class Vd{static init(){var e;e=new Vd,Wc=e}addToWindow(t){X.getAngularTestability=(r,o=!0)=>{const i=t.findTestabilityInTree(r,o);if(null==i)throw new Error("Could not find testability for element.");return i},X.getAllAngularTestabilities=()=>t.getAllTestabilities(),X.getAllAngularRootElements=()=>t.getAllRootElements(),X.frameworkStabilizers||(X.frameworkStabilizers=[]),X.frameworkStabilizers.push(r=>{const o=X.getAllAngularTestabilities();let i=o.length,s=!1;const a=function(u){s=s||u,i--,0==i&&r(s)};o.forEach(function(u){u.whenStable(a)})})}findTestabilityInTree(t,n,r){if(null==n)return null;const o=t.getTestability(n);return null!=o?o:r?Gn().isShadowRoot(n)?this.findTestabilityInTree(t,n.host,!0):this.findTestabilityInTree(t,n.parentElement,!0):null}}let PN=(()=>{class e{build(){return new XMLHttpRequest}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const Wi=new J("EventManagerPlugins");let $a=(()=>{class e{constructor(n,r){this._zone=r,this._eventNameToPlugin=new Map,n.forEach(o=>o.manager=this),this._plugins=n.slice().reverse()}addEventListener(n,r,o){return this._findPluginFor(r).addEventListener(n,r,o)}addGlobalEventListener(n,r,o){return this._findPluginFor(r).addGlobalEventListener(n,r,o)}getZone(){return this._zone}_findPluginFor(n){const r=this._eventNameToPlugin.get(n);if(r)return r;const o=this._plugins;for(let i=0;i<o.length;i++){const s=o[i];if(s.supports(n))return this._eventNameToPlugin.set(n,s),s}throw new Error(`No event manager plugin found for event ${n}`)}}return e.\u0275fac=function(n){return new(n||e)(A(Wi),A(De))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class jd{constructor(t){this._doc=t}addGlobalEventListener(t,n,r){const o=Gn().getGlobalEventTarget(this._doc,t);if(!o)throw new Error(`Unsupported event target ${o} for event ${n}`);return this.addEventListener(o,n,r)}}let KD=(()=>{class e{constructor(){this._stylesSet=new Set}addStyles(n){const r=new Set;n.forEach(o=>{this._stylesSet.has(o)||(this._stylesSet.add(o),r.add(o))}),this.onStylesAdded(r)}onStylesAdded(n){}getAllStyles(){return Array.from(this._stylesSet)}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),Gi=(()=>{class e extends KD{constructor(n){super(),this._doc=n,this._hostNodes=new Map,this._hostNodes.set(n.head,[])}_addStylesToHost(n,r,o){n.forEach(i=>{const s=this._doc.createElement("style");s.textContent=i,o.push(r.appendChild(s))})}addHost(n){const r=[];this._addStylesToHost(this._stylesSet,n,r),this._hostNodes.set(n,r)}removeHost(n){const r=this._hostNodes.get(n);r&&r.forEach(YD),this._hostNodes.delete(n)}onStylesAdded(n){this._hostNodes.forEach((r,o)=>{this._addStylesToHost(n,o,r)})}ngOnDestroy(){this._hostNodes.forEach(n=>n.forEach(YD))}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function YD(e){Gn().remove(e)}const Bd={svg:"http://www.w3.org/2000/svg",xhtml:"http://www.w3.org/1999/xhtml",xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"},Ud=/%COMP%/g;function qa(e,t,n){for(let r=0;r<t.length;r++){let o=t[r];Array.isArray(o)?qa(e,o,n):(o=o.replace(Ud,e),n.push(o))}return n}function XD(e){return t=>{if("__ngUnwrap__"===t)return e;!1===e(t)&&(t.preventDefault(),t.returnValue=!1)}}let Hd=(()=>{class e{constructor(n,r,o){this.eventManager=n,this.sharedStylesHost=r,this.appId=o,this.rendererByCompId=new Map,this.defaultRenderer=new $d(n)}createRenderer(n,r){if(!n||!r)return this.defaultRenderer;switch(r.encapsulation){case ft.Emulated:{let o=this.rendererByCompId.get(r.id);return o||(o=new QN(this.eventManager,this.sharedStylesHost,r,this.appId),this.rendererByCompId.set(r.id,o)),o.applyToHost(n),o}case 1:case ft.ShadowDom:return new KN(this.eventManager,this.sharedStylesHost,n,r);default:if(!this.rendererByCompId.has(r.id)){const o=qa(r.id,r.styles,[]);this.sharedStylesHost.addStyles(o),this.rendererByCompId.set(r.id,this.defaultRenderer)}return this.defaultRenderer}}begin(){}end(){}}return e.\u0275fac=function(n){return new(n||e)(A($a),A(Gi),A(Ai))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class $d{constructor(t){this.eventManager=t,this.data=Object.create(null),this.destroyNode=null}destroy(){}createElement(t,n){return n?document.createElementNS(Bd[n]||n,t):document.createElement(t)}createComment(t){return document.createComment(t)}createText(t){return document.createTextNode(t)}appendChild(t,n){t.appendChild(n)}insertBefore(t,n,r){t&&t.insertBefore(n,r)}removeChild(t,n){t&&t.removeChild(n)}selectRootElement(t,n){let r="string"==typeof t?document.querySelector(t):t;if(!r)throw new Error(`The selector "${t}" did not match any elements`);return n||(r.textContent=""),r}parentNode(t){return t.parentNode}nextSibling(t){return t.nextSibling}setAttribute(t,n,r,o){if(o){n=o+":"+n;const i=Bd[o];i?t.setAttributeNS(i,n,r):t.setAttribute(n,r)}else t.setAttribute(n,r)}removeAttribute(t,n,r){if(r){const o=Bd[r];o?t.removeAttributeNS(o,n):t.removeAttribute(`${r}:${n}`)}else t.removeAttribute(n)}addClass(t,n){t.classList.add(n)}removeClass(t,n){t.classList.remove(n)}setStyle(t,n,r,o){o&(yt.DashCase|yt.Important)?t.style.setProperty(n,r,o&yt.Important?"important":""):t.style[n]=r}removeStyle(t,n,r){r&yt.DashCase?t.style.removeProperty(n):t.style[n]=""}setProperty(t,n,r){t[n]=r}setValue(t,n){t.nodeValue=n}listen(t,n,r){return"string"==typeof t?this.eventManager.addGlobalEventListener(t,n,XD(r)):this.eventManager.addEventListener(t,n,XD(r))}}class QN extends $d{constructor(t,n,r,o){super(t),this.component=r;const i=qa(o+"-"+r.id,r.styles,[]);n.addStyles(i),this.contentAttr="_ngcontent-%COMP%".replace(Ud,o+"-"+r.id),this.hostAttr="_nghost-%COMP%".replace(Ud,o+"-"+r.id)}applyToHost(t){super.setAttribute(t,this.hostAttr,"")}createElement(t,n){const r=super.createElement(t,n);return super.setAttribute(r,this.contentAttr,""),r}}class KN extends $d{constructor(t,n,r,o){super(t),this.sharedStylesHost=n,this.hostEl=r,this.shadowRoot=r.attachShadow({mode:"open"}),this.sharedStylesHost.addHost(this.shadowRoot);const i=qa(o.id,o.styles,[]);for(let s=0;s<i.length;s++){const a=document.createElement("style");a.textContent=i[s],this.shadowRoot.appendChild(a)}}nodeOrShadowRoot(t){return t===this.hostEl?this.shadowRoot:t}destroy(){this.sharedStylesHost.removeHost(this.shadowRoot)}appendChild(t,n){return super.appendChild(this.nodeOrShadowRoot(t),n)}insertBefore(t,n,r){return super.insertBefore(this.nodeOrShadowRoot(t),n,r)}removeChild(t,n){return super.removeChild(this.nodeOrShadowRoot(t),n)}parentNode(t){return this.nodeOrShadowRoot(super.parentNode(this.nodeOrShadowRoot(t)))}}let YN=(()=>{class e extends jd{constructor(n){super(n)}supports(n){return!0}addEventListener(n,r,o){return n.addEventListener(r,o,!1),()=>this.removeEventListener(n,r,o)}removeEventListener(n,r,o){return n.removeEventListener(r,o)}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const nv=["alt","control","meta","shift"],rP={"\b":"Backspace","\t":"Tab","\x7f":"Delete","\x1b":"Escape",Del:"Delete",Esc:"Escape",Left:"ArrowLeft",Right:"ArrowRight",Up:"ArrowUp",Down:"ArrowDown",Menu:"ContextMenu",Scroll:"ScrollLock",Win:"OS"},rv={A:"1",B:"2",C:"3",D:"4",E:"5",F:"6",G:"7",H:"8",I:"9",J:"*",K:"+",M:"-",N:".",O:"/","`":"0","\x90":"NumLock"},oP={alt:e=>e.altKey,control:e=>e.ctrlKey,meta:e=>e.metaKey,shift:e=>e.shiftKey};let iP=(()=>{class e extends jd{constructor(n){super(n)}supports(n){return null!=e.parseEventName(n)}addEventListener(n,r,o){const i=e.parseEventName(r),s=e.eventCallback(i.fullKey,o,this.manager.getZone());return this.manager.getZone().runOutsideAngular(()=>Gn().onAndCancel(n,i.domEventName,s))}static parseEventName(n){const r=n.toLowerCase().split("."),o=r.shift();if(0===r.length||"keydown"!==o&&"keyup"!==o)return null;const i=e._normalizeKey(r.pop());let s="";if(nv.forEach(u=>{const l=r.indexOf(u);l>-1&&(r.splice(l,1),s+=u+".")}),s+=i,0!=r.length||0===i.length)return null;const a={};return a.domEventName=o,a.fullKey=s,a}static getEventFullKey(n){let r="",o=function(e){let t=e.key;if(null==t){if(t=e.keyIdentifier,null==t)return"Unidentified";t.startsWith("U+")&&(t=String.fromCharCode(parseInt(t.substring(2),16)),3===e.location&&rv.hasOwnProperty(t)&&(t=rv[t]))}return rP[t]||t}(n);return o=o.toLowerCase()," "===o?o="space":"."===o&&(o="dot"),nv.forEach(i=>{i!=o&&oP[i](n)&&(r+=i+".")}),r+=o,r}static eventCallback(n,r,o){return i=>{e.getEventFullKey(i)===n&&o.runGuarded(()=>r(i))}}static _normalizeKey(n){return"esc"===n?"escape":n}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const hP=S_(XM,"browser",[{provide:jc,useValue:"browser"},{provide:g_,useValue:function(){Ld.makeCurrent(),Vd.init()},multi:!0},{provide:je,useFactory:function(){return e=document,Au=e,document;var e},deps:[]}]),pP=[[],{provide:pi,useValue:"root"},{provide:fr,useFactory:function(){return new fr},deps:[]},{provide:Wi,useClass:YN,multi:!0,deps:[je,De,jc]},{provide:Wi,useClass:iP,multi:!0,deps:[je]},[],{provide:Hd,useClass:Hd,deps:[$a,Gi,Ai]},{provide:aa,useExisting:Hd},{provide:KD,useExisting:Gi},{provide:Gi,useClass:Gi,deps:[je]},{provide:qc,useClass:qc,deps:[De]},{provide:$a,useClass:$a,deps:[Wi,De]},{provide:class{},useClass:PN,deps:[]},[]];let gP=(()=>{class e{constructor(n){if(n)throw new Error("BrowserModule has already been loaded. If you need access to common directives such as NgIf and NgFor from a lazy loaded module, import CommonModule instead.")}static withServerTransition(n){return{ngModule:e,providers:[{provide:Ai,useValue:n.appId},{provide:zD,useExisting:Ai},NN]}}}return e.\u0275fac=function(n){return new(n||e)(A(e,12))},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({providers:pP,imports:[vN,sA]}),e})();function H(...e){return Ve(e,Bo(e))}"undefined"!=typeof window&&window;class Xt extends pn{constructor(t){super(),this._value=t}get value(){return this.getValue()}_subscribe(t){const n=super._subscribe(t);return!n.closed&&t.next(this._value),n}getValue(){const{hasError:t,thrownError:n,_value:r}=this;if(t)throw n;return this._throwIfClosed(),r}next(t){super.next(this._value=t)}}const{isArray:wP}=Array,{getPrototypeOf:bP,prototype:IP,keys:TP}=Object;const{isArray:AP}=Array;function PP(...e){const t=Bo(e),n=function(e){return Y(pu(e))?e.pop():void 0}(e),{args:r,keys:o}=function(e){if(1===e.length){const t=e[0];if(wP(t))return{args:t,keys:null};if(function(e){return e&&"object"==typeof e&&bP(e)===IP}(t)){const n=TP(t);return{args:n.map(r=>t[r]),keys:n}}}return{args:e,keys:null}}(e);if(0===r.length)return Ve([],t);const i=new fe(function(e,t,n=Jn){return r=>{iv(t,()=>{const{length:o}=e,i=new Array(o);let s=o,a=o;for(let u=0;u<o;u++)iv(t,()=>{const l=Ve(e[u],t);let c=!1;l.subscribe(new Le(r,d=>{i[u]=d,c||(c=!0,a--),a||r.next(n(i.slice()))},()=>{--s||r.complete()}))},r)},r)}}(r,t,o?s=>function(e,t){return e.reduce((n,r,o)=>(n[r]=t[o],n),{})}(o,s):Jn));return n?i.pipe(function(e){return ae(t=>function(e,t){return AP(t)?e(...t):e(t)}(e,t))}(n)):i}function iv(e,t,n){e?mn(n,e,t):t()}const Wa=Ae(e=>function(){e(this),this.name="EmptyError",this.message="no elements in sequence"});function Qd(...e){return jo(1)(Ve(e,Bo(e)))}function sv(e){return new fe(t=>{gn(e()).subscribe(t)})}function av(){return ke((e,t)=>{let n=null;e._refCount++;const r=new Le(t,void 0,void 0,void 0,()=>{if(!e||e._refCount<=0||0<--e._refCount)return void(n=null);const o=e._connection,i=n;n=null,o&&(!i||o===i)&&o.unsubscribe(),t.unsubscribe()});e.subscribe(r),r.closed||(n=e.connect())})}class kP extends fe{constructor(t,n){super(),this.source=t,this.subjectFactory=n,this._subject=null,this._refCount=0,this._connection=null,xf(t)&&(this.lift=t.lift)}_subscribe(t){return this.getSubject().subscribe(t)}getSubject(){const t=this._subject;return(!t||t.isStopped)&&(this._subject=this.subjectFactory()),this._subject}_teardown(){this._refCount=0;const{_connection:t}=this;this._subject=this._connection=null,null==t||t.unsubscribe()}connect(){let t=this._connection;if(!t){t=this._connection=new Et;const n=this.getSubject();t.add(this.source.subscribe(new Le(n,void 0,()=>{this._teardown(),n.complete()},r=>{this._teardown(),n.error(r)},()=>this._teardown()))),t.closed&&(this._connection=null,t=Et.EMPTY)}return t}refCount(){return av()(this)}}function wr(e,t){return ke((n,r)=>{let o=null,i=0,s=!1;const a=()=>s&&!o&&r.complete();n.subscribe(new Le(r,u=>{null==o||o.unsubscribe();let l=0;const c=i++;gn(e(u,c)).subscribe(o=new Le(r,d=>r.next(t?t(u,d,c,l++):d),()=>{o=null,a()}))},()=>{s=!0,a()}))})}function VP(e,t,n,r,o){return(i,s)=>{let a=n,u=t,l=0;i.subscribe(new Le(s,c=>{const d=l++;u=a?e(u,c,d):(a=!0,c),r&&s.next(u)},o&&(()=>{a&&s.next(u),s.complete()})))}}function uv(e,t){return ke(VP(e,t,arguments.length>=2,!0))}function Ao(e,t){return ke((n,r)=>{let o=0;n.subscribe(new Le(r,i=>e.call(t,i,o++)&&r.next(i)))})}function Qn(e){return ke((t,n)=>{let i,r=null,o=!1;r=t.subscribe(new Le(n,void 0,void 0,s=>{i=gn(e(s,Qn(e)(t))),r?(r.unsubscribe(),r=null,i.subscribe(n)):o=!0})),o&&(r.unsubscribe(),r=null,i.subscribe(n))})}function zi(e,t){return Y(t)?Re(e,t,1):Re(e,1)}function Kd(e){return e<=0?()=>yn:ke((t,n)=>{let r=[];t.subscribe(new Le(n,o=>{r.push(o),e<r.length&&r.shift()},()=>{for(const o of r)n.next(o);n.complete()},void 0,()=>{r=null}))})}function lv(e=jP){return ke((t,n)=>{let r=!1;t.subscribe(new Le(n,o=>{r=!0,n.next(o)},()=>r?n.complete():n.error(e())))})}function jP(){return new Wa}function cv(e){return ke((t,n)=>{let r=!1;t.subscribe(new Le(n,o=>{r=!0,n.next(o)},()=>{r||n.next(e),n.complete()}))})}function Ro(e,t){const n=arguments.length>=2;return r=>r.pipe(e?Ao((o,i)=>e(o,i,r)):Jn,ls(1),n?cv(t):lv(()=>new Wa))}function Ct(e,t,n){const r=Y(e)||t||n?{next:e,error:t,complete:n}:e;return r?ke((o,i)=>{var s;null===(s=r.subscribe)||void 0===s||s.call(r);let a=!0;o.subscribe(new Le(i,u=>{var l;null===(l=r.next)||void 0===l||l.call(r,u),i.next(u)},()=>{var u;a=!1,null===(u=r.complete)||void 0===u||u.call(r),i.complete()},u=>{var l;a=!1,null===(l=r.error)||void 0===l||l.call(r,u),i.error(u)},()=>{var u,l;a&&(null===(u=r.unsubscribe)||void 0===u||u.call(r)),null===(l=r.finalize)||void 0===l||l.call(r)}))}):Jn}class xn{constructor(t,n){this.id=t,this.url=n}}class Yd extends xn{constructor(t,n,r="imperative",o=null){super(t,n),this.navigationTrigger=r,this.restoredState=o}toString(){return`NavigationStart(id: ${this.id}, url: '${this.url}')`}}class Qi extends xn{constructor(t,n,r){super(t,n),this.urlAfterRedirects=r}toString(){return`NavigationEnd(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}')`}}class dv extends xn{constructor(t,n,r){super(t,n),this.reason=r}toString(){return`NavigationCancel(id: ${this.id}, url: '${this.url}')`}}class HP extends xn{constructor(t,n,r){super(t,n),this.error=r}toString(){return`NavigationError(id: ${this.id}, url: '${this.url}', error: ${this.error})`}}class $P extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`RoutesRecognized(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class qP extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`GuardsCheckStart(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class WP extends xn{constructor(t,n,r,o,i){super(t,n),this.urlAfterRedirects=r,this.state=o,this.shouldActivate=i}toString(){return`GuardsCheckEnd(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state}, shouldActivate: ${this.shouldActivate})`}}class GP extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`ResolveStart(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class zP extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`ResolveEnd(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class fv{constructor(t){this.route=t}toString(){return`RouteConfigLoadStart(path: ${this.route.path})`}}class hv{constructor(t){this.route=t}toString(){return`RouteConfigLoadEnd(path: ${this.route.path})`}}class QP{constructor(t){this.snapshot=t}toString(){return`ChildActivationStart(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class KP{constructor(t){this.snapshot=t}toString(){return`ChildActivationEnd(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class YP{constructor(t){this.snapshot=t}toString(){return`ActivationStart(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class ZP{constructor(t){this.snapshot=t}toString(){return`ActivationEnd(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class pv{constructor(t,n,r){this.routerEvent=t,this.position=n,this.anchor=r}toString(){return`Scroll(anchor: '${this.anchor}', position: '${this.position?`${this.position[0]}, ${this.position[1]}`:null}')`}}const G="primary";class JP{constructor(t){this.params=t||{}}has(t){return Object.prototype.hasOwnProperty.call(this.params,t)}get(t){if(this.has(t)){const n=this.params[t];return Array.isArray(n)?n[0]:n}return null}getAll(t){if(this.has(t)){const n=this.params[t];return Array.isArray(n)?n:[n]}return[]}get keys(){return Object.keys(this.params)}}function xo(e){return new JP(e)}const gv="ngNavigationCancelingError";function Zd(e){const t=Error("NavigationCancelingError: "+e);return t[gv]=!0,t}function eF(e,t,n){const r=n.path.split("/");if(r.length>e.length||"full"===n.pathMatch&&(t.hasChildren()||r.length<e.length))return null;const o={};for(let i=0;i<r.length;i++){const s=r[i],a=e[i];if(s.startsWith(":"))o[s.substring(1)]=a;else if(s!==a.path)return null}return{consumed:e.slice(0,r.length),posParams:o}}function fn(e,t){const n=e?Object.keys(e):void 0,r=t?Object.keys(t):void 0;if(!n||!r||n.length!=r.length)return!1;let o;for(let i=0;i<n.length;i++)if(o=n[i],!mv(e[o],t[o]))return!1;return!0}function mv(e,t){if(Array.isArray(e)&&Array.isArray(t)){if(e.length!==t.length)return!1;const n=[...e].sort(),r=[...t].sort();return n.every((o,i)=>r[i]===o)}return e===t}function yv(e){return Array.prototype.concat.apply([],e)}function _v(e){return e.length>0?e[e.length-1]:null}function Be(e,t){for(const n in e)e.hasOwnProperty(n)&&t(e[n],n)}function hn(e){return ac(e)?e:Xs(e)?Ve(Promise.resolve(e)):H(e)}const rF={exact:function Cv(e,t,n){if(!Ir(e.segments,t.segments)||!Ga(e.segments,t.segments,n)||e.numberOfChildren!==t.numberOfChildren)return!1;for(const r in t.children)if(!e.children[r]||!Cv(e.children[r],t.children[r],n))return!1;return!0},subset:Ev},Dv={exact:function(e,t){return fn(e,t)},subset:function(e,t){return Object.keys(t).length<=Object.keys(e).length&&Object.keys(t).every(n=>mv(e[n],t[n]))},ignored:()=>!0};function vv(e,t,n){return rF[n.paths](e.root,t.root,n.matrixParams)&&Dv[n.queryParams](e.queryParams,t.queryParams)&&!("exact"===n.fragment&&e.fragment!==t.fragment)}function Ev(e,t,n){return wv(e,t,t.segments,n)}function wv(e,t,n,r){if(e.segments.length>n.length){const o=e.segments.slice(0,n.length);return!(!Ir(o,n)||t.hasChildren()||!Ga(o,n,r))}if(e.segments.length===n.length){if(!Ir(e.segments,n)||!Ga(e.segments,n,r))return!1;for(const o in t.children)if(!e.children[o]||!Ev(e.children[o],t.children[o],r))return!1;return!0}{const o=n.slice(0,e.segments.length),i=n.slice(e.segments.length);return!!(Ir(e.segments,o)&&Ga(e.segments,o,r)&&e.children[G])&&wv(e.children[G],t,i,r)}}function Ga(e,t,n){return t.every((r,o)=>Dv[n](e[o].parameters,r.parameters))}class br{constructor(t,n,r){this.root=t,this.queryParams=n,this.fragment=r}get queryParamMap(){return this._queryParamMap||(this._queryParamMap=xo(this.queryParams)),this._queryParamMap}toString(){return uF.serialize(this)}}class K{constructor(t,n){this.segments=t,this.children=n,this.parent=null,Be(n,(r,o)=>r.parent=this)}hasChildren(){return this.numberOfChildren>0}get numberOfChildren(){return Object.keys(this.children).length}toString(){return za(this)}}class Ki{constructor(t,n){this.path=t,this.parameters=n}get parameterMap(){return this._parameterMap||(this._parameterMap=xo(this.parameters)),this._parameterMap}toString(){return Mv(this)}}function Ir(e,t){return e.length===t.length&&e.every((n,r)=>n.path===t[r].path)}class bv{}class Iv{parse(t){const n=new yF(t);return new br(n.parseRootSegment(),n.parseQueryParams(),n.parseFragment())}serialize(t){const n=`/${Yi(t.root,!0)}`,r=function(e){const t=Object.keys(e).map(n=>{const r=e[n];return Array.isArray(r)?r.map(o=>`${Qa(n)}=${Qa(o)}`).join("&"):`${Qa(n)}=${Qa(r)}`}).filter(n=>!!n);return t.length?`?${t.join("&")}`:""}(t.queryParams);var e;return`${n}${r}${"string"==typeof t.fragment?`#${e=t.fragment,encodeURI(e)}`:""}`}}const uF=new Iv;function za(e){return e.segments.map(t=>Mv(t)).join("/")}function Yi(e,t){if(!e.hasChildren())return za(e);if(t){const n=e.children[G]?Yi(e.children[G],!1):"",r=[];return Be(e.children,(o,i)=>{i!==G&&r.push(`${i}:${Yi(o,!1)}`)}),r.length>0?`${n}(${r.join("//")})`:n}{const n=function(e,t){let n=[];return Be(e.children,(r,o)=>{o===G&&(n=n.concat(t(r,o)))}),Be(e.children,(r,o)=>{o!==G&&(n=n.concat(t(r,o)))}),n}(e,(r,o)=>o===G?[Yi(e.children[G],!1)]:[`${o}:${Yi(r,!1)}`]);return 1===Object.keys(e.children).length&&null!=e.children[G]?`${za(e)}/${n[0]}`:`${za(e)}/(${n.join("//")})`}}function Tv(e){return encodeURIComponent(e).replace(/%40/g,"@").replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",")}function Qa(e){return Tv(e).replace(/%3B/gi,";")}function Jd(e){return Tv(e).replace(/\(/g,"%28").replace(/\)/g,"%29").replace(/%26/gi,"&")}function Ka(e){return decodeURIComponent(e)}function Sv(e){return Ka(e.replace(/\+/g,"%20"))}function Mv(e){return`${Jd(e.path)}${function(e){return Object.keys(e).map(t=>`;${Jd(t)}=${Jd(e[t])}`).join("")}(e.parameters)}`}const fF=/^[^\/()?;=#]+/;function Ya(e){const t=e.match(fF);return t?t[0]:""}const hF=/^[^=?&#]+/,gF=/^[^&#]+/;class yF{constructor(t){this.url=t,this.remaining=t}parseRootSegment(){return this.consumeOptional("/"),""===this.remaining||this.peekStartsWith("?")||this.peekStartsWith("#")?new K([],{}):new K([],this.parseChildren())}parseQueryParams(){const t={};if(this.consumeOptional("?"))do{this.parseQueryParam(t)}while(this.consumeOptional("&"));return t}parseFragment(){return this.consumeOptional("#")?decodeURIComponent(this.remaining):null}parseChildren(){if(""===this.remaining)return{};this.consumeOptional("/");const t=[];for(this.peekStartsWith("(")||t.push(this.parseSegment());this.peekStartsWith("/")&&!this.peekStartsWith("//")&&!this.peekStartsWith("/(");)this.capture("/"),t.push(this.parseSegment());let n={};this.peekStartsWith("/(")&&(this.capture("/"),n=this.parseParens(!0));let r={};return this.peekStartsWith("(")&&(r=this.parseParens(!1)),(t.length>0||Object.keys(n).length>0)&&(r[G]=new K(t,n)),r}parseSegment(){const t=Ya(this.remaining);if(""===t&&this.peekStartsWith(";"))throw new Error(`Empty path url segment cannot have parameters: '${this.remaining}'.`);return this.capture(t),new Ki(Ka(t),this.parseMatrixParams())}parseMatrixParams(){const t={};for(;this.consumeOptional(";");)this.parseParam(t);return t}parseParam(t){const n=Ya(this.remaining);if(!n)return;this.capture(n);let r="";if(this.consumeOptional("=")){const o=Ya(this.remaining);o&&(r=o,this.capture(r))}t[Ka(n)]=Ka(r)}parseQueryParam(t){const n=function(e){const t=e.match(hF);return t?t[0]:""}(this.remaining);if(!n)return;this.capture(n);let r="";if(this.consumeOptional("=")){const s=function(e){const t=e.match(gF);return t?t[0]:""}(this.remaining);s&&(r=s,this.capture(r))}const o=Sv(n),i=Sv(r);if(t.hasOwnProperty(o)){let s=t[o];Array.isArray(s)||(s=[s],t[o]=s),s.push(i)}else t[o]=i}parseParens(t){const n={};for(this.capture("(");!this.consumeOptional(")")&&this.remaining.length>0;){const r=Ya(this.remaining),o=this.remaining[r.length];if("/"!==o&&")"!==o&&";"!==o)throw new Error(`Cannot parse url '${this.url}'`);let i;r.indexOf(":")>-1?(i=r.substr(0,r.indexOf(":")),this.capture(i),this.capture(":")):t&&(i=G);const s=this.parseChildren();n[i]=1===Object.keys(s).length?s[G]:new K([],s),this.consumeOptional("//")}return n}peekStartsWith(t){return this.remaining.startsWith(t)}consumeOptional(t){return!!this.peekStartsWith(t)&&(this.remaining=this.remaining.substring(t.length),!0)}capture(t){if(!this.consumeOptional(t))throw new Error(`Expected "${t}".`)}}class Av{constructor(t){this._root=t}get root(){return this._root.value}parent(t){const n=this.pathFromRoot(t);return n.length>1?n[n.length-2]:null}children(t){const n=Xd(t,this._root);return n?n.children.map(r=>r.value):[]}firstChild(t){const n=Xd(t,this._root);return n&&n.children.length>0?n.children[0].value:null}siblings(t){const n=ef(t,this._root);return n.length<2?[]:n[n.length-2].children.map(o=>o.value).filter(o=>o!==t)}pathFromRoot(t){return ef(t,this._root).map(n=>n.value)}}function Xd(e,t){if(e===t.value)return t;for(const n of t.children){const r=Xd(e,n);if(r)return r}return null}function ef(e,t){if(e===t.value)return[t];for(const n of t.children){const r=ef(e,n);if(r.length)return r.unshift(t),r}return[]}class Nn{constructor(t,n){this.value=t,this.children=n}toString(){return`TreeNode(${this.value})`}}function No(e){const t={};return e&&e.children.forEach(n=>t[n.value.outlet]=n),t}class Rv extends Av{constructor(t,n){super(t),this.snapshot=n,tf(this,t)}toString(){return this.snapshot.toString()}}function xv(e,t){const n=function(e,t){const s=new Za([],{},{},"",{},G,t,null,e.root,-1,{});return new Pv("",new Nn(s,[]))}(e,t),r=new Xt([new Ki("",{})]),o=new Xt({}),i=new Xt({}),s=new Xt({}),a=new Xt(""),u=new Po(r,o,s,a,i,G,t,n.root);return u.snapshot=n.root,new Rv(new Nn(u,[]),n)}class Po{constructor(t,n,r,o,i,s,a,u){this.url=t,this.params=n,this.queryParams=r,this.fragment=o,this.data=i,this.outlet=s,this.component=a,this._futureSnapshot=u}get routeConfig(){return this._futureSnapshot.routeConfig}get root(){return this._routerState.root}get parent(){return this._routerState.parent(this)}get firstChild(){return this._routerState.firstChild(this)}get children(){return this._routerState.children(this)}get pathFromRoot(){return this._routerState.pathFromRoot(this)}get paramMap(){return this._paramMap||(this._paramMap=this.params.pipe(ae(t=>xo(t)))),this._paramMap}get queryParamMap(){return this._queryParamMap||(this._queryParamMap=this.queryParams.pipe(ae(t=>xo(t)))),this._queryParamMap}toString(){return this.snapshot?this.snapshot.toString():`Future(${this._futureSnapshot})`}}function Nv(e,t="emptyOnly"){const n=e.pathFromRoot;let r=0;if("always"!==t)for(r=n.length-1;r>=1;){const o=n[r],i=n[r-1];if(o.routeConfig&&""===o.routeConfig.path)r--;else{if(i.component)break;r--}}return function(e){return e.reduce((t,n)=>({params:P(P({},t.params),n.params),data:P(P({},t.data),n.data),resolve:P(P({},t.resolve),n._resolvedData)}),{params:{},data:{},resolve:{}})}(n.slice(r))}class Za{constructor(t,n,r,o,i,s,a,u,l,c,d){this.url=t,this.params=n,this.queryParams=r,this.fragment=o,this.data=i,this.outlet=s,this.component=a,this.routeConfig=u,this._urlSegment=l,this._lastPathIndex=c,this._resolve=d}get root(){return this._routerState.root}get parent(){return this._routerState.parent(this)}get firstChild(){return this._routerState.firstChild(this)}get children(){return this._routerState.children(this)}get pathFromRoot(){return this._routerState.pathFromRoot(this)}get paramMap(){return this._paramMap||(this._paramMap=xo(this.params)),this._paramMap}get queryParamMap(){return this._queryParamMap||(this._queryParamMap=xo(this.queryParams)),this._queryParamMap}toString(){return`Route(url:'${this.url.map(r=>r.toString()).join("/")}', path:'${this.routeConfig?this.routeConfig.path:""}')`}}class Pv extends Av{constructor(t,n){super(n),this.url=t,tf(this,n)}toString(){return Fv(this._root)}}function tf(e,t){t.value._routerState=e,t.children.forEach(n=>tf(e,n))}function Fv(e){const t=e.children.length>0?` { ${e.children.map(Fv).join(", ")} } `:"";return`${e.value}${t}`}function nf(e){if(e.snapshot){const t=e.snapshot,n=e._futureSnapshot;e.snapshot=n,fn(t.queryParams,n.queryParams)||e.queryParams.next(n.queryParams),t.fragment!==n.fragment&&e.fragment.next(n.fragment),fn(t.params,n.params)||e.params.next(n.params),function(e,t){if(e.length!==t.length)return!1;for(let n=0;n<e.length;++n)if(!fn(e[n],t[n]))return!1;return!0}(t.url,n.url)||e.url.next(n.url),fn(t.data,n.data)||e.data.next(n.data)}else e.snapshot=e._futureSnapshot,e.data.next(e._futureSnapshot.data)}function rf(e,t){const n=fn(e.params,t.params)&&function(e,t){return Ir(e,t)&&e.every((n,r)=>fn(n.parameters,t[r].parameters))}(e.url,t.url);return n&&!(!e.parent!=!t.parent)&&(!e.parent||rf(e.parent,t.parent))}function Zi(e,t,n){if(n&&e.shouldReuseRoute(t.value,n.value.snapshot)){const r=n.value;r._futureSnapshot=t.value;const o=function(e,t,n){return t.children.map(r=>{for(const o of n.children)if(e.shouldReuseRoute(r.value,o.value.snapshot))return Zi(e,r,o);return Zi(e,r)})}(e,t,n);return new Nn(r,o)}{if(e.shouldAttach(t.value)){const i=e.retrieve(t.value);if(null!==i){const s=i.route;return s.value._futureSnapshot=t.value,s.children=t.children.map(a=>Zi(e,a)),s}}const r=function(e){return new Po(new Xt(e.url),new Xt(e.params),new Xt(e.queryParams),new Xt(e.fragment),new Xt(e.data),e.outlet,e.component,e)}(t.value),o=t.children.map(i=>Zi(e,i));return new Nn(r,o)}}function Ja(e){return"object"==typeof e&&null!=e&&!e.outlets&&!e.segmentPath}function Ji(e){return"object"==typeof e&&null!=e&&e.outlets}function of(e,t,n,r,o){let i={};return r&&Be(r,(s,a)=>{i[a]=Array.isArray(s)?s.map(u=>`${u}`):`${s}`}),new br(n.root===e?t:Ov(n.root,e,t),i,o)}function Ov(e,t,n){const r={};return Be(e.children,(o,i)=>{r[i]=o===t?n:Ov(o,t,n)}),new K(e.segments,r)}class kv{constructor(t,n,r){if(this.isAbsolute=t,this.numberOfDoubleDots=n,this.commands=r,t&&r.length>0&&Ja(r[0]))throw new Error("Root segment cannot have matrix parameters");const o=r.find(Ji);if(o&&o!==_v(r))throw new Error("{outlets:{}} has to be the last command")}toRoot(){return this.isAbsolute&&1===this.commands.length&&"/"==this.commands[0]}}class sf{constructor(t,n,r){this.segmentGroup=t,this.processChildren=n,this.index=r}}function Lv(e,t,n){if(e||(e=new K([],{})),0===e.segments.length&&e.hasChildren())return Xa(e,t,n);const r=function(e,t,n){let r=0,o=t;const i={match:!1,pathIndex:0,commandIndex:0};for(;o<e.segments.length;){if(r>=n.length)return i;const s=e.segments[o],a=n[r];if(Ji(a))break;const u=`${a}`,l=r<n.length-1?n[r+1]:null;if(o>0&&void 0===u)break;if(u&&l&&"object"==typeof l&&void 0===l.outlets){if(!jv(u,l,s))return i;r+=2}else{if(!jv(u,{},s))return i;r++}o++}return{match:!0,pathIndex:o,commandIndex:r}}(e,t,n),o=n.slice(r.commandIndex);if(r.match&&r.pathIndex<e.segments.length){const i=new K(e.segments.slice(0,r.pathIndex),{});return i.children[G]=new K(e.segments.slice(r.pathIndex),e.children),Xa(i,0,o)}return r.match&&0===o.length?new K(e.segments,{}):r.match&&!e.hasChildren()?af(e,t,n):r.match?Xa(e,0,o):af(e,t,n)}function Xa(e,t,n){if(0===n.length)return new K(e.segments,{});{const r=function(e){return Ji(e[0])?e[0].outlets:{[G]:e}}(n),o={};return Be(r,(i,s)=>{"string"==typeof i&&(i=[i]),null!==i&&(o[s]=Lv(e.children[s],t,i))}),Be(e.children,(i,s)=>{void 0===r[s]&&(o[s]=i)}),new K(e.segments,o)}}function af(e,t,n){const r=e.segments.slice(0,t);let o=0;for(;o<n.length;){const i=n[o];if(Ji(i)){const u=AF(i.outlets);return new K(r,u)}if(0===o&&Ja(n[0])){r.push(new Ki(e.segments[t].path,Vv(n[0]))),o++;continue}const s=Ji(i)?i.outlets[G]:`${i}`,a=o<n.length-1?n[o+1]:null;s&&a&&Ja(a)?(r.push(new Ki(s,Vv(a))),o+=2):(r.push(new Ki(s,{})),o++)}return new K(r,{})}function AF(e){const t={};return Be(e,(n,r)=>{"string"==typeof n&&(n=[n]),null!==n&&(t[r]=af(new K([],{}),0,n))}),t}function Vv(e){const t={};return Be(e,(n,r)=>t[r]=`${n}`),t}function jv(e,t,n){return e==n.path&&fn(t,n.parameters)}class xF{constructor(t,n,r,o){this.routeReuseStrategy=t,this.futureState=n,this.currState=r,this.forwardEvent=o}activate(t){const n=this.futureState._root,r=this.currState?this.currState._root:null;this.deactivateChildRoutes(n,r,t),nf(this.futureState.root),this.activateChildRoutes(n,r,t)}deactivateChildRoutes(t,n,r){const o=No(n);t.children.forEach(i=>{const s=i.value.outlet;this.deactivateRoutes(i,o[s],r),delete o[s]}),Be(o,(i,s)=>{this.deactivateRouteAndItsChildren(i,r)})}deactivateRoutes(t,n,r){const o=t.value,i=n?n.value:null;if(o===i)if(o.component){const s=r.getContext(o.outlet);s&&this.deactivateChildRoutes(t,n,s.children)}else this.deactivateChildRoutes(t,n,r);else i&&this.deactivateRouteAndItsChildren(n,r)}deactivateRouteAndItsChildren(t,n){this.routeReuseStrategy.shouldDetach(t.value.snapshot)?this.detachAndStoreRouteSubtree(t,n):this.deactivateRouteAndOutlet(t,n)}detachAndStoreRouteSubtree(t,n){const r=n.getContext(t.value.outlet),o=r&&t.value.component?r.children:n,i=No(t);for(const s of Object.keys(i))this.deactivateRouteAndItsChildren(i[s],o);if(r&&r.outlet){const s=r.outlet.detach(),a=r.children.onOutletDeactivated();this.routeReuseStrategy.store(t.value.snapshot,{componentRef:s,route:t,contexts:a})}}deactivateRouteAndOutlet(t,n){const r=n.getContext(t.value.outlet),o=r&&t.value.component?r.children:n,i=No(t);for(const s of Object.keys(i))this.deactivateRouteAndItsChildren(i[s],o);r&&r.outlet&&(r.outlet.deactivate(),r.children.onOutletDeactivated(),r.attachRef=null,r.resolver=null,r.route=null)}activateChildRoutes(t,n,r){const o=No(n);t.children.forEach(i=>{this.activateRoutes(i,o[i.value.outlet],r),this.forwardEvent(new ZP(i.value.snapshot))}),t.children.length&&this.forwardEvent(new KP(t.value.snapshot))}activateRoutes(t,n,r){const o=t.value,i=n?n.value:null;if(nf(o),o===i)if(o.component){const s=r.getOrCreateContext(o.outlet);this.activateChildRoutes(t,n,s.children)}else this.activateChildRoutes(t,n,r);else if(o.component){const s=r.getOrCreateContext(o.outlet);if(this.routeReuseStrategy.shouldAttach(o.snapshot)){const a=this.routeReuseStrategy.retrieve(o.snapshot);this.routeReuseStrategy.store(o.snapshot,null),s.children.onOutletReAttached(a.contexts),s.attachRef=a.componentRef,s.route=a.route.value,s.outlet&&s.outlet.attach(a.componentRef,a.route.value),nf(a.route.value),this.activateChildRoutes(t,null,s.children)}else{const a=function(e){for(let t=e.parent;t;t=t.parent){const n=t.routeConfig;if(n&&n._loadedConfig)return n._loadedConfig;if(n&&n.component)return null}return null}(o.snapshot),u=a?a.module.componentFactoryResolver:null;s.attachRef=null,s.route=o,s.resolver=u,s.outlet&&s.outlet.activateWith(o,u),this.activateChildRoutes(t,null,s.children)}}else this.activateChildRoutes(t,null,r)}}class uf{constructor(t,n){this.routes=t,this.module=n}}function Kn(e){return"function"==typeof e}function Tr(e){return e instanceof br}const Xi=Symbol("INITIAL_VALUE");function es(){return wr(e=>PP(e.map(t=>t.pipe(ls(1),function(...e){const t=Bo(e);return ke((n,r)=>{(t?Qd(e,n,t):Qd(e,n)).subscribe(r)})}(Xi)))).pipe(uv((t,n)=>{let r=!1;return n.reduce((o,i,s)=>o!==Xi?o:(i===Xi&&(r=!0),r||!1!==i&&s!==n.length-1&&!Tr(i)?o:i),t)},Xi),Ao(t=>t!==Xi),ae(t=>Tr(t)?t:!0===t),ls(1)))}class VF{constructor(){this.outlet=null,this.route=null,this.resolver=null,this.children=new ts,this.attachRef=null}}class ts{constructor(){this.contexts=new Map}onChildOutletCreated(t,n){const r=this.getOrCreateContext(t);r.outlet=n,this.contexts.set(t,r)}onChildOutletDestroyed(t){const n=this.getContext(t);n&&(n.outlet=null,n.attachRef=null)}onOutletDeactivated(){const t=this.contexts;return this.contexts=new Map,t}onOutletReAttached(t){this.contexts=t}getOrCreateContext(t){let n=this.getContext(t);return n||(n=new VF,this.contexts.set(t,n)),n}getContext(t){return this.contexts.get(t)||null}}let lf=(()=>{class e{constructor(n,r,o,i,s){this.parentContexts=n,this.location=r,this.resolver=o,this.changeDetector=s,this.activated=null,this._activatedRoute=null,this.activateEvents=new tt,this.deactivateEvents=new tt,this.attachEvents=new tt,this.detachEvents=new tt,this.name=i||G,n.onChildOutletCreated(this.name,this)}ngOnDestroy(){this.parentContexts.onChildOutletDestroyed(this.name)}ngOnInit(){if(!this.activated){const n=this.parentContexts.getContext(this.name);n&&n.route&&(n.attachRef?this.attach(n.attachRef,n.route):this.activateWith(n.route,n.resolver||null))}}get isActivated(){return!!this.activated}get component(){if(!this.activated)throw new Error("Outlet is not activated");return this.activated.instance}get activatedRoute(){if(!this.activated)throw new Error("Outlet is not activated");return this._activatedRoute}get activatedRouteData(){return this._activatedRoute?this._activatedRoute.snapshot.data:{}}detach(){if(!this.activated)throw new Error("Outlet is not activated");this.location.detach();const n=this.activated;return this.activated=null,this._activatedRoute=null,this.detachEvents.emit(n.instance),n}attach(n,r){this.activated=n,this._activatedRoute=r,this.location.insert(n.hostView),this.attachEvents.emit(n.instance)}deactivate(){if(this.activated){const n=this.component;this.activated.destroy(),this.activated=null,this._activatedRoute=null,this.deactivateEvents.emit(n)}}activateWith(n,r){if(this.isActivated)throw new Error("Cannot activate an already activated outlet");this._activatedRoute=n;const s=(r=r||this.resolver).resolveComponentFactory(n._futureSnapshot.routeConfig.component),a=this.parentContexts.getOrCreateContext(this.name).children,u=new jF(n,a,this.location.injector);this.activated=this.location.createComponent(s,this.location.length,u),this.changeDetector.markForCheck(),this.activateEvents.emit(this.activated.instance)}}return e.\u0275fac=function(n){return new(n||e)(S(ts),S(Wt),S(yr),function(e){return function(e,t){if("class"===t)return e.classes;if("style"===t)return e.styles;const n=e.attrs;if(n){const r=n.length;let o=0;for(;o<r;){const i=n[o];if(Ih(i))break;if(0===i)o+=2;else if("number"==typeof i)for(o++;o<r&&"string"==typeof n[o];)o++;else{if(i===t)return n[o+1];o+=2}}}return null}(Ee(),e)}("name"),S(Kc))},e.\u0275dir=Ue({type:e,selectors:[["router-outlet"]],outputs:{activateEvents:"activate",deactivateEvents:"deactivate",attachEvents:"attach",detachEvents:"detach"},exportAs:["outlet"]}),e})();class jF{constructor(t,n,r){this.route=t,this.childContexts=n,this.parent=r}get(t,n){return t===Po?this.route:t===ts?this.childContexts:this.parent.get(t,n)}}let Bv=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275cmp=Ar({type:e,selectors:[["ng-component"]],decls:1,vars:0,template:function(n,r){1&n&&Ne(0,"router-outlet")},directives:[lf],encapsulation:2}),e})();function Uv(e,t=""){for(let n=0;n<e.length;n++){const r=e[n];BF(r,UF(t,r))}}function BF(e,t){e.children&&Uv(e.children,t)}function UF(e,t){return t?e||t.path?e&&!t.path?`${e}/`:!e&&t.path?t.path:`${e}/${t.path}`:"":e}function cf(e){const t=e.children&&e.children.map(cf),n=t?lt(P({},e),{children:t}):P({},e);return!n.component&&(t||n.loadChildren)&&n.outlet&&n.outlet!==G&&(n.component=Bv),n}function Ft(e){return e.outlet||G}function Hv(e,t){const n=e.filter(r=>Ft(r)===t);return n.push(...e.filter(r=>Ft(r)!==t)),n}const $v={matched:!1,consumedSegments:[],lastChild:0,parameters:{},positionalParamSegments:{}};function eu(e,t,n){var a;if(""===t.path)return"full"===t.pathMatch&&(e.hasChildren()||n.length>0)?P({},$v):{matched:!0,consumedSegments:[],lastChild:0,parameters:{},positionalParamSegments:{}};const o=(t.matcher||eF)(n,e,t);if(!o)return P({},$v);const i={};Be(o.posParams,(u,l)=>{i[l]=u.path});const s=o.consumed.length>0?P(P({},i),o.consumed[o.consumed.length-1].parameters):i;return{matched:!0,consumedSegments:o.consumed,lastChild:o.consumed.length,parameters:s,positionalParamSegments:null!=(a=o.posParams)?a:{}}}function tu(e,t,n,r,o="corrected"){if(n.length>0&&function(e,t,n){return n.some(r=>nu(e,t,r)&&Ft(r)!==G)}(e,n,r)){const s=new K(t,function(e,t,n,r){const o={};o[G]=r,r._sourceSegment=e,r._segmentIndexShift=t.length;for(const i of n)if(""===i.path&&Ft(i)!==G){const s=new K([],{});s._sourceSegment=e,s._segmentIndexShift=t.length,o[Ft(i)]=s}return o}(e,t,r,new K(n,e.children)));return s._sourceSegment=e,s._segmentIndexShift=t.length,{segmentGroup:s,slicedSegments:[]}}if(0===n.length&&function(e,t,n){return n.some(r=>nu(e,t,r))}(e,n,r)){const s=new K(e.segments,function(e,t,n,r,o,i){const s={};for(const a of r)if(nu(e,n,a)&&!o[Ft(a)]){const u=new K([],{});u._sourceSegment=e,u._segmentIndexShift="legacy"===i?e.segments.length:t.length,s[Ft(a)]=u}return P(P({},o),s)}(e,t,n,r,e.children,o));return s._sourceSegment=e,s._segmentIndexShift=t.length,{segmentGroup:s,slicedSegments:n}}const i=new K(e.segments,e.children);return i._sourceSegment=e,i._segmentIndexShift=t.length,{segmentGroup:i,slicedSegments:n}}function nu(e,t,n){return(!(e.hasChildren()||t.length>0)||"full"!==n.pathMatch)&&""===n.path}function qv(e,t,n,r){return!!(Ft(e)===r||r!==G&&nu(t,n,e))&&("**"===e.path||eu(t,e,n).matched)}function Wv(e,t,n){return 0===t.length&&!e.children[n]}class ns{constructor(t){this.segmentGroup=t||null}}class Gv{constructor(t){this.urlTree=t}}function ru(e){return new fe(t=>t.error(new ns(e)))}function zv(e){return new fe(t=>t.error(new Gv(e)))}function GF(e){return new fe(t=>t.error(new Error(`Only absolute redirects can have named outlets. redirectTo: '${e}'`)))}class KF{constructor(t,n,r,o,i){this.configLoader=n,this.urlSerializer=r,this.urlTree=o,this.config=i,this.allowRedirects=!0,this.ngModule=t.get(dn)}apply(){const t=tu(this.urlTree.root,[],[],this.config).segmentGroup,n=new K(t.segments,t.children);return this.expandSegmentGroup(this.ngModule,this.config,n,G).pipe(ae(i=>this.createUrlTree(df(i),this.urlTree.queryParams,this.urlTree.fragment))).pipe(Qn(i=>{if(i instanceof Gv)return this.allowRedirects=!1,this.match(i.urlTree);throw i instanceof ns?this.noMatchError(i):i}))}match(t){return this.expandSegmentGroup(this.ngModule,this.config,t.root,G).pipe(ae(o=>this.createUrlTree(df(o),t.queryParams,t.fragment))).pipe(Qn(o=>{throw o instanceof ns?this.noMatchError(o):o}))}noMatchError(t){return new Error(`Cannot match any routes. URL Segment: '${t.segmentGroup}'`)}createUrlTree(t,n,r){const o=t.segments.length>0?new K([],{[G]:t}):t;return new br(o,n,r)}expandSegmentGroup(t,n,r,o){return 0===r.segments.length&&r.hasChildren()?this.expandChildren(t,n,r).pipe(ae(i=>new K([],i))):this.expandSegment(t,r,n,r.segments,o,!0)}expandChildren(t,n,r){const o=[];for(const i of Object.keys(r.children))"primary"===i?o.unshift(i):o.push(i);return Ve(o).pipe(zi(i=>{const s=r.children[i],a=Hv(n,i);return this.expandSegmentGroup(t,a,s,i).pipe(ae(u=>({segment:u,outlet:i})))}),uv((i,s)=>(i[s.outlet]=s.segment,i),{}),function(e,t){const n=arguments.length>=2;return r=>r.pipe(e?Ao((o,i)=>e(o,i,r)):Jn,Kd(1),n?cv(t):lv(()=>new Wa))}())}expandSegment(t,n,r,o,i,s){return Ve(r).pipe(zi(a=>this.expandSegmentAgainstRoute(t,n,r,a,o,i,s).pipe(Qn(l=>{if(l instanceof ns)return H(null);throw l}))),Ro(a=>!!a),Qn((a,u)=>{if(a instanceof Wa||"EmptyError"===a.name){if(Wv(n,o,i))return H(new K([],{}));throw new ns(n)}throw a}))}expandSegmentAgainstRoute(t,n,r,o,i,s,a){return qv(o,n,i,s)?void 0===o.redirectTo?this.matchSegmentAgainstRoute(t,n,o,i,s):a&&this.allowRedirects?this.expandSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s):ru(n):ru(n)}expandSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s){return"**"===o.path?this.expandWildCardWithParamsAgainstRouteUsingRedirect(t,r,o,s):this.expandRegularSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s)}expandWildCardWithParamsAgainstRouteUsingRedirect(t,n,r,o){const i=this.applyRedirectCommands([],r.redirectTo,{});return r.redirectTo.startsWith("/")?zv(i):this.lineralizeSegments(r,i).pipe(Re(s=>{const a=new K(s,{});return this.expandSegment(t,a,n,s,o,!1)}))}expandRegularSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s){const{matched:a,consumedSegments:u,lastChild:l,positionalParamSegments:c}=eu(n,o,i);if(!a)return ru(n);const d=this.applyRedirectCommands(u,o.redirectTo,c);return o.redirectTo.startsWith("/")?zv(d):this.lineralizeSegments(o,d).pipe(Re(f=>this.expandSegment(t,n,r,f.concat(i.slice(l)),s,!1)))}matchSegmentAgainstRoute(t,n,r,o,i){if("**"===r.path)return r.loadChildren?(r._loadedConfig?H(r._loadedConfig):this.configLoader.load(t.injector,r)).pipe(ae(f=>(r._loadedConfig=f,new K(o,{})))):H(new K(o,{}));const{matched:s,consumedSegments:a,lastChild:u}=eu(n,r,o);if(!s)return ru(n);const l=o.slice(u);return this.getChildConfig(t,r,o).pipe(Re(d=>{const f=d.module,h=d.routes,{segmentGroup:m,slicedSegments:_}=tu(n,a,l,h),y=new K(m.segments,m.children);if(0===_.length&&y.hasChildren())return this.expandChildren(f,h,y).pipe(ae(T=>new K(a,T)));if(0===h.length&&0===_.length)return H(new K(a,{}));const v=Ft(r)===i;return this.expandSegment(f,y,h,_,v?G:i,!0).pipe(ae(I=>new K(a.concat(I.segments),I.children)))}))}getChildConfig(t,n,r){return n.children?H(new uf(n.children,t)):n.loadChildren?void 0!==n._loadedConfig?H(n._loadedConfig):this.runCanLoadGuards(t.injector,n,r).pipe(Re(o=>{return o?this.configLoader.load(t.injector,n).pipe(ae(i=>(n._loadedConfig=i,i))):(e=n,new fe(t=>t.error(Zd(`Cannot load children because the guard of the route "path: '${e.path}'" returned false`))));var e})):H(new uf([],t))}runCanLoadGuards(t,n,r){const o=n.canLoad;return o&&0!==o.length?H(o.map(s=>{const a=t.get(s);let u;if((e=a)&&Kn(e.canLoad))u=a.canLoad(n,r);else{if(!Kn(a))throw new Error("Invalid CanLoad guard");u=a(n,r)}var e;return hn(u)})).pipe(es(),Ct(s=>{if(!Tr(s))return;const a=Zd(`Redirecting to "${this.urlSerializer.serialize(s)}"`);throw a.url=s,a}),ae(s=>!0===s)):H(!0)}lineralizeSegments(t,n){let r=[],o=n.root;for(;;){if(r=r.concat(o.segments),0===o.numberOfChildren)return H(r);if(o.numberOfChildren>1||!o.children[G])return GF(t.redirectTo);o=o.children[G]}}applyRedirectCommands(t,n,r){return this.applyRedirectCreatreUrlTree(n,this.urlSerializer.parse(n),t,r)}applyRedirectCreatreUrlTree(t,n,r,o){const i=this.createSegmentGroup(t,n.root,r,o);return new br(i,this.createQueryParams(n.queryParams,this.urlTree.queryParams),n.fragment)}createQueryParams(t,n){const r={};return Be(t,(o,i)=>{if("string"==typeof o&&o.startsWith(":")){const a=o.substring(1);r[i]=n[a]}else r[i]=o}),r}createSegmentGroup(t,n,r,o){const i=this.createSegments(t,n.segments,r,o);let s={};return Be(n.children,(a,u)=>{s[u]=this.createSegmentGroup(t,a,r,o)}),new K(i,s)}createSegments(t,n,r,o){return n.map(i=>i.path.startsWith(":")?this.findPosParam(t,i,o):this.findOrReturn(i,r))}findPosParam(t,n,r){const o=r[n.path.substring(1)];if(!o)throw new Error(`Cannot redirect to '${t}'. Cannot find '${n.path}'.`);return o}findOrReturn(t,n){let r=0;for(const o of n){if(o.path===t.path)return n.splice(r),o;r++}return t}}function df(e){const t={};for(const r of Object.keys(e.children)){const i=df(e.children[r]);(i.segments.length>0||i.hasChildren())&&(t[r]=i)}return function(e){if(1===e.numberOfChildren&&e.children[G]){const t=e.children[G];return new K(e.segments.concat(t.segments),t.children)}return e}(new K(e.segments,t))}class Qv{constructor(t){this.path=t,this.route=this.path[this.path.length-1]}}class ou{constructor(t,n){this.component=t,this.route=n}}function JF(e,t,n){const r=e._root;return rs(r,t?t._root:null,n,[r.value])}function iu(e,t,n){const r=function(e){if(!e)return null;for(let t=e.parent;t;t=t.parent){const n=t.routeConfig;if(n&&n._loadedConfig)return n._loadedConfig}return null}(t);return(r?r.module.injector:n).get(e)}function rs(e,t,n,r,o={canDeactivateChecks:[],canActivateChecks:[]}){const i=No(t);return e.children.forEach(s=>{(function(e,t,n,r,o={canDeactivateChecks:[],canActivateChecks:[]}){const i=e.value,s=t?t.value:null,a=n?n.getContext(e.value.outlet):null;if(s&&i.routeConfig===s.routeConfig){const u=function(e,t,n){if("function"==typeof n)return n(e,t);switch(n){case"pathParamsChange":return!Ir(e.url,t.url);case"pathParamsOrQueryParamsChange":return!Ir(e.url,t.url)||!fn(e.queryParams,t.queryParams);case"always":return!0;case"paramsOrQueryParamsChange":return!rf(e,t)||!fn(e.queryParams,t.queryParams);default:return!rf(e,t)}}(s,i,i.routeConfig.runGuardsAndResolvers);u?o.canActivateChecks.push(new Qv(r)):(i.data=s.data,i._resolvedData=s._resolvedData),rs(e,t,i.component?a?a.children:null:n,r,o),u&&a&&a.outlet&&a.outlet.isActivated&&o.canDeactivateChecks.push(new ou(a.outlet.component,s))}else s&&os(t,a,o),o.canActivateChecks.push(new Qv(r)),rs(e,null,i.component?a?a.children:null:n,r,o)})(s,i[s.value.outlet],n,r.concat([s.value]),o),delete i[s.value.outlet]}),Be(i,(s,a)=>os(s,n.getContext(a),o)),o}function os(e,t,n){const r=No(e),o=e.value;Be(r,(i,s)=>{os(i,o.component?t?t.children.getContext(s):null:t,n)}),n.canDeactivateChecks.push(new ou(o.component&&t&&t.outlet&&t.outlet.isActivated?t.outlet.component:null,o))}class dO{}function Kv(e){return new fe(t=>t.error(e))}class hO{constructor(t,n,r,o,i,s){this.rootComponentType=t,this.config=n,this.urlTree=r,this.url=o,this.paramsInheritanceStrategy=i,this.relativeLinkResolution=s}recognize(){const t=tu(this.urlTree.root,[],[],this.config.filter(s=>void 0===s.redirectTo),this.relativeLinkResolution).segmentGroup,n=this.processSegmentGroup(this.config,t,G);if(null===n)return null;const r=new Za([],Object.freeze({}),Object.freeze(P({},this.urlTree.queryParams)),this.urlTree.fragment,{},G,this.rootComponentType,null,this.urlTree.root,-1,{}),o=new Nn(r,n),i=new Pv(this.url,o);return this.inheritParamsAndData(i._root),i}inheritParamsAndData(t){const n=t.value,r=Nv(n,this.paramsInheritanceStrategy);n.params=Object.freeze(r.params),n.data=Object.freeze(r.data),t.children.forEach(o=>this.inheritParamsAndData(o))}processSegmentGroup(t,n,r){return 0===n.segments.length&&n.hasChildren()?this.processChildren(t,n):this.processSegment(t,n,n.segments,r)}processChildren(t,n){const r=[];for(const i of Object.keys(n.children)){const s=n.children[i],a=Hv(t,i),u=this.processSegmentGroup(a,s,i);if(null===u)return null;r.push(...u)}const o=Yv(r);return o.sort((t,n)=>t.value.outlet===G?-1:n.value.outlet===G?1:t.value.outlet.localeCompare(n.value.outlet)),o}processSegment(t,n,r,o){for(const i of t){const s=this.processSegmentAgainstRoute(i,n,r,o);if(null!==s)return s}return Wv(n,r,o)?[]:null}processSegmentAgainstRoute(t,n,r,o){if(t.redirectTo||!qv(t,n,r,o))return null;let i,s=[],a=[];if("**"===t.path){const h=r.length>0?_v(r).parameters:{};i=new Za(r,h,Object.freeze(P({},this.urlTree.queryParams)),this.urlTree.fragment,Xv(t),Ft(t),t.component,t,Zv(n),Jv(n)+r.length,eC(t))}else{const h=eu(n,t,r);if(!h.matched)return null;s=h.consumedSegments,a=r.slice(h.lastChild),i=new Za(s,h.parameters,Object.freeze(P({},this.urlTree.queryParams)),this.urlTree.fragment,Xv(t),Ft(t),t.component,t,Zv(n),Jv(n)+s.length,eC(t))}const u=(e=t).children?e.children:e.loadChildren?e._loadedConfig.routes:[],{segmentGroup:l,slicedSegments:c}=tu(n,s,a,u.filter(h=>void 0===h.redirectTo),this.relativeLinkResolution);var e;if(0===c.length&&l.hasChildren()){const h=this.processChildren(u,l);return null===h?null:[new Nn(i,h)]}if(0===u.length&&0===c.length)return[new Nn(i,[])];const d=Ft(t)===o,f=this.processSegment(u,l,c,d?G:o);return null===f?null:[new Nn(i,f)]}}function mO(e){const t=e.value.routeConfig;return t&&""===t.path&&void 0===t.redirectTo}function Yv(e){const t=[],n=new Set;for(const r of e){if(!mO(r)){t.push(r);continue}const o=t.find(i=>r.value.routeConfig===i.value.routeConfig);void 0!==o?(o.children.push(...r.children),n.add(o)):t.push(r)}for(const r of n){const o=Yv(r.children);t.push(new Nn(r.value,o))}return t.filter(r=>!n.has(r))}function Zv(e){let t=e;for(;t._sourceSegment;)t=t._sourceSegment;return t}function Jv(e){let t=e,n=t._segmentIndexShift?t._segmentIndexShift:0;for(;t._sourceSegment;)t=t._sourceSegment,n+=t._segmentIndexShift?t._segmentIndexShift:0;return n-1}function Xv(e){return e.data||{}}function eC(e){return e.resolve||{}}function ff(e){return wr(t=>{const n=e(t);return n?Ve(n).pipe(ae(()=>t)):H(t)})}class bO extends class{shouldDetach(t){return!1}store(t,n){}shouldAttach(t){return!1}retrieve(t){return null}shouldReuseRoute(t,n){return t.routeConfig===n.routeConfig}}{}const hf=new J("ROUTES");class tC{constructor(t,n,r,o){this.injector=t,this.compiler=n,this.onLoadStartListener=r,this.onLoadEndListener=o}load(t,n){if(n._loader$)return n._loader$;this.onLoadStartListener&&this.onLoadStartListener(n);const o=this.loadModuleFactory(n.loadChildren).pipe(ae(i=>{this.onLoadEndListener&&this.onLoadEndListener(n);const s=i.create(t);return new uf(yv(s.injector.get(hf,void 0,R.Self|R.Optional)).map(cf),s)}),Qn(i=>{throw n._loader$=void 0,i}));return n._loader$=new kP(o,()=>new pn).pipe(av()),n._loader$}loadModuleFactory(t){return hn(t()).pipe(Re(n=>n instanceof ky?H(n):Ve(this.compiler.compileModuleAsync(n))))}}class TO{shouldProcessUrl(t){return!0}extract(t){return t}merge(t,n){return t}}function SO(e){throw e}function MO(e,t,n){return t.parse("/")}function nC(e,t){return H(null)}const AO={paths:"exact",fragment:"ignored",matrixParams:"ignored",queryParams:"exact"},RO={paths:"subset",fragment:"ignored",matrixParams:"ignored",queryParams:"subset"};let ot=(()=>{class e{constructor(n,r,o,i,s,a,u){this.rootComponentType=n,this.urlSerializer=r,this.rootContexts=o,this.location=i,this.config=u,this.lastSuccessfulNavigation=null,this.currentNavigation=null,this.disposed=!1,this.navigationId=0,this.currentPageId=0,this.isNgZoneEnabled=!1,this.events=new pn,this.errorHandler=SO,this.malformedUriErrorHandler=MO,this.navigated=!1,this.lastSuccessfulId=-1,this.hooks={beforePreactivation:nC,afterPreactivation:nC},this.urlHandlingStrategy=new TO,this.routeReuseStrategy=new bO,this.onSameUrlNavigation="ignore",this.paramsInheritanceStrategy="emptyOnly",this.urlUpdateStrategy="deferred",this.relativeLinkResolution="corrected",this.canceledNavigationResolution="replace",this.ngModule=s.get(dn),this.console=s.get(ga);const d=s.get(De);this.isNgZoneEnabled=d instanceof De&&De.isInAngularZone(),this.resetConfig(u),this.currentUrlTree=new br(new K([],{}),{},null),this.rawUrlTree=this.currentUrlTree,this.browserUrlTree=this.currentUrlTree,this.configLoader=new tC(s,a,f=>this.triggerEvent(new fv(f)),f=>this.triggerEvent(new hv(f))),this.routerState=xv(this.currentUrlTree,this.rootComponentType),this.transitions=new Xt({id:0,targetPageId:0,currentUrlTree:this.currentUrlTree,currentRawUrl:this.currentUrlTree,extractedUrl:this.urlHandlingStrategy.extract(this.currentUrlTree),urlAfterRedirects:this.urlHandlingStrategy.extract(this.currentUrlTree),rawUrl:this.currentUrlTree,extras:{},resolve:null,reject:null,promise:Promise.resolve(!0),source:"imperative",restoredState:null,currentSnapshot:this.routerState.snapshot,targetSnapshot:null,currentRouterState:this.routerState,targetRouterState:null,guards:{canActivateChecks:[],canDeactivateChecks:[]},guardsResult:null}),this.navigations=this.setupNavigations(this.transitions),this.processNavigations()}get browserPageId(){var n;return null==(n=this.location.getState())?void 0:n.\u0275routerPageId}setupNavigations(n){const r=this.events;return n.pipe(Ao(o=>0!==o.id),ae(o=>lt(P({},o),{extractedUrl:this.urlHandlingStrategy.extract(o.rawUrl)})),wr(o=>{let i=!1,s=!1;return H(o).pipe(Ct(a=>{this.currentNavigation={id:a.id,initialUrl:a.currentRawUrl,extractedUrl:a.extractedUrl,trigger:a.source,extras:a.extras,previousNavigation:this.lastSuccessfulNavigation?lt(P({},this.lastSuccessfulNavigation),{previousNavigation:null}):null}}),wr(a=>{const u=this.browserUrlTree.toString(),l=!this.navigated||a.extractedUrl.toString()!==u||u!==this.currentUrlTree.toString();if(("reload"===this.onSameUrlNavigation||l)&&this.urlHandlingStrategy.shouldProcessUrl(a.rawUrl))return su(a.source)&&(this.browserUrlTree=a.extractedUrl),H(a).pipe(wr(d=>{const f=this.transitions.getValue();return r.next(new Yd(d.id,this.serializeUrl(d.extractedUrl),d.source,d.restoredState)),f!==this.transitions.getValue()?yn:Promise.resolve(d)}),function(e,t,n,r){return wr(o=>function(e,t,n,r,o){return new KF(e,t,n,r,o).apply()}(e,t,n,o.extractedUrl,r).pipe(ae(i=>lt(P({},o),{urlAfterRedirects:i}))))}(this.ngModule.injector,this.configLoader,this.urlSerializer,this.config),Ct(d=>{this.currentNavigation=lt(P({},this.currentNavigation),{finalUrl:d.urlAfterRedirects})}),function(e,t,n,r,o){return Re(i=>function(e,t,n,r,o="emptyOnly",i="legacy"){try{const s=new hO(e,t,n,r,o,i).recognize();return null===s?Kv(new dO):H(s)}catch(s){return Kv(s)}}(e,t,i.urlAfterRedirects,n(i.urlAfterRedirects),r,o).pipe(ae(s=>lt(P({},i),{targetSnapshot:s}))))}(this.rootComponentType,this.config,d=>this.serializeUrl(d),this.paramsInheritanceStrategy,this.relativeLinkResolution),Ct(d=>{if("eager"===this.urlUpdateStrategy){if(!d.extras.skipLocationChange){const h=this.urlHandlingStrategy.merge(d.urlAfterRedirects,d.rawUrl);this.setBrowserUrl(h,d)}this.browserUrlTree=d.urlAfterRedirects}const f=new $P(d.id,this.serializeUrl(d.extractedUrl),this.serializeUrl(d.urlAfterRedirects),d.targetSnapshot);r.next(f)}));if(l&&this.rawUrlTree&&this.urlHandlingStrategy.shouldProcessUrl(this.rawUrlTree)){const{id:f,extractedUrl:h,source:m,restoredState:_,extras:y}=a,v=new Yd(f,this.serializeUrl(h),m,_);r.next(v);const D=xv(h,this.rootComponentType).snapshot;return H(lt(P({},a),{targetSnapshot:D,urlAfterRedirects:h,extras:lt(P({},y),{skipLocationChange:!1,replaceUrl:!1})}))}return this.rawUrlTree=a.rawUrl,a.resolve(null),yn}),ff(a=>{const{targetSnapshot:u,id:l,extractedUrl:c,rawUrl:d,extras:{skipLocationChange:f,replaceUrl:h}}=a;return this.hooks.beforePreactivation(u,{navigationId:l,appliedUrlTree:c,rawUrlTree:d,skipLocationChange:!!f,replaceUrl:!!h})}),Ct(a=>{const u=new qP(a.id,this.serializeUrl(a.extractedUrl),this.serializeUrl(a.urlAfterRedirects),a.targetSnapshot);this.triggerEvent(u)}),ae(a=>lt(P({},a),{guards:JF(a.targetSnapshot,a.currentSnapshot,this.rootContexts)})),function(e,t){return Re(n=>{const{targetSnapshot:r,currentSnapshot:o,guards:{canActivateChecks:i,canDeactivateChecks:s}}=n;return 0===s.length&&0===i.length?H(lt(P({},n),{guardsResult:!0})):function(e,t,n,r){return Ve(e).pipe(Re(o=>function(e,t,n,r,o){const i=t&&t.routeConfig?t.routeConfig.canDeactivate:null;return i&&0!==i.length?H(i.map(a=>{const u=iu(a,t,o);let l;if(function(e){return e&&Kn(e.canDeactivate)}(u))l=hn(u.canDeactivate(e,t,n,r));else{if(!Kn(u))throw new Error("Invalid CanDeactivate guard");l=hn(u(e,t,n,r))}return l.pipe(Ro())})).pipe(es()):H(!0)}(o.component,o.route,n,t,r)),Ro(o=>!0!==o,!0))}(s,r,o,e).pipe(Re(a=>a&&function(e){return"boolean"==typeof e}(a)?function(e,t,n,r){return Ve(t).pipe(zi(o=>Qd(function(e,t){return null!==e&&t&&t(new QP(e)),H(!0)}(o.route.parent,r),function(e,t){return null!==e&&t&&t(new YP(e)),H(!0)}(o.route,r),function(e,t,n){const r=t[t.length-1],i=t.slice(0,t.length-1).reverse().map(s=>function(e){const t=e.routeConfig?e.routeConfig.canActivateChild:null;return t&&0!==t.length?{node:e,guards:t}:null}(s)).filter(s=>null!==s).map(s=>sv(()=>H(s.guards.map(u=>{const l=iu(u,s.node,n);let c;if(function(e){return e&&Kn(e.canActivateChild)}(l))c=hn(l.canActivateChild(r,e));else{if(!Kn(l))throw new Error("Invalid CanActivateChild guard");c=hn(l(r,e))}return c.pipe(Ro())})).pipe(es())));return H(i).pipe(es())}(e,o.path,n),function(e,t,n){const r=t.routeConfig?t.routeConfig.canActivate:null;if(!r||0===r.length)return H(!0);const o=r.map(i=>sv(()=>{const s=iu(i,t,n);let a;if(function(e){return e&&Kn(e.canActivate)}(s))a=hn(s.canActivate(t,e));else{if(!Kn(s))throw new Error("Invalid CanActivate guard");a=hn(s(t,e))}return a.pipe(Ro())}));return H(o).pipe(es())}(e,o.route,n))),Ro(o=>!0!==o,!0))}(r,i,e,t):H(a)),ae(a=>lt(P({},n),{guardsResult:a})))})}(this.ngModule.injector,a=>this.triggerEvent(a)),Ct(a=>{if(Tr(a.guardsResult)){const l=Zd(`Redirecting to "${this.serializeUrl(a.guardsResult)}"`);throw l.url=a.guardsResult,l}const u=new WP(a.id,this.serializeUrl(a.extractedUrl),this.serializeUrl(a.urlAfterRedirects),a.targetSnapshot,!!a.guardsResult);this.triggerEvent(u)}),Ao(a=>!!a.guardsResult||(this.restoreHistory(a),this.cancelNavigationTransition(a,""),!1)),ff(a=>{if(a.guards.canActivateChecks.length)return H(a).pipe(Ct(u=>{const l=new GP(u.id,this.serializeUrl(u.extractedUrl),this.serializeUrl(u.urlAfterRedirects),u.targetSnapshot);this.triggerEvent(l)}),wr(u=>{let l=!1;return H(u).pipe(function(e,t){return Re(n=>{const{targetSnapshot:r,guards:{canActivateChecks:o}}=n;if(!o.length)return H(n);let i=0;return Ve(o).pipe(zi(s=>function(e,t,n,r){return function(e,t,n,r){const o=Object.keys(e);if(0===o.length)return H({});const i={};return Ve(o).pipe(Re(s=>function(e,t,n,r){const o=iu(e,t,r);return hn(o.resolve?o.resolve(t,n):o(t,n))}(e[s],t,n,r).pipe(Ct(a=>{i[s]=a}))),Kd(1),Re(()=>Object.keys(i).length===o.length?H(i):yn))}(e._resolve,e,t,r).pipe(ae(i=>(e._resolvedData=i,e.data=P(P({},e.data),Nv(e,n).resolve),null)))}(s.route,r,e,t)),Ct(()=>i++),Kd(1),Re(s=>i===o.length?H(n):yn))})}(this.paramsInheritanceStrategy,this.ngModule.injector),Ct({next:()=>l=!0,complete:()=>{l||(this.restoreHistory(u),this.cancelNavigationTransition(u,"At least one route resolver didn't emit any value."))}}))}),Ct(u=>{const l=new zP(u.id,this.serializeUrl(u.extractedUrl),this.serializeUrl(u.urlAfterRedirects),u.targetSnapshot);this.triggerEvent(l)}))}),ff(a=>{const{targetSnapshot:u,id:l,extractedUrl:c,rawUrl:d,extras:{skipLocationChange:f,replaceUrl:h}}=a;return this.hooks.afterPreactivation(u,{navigationId:l,appliedUrlTree:c,rawUrlTree:d,skipLocationChange:!!f,replaceUrl:!!h})}),ae(a=>{const u=function(e,t,n){const r=Zi(e,t._root,n?n._root:void 0);return new Rv(r,t)}(this.routeReuseStrategy,a.targetSnapshot,a.currentRouterState);return lt(P({},a),{targetRouterState:u})}),Ct(a=>{this.currentUrlTree=a.urlAfterRedirects,this.rawUrlTree=this.urlHandlingStrategy.merge(a.urlAfterRedirects,a.rawUrl),this.routerState=a.targetRouterState,"deferred"===this.urlUpdateStrategy&&(a.extras.skipLocationChange||this.setBrowserUrl(this.rawUrlTree,a),this.browserUrlTree=a.urlAfterRedirects)}),((e,t,n)=>ae(r=>(new xF(t,r.targetRouterState,r.currentRouterState,n).activate(e),r)))(this.rootContexts,this.routeReuseStrategy,a=>this.triggerEvent(a)),Ct({next(){i=!0},complete(){i=!0}}),function(e){return ke((t,n)=>{try{t.subscribe(n)}finally{n.add(e)}})}(()=>{var a;i||s||this.cancelNavigationTransition(o,`Navigation ID ${o.id} is not equal to the current navigation id ${this.navigationId}`),(null==(a=this.currentNavigation)?void 0:a.id)===o.id&&(this.currentNavigation=null)}),Qn(a=>{if(s=!0,function(e){return e&&e[gv]}(a)){const u=Tr(a.url);u||(this.navigated=!0,this.restoreHistory(o,!0));const l=new dv(o.id,this.serializeUrl(o.extractedUrl),a.message);r.next(l),u?setTimeout(()=>{const c=this.urlHandlingStrategy.merge(a.url,this.rawUrlTree),d={skipLocationChange:o.extras.skipLocationChange,replaceUrl:"eager"===this.urlUpdateStrategy||su(o.source)};this.scheduleNavigation(c,"imperative",null,d,{resolve:o.resolve,reject:o.reject,promise:o.promise})},0):o.resolve(!1)}else{this.restoreHistory(o,!0);const u=new HP(o.id,this.serializeUrl(o.extractedUrl),a);r.next(u);try{o.resolve(this.errorHandler(a))}catch(l){o.reject(l)}}return yn}))}))}resetRootComponentType(n){this.rootComponentType=n,this.routerState.root.component=this.rootComponentType}setTransition(n){this.transitions.next(P(P({},this.transitions.value),n))}initialNavigation(){this.setUpLocationChangeListener(),0===this.navigationId&&this.navigateByUrl(this.location.path(!0),{replaceUrl:!0})}setUpLocationChangeListener(){this.locationSubscription||(this.locationSubscription=this.location.subscribe(n=>{const r="popstate"===n.type?"popstate":"hashchange";"popstate"===r&&setTimeout(()=>{var a;const o={replaceUrl:!0},i=(null==(a=n.state)?void 0:a.navigationId)?n.state:null;if(i){const u=P({},i);delete u.navigationId,delete u.\u0275routerPageId,0!==Object.keys(u).length&&(o.state=u)}const s=this.parseUrl(n.url);this.scheduleNavigation(s,r,i,o)},0)}))}get url(){return this.serializeUrl(this.currentUrlTree)}getCurrentNavigation(){return this.currentNavigation}triggerEvent(n){this.events.next(n)}resetConfig(n){Uv(n),this.config=n.map(cf),this.navigated=!1,this.lastSuccessfulId=-1}ngOnDestroy(){this.dispose()}dispose(){this.transitions.complete(),this.locationSubscription&&(this.locationSubscription.unsubscribe(),this.locationSubscription=void 0),this.disposed=!0}createUrlTree(n,r={}){const{relativeTo:o,queryParams:i,fragment:s,queryParamsHandling:a,preserveFragment:u}=r,l=o||this.routerState.root,c=u?this.currentUrlTree.fragment:s;let d=null;switch(a){case"merge":d=P(P({},this.currentUrlTree.queryParams),i);break;case"preserve":d=this.currentUrlTree.queryParams;break;default:d=i||null}return null!==d&&(d=this.removeEmptyProps(d)),function(e,t,n,r,o){if(0===n.length)return of(t.root,t.root,t,r,o);const i=function(e){if("string"==typeof e[0]&&1===e.length&&"/"===e[0])return new kv(!0,0,e);let t=0,n=!1;const r=e.reduce((o,i,s)=>{if("object"==typeof i&&null!=i){if(i.outlets){const a={};return Be(i.outlets,(u,l)=>{a[l]="string"==typeof u?u.split("/"):u}),[...o,{outlets:a}]}if(i.segmentPath)return[...o,i.segmentPath]}return"string"!=typeof i?[...o,i]:0===s?(i.split("/").forEach((a,u)=>{0==u&&"."===a||(0==u&&""===a?n=!0:".."===a?t++:""!=a&&o.push(a))}),o):[...o,i]},[]);return new kv(n,t,r)}(n);if(i.toRoot())return of(t.root,new K([],{}),t,r,o);const s=function(e,t,n){if(e.isAbsolute)return new sf(t.root,!0,0);if(-1===n.snapshot._lastPathIndex){const i=n.snapshot._urlSegment;return new sf(i,i===t.root,0)}const r=Ja(e.commands[0])?0:1;return function(e,t,n){let r=e,o=t,i=n;for(;i>o;){if(i-=o,r=r.parent,!r)throw new Error("Invalid number of '../'");o=r.segments.length}return new sf(r,!1,o-i)}(n.snapshot._urlSegment,n.snapshot._lastPathIndex+r,e.numberOfDoubleDots)}(i,t,e),a=s.processChildren?Xa(s.segmentGroup,s.index,i.commands):Lv(s.segmentGroup,s.index,i.commands);return of(s.segmentGroup,a,t,r,o)}(l,this.currentUrlTree,n,d,null!=c?c:null)}navigateByUrl(n,r={skipLocationChange:!1}){const o=Tr(n)?n:this.parseUrl(n),i=this.urlHandlingStrategy.merge(o,this.rawUrlTree);return this.scheduleNavigation(i,"imperative",null,r)}navigate(n,r={skipLocationChange:!1}){return function(e){for(let t=0;t<e.length;t++){const n=e[t];if(null==n)throw new Error(`The requested path contains ${n} segment at index ${t}`)}}(n),this.navigateByUrl(this.createUrlTree(n,r),r)}serializeUrl(n){return this.urlSerializer.serialize(n)}parseUrl(n){let r;try{r=this.urlSerializer.parse(n)}catch(o){r=this.malformedUriErrorHandler(o,this.urlSerializer,n)}return r}isActive(n,r){let o;if(o=!0===r?P({},AO):!1===r?P({},RO):r,Tr(n))return vv(this.currentUrlTree,n,o);const i=this.parseUrl(n);return vv(this.currentUrlTree,i,o)}removeEmptyProps(n){return Object.keys(n).reduce((r,o)=>{const i=n[o];return null!=i&&(r[o]=i),r},{})}processNavigations(){this.navigations.subscribe(n=>{this.navigated=!0,this.lastSuccessfulId=n.id,this.currentPageId=n.targetPageId,this.events.next(new Qi(n.id,this.serializeUrl(n.extractedUrl),this.serializeUrl(this.currentUrlTree))),this.lastSuccessfulNavigation=this.currentNavigation,n.resolve(!0)},n=>{this.console.warn(`Unhandled Navigation Error: ${n}`)})}scheduleNavigation(n,r,o,i,s){var v,D,I;if(this.disposed)return Promise.resolve(!1);const a=this.transitions.value,u=su(r)&&a&&!su(a.source),l=a.rawUrl.toString()===n.toString(),c=a.id===(null==(v=this.currentNavigation)?void 0:v.id);if(u&&l&&c)return Promise.resolve(!0);let f,h,m;s?(f=s.resolve,h=s.reject,m=s.promise):m=new Promise((T,j)=>{f=T,h=j});const _=++this.navigationId;let y;return"computed"===this.canceledNavigationResolution?(0===this.currentPageId&&(o=this.location.getState()),y=o&&o.\u0275routerPageId?o.\u0275routerPageId:i.replaceUrl||i.skipLocationChange?null!=(D=this.browserPageId)?D:0:(null!=(I=this.browserPageId)?I:0)+1):y=0,this.setTransition({id:_,targetPageId:y,source:r,restoredState:o,currentUrlTree:this.currentUrlTree,currentRawUrl:this.rawUrlTree,rawUrl:n,extras:i,resolve:f,reject:h,promise:m,currentSnapshot:this.routerState.snapshot,currentRouterState:this.routerState}),m.catch(T=>Promise.reject(T))}setBrowserUrl(n,r){const o=this.urlSerializer.serialize(n),i=P(P({},r.extras.state),this.generateNgRouterState(r.id,r.targetPageId));this.location.isCurrentPathEqualTo(o)||r.extras.replaceUrl?this.location.replaceState(o,"",i):this.location.go(o,"",i)}restoreHistory(n,r=!1){var o,i;if("computed"===this.canceledNavigationResolution){const s=this.currentPageId-n.targetPageId;"popstate"!==n.source&&"eager"!==this.urlUpdateStrategy&&this.currentUrlTree!==(null==(o=this.currentNavigation)?void 0:o.finalUrl)||0===s?this.currentUrlTree===(null==(i=this.currentNavigation)?void 0:i.finalUrl)&&0===s&&(this.resetState(n),this.browserUrlTree=n.currentUrlTree,this.resetUrlToCurrentUrlTree()):this.location.historyGo(s)}else"replace"===this.canceledNavigationResolution&&(r&&this.resetState(n),this.resetUrlToCurrentUrlTree())}resetState(n){this.routerState=n.currentRouterState,this.currentUrlTree=n.currentUrlTree,this.rawUrlTree=this.urlHandlingStrategy.merge(this.currentUrlTree,n.rawUrl)}resetUrlToCurrentUrlTree(){this.location.replaceState(this.urlSerializer.serialize(this.rawUrlTree),"",this.generateNgRouterState(this.lastSuccessfulId,this.currentPageId))}cancelNavigationTransition(n,r){const o=new dv(n.id,this.serializeUrl(n.extractedUrl),r);this.triggerEvent(o),n.resolve(!1)}generateNgRouterState(n,r){return"computed"===this.canceledNavigationResolution?{navigationId:n,\u0275routerPageId:r}:{navigationId:n}}}return e.\u0275fac=function(n){ic()},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function su(e){return"imperative"!==e}class rC{}class oC{preload(t,n){return H(null)}}let iC=(()=>{class e{constructor(n,r,o,i){this.router=n,this.injector=o,this.preloadingStrategy=i,this.loader=new tC(o,r,u=>n.triggerEvent(new fv(u)),u=>n.triggerEvent(new hv(u)))}setUpPreloading(){this.subscription=this.router.events.pipe(Ao(n=>n instanceof Qi),zi(()=>this.preload())).subscribe(()=>{})}preload(){const n=this.injector.get(dn);return this.processRoutes(n,this.router.config)}ngOnDestroy(){this.subscription&&this.subscription.unsubscribe()}processRoutes(n,r){const o=[];for(const i of r)if(i.loadChildren&&!i.canLoad&&i._loadedConfig){const s=i._loadedConfig;o.push(this.processRoutes(s.module,s.routes))}else i.loadChildren&&!i.canLoad?o.push(this.preloadConfig(n,i)):i.children&&o.push(this.processRoutes(n,i.children));return Ve(o).pipe(jo(),ae(i=>{}))}preloadConfig(n,r){return this.preloadingStrategy.preload(r,()=>(r._loadedConfig?H(r._loadedConfig):this.loader.load(n.injector,r)).pipe(Re(i=>(r._loadedConfig=i,this.processRoutes(i.module,i.routes)))))}}return e.\u0275fac=function(n){return new(n||e)(A(ot),A(ma),A(re),A(rC))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),mf=(()=>{class e{constructor(n,r,o={}){this.router=n,this.viewportScroller=r,this.options=o,this.lastId=0,this.lastSource="imperative",this.restoredId=0,this.store={},o.scrollPositionRestoration=o.scrollPositionRestoration||"disabled",o.anchorScrolling=o.anchorScrolling||"disabled"}init(){"disabled"!==this.options.scrollPositionRestoration&&this.viewportScroller.setHistoryScrollRestoration("manual"),this.routerEventsSubscription=this.createScrollEvents(),this.scrollEventsSubscription=this.consumeScrollEvents()}createScrollEvents(){return this.router.events.subscribe(n=>{n instanceof Yd?(this.store[this.lastId]=this.viewportScroller.getScrollPosition(),this.lastSource=n.navigationTrigger,this.restoredId=n.restoredState?n.restoredState.navigationId:0):n instanceof Qi&&(this.lastId=n.id,this.scheduleScrollEvent(n,this.router.parseUrl(n.urlAfterRedirects).fragment))})}consumeScrollEvents(){return this.router.events.subscribe(n=>{n instanceof pv&&(n.position?"top"===this.options.scrollPositionRestoration?this.viewportScroller.scrollToPosition([0,0]):"enabled"===this.options.scrollPositionRestoration&&this.viewportScroller.scrollToPosition(n.position):n.anchor&&"enabled"===this.options.anchorScrolling?this.viewportScroller.scrollToAnchor(n.anchor):"disabled"!==this.options.scrollPositionRestoration&&this.viewportScroller.scrollToPosition([0,0]))})}scheduleScrollEvent(n,r){this.router.triggerEvent(new pv(n,"popstate"===this.lastSource?this.store[this.restoredId]:null,r))}ngOnDestroy(){this.routerEventsSubscription&&this.routerEventsSubscription.unsubscribe(),this.scrollEventsSubscription&&this.scrollEventsSubscription.unsubscribe()}}return e.\u0275fac=function(n){ic()},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const Sr=new J("ROUTER_CONFIGURATION"),sC=new J("ROUTER_FORROOT_GUARD"),OO=[bd,{provide:bv,useClass:Iv},{provide:ot,useFactory:function(e,t,n,r,o,i,s={},a,u){const l=new ot(null,e,t,n,r,o,yv(i));return a&&(l.urlHandlingStrategy=a),u&&(l.routeReuseStrategy=u),function(e,t){e.errorHandler&&(t.errorHandler=e.errorHandler),e.malformedUriErrorHandler&&(t.malformedUriErrorHandler=e.malformedUriErrorHandler),e.onSameUrlNavigation&&(t.onSameUrlNavigation=e.onSameUrlNavigation),e.paramsInheritanceStrategy&&(t.paramsInheritanceStrategy=e.paramsInheritanceStrategy),e.relativeLinkResolution&&(t.relativeLinkResolution=e.relativeLinkResolution),e.urlUpdateStrategy&&(t.urlUpdateStrategy=e.urlUpdateStrategy),e.canceledNavigationResolution&&(t.canceledNavigationResolution=e.canceledNavigationResolution)}(s,l),s.enableTracing&&l.events.subscribe(c=>{var d,f;null==(d=console.group)||d.call(console,`Router Event: ${c.constructor.name}`),console.log(c.toString()),console.log(c),null==(f=console.groupEnd)||f.call(console)}),l},deps:[bv,ts,bd,re,ma,hf,Sr,[class{},new at],[class{},new at]]},ts,{provide:Po,useFactory:function(e){return e.routerState.root},deps:[ot]},iC,oC,class{preload(t,n){return n().pipe(Qn(()=>H(null)))}},{provide:Sr,useValue:{enableTracing:!1}}];function kO(){return new Gc("Router",ot)}let aC=(()=>{class e{constructor(n,r){}static forRoot(n,r){return{ngModule:e,providers:[OO,uC(n),{provide:sC,useFactory:jO,deps:[[ot,new at,new Bn]]},{provide:Sr,useValue:r||{}},{provide:Mo,useFactory:VO,deps:[Er,[new Wr(wd),new at],Sr]},{provide:mf,useFactory:LO,deps:[ot,bN,Sr]},{provide:rC,useExisting:r&&r.preloadingStrategy?r.preloadingStrategy:oC},{provide:Gc,multi:!0,useFactory:kO},[yf,{provide:Mi,multi:!0,useFactory:$O,deps:[yf]},{provide:lC,useFactory:qO,deps:[yf]},{provide:m_,multi:!0,useExisting:lC}]]}}static forChild(n){return{ngModule:e,providers:[uC(n)]}}}return e.\u0275fac=function(n){return new(n||e)(A(sC,8),A(ot,8))},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({}),e})();function LO(e,t,n){return n.scrollOffset&&t.setOffset(n.scrollOffset),new mf(e,t,n)}function VO(e,t,n={}){return n.useHash?new rx(e,t):new AD(e,t)}function jO(e){return"guarded"}function uC(e){return[{provide:ew,multi:!0,useValue:e},{provide:hf,multi:!0,useValue:e}]}let yf=(()=>{class e{constructor(n){this.injector=n,this.initNavigation=!1,this.destroyed=!1,this.resultOfPreactivationDone=new pn}appInitializer(){return this.injector.get(ex,Promise.resolve(null)).then(()=>{if(this.destroyed)return Promise.resolve(!0);let r=null;const o=new Promise(a=>r=a),i=this.injector.get(ot),s=this.injector.get(Sr);return"disabled"===s.initialNavigation?(i.setUpLocationChangeListener(),r(!0)):"enabled"===s.initialNavigation||"enabledBlocking"===s.initialNavigation?(i.hooks.afterPreactivation=()=>this.initNavigation?H(null):(this.initNavigation=!0,r(!0),this.resultOfPreactivationDone),i.initialNavigation()):r(!0),o})}bootstrapListener(n){const r=this.injector.get(Sr),o=this.injector.get(iC),i=this.injector.get(mf),s=this.injector.get(ot),a=this.injector.get(Co);n===a.components[0]&&(("enabledNonBlocking"===r.initialNavigation||void 0===r.initialNavigation)&&s.initialNavigation(),o.setUpPreloading(),i.init(),s.resetRootComponentType(a.componentTypes[0]),this.resultOfPreactivationDone.next(null),this.resultOfPreactivationDone.complete())}ngOnDestroy(){this.destroyed=!0}}return e.\u0275fac=function(n){return new(n||e)(A(re))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function $O(e){return e.appInitializer.bind(e)}function qO(e){return e.bootstrapListener.bind(e)}const lC=new J("Router Initializer");function cC(e,t,n,r,o,i,s){try{var a=e[i](s),u=a.value}catch(l){return void n(l)}a.done?t(u):Promise.resolve(u).then(r,o)}function Ot(e){return function(){var t=this,n=arguments;return new Promise(function(r,o){var i=e.apply(t,n);function s(u){cC(i,r,o,s,a,"next",u)}function a(u){cC(i,r,o,s,a,"throw",u)}s(void 0)})}}function zO(e,t){if(1&e&&(p(0,"option",69),E(1),g()),2&e){const n=t.$implicit;be("value",t.index),z(1),Pe(n)}}function QO(e,t){if(1&e&&(p(0,"option",69),E(1),g()),2&e){const n=t.$implicit;be("value",n),z(1),Pe(n)}}function KO(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt();z(2),Pe(n),z(2),Pe(o.actions_per_country_data.actions[r])}}function YO(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),p(5,"td"),E(6),g(),p(7,"td"),E(8),g(),g()),2&e){const n=t.$implicit;z(2),Pe(n.month),z(2),Pe(n.day),z(2),Pe(n.hour),z(2),Pe(n.requests_amount)}}function ZO(e,t){if(1&e&&(p(0,"div",56),p(1,"p"),E(2),g(),p(3,"table",57),p(4,"thead"),p(5,"tr"),p(6,"th",58),E(7,"Month"),g(),p(8,"th",58),E(9,"Day"),g(),p(10,"th",58),E(11,"Hour"),g(),p(12,"th",58),E(13,"Requests amount"),g(),g(),g(),p(14,"tbody"),Ge(15,YO,9,4,"tr",59),g(),g(),g()),2&e){const n=Dt();z(2),gr("Average: ",n.server_load_data.avg,""),z(13),be("ngForOf",n.server_load_data.statistics)}}function JO(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),g()),2&e){const n=t.$implicit;z(2),Pe(n)}}function XO(e,t){if(1&e&&(p(0,"div",56),p(1,"p"),E(2),g(),p(3,"table",57),p(4,"thead"),p(5,"tr"),p(6,"th",58),E(7,"Card ID"),g(),g(),g(),p(8,"tbody"),Ge(9,JO,3,1,"tr",59),g(),g(),g()),2&e){const n=Dt();z(2),gr("Amount: ",n.unpayed_carts.list.length,""),z(7),be("ngForOf",n.unpayed_carts.list)}}function ek(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt(2);z(2),Pe(n),z(2),Pe(o.repeat_purchases.amount[r])}}function tk(e,t){if(1&e&&(p(0,"div",56),p(1,"p"),E(2),g(),p(3,"table",57),p(4,"thead"),p(5,"tr"),p(6,"th",58),E(7,"Users's IP"),g(),p(8,"th",58),E(9,"Amount"),g(),g(),g(),p(10,"tbody"),Ge(11,ek,5,2,"tr",59),g(),g(),g()),2&e){const n=Dt();z(2),gr("Total amount: ",n.repeat_purchases.total_amount,""),z(9),be("ngForOf",n.repeat_purchases.ip_list)}}function nk(e,t){if(1&e&&(p(0,"td"),E(1),g()),2&e){const n=Dt().index,r=Dt(2);z(1),gr("00:00 - ",n*(24/r.time_pattern.amount.length)+24/r.time_pattern.amount.length,":00")}}function rk(e,t){if(1&e&&(p(0,"td"),E(1),g()),2&e){const n=Dt().index,r=Dt(2);z(1),dc("",24/r.time_pattern.amount.length*(n-1)+24/r.time_pattern.amount.length,":00 - ",n*(24/r.time_pattern.amount.length)+24/r.time_pattern.amount.length,":00")}}function ok(e,t){if(1&e&&(p(0,"tr"),Ge(1,nk,2,1,"td",70),Ge(2,rk,2,2,"td",70),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.first;z(1),be("ngIf",r),z(1),be("ngIf",!r),z(2),Pe(n)}}function ik(e,t){if(1&e&&(p(0,"div",56),p(1,"table",57),p(2,"thead"),p(3,"tr"),p(4,"th",58),E(5,"Time period"),g(),p(6,"th",58),E(7,"Amount"),g(),g(),g(),p(8,"tbody"),Ge(9,ok,5,3,"tr",59),g(),g(),g()),2&e){const n=Dt();z(9),be("ngForOf",n.time_pattern.amount)}}function sk(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt();z(2),Pe(n),z(2),Pe(o.pattern_view.actions[r])}}function ak(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt();z(2),Pe(n),z(2),Pe(o.pattern_buy.purchases[r])}}const uk=[{path:"",component:(()=>{class e{constructor(n){this.router=n}ngOnInit(){}ngAfterViewInit(){this.upload_button=document.getElementById("upload_button"),this.spinner=document.getElementById("spinner"),this.warning_message=document.getElementById("warn_message")}upload_logs(){var n=this;this.disable_upload_button(),this.spinner.classList.remove("invisible"),this.warning_message.classList.add("invisible");let r=document.getElementById("formElement");r.onsubmit=function(){var o=Ot(function*(i){i.preventDefault();let a=yield(yield fetch("/api/upload",{method:"POST",body:new FormData(r)})).json();"ok"==a.status&&n.router.navigate(["dashboard"]),"wrong format"==a.status&&(n.warning_message.classList.remove("invisible"),n.spinner.classList.add("invisible"),n.enable_upload_button())});return function(i){return o.apply(this,arguments)}}()}enable_upload_button(){this.upload_button.classList.remove("disabled")}disable_upload_button(){this.upload_button.classList.add("disabled")}}return e.\u0275fac=function(n){return new(n||e)(S(ot))},e.\u0275cmp=Ar({type:e,selectors:[["app-upload-page"]],decls:19,vars:0,consts:[["xmlns","http://www.w3.org/2000/svg",2,"display","none"],["id","exclamation-triangle-fill","fill","currentColor","viewBox","0 0 16 16"],["d","M8.982 1.566a1.13 1.13 0 0 0-1.96 0L.165 13.233c-.457.778.091 1.767.98 1.767h13.713c.889 0 1.438-.99.98-1.767L8.982 1.566zM8 5c.535 0 .954.462.9.995l-.35 3.507a.552.552 0 0 1-1.1 0L7.1 5.995A.905.905 0 0 1 8 5zm.002 6a1 1 0 1 1 0 2 1 1 0 0 1 0-2z"],[1,"container","vh-100","d-flex","justify-content-center","align-items-center"],[1,"row","row-cols-1","justify-content-center"],[1,"col","text-center"],[1,"display-5","pb-3"],["id","formElement"],[1,"col"],["id","formFileLg","name","file","type","file",1,"form-control","form-control-lg",3,"change"],[1,"col","text-center","mt-3","d-flex","justify-content-center","align-items-center"],["type","submit","value","Proceed","id","upload_button",1,"btn","btn-primary","btn-lg","ms-5","disabled",3,"click"],["role","status","id","spinner",1,"spinner-border","text-primary","ms-3","invisible"],["role","alert","id","warn_message",1,"alert","alert-danger","d-flex","col-md-auto","align-items-center","mt-3","invisible"],["width","24","height","24","role","img","aria-label","Danger:",1,"bi","flex-shrink-0","me-2"],[0,"xlink","href","#exclamation-triangle-fill"]],template:function(n,r){1&n&&(ju(),p(0,"svg",0),p(1,"symbol",1),Ne(2,"path",2),g(),g(),Bu(),p(3,"div",3),p(4,"div",4),p(5,"div",5),p(6,"h2",6),E(7,"Choose log file to continue"),g(),g(),p(8,"form",7),p(9,"div",8),p(10,"input",9),Ie("change",function(){return r.enable_upload_button()}),g(),g(),p(11,"div",10),p(12,"input",11),Ie("click",function(){return r.upload_logs()}),g(),Ne(13,"div",12),g(),g(),p(14,"div",13),ju(),p(15,"svg",14),Ne(16,"use",15),g(),Bu(),p(17,"div"),E(18," File has wrong content. Upload only logs files "),g(),g(),g(),g())},styles:[""]}),e})()},{path:"dashboard",component:(()=>{class e{constructor(n){this.router=n,this.category_index=0,this.server_load_data={loaded:!1},this.actions_per_country_data={country:[],actions:[]},this.unpayed_carts={loaded:!1,list:[]},this.repeat_purchases={loaded:!1,ip_list:[],amount:[]},this.time_pattern={loaded:!1,amount:[]},this.pattern_view={country:[],actions:[]},this.pattern_buy={category:[],purchases:[]}}ngOnInit(){!this.check_db()||(this.get_categories(),this.get_filename(),setTimeout(this.getOverallStatistics,1e3))}ngAfterViewInit(){}getOverallStatistics(){return Ot(function*(){let r=yield(yield fetch("/api/overall_statistics",{method:"GET"})).json(),o=r.countries,i=r.items_views,s=r.payed_carts,a=r.unique_users;document.getElementById("countries").style.setProperty("--num",o),document.getElementById("items_views").style.setProperty("--num",i),document.getElementById("payed_carts").style.setProperty("--num",s),document.getElementById("unique_users").style.setProperty("--num",a)})()}check_db(){var n=this;return Ot(function*(){return 204!=(yield fetch("api/check_db",{method:"GET"})).status||(n.router.navigate([""]),!1)})()}get_categories(){var n=this;return Ot(function*(){let o=yield(yield fetch("/api/categories",{method:"GET"})).json();n.categories=Object.keys(o),n.items=Object.values(o)})()}get_filename(){return Ot(function*(){let o=(yield(yield fetch("/api/uploaded_filename",{method:"GET"})).json()).filename;document.getElementById("filename").textContent=o})()}update_items_list(){let n=document.getElementById("category_select"),r=document.getElementById("item_select");this.category_index=n.options[n.selectedIndex].value,r.removeAttribute("disabled"),document.getElementById("rep_time_pattern_button").removeAttribute("disabled")}enable_reports_buttons(){document.getElementById("rep_pattern_view_button").removeAttribute("disabled"),document.getElementById("rep_pattern_buy_button").removeAttribute("disabled")}check_for_button_unlock(n){let r=document.getElementById(`rep${n}_date1`).value,o=document.getElementById(`rep${n}_date2`).value,i=document.getElementById(`rep${n}_button`);r&&o?i.removeAttribute("disabled"):i.setAttribute("disabled","true")}debug(){let n={canned_food:["midii","pate_of_tuna"],caviar:["squash_caviar","black_caviar"],fresh_fish:["tuna","codfish","herring","salmon","crucian"],frozen_fish:["shark","pike","peljad"],semi_manufactures:["soup_set","squid_rings","salmon_cutlet"]};this.categories=Object.keys(n),this.items=Object.values(n),this.server_load_data={avg:"57.2857142857142857",statistics:[{day:1,hour:0,requests_amount:55},{day:1,hour:1,requests_amount:67},{day:1,hour:2,requests_amount:62},{day:1,hour:3,requests_amount:57},{day:1,hour:4,requests_amount:62},{day:1,hour:5,requests_amount:69},{day:1,hour:6,requests_amount:29}]}}rep_server_load(){var n=this;return Ot(function*(){let o=yield(yield fetch("/api/server_load_per_hour",{method:"GET"})).json();o.loaded=!0,n.server_load_data=o})()}rep_actions_per_country(){var n=this;return Ot(function*(){let o=yield(yield fetch("/api/rep_actions_per_country",{method:"GET"})).json();n.actions_per_country_data.country=Object.keys(o),n.actions_per_country_data.actions=Object.values(o)})()}rep_unpayed_carts(){var n=this;return Ot(function*(){let r_date_1=document.getElementById("rep1_date1").value,r_date_2=document.getElementById("rep1_date2").value,s={list:yield(yield fetch(`/api/rep_unpayed_carts?date_1=${r_date_1}&date_2=${r_date_2}`,{method:"GET"})).json(),loaded:!0};n.unpayed_carts=s})()}rep_repeat_purchases(){var n=this;return Ot(function*(){let r_date_1=document.getElementById("rep2_date1").value,r_date_2=document.getElementById("rep2_date2").value,i=yield(yield fetch(`/api/rep_repeated_payments?date_1=${r_date_1}&date_2=${r_date_2}`,{method:"GET"})).json(),s={ip_list:Object.keys(i.data),amount:Object.values(i.data),loaded:!0,total_amount:i.amount};n.repeat_purchases=s})()}rep_time_pattern(){var n=this;return Ot(function*(){let r=n.categories[n.category_index],o=document.getElementById("k_select"),i=o.options[o.selectedIndex].value;i=24/i;let a=yield(yield fetch(`/api/rep_time_pattern?category=${r}&k=${i}`,{method:"GET"})).json();n.time_pattern.amount=[];for(let u of Object.values(a))n.time_pattern.amount.push(u);n.time_pattern.loaded=!0})()}rep_pattern_view(){var n=this;return Ot(function*(){let r=n.categories[n.category_index],o=document.getElementById("item_select"),i=o.options[o.selectedIndex].value,a=yield(yield fetch(`/api/rep_pattern_view?category=${r}&item=${i}`,{method:"GET"})).json();n.pattern_view.country=Object.keys(a),n.pattern_view.actions=Object.values(a)})()}rep_pattern_buy(){var n=this;return Ot(function*(){let r=n.categories[n.category_index],o=document.getElementById("item_select"),i=o.options[o.selectedIndex].value,a=yield(yield fetch(`/api/rep_pattern_buy?category=${r}&item=${i}`,{method:"GET"})).json();n.pattern_buy.category=Object.keys(a),n.pattern_buy.purchases=Object.values(a)})()}}return e.\u0275fac=function(n){return new(n||e)(S(ot))},e.\u0275cmp=Ar({type:e,selectors:[["app-dashboard"]],decls:247,vars:9,consts:[[1,"container"],[1,"d-flex","align-items-center","justify-content-between"],["aria-label","breadcrumb",1,"fs-4","mt-3"],[1,"breadcrumb"],[1,"breadcrumb-item"],["href","#"],["aria-current","page",1,"breadcrumb-item","active"],["id","filename",1,"fs-5","ps-2",2,"color","#5f676e"],[1,"card"],[1,"card-header"],[1,"card-body"],[1,"fs-5","py-1","hstack"],[1,"pe-4"],["id","countries",1,"animated","fw-bold"],[1,"pe-4","text-nowrap"],["id","items_views",1,"animated","fw-bold"],["id","payed_carts",1,"animated","fw-bold"],["id","unique_users",1,"animated","fw-bold"],[1,"fw-light","mt-3"],[1,"row"],[1,"col-sm-6","mt-3"],[1,"card","text-white","bg-secondary"],[1,"card-title"],[1,"card-text"],["data-bs-toggle","modal","data-bs-target","#server_load_Modal",1,"btn","btn-light",3,"click"],["data-bs-toggle","modal","data-bs-target","#actions_per_country_Modal",1,"btn","btn-light",3,"click"],[1,""],[1,"table","table-borderless","d-block"],[1,"fw-normal"],["type","date","id","rep1_date1",3,"change"],["type","date","id","rep1_date2",3,"change"],["id","rep1_button","data-bs-toggle","modal","data-bs-target","#unpayed_carts_Modal","disabled","",1,"btn","btn-primary",3,"click"],["type","date","id","rep2_date1",3,"change"],["type","date","id","rep2_date2",3,"change"],["id","rep2_button","data-bs-toggle","modal","data-bs-target","#repeat_purchases_Modal","disabled","",1,"btn","btn-primary",3,"click"],["id","category_select",1,"form-select","mt-1",3,"change"],["selected","","disabled",""],[3,"value",4,"ngFor","ngForOf"],["id","item_select","disabled","",1,"form-select","mt-2",3,"change"],[1,"d-inline-flex","align-items-center"],["id","rep_time_pattern_button","data-bs-toggle","modal","data-bs-target","#time_pattern_Modal","disabled","",1,"btn","btn-primary","text-nowrap","me-2",3,"click"],["id","k_select",1,"form-select"],["value","2"],["value","4","selected",""],["value","6"],[1,"card-title","mt-2"],["id","rep_pattern_view_button","data-bs-toggle","modal","data-bs-target","#pattern_view_Modal","disabled","",1,"btn","btn-primary",3,"click"],[1,"card-text","mt-2"],["id","rep_pattern_buy_button","data-bs-toggle","modal","data-bs-target","#pattern_buy_Modal","disabled","",1,"btn","btn-primary",3,"click"],[1,"fw-light","mt-5"],["id","actions_per_country_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],[1,"modal-dialog","modal-dialog-scrollable"],[1,"modal-content"],[1,"modal-header"],[1,"modal-title"],["type","button","data-bs-dismiss","modal","aria-label","Close",1,"btn-close"],[1,"modal-body"],[1,"table","mt-2"],["scope","col"],[4,"ngFor","ngForOf"],[1,"modal-footer"],["type","button","data-bs-dismiss","modal",1,"btn","btn-secondary"],["id","server_load_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["class","modal-body",4,"ngIf"],["id","unpayed_carts_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","repeat_purchases_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","time_pattern_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","pattern_view_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","pattern_buy_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],[3,"value"],[4,"ngIf"]],template:function(n,r){1&n&&(p(0,"div",0),p(1,"div",1),p(2,"nav",2),p(3,"ol",3),p(4,"li",4),p(5,"a",5),E(6,"Uploading logs"),g(),g(),p(7,"li",6),E(8,"Dashboard"),g(),g(),g(),p(9,"span",7),E(10,"filename_placeholder"),g(),g(),p(11,"div",8),p(12,"h5",9),E(13,"Overall"),g(),p(14,"div",10),p(15,"div",11),p(16,"span",12),E(17,"Countries:"),g(),Ne(18,"span",13),g(),p(19,"div",11),p(20,"span",14),E(21,"Category / Items views:"),g(),Ne(22,"span",15),g(),p(23,"div",11),p(24,"span",12),E(25,"Payed carts:"),g(),Ne(26,"span",16),g(),p(27,"div",11),p(28,"span",12),E(29,"Unique users:"),g(),Ne(30,"span",17),g(),g(),g(),p(31,"h3",18),E(32,"Reports section"),g(),Ne(33,"hr"),p(34,"div",19),p(35,"div",20),p(36,"div",21),p(37,"div",10),p(38,"h5",22),E(39,"Server load"),g(),p(40,"p",23),E(41,"Check server load statistics per hour"),g(),p(42,"button",24),Ie("click",function(){return r.rep_server_load()}),E(43,"View data"),g(),g(),g(),g(),p(44,"div",20),p(45,"div",21),p(46,"div",10),p(47,"h5",22),E(48,"Actions per country"),g(),p(49,"p",23),E(50,"Report that shows number of users actions groupped by country"),g(),p(51,"button",25),Ie("click",function(){return r.rep_actions_per_country()}),E(52,"View data"),g(),g(),g(),g(),g(),p(53,"div",19),p(54,"div",20),p(55,"div",8),p(56,"div",10),p(57,"h5",22),E(58,"Unpayed carts"),g(),p(59,"p",23),E(60,"Report that shows number of unpayed carts for a certain period"),g(),p(61,"div",26),p(62,"table",27),p(63,"tbody"),p(64,"tr"),p(65,"th"),p(66,"span",28),E(67,"Date from"),g(),g(),p(68,"th"),p(69,"input",29),Ie("change",function(){return r.check_for_button_unlock(1)}),g(),g(),g(),p(70,"tr"),p(71,"th"),p(72,"span",28),E(73,"Date to"),g(),g(),p(74,"th"),p(75,"input",30),Ie("change",function(){return r.check_for_button_unlock(1)}),g(),g(),g(),g(),g(),p(76,"button",31),Ie("click",function(){return r.rep_unpayed_carts()}),E(77,"View data"),g(),g(),g(),g(),g(),p(78,"div",20),p(79,"div",8),p(80,"div",10),p(81,"h5",22),E(82,"Repeat purchases"),g(),p(83,"p",23),E(84,"Report that shows number of repeat purchases for a certain period"),g(),p(85,"div",26),p(86,"table",27),p(87,"tbody"),p(88,"tr"),p(89,"th"),p(90,"span",28),E(91,"Date from"),g(),g(),p(92,"th"),p(93,"input",32),Ie("change",function(){return r.check_for_button_unlock(2)}),g(),g(),g(),p(94,"tr"),p(95,"th"),p(96,"span",28),E(97,"Date to"),g(),g(),p(98,"th"),p(99,"input",33),Ie("change",function(){return r.check_for_button_unlock(2)}),g(),g(),g(),g(),g(),p(100,"button",34),Ie("click",function(){return r.rep_repeat_purchases()}),E(101,"View data"),g(),g(),g(),g(),g(),g(),p(102,"div",19),p(103,"div",20),p(104,"div",8),p(105,"div",10),p(106,"h5",22),E(107,"Reports on categories and goods"),g(),p(108,"p",22),E(109,"Before generating reports you need to specify the following:"),g(),p(110,"select",35),Ie("change",function(){return r.update_items_list()}),p(111,"option",36),E(112,"Category"),g(),Ge(113,zO,2,2,"option",37),g(),p(114,"select",38),Ie("change",function(){return r.enable_reports_buttons()}),p(115,"option",36),E(116,"Item"),g(),Ge(117,QO,2,2,"option",37),g(),g(),g(),g(),p(118,"div",20),p(119,"div",8),p(120,"div",10),p(121,"p",23),E(122,"At what time of day is specified category most often viewed"),g(),p(123,"div",39),p(124,"button",40),Ie("click",function(){return r.rep_time_pattern()}),E(125,"View data"),g(),p(126,"select",41),p(127,"option",42),E(128,"2"),g(),p(129,"option",43),E(130,"4"),g(),p(131,"option",44),E(132,"6"),g(),g(),g(),p(133,"p",45),E(134,"Users from which country are most often interested in products from certain category"),g(),p(135,"button",46),Ie("click",function(){return r.rep_pattern_view()}),E(136,"View data"),g(),p(137,"p",47),E(138,"Products from which category are most often bought together with a product from a given category"),g(),p(139,"button",48),Ie("click",function(){return r.rep_pattern_buy()}),E(140,"View data"),g(),g(),g(),g(),g(),p(141,"h3",49),E(142,"2021"),g(),p(143,"div",50),p(144,"div",51),p(145,"div",52),p(146,"div",53),p(147,"h5",54),E(148,"Actions per country"),g(),Ne(149,"button",55),g(),p(150,"div",56),p(151,"table",57),p(152,"thead"),p(153,"tr"),p(154,"th",58),E(155,"Country"),g(),p(156,"th",58),E(157,"Actions"),g(),g(),g(),p(158,"tbody"),Ge(159,KO,5,2,"tr",59),g(),g(),g(),p(160,"div",60),p(161,"button",61),E(162,"Close"),g(),g(),g(),g(),g(),p(163,"div",62),p(164,"div",51),p(165,"div",52),p(166,"div",53),p(167,"h5",54),E(168,"Server Load per hour"),g(),Ne(169,"button",55),g(),Ge(170,ZO,16,2,"div",63),p(171,"div",60),p(172,"button",61),E(173,"Close"),g(),g(),g(),g(),g(),p(174,"div",64),p(175,"div",51),p(176,"div",52),p(177,"div",53),p(178,"h5",54),E(179,"Unpayed carts"),g(),Ne(180,"button",55),g(),Ge(181,XO,10,2,"div",63),p(182,"div",60),p(183,"button",61),E(184,"Close"),g(),g(),g(),g(),g(),p(185,"div",65),p(186,"div",51),p(187,"div",52),p(188,"div",53),p(189,"h5",54),E(190,"Repeat purchases"),g(),Ne(191,"button",55),g(),Ge(192,tk,12,2,"div",63),p(193,"div",60),p(194,"button",61),E(195,"Close"),g(),g(),g(),g(),g(),p(196,"div",66),p(197,"div",51),p(198,"div",52),p(199,"div",53),p(200,"h5",54),E(201,"Time pattern report"),g(),Ne(202,"button",55),g(),Ge(203,ik,10,1,"div",63),p(204,"div",60),p(205,"button",61),E(206,"Close"),g(),g(),g(),g(),g(),p(207,"div",67),p(208,"div",51),p(209,"div",52),p(210,"div",53),p(211,"h5",54),E(212,"Country actions specified report"),g(),Ne(213,"button",55),g(),p(214,"div",56),p(215,"table",57),p(216,"thead"),p(217,"tr"),p(218,"th",58),E(219,"Country"),g(),p(220,"th",58),E(221,"Actions"),g(),g(),g(),p(222,"tbody"),Ge(223,sk,5,2,"tr",59),g(),g(),g(),p(224,"div",60),p(225,"button",61),E(226,"Close"),g(),g(),g(),g(),g(),p(227,"div",68),p(228,"div",51),p(229,"div",52),p(230,"div",53),p(231,"h5",54),E(232,"Pattern buy report"),g(),Ne(233,"button",55),g(),p(234,"div",56),p(235,"table",57),p(236,"thead"),p(237,"tr"),p(238,"th",58),E(239,"Category"),g(),p(240,"th",58),E(241,"Purchases"),g(),g(),g(),p(242,"tbody"),Ge(243,ak,5,2,"tr",59),g(),g(),g(),p(244,"div",60),p(245,"button",61),E(246,"Close"),g(),g(),g(),g(),g(),g()),2&n&&(z(113),be("ngForOf",r.categories),z(4),be("ngForOf",r.items[r.category_index]),z(42),be("ngForOf",r.actions_per_country_data.country),z(11),be("ngIf",r.server_load_data.loaded),z(11),be("ngIf",r.unpayed_carts.loaded),z(11),be("ngIf",r.repeat_purchases.loaded),z(11),be("ngIf",r.time_pattern.loaded),z(20),be("ngForOf",r.pattern_view.country),z(20),be("ngForOf",r.pattern_buy.category))},directives:[jD,UD],styles:['@property --num{syntax: "<integer>"; initial-value: 0; inherits: false;}.animated[_ngcontent-%COMP%]{transition:--num 1s;counter-reset:num var(--num)}.animated[_ngcontent-%COMP%]:after{content:counter(num)}']}),e})()}];let lk=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({imports:[[aC.forRoot(uk)],aC]}),e})(),ck=(()=>{class e{constructor(){this.title="app"}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275cmp=Ar({type:e,selectors:[["app-root"]],decls:1,vars:0,template:function(n,r){1&n&&Ne(0,"router-outlet")},directives:[lf],styles:[""]}),e})(),dk=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275mod=tr({type:e,bootstrap:[ck]}),e.\u0275inj=Dn({providers:[],imports:[[gP,lk]]}),e})();(function(){if(b_)throw new Error("Cannot enable prod mode after platform setup.");w_=!1})(),hP().bootstrapModule(dk).catch(e=>console.error(e))}},Y=>{Y(Y.s=240)}]);
\ No newline at end of file
+"use strict";var fk=Object.defineProperty,hk=Object.defineProperties,pk=Object.getOwnPropertyDescriptors,dC=Object.getOwnPropertySymbols,gk=Object.prototype.hasOwnProperty,mk=Object.prototype.propertyIsEnumerable,fC=(Y,Ae,Ke)=>Ae in Y?fk(Y,Ae,{enumerable:!0,configurable:!0,writable:!0,value:Ke}):Y[Ae]=Ke,P=(Y,Ae)=>{for(var Ke in Ae||(Ae={}))gk.call(Ae,Ke)&&fC(Y,Ke,Ae[Ke]);if(dC)for(var Ke of dC(Ae))mk.call(Ae,Ke)&&fC(Y,Ke,Ae[Ke]);return Y},lt=(Y,Ae)=>hk(Y,pk(Ae));(self.webpackChunkapp=self.webpackChunkapp||[]).push([[179],{240:()=>{function Y(e){return"function"==typeof e}function Ae(e){const n=e(r=>{Error.call(r),r.stack=(new Error).stack});return n.prototype=Object.create(Error.prototype),n.prototype.constructor=n,n}const Ke=Ae(e=>function(n){e(this),this.message=n?`${n.length} errors occurred during unsubscription:\n${n.map((r,o)=>`${o+1}) ${r.toString()}`).join("\n  ")}`:"",this.name="UnsubscriptionError",this.errors=n});function Vo(e,t){if(e){const n=e.indexOf(t);0<=n&&e.splice(n,1)}}class Et{constructor(t){this.initialTeardown=t,this.closed=!1,this._parentage=null,this._teardowns=null}unsubscribe(){let t;if(!this.closed){this.closed=!0;const{_parentage:n}=this;if(n)if(this._parentage=null,Array.isArray(n))for(const i of n)i.remove(this);else n.remove(this);const{initialTeardown:r}=this;if(Y(r))try{r()}catch(i){t=i instanceof Ke?i.errors:[i]}const{_teardowns:o}=this;if(o){this._teardowns=null;for(const i of o)try{If(i)}catch(s){t=null!=t?t:[],s instanceof Ke?t=[...t,...s.errors]:t.push(s)}}if(t)throw new Ke(t)}}add(t){var n;if(t&&t!==this)if(this.closed)If(t);else{if(t instanceof Et){if(t.closed||t._hasParent(this))return;t._addParent(this)}(this._teardowns=null!==(n=this._teardowns)&&void 0!==n?n:[]).push(t)}}_hasParent(t){const{_parentage:n}=this;return n===t||Array.isArray(n)&&n.includes(t)}_addParent(t){const{_parentage:n}=this;this._parentage=Array.isArray(n)?(n.push(t),n):n?[n,t]:t}_removeParent(t){const{_parentage:n}=this;n===t?this._parentage=null:Array.isArray(n)&&Vo(n,t)}remove(t){const{_teardowns:n}=this;n&&Vo(n,t),t instanceof Et&&t._removeParent(this)}}Et.EMPTY=(()=>{const e=new Et;return e.closed=!0,e})();const wf=Et.EMPTY;function bf(e){return e instanceof Et||e&&"closed"in e&&Y(e.remove)&&Y(e.add)&&Y(e.unsubscribe)}function If(e){Y(e)?e():e.unsubscribe()}const Yn={onUnhandledError:null,onStoppedNotification:null,Promise:void 0,useDeprecatedSynchronousErrorHandling:!1,useDeprecatedNextContext:!1},ss={setTimeout(...e){const{delegate:t}=ss;return((null==t?void 0:t.setTimeout)||setTimeout)(...e)},clearTimeout(e){const{delegate:t}=ss;return((null==t?void 0:t.clearTimeout)||clearTimeout)(e)},delegate:void 0};function Tf(e){ss.setTimeout(()=>{const{onUnhandledError:t}=Yn;if(!t)throw e;t(e)})}function as(){}const hC=au("C",void 0,void 0);function au(e,t,n){return{kind:e,value:t,error:n}}let Zn=null;function us(e){if(Yn.useDeprecatedSynchronousErrorHandling){const t=!Zn;if(t&&(Zn={errorThrown:!1,error:null}),e(),t){const{errorThrown:n,error:r}=Zn;if(Zn=null,n)throw r}}else e()}class uu extends Et{constructor(t){super(),this.isStopped=!1,t?(this.destination=t,bf(t)&&t.add(this)):this.destination=yC}static create(t,n,r){return new lu(t,n,r)}next(t){this.isStopped?du(au("N",t,void 0),this):this._next(t)}error(t){this.isStopped?du(au("E",void 0,t),this):(this.isStopped=!0,this._error(t))}complete(){this.isStopped?du(hC,this):(this.isStopped=!0,this._complete())}unsubscribe(){this.closed||(this.isStopped=!0,super.unsubscribe(),this.destination=null)}_next(t){this.destination.next(t)}_error(t){try{this.destination.error(t)}finally{this.unsubscribe()}}_complete(){try{this.destination.complete()}finally{this.unsubscribe()}}}class lu extends uu{constructor(t,n,r){let o;if(super(),Y(t))o=t;else if(t){let i;({next:o,error:n,complete:r}=t),this&&Yn.useDeprecatedNextContext?(i=Object.create(t),i.unsubscribe=()=>this.unsubscribe()):i=t,o=null==o?void 0:o.bind(i),n=null==n?void 0:n.bind(i),r=null==r?void 0:r.bind(i)}this.destination={next:o?cu(o):as,error:cu(null!=n?n:Sf),complete:r?cu(r):as}}}function cu(e,t){return(...n)=>{try{e(...n)}catch(r){Yn.useDeprecatedSynchronousErrorHandling?function(e){Yn.useDeprecatedSynchronousErrorHandling&&Zn&&(Zn.errorThrown=!0,Zn.error=e)}(r):Tf(r)}}}function Sf(e){throw e}function du(e,t){const{onStoppedNotification:n}=Yn;n&&ss.setTimeout(()=>n(e,t))}const yC={closed:!0,next:as,error:Sf,complete:as},fu="function"==typeof Symbol&&Symbol.observable||"@@observable";function Jn(e){return e}let fe=(()=>{class e{constructor(n){n&&(this._subscribe=n)}lift(n){const r=new e;return r.source=this,r.operator=n,r}subscribe(n,r,o){const i=function(e){return e&&e instanceof uu||function(e){return e&&Y(e.next)&&Y(e.error)&&Y(e.complete)}(e)&&bf(e)}(n)?n:new lu(n,r,o);return us(()=>{const{operator:s,source:a}=this;i.add(s?s.call(i,a):a?this._subscribe(i):this._trySubscribe(i))}),i}_trySubscribe(n){try{return this._subscribe(n)}catch(r){n.error(r)}}forEach(n,r){return new(r=Af(r))((o,i)=>{let s;s=this.subscribe(a=>{try{n(a)}catch(u){i(u),null==s||s.unsubscribe()}},i,o)})}_subscribe(n){var r;return null===(r=this.source)||void 0===r?void 0:r.subscribe(n)}[fu](){return this}pipe(...n){return function(e){return 0===e.length?Jn:1===e.length?e[0]:function(n){return e.reduce((r,o)=>o(r),n)}}(n)(this)}toPromise(n){return new(n=Af(n))((r,o)=>{let i;this.subscribe(s=>i=s,s=>o(s),()=>r(i))})}}return e.create=t=>new e(t),e})();function Af(e){var t;return null!==(t=null!=e?e:Yn.Promise)&&void 0!==t?t:Promise}const vC=Ae(e=>function(){e(this),this.name="ObjectUnsubscribedError",this.message="object unsubscribed"});let pn=(()=>{class e extends fe{constructor(){super(),this.closed=!1,this.observers=[],this.isStopped=!1,this.hasError=!1,this.thrownError=null}lift(n){const r=new Rf(this,this);return r.operator=n,r}_throwIfClosed(){if(this.closed)throw new vC}next(n){us(()=>{if(this._throwIfClosed(),!this.isStopped){const r=this.observers.slice();for(const o of r)o.next(n)}})}error(n){us(()=>{if(this._throwIfClosed(),!this.isStopped){this.hasError=this.isStopped=!0,this.thrownError=n;const{observers:r}=this;for(;r.length;)r.shift().error(n)}})}complete(){us(()=>{if(this._throwIfClosed(),!this.isStopped){this.isStopped=!0;const{observers:n}=this;for(;n.length;)n.shift().complete()}})}unsubscribe(){this.isStopped=this.closed=!0,this.observers=null}get observed(){var n;return(null===(n=this.observers)||void 0===n?void 0:n.length)>0}_trySubscribe(n){return this._throwIfClosed(),super._trySubscribe(n)}_subscribe(n){return this._throwIfClosed(),this._checkFinalizedStatuses(n),this._innerSubscribe(n)}_innerSubscribe(n){const{hasError:r,isStopped:o,observers:i}=this;return r||o?wf:(i.push(n),new Et(()=>Vo(i,n)))}_checkFinalizedStatuses(n){const{hasError:r,thrownError:o,isStopped:i}=this;r?n.error(o):i&&n.complete()}asObservable(){const n=new fe;return n.source=this,n}}return e.create=(t,n)=>new Rf(t,n),e})();class Rf extends pn{constructor(t,n){super(),this.destination=t,this.source=n}next(t){var n,r;null===(r=null===(n=this.destination)||void 0===n?void 0:n.next)||void 0===r||r.call(n,t)}error(t){var n,r;null===(r=null===(n=this.destination)||void 0===n?void 0:n.error)||void 0===r||r.call(n,t)}complete(){var t,n;null===(n=null===(t=this.destination)||void 0===t?void 0:t.complete)||void 0===n||n.call(t)}_subscribe(t){var n,r;return null!==(r=null===(n=this.source)||void 0===n?void 0:n.subscribe(t))&&void 0!==r?r:wf}}function xf(e){return Y(null==e?void 0:e.lift)}function ke(e){return t=>{if(xf(t))return t.lift(function(n){try{return e(n,this)}catch(r){this.error(r)}});throw new TypeError("Unable to lift unknown Observable type")}}class Le extends uu{constructor(t,n,r,o,i){super(t),this.onFinalize=i,this._next=n?function(s){try{n(s)}catch(a){t.error(a)}}:super._next,this._error=o?function(s){try{o(s)}catch(a){t.error(a)}finally{this.unsubscribe()}}:super._error,this._complete=r?function(){try{r()}catch(s){t.error(s)}finally{this.unsubscribe()}}:super._complete}unsubscribe(){var t;const{closed:n}=this;super.unsubscribe(),!n&&(null===(t=this.onFinalize)||void 0===t||t.call(this))}}function ae(e,t){return ke((n,r)=>{let o=0;n.subscribe(new Le(r,i=>{r.next(e.call(t,i,o++))}))})}function Xn(e){return this instanceof Xn?(this.v=e,this):new Xn(e)}function wC(e,t,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var o,r=n.apply(e,t||[]),i=[];return o={},s("next"),s("throw"),s("return"),o[Symbol.asyncIterator]=function(){return this},o;function s(f){r[f]&&(o[f]=function(h){return new Promise(function(m,_){i.push([f,h,m,_])>1||a(f,h)})})}function a(f,h){try{!function(f){f.value instanceof Xn?Promise.resolve(f.value.v).then(l,c):d(i[0][2],f)}(r[f](h))}catch(m){d(i[0][3],m)}}function l(f){a("next",f)}function c(f){a("throw",f)}function d(f,h){f(h),i.shift(),i.length&&a(i[0][0],i[0][1])}}function bC(e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var n,t=e[Symbol.asyncIterator];return t?t.call(e):(e=function(e){var t="function"==typeof Symbol&&Symbol.iterator,n=t&&e[t],r=0;if(n)return n.call(e);if(e&&"number"==typeof e.length)return{next:function(){return e&&r>=e.length&&(e=void 0),{value:e&&e[r++],done:!e}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}(e),n={},r("next"),r("throw"),r("return"),n[Symbol.asyncIterator]=function(){return this},n);function r(i){n[i]=e[i]&&function(s){return new Promise(function(a,u){!function(i,s,a,u){Promise.resolve(u).then(function(l){i({value:l,done:a})},s)}(a,u,(s=e[i](s)).done,s.value)})}}}const Of=e=>e&&"number"==typeof e.length&&"function"!=typeof e;function kf(e){return Y(null==e?void 0:e.then)}function Lf(e){return Y(e[fu])}function Vf(e){return Symbol.asyncIterator&&Y(null==e?void 0:e[Symbol.asyncIterator])}function jf(e){return new TypeError(`You provided ${null!==e&&"object"==typeof e?"an invalid object":`'${e}'`} where a stream was expected. You can provide an Observable, Promise, ReadableStream, Array, AsyncIterable, or Iterable.`)}const Bf="function"==typeof Symbol&&Symbol.iterator?Symbol.iterator:"@@iterator";function Uf(e){return Y(null==e?void 0:e[Bf])}function Hf(e){return wC(this,arguments,function*(){const n=e.getReader();try{for(;;){const{value:r,done:o}=yield Xn(n.read());if(o)return yield Xn(void 0);yield yield Xn(r)}}finally{n.releaseLock()}})}function $f(e){return Y(null==e?void 0:e.getReader)}function gn(e){if(e instanceof fe)return e;if(null!=e){if(Lf(e))return function(e){return new fe(t=>{const n=e[fu]();if(Y(n.subscribe))return n.subscribe(t);throw new TypeError("Provided object does not correctly implement Symbol.observable")})}(e);if(Of(e))return function(e){return new fe(t=>{for(let n=0;n<e.length&&!t.closed;n++)t.next(e[n]);t.complete()})}(e);if(kf(e))return function(e){return new fe(t=>{e.then(n=>{t.closed||(t.next(n),t.complete())},n=>t.error(n)).then(null,Tf)})}(e);if(Vf(e))return qf(e);if(Uf(e))return function(e){return new fe(t=>{for(const n of e)if(t.next(n),t.closed)return;t.complete()})}(e);if($f(e))return function(e){return qf(Hf(e))}(e)}throw jf(e)}function qf(e){return new fe(t=>{(function(e,t){var n,r,o,i;return function(e,t,n,r){return new(n||(n=Promise))(function(i,s){function a(c){try{l(r.next(c))}catch(d){s(d)}}function u(c){try{l(r.throw(c))}catch(d){s(d)}}function l(c){c.done?i(c.value):function(i){return i instanceof n?i:new n(function(s){s(i)})}(c.value).then(a,u)}l((r=r.apply(e,t||[])).next())})}(this,void 0,void 0,function*(){try{for(n=bC(e);!(r=yield n.next()).done;)if(t.next(r.value),t.closed)return}catch(s){o={error:s}}finally{try{r&&!r.done&&(i=n.return)&&(yield i.call(n))}finally{if(o)throw o.error}}t.complete()})})(e,t).catch(n=>t.error(n))})}function mn(e,t,n,r=0,o=!1){const i=t.schedule(function(){n(),o?e.add(this.schedule(null,r)):this.unsubscribe()},r);if(e.add(i),!o)return i}function Re(e,t,n=1/0){return Y(t)?Re((r,o)=>ae((i,s)=>t(r,i,o,s))(gn(e(r,o))),n):("number"==typeof t&&(n=t),ke((r,o)=>function(e,t,n,r,o,i,s,a){const u=[];let l=0,c=0,d=!1;const f=()=>{d&&!u.length&&!l&&t.complete()},h=_=>l<r?m(_):u.push(_),m=_=>{l++;let y=!1;gn(n(_,c++)).subscribe(new Le(t,v=>{t.next(v)},()=>{y=!0},void 0,()=>{if(y)try{for(l--;u.length&&l<r;){const v=u.shift();m(v)}f()}catch(v){t.error(v)}}))};return e.subscribe(new Le(t,h,()=>{d=!0,f()})),()=>{}}(r,o,e,n)))}function jo(e=1/0){return Re(Jn,e)}const yn=new fe(e=>e.complete());function pu(e){return e[e.length-1]}function Bo(e){return function(e){return e&&Y(e.schedule)}(pu(e))?e.pop():void 0}function Wf(e,t=0){return ke((n,r)=>{n.subscribe(new Le(r,o=>mn(r,e,()=>r.next(o),t),()=>mn(r,e,()=>r.complete(),t),o=>mn(r,e,()=>r.error(o),t)))})}function Gf(e,t=0){return ke((n,r)=>{r.add(e.schedule(()=>n.subscribe(r),t))})}function zf(e,t){if(!e)throw new Error("Iterable cannot be null");return new fe(n=>{mn(n,t,()=>{const r=e[Symbol.asyncIterator]();mn(n,t,()=>{r.next().then(o=>{o.done?n.complete():n.next(o.value)})},0,!0)})})}function Ve(e,t){return t?function(e,t){if(null!=e){if(Lf(e))return function(e,t){return gn(e).pipe(Gf(t),Wf(t))}(e,t);if(Of(e))return function(e,t){return new fe(n=>{let r=0;return t.schedule(function(){r===e.length?n.complete():(n.next(e[r++]),n.closed||this.schedule())})})}(e,t);if(kf(e))return function(e,t){return gn(e).pipe(Gf(t),Wf(t))}(e,t);if(Vf(e))return zf(e,t);if(Uf(e))return function(e,t){return new fe(n=>{let r;return mn(n,t,()=>{r=e[Bf](),mn(n,t,()=>{let o,i;try{({value:o,done:i}=r.next())}catch(s){return void n.error(s)}i?n.complete():n.next(o)},0,!0)}),()=>Y(null==r?void 0:r.return)&&r.return()})}(e,t);if($f(e))return function(e,t){return zf(Hf(e),t)}(e,t)}throw jf(e)}(e,t):gn(e)}function ls(e){return e<=0?()=>yn:ke((t,n)=>{let r=0;t.subscribe(new Le(n,o=>{++r<=e&&(n.next(o),e<=r&&n.complete())}))})}function gu(e,t,...n){return!0===t?(e(),null):!1===t?null:t(...n).pipe(ls(1)).subscribe(()=>e())}function te(e){for(let t in e)if(e[t]===te)return t;throw Error("Could not find renamed property on target object.")}function $(e){if("string"==typeof e)return e;if(Array.isArray(e))return"["+e.map($).join(", ")+"]";if(null==e)return""+e;if(e.overriddenName)return`${e.overriddenName}`;if(e.name)return`${e.name}`;const t=e.toString();if(null==t)return""+t;const n=t.indexOf("\n");return-1===n?t:t.substring(0,n)}function yu(e,t){return null==e||""===e?null===t?"":t:null==t||""===t?e:e+" "+t}const GC=te({__forward_ref__:te});function _u(e){return e.__forward_ref__=_u,e.toString=function(){return $(this())},e}function M(e){return function(e){return"function"==typeof e&&e.hasOwnProperty(GC)&&e.__forward_ref__===_u}(e)?e():e}class er extends Error{constructor(t,n){super(function(e,t){return`${e?`NG0${e}: `:""}${t}`}(t,n)),this.code=t}}function L(e){return"string"==typeof e?e:null==e?"":String(e)}function Ye(e){return"function"==typeof e?e.name||e.toString():"object"==typeof e&&null!=e&&"function"==typeof e.type?e.type.name||e.type.toString():L(e)}function cs(e,t){const n=t?` in ${t}`:"";throw new er("201",`No provider for ${Ye(e)} found${n}`)}function dt(e,t){null==e&&function(e,t,n,r){throw new Error(`ASSERTION ERROR: ${e}`+(null==r?"":` [Expected=> ${n} ${r} ${t} <=Actual]`))}(t,e,null,"!=")}function q(e){return{token:e.token,providedIn:e.providedIn||null,factory:e.factory,value:void 0}}function Dn(e){return{providers:e.providers||[],imports:e.imports||[]}}function vn(e){return Kf(e,ds)||Kf(e,Zf)}function Kf(e,t){return e.hasOwnProperty(t)?e[t]:null}function Yf(e){return e&&(e.hasOwnProperty(vu)||e.hasOwnProperty(XC))?e[vu]:null}const ds=te({\u0275prov:te}),vu=te({\u0275inj:te}),Zf=te({ngInjectableDef:te}),XC=te({ngInjectorDef:te});var R=(()=>((R=R||{})[R.Default=0]="Default",R[R.Host=1]="Host",R[R.Self=2]="Self",R[R.SkipSelf=4]="SkipSelf",R[R.Optional=8]="Optional",R))();let Cu;function Pn(e){const t=Cu;return Cu=e,t}function Jf(e,t,n){const r=vn(e);return r&&"root"==r.providedIn?void 0===r.value?r.value=r.factory():r.value:n&R.Optional?null:void 0!==t?t:void cs($(e),"Injector")}function Fn(e){return{toString:e}.toString()}var wt=(()=>((wt=wt||{})[wt.OnPush=0]="OnPush",wt[wt.Default=1]="Default",wt))(),ft=(()=>{return(e=ft||(ft={}))[e.Emulated=0]="Emulated",e[e.None=2]="None",e[e.ShadowDom=3]="ShadowDom",ft;var e})();const tE="undefined"!=typeof globalThis&&globalThis,nE="undefined"!=typeof window&&window,rE="undefined"!=typeof self&&"undefined"!=typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&self,X=tE||"undefined"!=typeof global&&global||nE||rE,Mr={},ne=[],fs=te({\u0275cmp:te}),Eu=te({\u0275dir:te}),wu=te({\u0275pipe:te}),Xf=te({\u0275mod:te}),Cn=te({\u0275fac:te}),Uo=te({__NG_ELEMENT_ID__:te});let oE=0;function Ar(e){return Fn(()=>{const n={},r={type:e.type,providersResolver:null,decls:e.decls,vars:e.vars,factory:null,template:e.template||null,consts:e.consts||null,ngContentSelectors:e.ngContentSelectors,hostBindings:e.hostBindings||null,hostVars:e.hostVars||0,hostAttrs:e.hostAttrs||null,contentQueries:e.contentQueries||null,declaredInputs:n,inputs:null,outputs:null,exportAs:e.exportAs||null,onPush:e.changeDetection===wt.OnPush,directiveDefs:null,pipeDefs:null,selectors:e.selectors||ne,viewQuery:e.viewQuery||null,features:e.features||null,data:e.data||{},encapsulation:e.encapsulation||ft.Emulated,id:"c",styles:e.styles||ne,_:null,setInput:null,schemas:e.schemas||null,tView:null},o=e.directives,i=e.features,s=e.pipes;return r.id+=oE++,r.inputs=rh(e.inputs,n),r.outputs=rh(e.outputs),i&&i.forEach(a=>a(r)),r.directiveDefs=o?()=>("function"==typeof o?o():o).map(eh):null,r.pipeDefs=s?()=>("function"==typeof s?s():s).map(th):null,r})}function eh(e){return He(e)||function(e){return e[Eu]||null}(e)}function th(e){return function(e){return e[wu]||null}(e)}const nh={};function tr(e){return Fn(()=>{const t={type:e.type,bootstrap:e.bootstrap||ne,declarations:e.declarations||ne,imports:e.imports||ne,exports:e.exports||ne,transitiveCompileScopes:null,schemas:e.schemas||null,id:e.id||null};return null!=e.id&&(nh[e.id]=e.type),t})}function rh(e,t){if(null==e)return Mr;const n={};for(const r in e)if(e.hasOwnProperty(r)){let o=e[r],i=o;Array.isArray(o)&&(i=o[1],o=o[0]),n[o]=r,t&&(t[o]=i)}return n}const Ue=Ar;function He(e){return e[fs]||null}function bt(e,t){const n=e[Xf]||null;if(!n&&!0===t)throw new Error(`Type ${$(e)} does not have '\u0275mod' property.`);return n}const B=11;function en(e){return Array.isArray(e)&&"object"==typeof e[1]}function Vt(e){return Array.isArray(e)&&!0===e[1]}function Tu(e){return 0!=(8&e.flags)}function ms(e){return 2==(2&e.flags)}function ys(e){return 1==(1&e.flags)}function jt(e){return null!==e.template}function cE(e){return 0!=(512&e[2])}function sr(e,t){return e.hasOwnProperty(Cn)?e[Cn]:null}class ih{constructor(t,n,r){this.previousValue=t,this.currentValue=n,this.firstChange=r}isFirstChange(){return this.firstChange}}function sh(e){return e.type.prototype.ngOnChanges&&(e.setInput=pE),hE}function hE(){const e=uh(this),t=null==e?void 0:e.current;if(t){const n=e.previous;if(n===Mr)e.previous=t;else for(let r in t)n[r]=t[r];e.current=null,this.ngOnChanges(t)}}function pE(e,t,n,r){const o=uh(e)||function(e,t){return e[ah]=t}(e,{previous:Mr,current:null}),i=o.current||(o.current={}),s=o.previous,a=this.declaredInputs[n],u=s[a];i[a]=new ih(u&&u.currentValue,t,s===Mr),e[r]=t}const ah="__ngSimpleChanges__";function uh(e){return e[ah]||null}const lh="http://www.w3.org/2000/svg";let Au;function he(e){return!!e.listen}const dh={createRenderer:(e,t)=>void 0!==Au?Au:"undefined"!=typeof document?document:void 0};function _e(e){for(;Array.isArray(e);)e=e[0];return e}function St(e,t){return _e(t[e.index])}function xu(e,t){return e.data[t]}function pt(e,t){const n=t[e];return en(n)?n:n[0]}function Nu(e){return 128==(128&e[2])}function kn(e,t){return null==t?null:e[t]}function hh(e){e[18]=0}function Pu(e,t){e[5]+=t;let n=e,r=e[3];for(;null!==r&&(1===t&&1===n[5]||-1===t&&0===n[5]);)r[5]+=t,n=r,r=r[3]}const F={lFrame:Ch(null),bindingsEnabled:!0,isInCheckNoChangesMode:!1};function ph(){return F.bindingsEnabled}function C(){return F.lFrame.lView}function Z(){return F.lFrame.tView}function Ee(){let e=gh();for(;null!==e&&64===e.type;)e=e.parent;return e}function gh(){return F.lFrame.currentTNode}function tn(e,t){const n=F.lFrame;n.currentTNode=e,n.isParent=t}function Fu(){return F.lFrame.isParent}function Ds(){return F.isInCheckNoChangesMode}function vs(e){F.isInCheckNoChangesMode=e}function Or(){return F.lFrame.bindingIndex++}function RE(e,t){const n=F.lFrame;n.bindingIndex=n.bindingRootIndex=e,ku(t)}function ku(e){F.lFrame.currentDirectiveIndex=e}function Vu(e){F.lFrame.currentQueryIndex=e}function NE(e){const t=e[1];return 2===t.type?t.declTNode:1===t.type?e[6]:null}function Dh(e,t,n){if(n&R.SkipSelf){let o=t,i=e;for(;!(o=o.parent,null!==o||n&R.Host||(o=NE(i),null===o||(i=i[15],10&o.type))););if(null===o)return!1;t=o,e=i}const r=F.lFrame=vh();return r.currentTNode=t,r.lView=e,!0}function Cs(e){const t=vh(),n=e[1];F.lFrame=t,t.currentTNode=n.firstChild,t.lView=e,t.tView=n,t.contextLView=e,t.bindingIndex=n.bindingStartIndex,t.inI18n=!1}function vh(){const e=F.lFrame,t=null===e?null:e.child;return null===t?Ch(e):t}function Ch(e){const t={currentTNode:null,isParent:!0,lView:null,tView:null,selectedIndex:-1,contextLView:null,elementDepthCount:0,currentNamespace:null,currentDirectiveIndex:-1,bindingRootIndex:-1,bindingIndex:-1,currentQueryIndex:0,parent:e,child:null,inI18n:!1};return null!==e&&(e.child=t),t}function Eh(){const e=F.lFrame;return F.lFrame=e.parent,e.currentTNode=null,e.lView=null,e}const wh=Eh;function Es(){const e=Eh();e.isParent=!0,e.tView=null,e.selectedIndex=-1,e.contextLView=null,e.elementDepthCount=0,e.currentDirectiveIndex=-1,e.currentNamespace=null,e.bindingRootIndex=-1,e.bindingIndex=-1,e.currentQueryIndex=0}function Je(){return F.lFrame.selectedIndex}function Ln(e){F.lFrame.selectedIndex=e}function ju(){F.lFrame.currentNamespace=lh}function Bu(){F.lFrame.currentNamespace=null}function ws(e,t){for(let n=t.directiveStart,r=t.directiveEnd;n<r;n++){const i=e.data[n].type.prototype,{ngAfterContentInit:s,ngAfterContentChecked:a,ngAfterViewInit:u,ngAfterViewChecked:l,ngOnDestroy:c}=i;s&&(e.contentHooks||(e.contentHooks=[])).push(-n,s),a&&((e.contentHooks||(e.contentHooks=[])).push(n,a),(e.contentCheckHooks||(e.contentCheckHooks=[])).push(n,a)),u&&(e.viewHooks||(e.viewHooks=[])).push(-n,u),l&&((e.viewHooks||(e.viewHooks=[])).push(n,l),(e.viewCheckHooks||(e.viewCheckHooks=[])).push(n,l)),null!=c&&(e.destroyHooks||(e.destroyHooks=[])).push(n,c)}}function bs(e,t,n){bh(e,t,3,n)}function Is(e,t,n,r){(3&e[2])===n&&bh(e,t,n,r)}function Uu(e,t){let n=e[2];(3&n)===t&&(n&=2047,n+=1,e[2]=n)}function bh(e,t,n,r){const i=null!=r?r:-1,s=t.length-1;let a=0;for(let u=void 0!==r?65535&e[18]:0;u<s;u++)if("number"==typeof t[u+1]){if(a=t[u],null!=r&&a>=r)break}else t[u]<0&&(e[18]+=65536),(a<i||-1==i)&&(jE(e,n,t,u),e[18]=(4294901760&e[18])+u+2),u++}function jE(e,t,n,r){const o=n[r]<0,i=n[r+1],a=e[o?-n[r]:n[r]];if(o){if(e[2]>>11<e[18]>>16&&(3&e[2])===t){e[2]+=2048;try{i.call(a)}finally{}}}else try{i.call(a)}finally{}}class Go{constructor(t,n,r){this.factory=t,this.resolving=!1,this.canSeeViewProviders=n,this.injectImpl=r}}function Ts(e,t,n){const r=he(e);let o=0;for(;o<n.length;){const i=n[o];if("number"==typeof i){if(0!==i)break;o++;const s=n[o++],a=n[o++],u=n[o++];r?e.setAttribute(t,a,u,s):t.setAttributeNS(s,a,u)}else{const s=i,a=n[++o];$u(s)?r&&e.setProperty(t,s,a):r?e.setAttribute(t,s,a):t.setAttribute(s,a),o++}}return o}function Ih(e){return 3===e||4===e||6===e}function $u(e){return 64===e.charCodeAt(0)}function Ss(e,t){if(null!==t&&0!==t.length)if(null===e||0===e.length)e=t.slice();else{let n=-1;for(let r=0;r<t.length;r++){const o=t[r];"number"==typeof o?n=o:0===n||Th(e,n,o,null,-1===n||2===n?t[++r]:null)}}return e}function Th(e,t,n,r,o){let i=0,s=e.length;if(-1===t)s=-1;else for(;i<e.length;){const a=e[i++];if("number"==typeof a){if(a===t){s=-1;break}if(a>t){s=i-1;break}}}for(;i<e.length;){const a=e[i];if("number"==typeof a)break;if(a===n){if(null===r)return void(null!==o&&(e[i+1]=o));if(r===e[i+1])return void(e[i+2]=o)}i++,null!==r&&i++,null!==o&&i++}-1!==s&&(e.splice(s,0,t),i=s+1),e.splice(i++,0,n),null!==r&&e.splice(i++,0,r),null!==o&&e.splice(i++,0,o)}function Sh(e){return-1!==e}function kr(e){return 32767&e}function Lr(e,t){let n=function(e){return e>>16}(e),r=t;for(;n>0;)r=r[15],n--;return r}let qu=!0;function Ms(e){const t=qu;return qu=e,t}let WE=0;function Qo(e,t){const n=Gu(e,t);if(-1!==n)return n;const r=t[1];r.firstCreatePass&&(e.injectorIndex=t.length,Wu(r.data,e),Wu(t,null),Wu(r.blueprint,null));const o=As(e,t),i=e.injectorIndex;if(Sh(o)){const s=kr(o),a=Lr(o,t),u=a[1].data;for(let l=0;l<8;l++)t[i+l]=a[s+l]|u[s+l]}return t[i+8]=o,i}function Wu(e,t){e.push(0,0,0,0,0,0,0,0,t)}function Gu(e,t){return-1===e.injectorIndex||e.parent&&e.parent.injectorIndex===e.injectorIndex||null===t[e.injectorIndex+8]?-1:e.injectorIndex}function As(e,t){if(e.parent&&-1!==e.parent.injectorIndex)return e.parent.injectorIndex;let n=0,r=null,o=t;for(;null!==o;){const i=o[1],s=i.type;if(r=2===s?i.declTNode:1===s?o[6]:null,null===r)return-1;if(n++,o=o[15],-1!==r.injectorIndex)return r.injectorIndex|n<<16}return-1}function Rs(e,t,n){!function(e,t,n){let r;"string"==typeof n?r=n.charCodeAt(0)||0:n.hasOwnProperty(Uo)&&(r=n[Uo]),null==r&&(r=n[Uo]=WE++);const o=255&r;t.data[e+(o>>5)]|=1<<o}(e,t,n)}function Rh(e,t,n){if(n&R.Optional)return e;cs(t,"NodeInjector")}function xh(e,t,n,r){if(n&R.Optional&&void 0===r&&(r=null),0==(n&(R.Self|R.Host))){const o=e[9],i=Pn(void 0);try{return o?o.get(t,r,n&R.Optional):Jf(t,r,n&R.Optional)}finally{Pn(i)}}return Rh(r,t,n)}function Nh(e,t,n,r=R.Default,o){if(null!==e){const i=function(e){if("string"==typeof e)return e.charCodeAt(0)||0;const t=e.hasOwnProperty(Uo)?e[Uo]:void 0;return"number"==typeof t?t>=0?255&t:QE:t}(n);if("function"==typeof i){if(!Dh(t,e,r))return r&R.Host?Rh(o,n,r):xh(t,n,r,o);try{const s=i(r);if(null!=s||r&R.Optional)return s;cs(n)}finally{wh()}}else if("number"==typeof i){let s=null,a=Gu(e,t),u=-1,l=r&R.Host?t[16][6]:null;for((-1===a||r&R.SkipSelf)&&(u=-1===a?As(e,t):t[a+8],-1!==u&&Oh(r,!1)?(s=t[1],a=kr(u),t=Lr(u,t)):a=-1);-1!==a;){const c=t[1];if(Fh(i,a,c.data)){const d=KE(a,t,n,s,r,l);if(d!==Ph)return d}u=t[a+8],-1!==u&&Oh(r,t[1].data[a+8]===l)&&Fh(i,a,t)?(s=c,a=kr(u),t=Lr(u,t)):a=-1}}}return xh(t,n,r,o)}const Ph={};function QE(){return new Vr(Ee(),C())}function KE(e,t,n,r,o,i){const s=t[1],a=s.data[e+8],c=function(e,t,n,r,o){const i=e.providerIndexes,s=t.data,a=1048575&i,u=e.directiveStart,c=i>>20,f=o?a+c:e.directiveEnd;for(let h=r?a:a+c;h<f;h++){const m=s[h];if(h<u&&n===m||h>=u&&m.type===n)return h}if(o){const h=s[u];if(h&&jt(h)&&h.type===n)return u}return null}(a,s,n,null==r?ms(a)&&qu:r!=s&&0!=(3&a.type),o&R.Host&&i===a);return null!==c?Ko(t,s,c,a):Ph}function Ko(e,t,n,r){let o=e[n];const i=t.data;if(function(e){return e instanceof Go}(o)){const s=o;s.resolving&&function(e,t){throw new er("200",`Circular dependency in DI detected for ${e}`)}(Ye(i[n]));const a=Ms(s.canSeeViewProviders);s.resolving=!0;const u=s.injectImpl?Pn(s.injectImpl):null;Dh(e,r,R.Default);try{o=e[n]=s.factory(void 0,i,e,r),t.firstCreatePass&&n>=r.directiveStart&&function(e,t,n){const{ngOnChanges:r,ngOnInit:o,ngDoCheck:i}=t.type.prototype;if(r){const s=sh(t);(n.preOrderHooks||(n.preOrderHooks=[])).push(e,s),(n.preOrderCheckHooks||(n.preOrderCheckHooks=[])).push(e,s)}o&&(n.preOrderHooks||(n.preOrderHooks=[])).push(0-e,o),i&&((n.preOrderHooks||(n.preOrderHooks=[])).push(e,i),(n.preOrderCheckHooks||(n.preOrderCheckHooks=[])).push(e,i))}(n,i[n],t)}finally{null!==u&&Pn(u),Ms(a),s.resolving=!1,wh()}}return o}function Fh(e,t,n){return!!(n[t+(e>>5)]&1<<e)}function Oh(e,t){return!(e&R.Self||e&R.Host&&t)}class Vr{constructor(t,n){this._tNode=t,this._lView=n}get(t,n,r){return Nh(this._tNode,this._lView,t,r,n)}}const Br="__parameters__";function ur(e,t,n){return Fn(()=>{const r=function(e){return function(...n){if(e){const r=e(...n);for(const o in r)this[o]=r[o]}}}(t);function o(...i){if(this instanceof o)return r.apply(this,i),this;const s=new o(...i);return a.annotation=s,a;function a(u,l,c){const d=u.hasOwnProperty(Br)?u[Br]:Object.defineProperty(u,Br,{value:[]})[Br];for(;d.length<=c;)d.push(null);return(d[c]=d[c]||[]).push(s),u}}return n&&(o.prototype=Object.create(n.prototype)),o.prototype.ngMetadataName=e,o.annotationCls=o,o})}class J{constructor(t,n){this._desc=t,this.ngMetadataName="InjectionToken",this.\u0275prov=void 0,"number"==typeof n?this.__NG_ELEMENT_ID__=n:void 0!==n&&(this.\u0275prov=q({token:this,providedIn:n.providedIn||"root",factory:n.factory}))}toString(){return`InjectionToken ${this._desc}`}}const ew=new J("AnalyzeForEntryComponents");function nn(e,t){e.forEach(n=>Array.isArray(n)?nn(n,t):t(n))}function Ns(e,t,n){t>=e.length?e.push(n):e.splice(t,0,n)}function lr(e,t){return t>=e.length-1?e.pop():e.splice(t,1)[0]}const ti={},Ju="__NG_DI_FLAG__",$r="ngTempTokenPath",cw=/\n/gm,Xu="__source",el=te({provide:String,useValue:te});let ni;function qr(e){const t=ni;return ni=e,t}function fw(e,t=R.Default){if(void 0===ni)throw new Error("inject() must be called from an injection context");return null===ni?Jf(e,void 0,t):ni.get(e,t&R.Optional?null:void 0,t)}function A(e,t=R.Default){return(Cu||fw)(M(e),t)}function cr(e){const t=[];for(let n=0;n<e.length;n++){const r=M(e[n]);if(Array.isArray(r)){if(0===r.length)throw new Error("Arguments array must have arguments.");let o,i=R.Default;for(let s=0;s<r.length;s++){const a=r[s],u=hw(a);"number"==typeof u?-1===u?o=a.token:i|=u:o=a}t.push(A(o,i))}else t.push(A(r))}return t}function ri(e,t){return e[Ju]=t,e.prototype[Ju]=t,e}function hw(e){return e[Ju]}function Bh(e,t,n,r){const o=e[$r];throw t[Xu]&&o.unshift(t[Xu]),e.message=function(e,t,n,r=null){e=e&&"\n"===e.charAt(0)&&"\u0275"==e.charAt(1)?e.substr(2):e;let o=$(t);if(Array.isArray(t))o=t.map($).join(" -> ");else if("object"==typeof t){let i=[];for(let s in t)if(t.hasOwnProperty(s)){let a=t[s];i.push(s+":"+("string"==typeof a?JSON.stringify(a):$(a)))}o=`{${i.join(", ")}}`}return`${n}${r?"("+r+")":""}[${o}]: ${e.replace(cw,"\n  ")}`}("\n"+e.message,o,n,r),e.ngTokenPath=o,e[$r]=null,e}const Wr=ri(ur("Inject",e=>({token:e})),-1),at=ri(ur("Optional"),8),Bn=ri(ur("SkipSelf"),4),ip="__ngContext__";function qe(e,t){e[ip]=t}function cl(e){const t=function(e){return e[ip]||null}(e);return t?Array.isArray(t)?t:t.lView:null}function js(e){return e.ngOriginalError}function sb(e,...t){e.error(...t)}class fr{constructor(){this._console=console}handleError(t){const n=this._findOriginalError(t),r=this._findContext(t),o=(e=t)&&e.ngErrorLogger||sb;var e;o(this._console,"ERROR",t),n&&o(this._console,"ORIGINAL ERROR",n),r&&o(this._console,"ERROR CONTEXT",r)}_findContext(t){return t?t.ngDebugContext||this._findContext(js(t)):null}_findOriginalError(t){let n=t&&js(t);for(;n&&js(n);)n=js(n);return n||null}}const pp=(()=>("undefined"!=typeof requestAnimationFrame&&requestAnimationFrame||setTimeout).bind(X))();function sn(e){return e instanceof Function?e():e}var yt=(()=>((yt=yt||{})[yt.Important=1]="Important",yt[yt.DashCase=2]="DashCase",yt))();function hl(e,t){return undefined(e,t)}function li(e){const t=e[3];return Vt(t)?t[3]:t}function pl(e){return Dp(e[13])}function gl(e){return Dp(e[4])}function Dp(e){for(;null!==e&&!Vt(e);)e=e[4];return e}function Kr(e,t,n,r,o){if(null!=r){let i,s=!1;Vt(r)?i=r:en(r)&&(s=!0,r=r[0]);const a=_e(r);0===e&&null!==n?null==o?Ip(t,n,a):hr(t,n,a,o||null,!0):1===e&&null!==n?hr(t,n,a,o||null,!0):2===e?function(e,t,n){const r=Us(e,t);r&&function(e,t,n,r){he(e)?e.removeChild(t,n,r):t.removeChild(n)}(e,r,t,n)}(t,a,s):3===e&&t.destroyNode(a),null!=i&&function(e,t,n,r,o){const i=n[7];i!==_e(n)&&Kr(t,e,r,i,o);for(let a=10;a<n.length;a++){const u=n[a];ci(u[1],u,e,t,r,i)}}(t,e,i,n,o)}}function yl(e,t,n){return he(e)?e.createElement(t,n):null===n?e.createElement(t):e.createElementNS(n,t)}function Cp(e,t){const n=e[9],r=n.indexOf(t),o=t[3];1024&t[2]&&(t[2]&=-1025,Pu(o,-1)),n.splice(r,1)}function _l(e,t){if(e.length<=10)return;const n=10+t,r=e[n];if(r){const o=r[17];null!==o&&o!==e&&Cp(o,r),t>0&&(e[n-1][4]=r[4]);const i=lr(e,10+t);!function(e,t){ci(e,t,t[B],2,null,null),t[0]=null,t[6]=null}(r[1],r);const s=i[19];null!==s&&s.detachView(i[1]),r[3]=null,r[4]=null,r[2]&=-129}return r}function Ep(e,t){if(!(256&t[2])){const n=t[B];he(n)&&n.destroyNode&&ci(e,t,n,3,null,null),function(e){let t=e[13];if(!t)return Dl(e[1],e);for(;t;){let n=null;if(en(t))n=t[13];else{const r=t[10];r&&(n=r)}if(!n){for(;t&&!t[4]&&t!==e;)en(t)&&Dl(t[1],t),t=t[3];null===t&&(t=e),en(t)&&Dl(t[1],t),n=t&&t[4]}t=n}}(t)}}function Dl(e,t){if(!(256&t[2])){t[2]&=-129,t[2]|=256,function(e,t){let n;if(null!=e&&null!=(n=e.destroyHooks))for(let r=0;r<n.length;r+=2){const o=t[n[r]];if(!(o instanceof Go)){const i=n[r+1];if(Array.isArray(i))for(let s=0;s<i.length;s+=2){const a=o[i[s]],u=i[s+1];try{u.call(a)}finally{}}else try{i.call(o)}finally{}}}}(e,t),function(e,t){const n=e.cleanup,r=t[7];let o=-1;if(null!==n)for(let i=0;i<n.length-1;i+=2)if("string"==typeof n[i]){const s=n[i+1],a="function"==typeof s?s(t):_e(t[s]),u=r[o=n[i+2]],l=n[i+3];"boolean"==typeof l?a.removeEventListener(n[i],u,l):l>=0?r[o=l]():r[o=-l].unsubscribe(),i+=2}else{const s=r[o=n[i+1]];n[i].call(s)}if(null!==r){for(let i=o+1;i<r.length;i++)r[i]();t[7]=null}}(e,t),1===t[1].type&&he(t[B])&&t[B].destroy();const n=t[17];if(null!==n&&Vt(t[3])){n!==t[3]&&Cp(n,t);const r=t[19];null!==r&&r.detachView(e)}}}function wp(e,t,n){return function(e,t,n){let r=t;for(;null!==r&&40&r.type;)r=(t=r).parent;if(null===r)return n[0];if(2&r.flags){const o=e.data[r.directiveStart].encapsulation;if(o===ft.None||o===ft.Emulated)return null}return St(r,n)}(e,t.parent,n)}function hr(e,t,n,r,o){he(e)?e.insertBefore(t,n,r,o):t.insertBefore(n,r,o)}function Ip(e,t,n){he(e)?e.appendChild(t,n):t.appendChild(n)}function Tp(e,t,n,r,o){null!==r?hr(e,t,n,r,o):Ip(e,t,n)}function Us(e,t){return he(e)?e.parentNode(t):t.parentNode}let Ap=function(e,t,n){return 40&e.type?St(e,n):null};function Hs(e,t,n,r){const o=wp(e,r,t),i=t[B],a=function(e,t,n){return Ap(e,t,n)}(r.parent||t[6],r,t);if(null!=o)if(Array.isArray(n))for(let u=0;u<n.length;u++)Tp(i,o,n[u],a,!1);else Tp(i,o,n,a,!1)}function $s(e,t){if(null!==t){const n=t.type;if(3&n)return St(t,e);if(4&n)return Cl(-1,e[t.index]);if(8&n){const r=t.child;if(null!==r)return $s(e,r);{const o=e[t.index];return Vt(o)?Cl(-1,o):_e(o)}}if(32&n)return hl(t,e)()||_e(e[t.index]);{const r=xp(e,t);return null!==r?Array.isArray(r)?r[0]:$s(li(e[16]),r):$s(e,t.next)}}return null}function xp(e,t){return null!==t?e[16][6].projection[t.projection]:null}function Cl(e,t){const n=10+e+1;if(n<t.length){const r=t[n],o=r[1].firstChild;if(null!==o)return $s(r,o)}return t[7]}function El(e,t,n,r,o,i,s){for(;null!=n;){const a=r[n.index],u=n.type;if(s&&0===t&&(a&&qe(_e(a),r),n.flags|=4),64!=(64&n.flags))if(8&u)El(e,t,n.child,r,o,i,!1),Kr(t,e,o,a,i);else if(32&u){const l=hl(n,r);let c;for(;c=l();)Kr(t,e,o,c,i);Kr(t,e,o,a,i)}else 16&u?Pp(e,t,r,n,o,i):Kr(t,e,o,a,i);n=s?n.projectionNext:n.next}}function ci(e,t,n,r,o,i){El(n,r,e.firstChild,t,o,i,!1)}function Pp(e,t,n,r,o,i){const s=n[16],u=s[6].projection[r.projection];if(Array.isArray(u))for(let l=0;l<u.length;l++)Kr(t,e,o,u[l],i);else El(e,t,u,s[3],o,i,!0)}function Fp(e,t,n){he(e)?e.setAttribute(t,"style",n):t.style.cssText=n}function wl(e,t,n){he(e)?""===n?e.removeAttribute(t,"class"):e.setAttribute(t,"class",n):t.className=n}function Op(e,t,n){let r=e.length;for(;;){const o=e.indexOf(t,n);if(-1===o)return o;if(0===o||e.charCodeAt(o-1)<=32){const i=t.length;if(o+i===r||e.charCodeAt(o+i)<=32)return o}n=o+1}}const kp="ng-template";function Nb(e,t,n){let r=0;for(;r<e.length;){let o=e[r++];if(n&&"class"===o){if(o=e[r],-1!==Op(o.toLowerCase(),t,0))return!0}else if(1===o){for(;r<e.length&&"string"==typeof(o=e[r++]);)if(o.toLowerCase()===t)return!0;return!1}}return!1}function Lp(e){return 4===e.type&&e.value!==kp}function Pb(e,t,n){return t===(4!==e.type||n?e.value:kp)}function Fb(e,t,n){let r=4;const o=e.attrs||[],i=function(e){for(let t=0;t<e.length;t++)if(Ih(e[t]))return t;return e.length}(o);let s=!1;for(let a=0;a<t.length;a++){const u=t[a];if("number"!=typeof u){if(!s)if(4&r){if(r=2|1&r,""!==u&&!Pb(e,u,n)||""===u&&1===t.length){if(Bt(r))return!1;s=!0}}else{const l=8&r?u:t[++a];if(8&r&&null!==e.attrs){if(!Nb(e.attrs,l,n)){if(Bt(r))return!1;s=!0}continue}const d=Ob(8&r?"class":u,o,Lp(e),n);if(-1===d){if(Bt(r))return!1;s=!0;continue}if(""!==l){let f;f=d>i?"":o[d+1].toLowerCase();const h=8&r?f:null;if(h&&-1!==Op(h,l,0)||2&r&&l!==f){if(Bt(r))return!1;s=!0}}}}else{if(!s&&!Bt(r)&&!Bt(u))return!1;if(s&&Bt(u))continue;s=!1,r=u|1&r}}return Bt(r)||s}function Bt(e){return 0==(1&e)}function Ob(e,t,n,r){if(null===t)return-1;let o=0;if(r||!n){let i=!1;for(;o<t.length;){const s=t[o];if(s===e)return o;if(3===s||6===s)i=!0;else{if(1===s||2===s){let a=t[++o];for(;"string"==typeof a;)a=t[++o];continue}if(4===s)break;if(0===s){o+=4;continue}}o+=i?1:2}return-1}return function(e,t){let n=e.indexOf(4);if(n>-1)for(n++;n<e.length;){const r=e[n];if("number"==typeof r)return-1;if(r===t)return n;n++}return-1}(t,e)}function Vp(e,t,n=!1){for(let r=0;r<t.length;r++)if(Fb(e,t[r],n))return!0;return!1}function jp(e,t){return e?":not("+t.trim()+")":t}function Bb(e){let t=e[0],n=1,r=2,o="",i=!1;for(;n<e.length;){let s=e[n];if("string"==typeof s)if(2&r){const a=e[++n];o+="["+s+(a.length>0?'="'+a+'"':"")+"]"}else 8&r?o+="."+s:4&r&&(o+=" "+s);else""!==o&&!Bt(s)&&(t+=jp(i,o),o=""),r=s,i=i||!Bt(r);n++}return""!==o&&(t+=jp(i,o)),t}const V={};function z(e){Bp(Z(),C(),Je()+e,Ds())}function Bp(e,t,n,r){if(!r)if(3==(3&t[2])){const i=e.preOrderCheckHooks;null!==i&&bs(t,i,n)}else{const i=e.preOrderHooks;null!==i&&Is(t,i,0,n)}Ln(n)}function Zp(e,t){const n=e.contentQueries;if(null!==n)for(let r=0;r<n.length;r+=2){const o=n[r],i=n[r+1];if(-1!==i){const s=e.data[i];Vu(o),s.contentQueries(2,t[i],i)}}}function di(e,t,n,r,o,i,s,a,u,l){const c=t.blueprint.slice();return c[0]=o,c[2]=140|r,hh(c),c[3]=c[15]=e,c[8]=n,c[10]=s||e&&e[10],c[B]=a||e&&e[B],c[12]=u||e&&e[12]||null,c[9]=l||e&&e[9]||null,c[6]=i,c[16]=2==t.type?e[16]:c,c}function Yr(e,t,n,r,o){let i=e.data[t];if(null===i)i=function(e,t,n,r,o){const i=gh(),s=Fu(),u=e.data[t]=function(e,t,n,r,o,i){return{type:n,index:r,insertBeforeIndex:null,injectorIndex:t?t.injectorIndex:-1,directiveStart:-1,directiveEnd:-1,directiveStylingLast:-1,propertyBindings:null,flags:0,providerIndexes:0,value:o,attrs:i,mergedAttrs:null,localNames:null,initialInputs:void 0,inputs:null,outputs:null,tViews:null,next:null,projectionNext:null,child:null,parent:t,projection:null,styles:null,stylesWithoutHost:null,residualStyles:void 0,classes:null,classesWithoutHost:null,residualClasses:void 0,classBindings:0,styleBindings:0}}(0,s?i:i&&i.parent,n,t,r,o);return null===e.firstChild&&(e.firstChild=u),null!==i&&(s?null==i.child&&null!==u.parent&&(i.child=u):null===i.next&&(i.next=u)),u}(e,t,n,r,o),F.lFrame.inI18n&&(i.flags|=64);else if(64&i.type){i.type=n,i.value=r,i.attrs=o;const s=function(){const e=F.lFrame,t=e.currentTNode;return e.isParent?t:t.parent}();i.injectorIndex=null===s?-1:s.injectorIndex}return tn(i,!0),i}function Zr(e,t,n,r){if(0===n)return-1;const o=t.length;for(let i=0;i<n;i++)t.push(r),e.blueprint.push(r),e.data.push(null);return o}function fi(e,t,n){Cs(t);try{const r=e.viewQuery;null!==r&&ql(1,r,n);const o=e.template;null!==o&&Jp(e,t,o,1,n),e.firstCreatePass&&(e.firstCreatePass=!1),e.staticContentQueries&&Zp(e,t),e.staticViewQueries&&ql(2,e.viewQuery,n);const i=e.components;null!==i&&function(e,t){for(let n=0;n<t.length;n++)w0(e,t[n])}(t,i)}catch(r){throw e.firstCreatePass&&(e.incompleteFirstPass=!0,e.firstCreatePass=!1),r}finally{t[2]&=-5,Es()}}function Jr(e,t,n,r){const o=t[2];if(256==(256&o))return;Cs(t);const i=Ds();try{hh(t),function(e){F.lFrame.bindingIndex=e}(e.bindingStartIndex),null!==n&&Jp(e,t,n,2,r);const s=3==(3&o);if(!i)if(s){const l=e.preOrderCheckHooks;null!==l&&bs(t,l,null)}else{const l=e.preOrderHooks;null!==l&&Is(t,l,0,null),Uu(t,0)}if(function(e){for(let t=pl(e);null!==t;t=gl(t)){if(!t[2])continue;const n=t[9];for(let r=0;r<n.length;r++){const o=n[r],i=o[3];0==(1024&o[2])&&Pu(i,1),o[2]|=1024}}}(t),function(e){for(let t=pl(e);null!==t;t=gl(t))for(let n=10;n<t.length;n++){const r=t[n],o=r[1];Nu(r)&&Jr(o,r,o.template,r[8])}}(t),null!==e.contentQueries&&Zp(e,t),!i)if(s){const l=e.contentCheckHooks;null!==l&&bs(t,l)}else{const l=e.contentHooks;null!==l&&Is(t,l,1),Uu(t,1)}!function(e,t){const n=e.hostBindingOpCodes;if(null!==n)try{for(let r=0;r<n.length;r++){const o=n[r];if(o<0)Ln(~o);else{const i=o,s=n[++r],a=n[++r];RE(s,i),a(2,t[i])}}}finally{Ln(-1)}}(e,t);const a=e.components;null!==a&&function(e,t){for(let n=0;n<t.length;n++)E0(e,t[n])}(t,a);const u=e.viewQuery;if(null!==u&&ql(2,u,r),!i)if(s){const l=e.viewCheckHooks;null!==l&&bs(t,l)}else{const l=e.viewHooks;null!==l&&Is(t,l,2),Uu(t,2)}!0===e.firstUpdatePass&&(e.firstUpdatePass=!1),i||(t[2]&=-73),1024&t[2]&&(t[2]&=-1025,Pu(t[3],-1))}finally{Es()}}function n0(e,t,n,r){const o=t[10],i=!Ds(),s=function(e){return 4==(4&e[2])}(t);try{i&&!s&&o.begin&&o.begin(),s&&fi(e,t,r),Jr(e,t,n,r)}finally{i&&!s&&o.end&&o.end()}}function Jp(e,t,n,r,o){const i=Je(),s=2&r;try{Ln(-1),s&&t.length>20&&Bp(e,t,20,Ds()),n(r,o)}finally{Ln(i)}}function kl(e,t,n){!ph()||(function(e,t,n,r){const o=n.directiveStart,i=n.directiveEnd;e.firstCreatePass||Qo(n,t),qe(r,t);const s=n.initialInputs;for(let a=o;a<i;a++){const u=e.data[a],l=jt(u);l&&y0(t,n,u);const c=Ko(t,e,a,n);qe(c,t),null!==s&&_0(0,a-o,c,u,0,s),l&&(pt(n.index,t)[8]=c)}}(e,t,n,St(n,t)),128==(128&n.flags)&&function(e,t,n){const r=n.directiveStart,o=n.directiveEnd,s=n.index,a=F.lFrame.currentDirectiveIndex;try{Ln(s);for(let u=r;u<o;u++){const l=e.data[u],c=t[u];ku(u),(null!==l.hostBindings||0!==l.hostVars||null!==l.hostAttrs)&&ag(l,c)}}finally{Ln(-1),ku(a)}}(e,t,n))}function Ll(e,t,n=St){const r=t.localNames;if(null!==r){let o=t.index+1;for(let i=0;i<r.length;i+=2){const s=r[i+1],a=-1===s?n(t,e):e[s];e[o++]=a}}}function eg(e){const t=e.tView;return null===t||t.incompleteFirstPass?e.tView=zs(1,null,e.template,e.decls,e.vars,e.directiveDefs,e.pipeDefs,e.viewQuery,e.schemas,e.consts):t}function zs(e,t,n,r,o,i,s,a,u,l){const c=20+r,d=c+o,f=function(e,t){const n=[];for(let r=0;r<t;r++)n.push(r<e?null:V);return n}(c,d),h="function"==typeof l?l():l;return f[1]={type:e,blueprint:f,template:n,queries:null,viewQuery:a,declTNode:t,data:f.slice().fill(null,c),bindingStartIndex:c,expandoStartIndex:d,hostBindingOpCodes:null,firstCreatePass:!0,firstUpdatePass:!0,staticViewQueries:!1,staticContentQueries:!1,preOrderHooks:null,preOrderCheckHooks:null,contentHooks:null,contentCheckHooks:null,viewHooks:null,viewCheckHooks:null,destroyHooks:null,cleanup:null,contentQueries:null,components:null,directiveRegistry:"function"==typeof i?i():i,pipeRegistry:"function"==typeof s?s():s,firstChild:null,schemas:u,consts:h,incompleteFirstPass:!1}}function og(e,t,n){for(let r in e)if(e.hasOwnProperty(r)){const o=e[r];(n=null===n?{}:n).hasOwnProperty(r)?n[r].push(t,o):n[r]=[t,o]}return n}function Vl(e,t,n,r){let o=!1;if(ph()){const i=function(e,t,n){const r=e.directiveRegistry;let o=null;if(r)for(let i=0;i<r.length;i++){const s=r[i];Vp(n,s.selectors,!1)&&(o||(o=[]),Rs(Qo(n,t),e,s.type),jt(s)?(ug(e,n),o.unshift(s)):o.push(s))}return o}(e,t,n),s=null===r?null:{"":-1};if(null!==i){o=!0,lg(n,e.data.length,i.length);for(let c=0;c<i.length;c++){const d=i[c];d.providersResolver&&d.providersResolver(d)}let a=!1,u=!1,l=Zr(e,t,i.length,null);for(let c=0;c<i.length;c++){const d=i[c];n.mergedAttrs=Ss(n.mergedAttrs,d.hostAttrs),cg(e,n,t,l,d),m0(l,d,s),null!==d.contentQueries&&(n.flags|=8),(null!==d.hostBindings||null!==d.hostAttrs||0!==d.hostVars)&&(n.flags|=128);const f=d.type.prototype;!a&&(f.ngOnChanges||f.ngOnInit||f.ngDoCheck)&&((e.preOrderHooks||(e.preOrderHooks=[])).push(n.index),a=!0),!u&&(f.ngOnChanges||f.ngDoCheck)&&((e.preOrderCheckHooks||(e.preOrderCheckHooks=[])).push(n.index),u=!0),l++}!function(e,t){const r=t.directiveEnd,o=e.data,i=t.attrs,s=[];let a=null,u=null;for(let l=t.directiveStart;l<r;l++){const c=o[l],d=c.inputs,f=null===i||Lp(t)?null:D0(d,i);s.push(f),a=og(d,l,a),u=og(c.outputs,l,u)}null!==a&&(a.hasOwnProperty("class")&&(t.flags|=16),a.hasOwnProperty("style")&&(t.flags|=32)),t.initialInputs=s,t.inputs=a,t.outputs=u}(e,n)}s&&function(e,t,n){if(t){const r=e.localNames=[];for(let o=0;o<t.length;o+=2){const i=n[t[o+1]];if(null==i)throw new er("301",`Export of name '${t[o+1]}' not found!`);r.push(t[o],i)}}}(n,r,s)}return n.mergedAttrs=Ss(n.mergedAttrs,n.attrs),o}function sg(e,t,n,r,o,i){const s=i.hostBindings;if(s){let a=e.hostBindingOpCodes;null===a&&(a=e.hostBindingOpCodes=[]);const u=~t.index;(function(e){let t=e.length;for(;t>0;){const n=e[--t];if("number"==typeof n&&n<0)return n}return 0})(a)!=u&&a.push(u),a.push(r,o,s)}}function ag(e,t){null!==e.hostBindings&&e.hostBindings(1,t)}function ug(e,t){t.flags|=2,(e.components||(e.components=[])).push(t.index)}function m0(e,t,n){if(n){if(t.exportAs)for(let r=0;r<t.exportAs.length;r++)n[t.exportAs[r]]=e;jt(t)&&(n[""]=e)}}function lg(e,t,n){e.flags|=1,e.directiveStart=t,e.directiveEnd=t+n,e.providerIndexes=t}function cg(e,t,n,r,o){e.data[r]=o;const i=o.factory||(o.factory=sr(o.type)),s=new Go(i,jt(o),null);e.blueprint[r]=s,n[r]=s,sg(e,t,0,r,Zr(e,n,o.hostVars,V),o)}function y0(e,t,n){const r=St(t,e),o=eg(n),i=e[10],s=Qs(e,di(e,o,null,n.onPush?64:16,r,t,i,i.createRenderer(r,n),null,null));e[t.index]=s}function _0(e,t,n,r,o,i){const s=i[t];if(null!==s){const a=r.setInput;for(let u=0;u<s.length;){const l=s[u++],c=s[u++],d=s[u++];null!==a?r.setInput(n,d,l,c):n[c]=d}}}function D0(e,t){let n=null,r=0;for(;r<t.length;){const o=t[r];if(0!==o)if(5!==o){if("number"==typeof o)break;e.hasOwnProperty(o)&&(null===n&&(n=[]),n.push(o,e[o],t[r+1])),r+=2}else r+=2;else r+=4}return n}function dg(e,t,n,r){return new Array(e,!0,!1,t,null,0,r,n,null,null)}function E0(e,t){const n=pt(t,e);if(Nu(n)){const r=n[1];80&n[2]?Jr(r,n,r.template,n[8]):n[5]>0&&Bl(n)}}function Bl(e){for(let r=pl(e);null!==r;r=gl(r))for(let o=10;o<r.length;o++){const i=r[o];if(1024&i[2]){const s=i[1];Jr(s,i,s.template,i[8])}else i[5]>0&&Bl(i)}const n=e[1].components;if(null!==n)for(let r=0;r<n.length;r++){const o=pt(n[r],e);Nu(o)&&o[5]>0&&Bl(o)}}function w0(e,t){const n=pt(t,e),r=n[1];(function(e,t){for(let n=t.length;n<e.blueprint.length;n++)t.push(e.blueprint[n])})(r,n),fi(r,n,n[8])}function Qs(e,t){return e[13]?e[14][4]=t:e[13]=t,e[14]=t,t}function Ul(e){for(;e;){e[2]|=64;const t=li(e);if(cE(e)&&!t)return e;e=t}return null}function $l(e,t,n){const r=t[10];r.begin&&r.begin();try{Jr(e,t,e.template,n)}catch(o){throw mg(t,o),o}finally{r.end&&r.end()}}function fg(e){!function(e){for(let t=0;t<e.components.length;t++){const n=e.components[t],r=cl(n),o=r[1];n0(o,r,o.template,n)}}(e[8])}function ql(e,t,n){Vu(0),t(e,n)}const M0=(()=>Promise.resolve(null))();function hg(e){return e[7]||(e[7]=[])}function pg(e){return e.cleanup||(e.cleanup=[])}function mg(e,t){const n=e[9],r=n?n.get(fr,null):null;r&&r.handleError(t)}function yg(e,t,n,r,o){for(let i=0;i<n.length;){const s=n[i++],a=n[i++],u=t[s],l=e.data[s];null!==l.setInput?l.setInput(u,o,r,a):u[a]=o}}function In(e,t,n){const r=function(e,t){return _e(t[e])}(t,e);!function(e,t,n){he(e)?e.setValue(t,n):t.textContent=n}(e[B],r,n)}function Ks(e,t,n){let r=n?e.styles:null,o=n?e.classes:null,i=0;if(null!==t)for(let s=0;s<t.length;s++){const a=t[s];"number"==typeof a?i=a:1==i?o=yu(o,a):2==i&&(r=yu(r,a+": "+t[++s]+";"))}n?e.styles=r:e.stylesWithoutHost=r,n?e.classes=o:e.classesWithoutHost=o}const hi=new J("INJECTOR",-1);class _g{get(t,n=ti){if(n===ti){const r=new Error(`NullInjectorError: No provider for ${$(t)}!`);throw r.name="NullInjectorError",r}return n}}const pi=new J("Set Injector scope."),gi={},x0={};let Wl;function Dg(){return void 0===Wl&&(Wl=new _g),Wl}function vg(e,t=null,n=null,r){return new P0(e,n,t||Dg(),r)}class P0{constructor(t,n,r,o=null){this.parent=r,this.records=new Map,this.injectorDefTypes=new Set,this.onDestroy=new Set,this._destroyed=!1;const i=[];n&&nn(n,a=>this.processProvider(a,t,n)),nn([t],a=>this.processInjectorType(a,[],i)),this.records.set(hi,Xr(void 0,this));const s=this.records.get(pi);this.scope=null!=s?s.value:null,this.source=o||("object"==typeof t?null:$(t))}get destroyed(){return this._destroyed}destroy(){this.assertNotDestroyed(),this._destroyed=!0;try{this.onDestroy.forEach(t=>t.ngOnDestroy())}finally{this.records.clear(),this.onDestroy.clear(),this.injectorDefTypes.clear()}}get(t,n=ti,r=R.Default){this.assertNotDestroyed();const o=qr(this),i=Pn(void 0);try{if(!(r&R.SkipSelf)){let a=this.records.get(t);if(void 0===a){const u=("function"==typeof(e=t)||"object"==typeof e&&e instanceof J)&&vn(t);a=u&&this.injectableDefInScope(u)?Xr(Gl(t),gi):null,this.records.set(t,a)}if(null!=a)return this.hydrate(t,a)}return(r&R.Self?Dg():this.parent).get(t,n=r&R.Optional&&n===ti?null:n)}catch(s){if("NullInjectorError"===s.name){if((s[$r]=s[$r]||[]).unshift($(t)),o)throw s;return Bh(s,t,"R3InjectorError",this.source)}throw s}finally{Pn(i),qr(o)}var e}_resolveInjectorDefTypes(){this.injectorDefTypes.forEach(t=>this.get(t))}toString(){const t=[];return this.records.forEach((r,o)=>t.push($(o))),`R3Injector[${t.join(", ")}]`}assertNotDestroyed(){if(this._destroyed)throw new Error("Injector has already been destroyed.")}processInjectorType(t,n,r){if(!(t=M(t)))return!1;let o=Yf(t);const i=null==o&&t.ngModule||void 0,s=void 0===i?t:i,a=-1!==r.indexOf(s);if(void 0!==i&&(o=Yf(i)),null==o)return!1;if(null!=o.imports&&!a){let c;r.push(s);try{nn(o.imports,d=>{this.processInjectorType(d,n,r)&&(void 0===c&&(c=[]),c.push(d))})}finally{}if(void 0!==c)for(let d=0;d<c.length;d++){const{ngModule:f,providers:h}=c[d];nn(h,m=>this.processProvider(m,f,h||ne))}}this.injectorDefTypes.add(s);const u=sr(s)||(()=>new s);this.records.set(s,Xr(u,gi));const l=o.providers;if(null!=l&&!a){const c=t;nn(l,d=>this.processProvider(d,c,l))}return void 0!==i&&void 0!==t.providers}processProvider(t,n,r){let o=eo(t=M(t))?t:M(t&&t.provide);const i=(e=t,Eg(e)?Xr(void 0,e.useValue):Xr(function(e,t,n){let r;if(eo(e)){const o=M(e);return sr(o)||Gl(o)}if(Eg(e))r=()=>M(e.useValue);else if(function(e){return!(!e||!e.useFactory)}(e))r=()=>e.useFactory(...cr(e.deps||[]));else if(function(e){return!(!e||!e.useExisting)}(e))r=()=>A(M(e.useExisting));else{const o=M(e&&(e.useClass||e.provide));if(!function(e){return!!e.deps}(e))return sr(o)||Gl(o);r=()=>new o(...cr(e.deps))}return r}(e),gi));var e;if(eo(t)||!0!==t.multi)this.records.get(o);else{let s=this.records.get(o);s||(s=Xr(void 0,gi,!0),s.factory=()=>cr(s.multi),this.records.set(o,s)),o=t,s.multi.push(t)}this.records.set(o,i)}hydrate(t,n){return n.value===gi&&(n.value=x0,n.value=n.factory()),"object"==typeof n.value&&n.value&&null!==(e=n.value)&&"object"==typeof e&&"function"==typeof e.ngOnDestroy&&this.onDestroy.add(n.value),n.value;var e}injectableDefInScope(t){if(!t.providedIn)return!1;const n=M(t.providedIn);return"string"==typeof n?"any"===n||n===this.scope:this.injectorDefTypes.has(n)}}function Gl(e){const t=vn(e),n=null!==t?t.factory:sr(e);if(null!==n)return n;if(e instanceof J)throw new Error(`Token ${$(e)} is missing a \u0275prov definition.`);if(e instanceof Function)return function(e){const t=e.length;if(t>0){const r=function(e,t){const n=[];for(let r=0;r<e;r++)n.push(t);return n}(t,"?");throw new Error(`Can't resolve all parameters for ${$(e)}: (${r.join(", ")}).`)}const n=function(e){const t=e&&(e[ds]||e[Zf]);if(t){const n=function(e){if(e.hasOwnProperty("name"))return e.name;const t=(""+e).match(/^function\s*([^\s(]+)/);return null===t?"":t[1]}(e);return console.warn(`DEPRECATED: DI is instantiating a token "${n}" that inherits its @Injectable decorator but does not provide one itself.\nThis will become an error in a future version of Angular. Please add @Injectable() to the "${n}" class.`),t}return null}(e);return null!==n?()=>n.factory(e):()=>new e}(e);throw new Error("unreachable")}function Xr(e,t,n=!1){return{factory:e,value:t,multi:n?[]:void 0}}function Eg(e){return null!==e&&"object"==typeof e&&el in e}function eo(e){return"function"==typeof e}const wg=function(e,t,n){return function(e,t=null,n=null,r){const o=vg(e,t,n,r);return o._resolveInjectorDefTypes(),o}({name:n},t,e,n)};let re=(()=>{class e{static create(n,r){return Array.isArray(n)?wg(n,r,""):wg(n.providers,n.parent,n.name||"")}}return e.THROW_IF_NOT_FOUND=ti,e.NULL=new _g,e.\u0275prov=q({token:e,providedIn:"any",factory:()=>A(hi)}),e.__NG_ELEMENT_ID__=-1,e})();function eI(e,t){ws(cl(e)[1],Ee())}let Ys=null;function to(){if(!Ys){const e=X.Symbol;if(e&&e.iterator)Ys=e.iterator;else{const t=Object.getOwnPropertyNames(Map.prototype);for(let n=0;n<t.length;++n){const r=t[n];"entries"!==r&&"size"!==r&&Map.prototype[r]===Map.prototype.entries&&(Ys=r)}}}return Ys}function yi(e){return!!Xl(e)&&(Array.isArray(e)||!(e instanceof Map)&&to()in e)}function Xl(e){return null!==e&&("function"==typeof e||"object"==typeof e)}function We(e,t,n){return!Object.is(e[t],n)&&(e[t]=n,!0)}function oo(e,t,n,r,o,i){const a=function(e,t,n,r){const o=We(e,t,n);return We(e,t+1,r)||o}(e,F.lFrame.bindingIndex,n,o);return function(e){const t=F.lFrame,n=t.bindingIndex;t.bindingIndex=t.bindingIndex+e}(2),a?t+L(n)+r+L(o)+i:V}function Ge(e,t,n,r,o,i,s,a){const u=C(),l=Z(),c=e+20,d=l.firstCreatePass?function(e,t,n,r,o,i,s,a,u){const l=t.consts,c=Yr(t,e,4,s||null,kn(l,a));Vl(t,n,c,kn(l,u)),ws(t,c);const d=c.tViews=zs(2,c,r,o,i,t.directiveRegistry,t.pipeRegistry,null,t.schemas,l);return null!==t.queries&&(t.queries.template(t,c),d.queries=t.queries.embeddedTView(c)),c}(c,l,u,t,n,r,o,i,s):l.data[c];tn(d,!1);const f=u[B].createComment("");Hs(l,u,f,d),qe(f,u),Qs(u,u[c]=dg(f,u,f,d)),ys(d)&&kl(l,u,d),null!=s&&Ll(u,d,a)}function S(e,t=R.Default){const n=C();return null===n?A(e,t):Nh(Ee(),n,M(e),t)}function ic(){throw new Error("invalid")}function be(e,t,n){const r=C();return We(r,Or(),t)&&function(e,t,n,r,o,i,s,a){const u=St(t,n);let c,l=t.inputs;!a&&null!=l&&(c=l[r])?(yg(e,n,c,r,o),ms(t)&&function(e,t){const n=pt(t,e);16&n[2]||(n[2]|=64)}(n,t.index)):3&t.type&&(r=function(e){return"class"===e?"className":"for"===e?"htmlFor":"formaction"===e?"formAction":"innerHtml"===e?"innerHTML":"readonly"===e?"readOnly":"tabindex"===e?"tabIndex":e}(r),o=null!=s?s(o,t.value||"",r):o,he(i)?i.setProperty(u,r,o):$u(r)||(u.setProperty?u.setProperty(r,o):u[r]=o))}(Z(),function(){const e=F.lFrame;return xu(e.tView,e.selectedIndex)}(),r,e,t,r[B],n,!1),be}function sc(e,t,n,r,o){const s=o?"class":"style";yg(e,n,t.inputs[s],s,r)}function p(e,t,n,r){const o=C(),i=Z(),s=20+e,a=o[B],u=o[s]=yl(a,t,F.lFrame.currentNamespace),l=i.firstCreatePass?function(e,t,n,r,o,i,s){const a=t.consts,l=Yr(t,e,2,o,kn(a,i));return Vl(t,n,l,kn(a,s)),null!==l.attrs&&Ks(l,l.attrs,!1),null!==l.mergedAttrs&&Ks(l,l.mergedAttrs,!0),null!==t.queries&&t.queries.elementStart(t,l),l}(s,i,o,0,t,n,r):i.data[s];tn(l,!0);const c=l.mergedAttrs;null!==c&&Ts(a,u,c);const d=l.classes;null!==d&&wl(a,u,d);const f=l.styles;null!==f&&Fp(a,u,f),64!=(64&l.flags)&&Hs(i,o,u,l),0===F.lFrame.elementDepthCount&&qe(u,o),F.lFrame.elementDepthCount++,ys(l)&&(kl(i,o,l),function(e,t,n){if(Tu(t)){const o=t.directiveEnd;for(let i=t.directiveStart;i<o;i++){const s=e.data[i];s.contentQueries&&s.contentQueries(1,n[i],i)}}}(i,l,o)),null!==r&&Ll(o,l)}function g(){let e=Ee();Fu()?F.lFrame.isParent=!1:(e=e.parent,tn(e,!1));const t=e;F.lFrame.elementDepthCount--;const n=Z();n.firstCreatePass&&(ws(n,e),Tu(e)&&n.queries.elementEnd(e)),null!=t.classesWithoutHost&&function(e){return 0!=(16&e.flags)}(t)&&sc(n,t,C(),t.classesWithoutHost,!0),null!=t.stylesWithoutHost&&function(e){return 0!=(32&e.flags)}(t)&&sc(n,t,C(),t.stylesWithoutHost,!1)}function Ne(e,t,n,r){p(e,t,n,r),g()}function Xs(e){return!!e&&"function"==typeof e.then}const ac=function(e){return!!e&&"function"==typeof e.subscribe};function Ie(e,t,n,r){const o=C(),i=Z(),s=Ee();return function(e,t,n,r,o,i,s,a){const u=ys(r),c=e.firstCreatePass&&pg(e),d=t[8],f=hg(t);let h=!0;if(3&r.type||a){const y=St(r,t),v=a?a(y):y,D=f.length,I=a?T=>a(_e(T[r.index])):r.index;if(he(n)){let T=null;if(!a&&u&&(T=function(e,t,n,r){const o=e.cleanup;if(null!=o)for(let i=0;i<o.length-1;i+=2){const s=o[i];if(s===n&&o[i+1]===r){const a=t[7],u=o[i+2];return a.length>u?a[u]:null}"string"==typeof s&&(i+=2)}return null}(e,t,o,r.index)),null!==T)(T.__ngLastListenerFn__||T).__ngNextListenerFn__=i,T.__ngLastListenerFn__=i,h=!1;else{i=uc(r,t,d,i,!1);const j=n.listen(v,o,i);f.push(i,j),c&&c.push(o,I,D,D+1)}}else i=uc(r,t,d,i,!0),v.addEventListener(o,i,s),f.push(i),c&&c.push(o,I,D,s)}else i=uc(r,t,d,i,!1);const m=r.outputs;let _;if(h&&null!==m&&(_=m[o])){const y=_.length;if(y)for(let v=0;v<y;v+=2){const Me=t[_[v]][_[v+1]].subscribe(i),kt=f.length;f.push(i,Me),c&&c.push(o,r.index,kt,-(kt+1))}}}(i,o,o[B],s,e,t,!!n,r),Ie}function hm(e,t,n,r){try{return!1!==n(r)}catch(o){return mg(e,o),!1}}function uc(e,t,n,r,o){return function i(s){if(s===Function)return r;const a=2&e.flags?pt(e.index,t):t;0==(32&t[2])&&Ul(a);let u=hm(t,0,r,s),l=i.__ngNextListenerFn__;for(;l;)u=hm(t,0,l,s)&&u,l=l.__ngNextListenerFn__;return o&&!1===u&&(s.preventDefault(),s.returnValue=!1),u}}function Dt(e=1){return function(e){return(F.lFrame.contextLView=function(e,t){for(;e>0;)t=t[15],e--;return t}(e,F.lFrame.contextLView))[8]}(e)}function E(e,t=""){const n=C(),r=Z(),o=e+20,i=r.firstCreatePass?Yr(r,o,1,t,null):r.data[o],s=n[o]=function(e,t){return he(e)?e.createText(t):e.createTextNode(t)}(n[B],t);Hs(r,n,s,i),tn(i,!1)}function Pe(e){return gr("",e,""),Pe}function gr(e,t,n){const r=C(),o=function(e,t,n,r){return We(e,Or(),n)?t+L(n)+r:V}(r,e,t,n);return o!==V&&In(r,Je(),o),gr}function dc(e,t,n,r,o){const i=C(),s=oo(i,e,t,n,r,o);return s!==V&&In(i,Je(),s),dc}const mr=void 0;var T1=["en",[["a","p"],["AM","PM"],mr],[["AM","PM"],mr,mr],[["S","M","T","W","T","F","S"],["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],["Su","Mo","Tu","We","Th","Fr","Sa"]],mr,[["J","F","M","A","M","J","J","A","S","O","N","D"],["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],["January","February","March","April","May","June","July","August","September","October","November","December"]],mr,[["B","A"],["BC","AD"],["Before Christ","Anno Domini"]],0,[6,0],["M/d/yy","MMM d, y","MMMM d, y","EEEE, MMMM d, y"],["h:mm a","h:mm:ss a","h:mm:ss a z","h:mm:ss a zzzz"],["{1}, {0}",mr,"{1} 'at' {0}",mr],[".",",",";","%","+","-","E","\xd7","\u2030","\u221e","NaN",":"],["#,##0.###","#,##0%","\xa4#,##0.00","#E0"],"USD","$","US Dollar",{},"ltr",function(e){const n=Math.floor(Math.abs(e)),r=e.toString().replace(/^[^.]*\.?/,"").length;return 1===n&&0===r?1:5}];let po={};function ry(e){return e in po||(po[e]=X.ng&&X.ng.common&&X.ng.common.locales&&X.ng.common.locales[e]),po[e]}var b=(()=>((b=b||{})[b.LocaleId=0]="LocaleId",b[b.DayPeriodsFormat=1]="DayPeriodsFormat",b[b.DayPeriodsStandalone=2]="DayPeriodsStandalone",b[b.DaysFormat=3]="DaysFormat",b[b.DaysStandalone=4]="DaysStandalone",b[b.MonthsFormat=5]="MonthsFormat",b[b.MonthsStandalone=6]="MonthsStandalone",b[b.Eras=7]="Eras",b[b.FirstDayOfWeek=8]="FirstDayOfWeek",b[b.WeekendRange=9]="WeekendRange",b[b.DateFormat=10]="DateFormat",b[b.TimeFormat=11]="TimeFormat",b[b.DateTimeFormat=12]="DateTimeFormat",b[b.NumberSymbols=13]="NumberSymbols",b[b.NumberFormats=14]="NumberFormats",b[b.CurrencyCode=15]="CurrencyCode",b[b.CurrencySymbol=16]="CurrencySymbol",b[b.CurrencyName=17]="CurrencyName",b[b.Currencies=18]="Currencies",b[b.Directionality=19]="Directionality",b[b.PluralCase=20]="PluralCase",b[b.ExtraData=21]="ExtraData",b))();const ta="en-US";let oy=ta;class Ay{}const xy="ngComponent";class MT{resolveComponentFactory(t){throw function(e){const t=Error(`No component factory found for ${$(e)}. Did you add it to @NgModule.entryComponents?`);return t[xy]=e,t}(t)}}let yr=(()=>{class e{}return e.NULL=new MT,e})();function sa(...e){}function mo(e,t){return new vt(St(e,t))}const xT=function(){return mo(Ee(),C())};let vt=(()=>{class e{constructor(n){this.nativeElement=n}}return e.__NG_ELEMENT_ID__=xT,e})();class aa{}let Dc=(()=>{class e{}return e.\u0275prov=q({token:e,providedIn:"root",factory:()=>null}),e})();class la{constructor(t){this.full=t,this.major=t.split(".")[0],this.minor=t.split(".")[1],this.patch=t.split(".").slice(2).join(".")}}const Py=new la("13.0.1"),yo={};function ca(e,t,n,r,o=!1){for(;null!==n;){const i=t[n.index];if(null!==i&&r.push(_e(i)),Vt(i))for(let a=10;a<i.length;a++){const u=i[a],l=u[1].firstChild;null!==l&&ca(u[1],u,l,r)}const s=n.type;if(8&s)ca(e,t,n.child,r);else if(32&s){const a=hl(n,t);let u;for(;u=a();)r.push(u)}else if(16&s){const a=xp(t,n);if(Array.isArray(a))r.push(...a);else{const u=li(t[16]);ca(u[1],u,a,r,!0)}}n=o?n.projectionNext:n.next}return r}class bi{constructor(t,n){this._lView=t,this._cdRefInjectingView=n,this._appRef=null,this._attachedToViewContainer=!1}get rootNodes(){const t=this._lView,n=t[1];return ca(n,t,n.firstChild,[])}get context(){return this._lView[8]}set context(t){this._lView[8]=t}get destroyed(){return 256==(256&this._lView[2])}destroy(){if(this._appRef)this._appRef.detachView(this);else if(this._attachedToViewContainer){const t=this._lView[3];if(Vt(t)){const n=t[8],r=n?n.indexOf(this):-1;r>-1&&(_l(t,r),lr(n,r))}this._attachedToViewContainer=!1}Ep(this._lView[1],this._lView)}onDestroy(t){!function(e,t,n,r){const o=hg(t);null===n?o.push(r):(o.push(n),e.firstCreatePass&&pg(e).push(r,o.length-1))}(this._lView[1],this._lView,null,t)}markForCheck(){Ul(this._cdRefInjectingView||this._lView)}detach(){this._lView[2]&=-129}reattach(){this._lView[2]|=128}detectChanges(){$l(this._lView[1],this._lView,this.context)}checkNoChanges(){!function(e,t,n){vs(!0);try{$l(e,t,n)}finally{vs(!1)}}(this._lView[1],this._lView,this.context)}attachToViewContainerRef(){if(this._appRef)throw new Error("This view is already attached directly to the ApplicationRef!");this._attachedToViewContainer=!0}detachFromAppRef(){var t;this._appRef=null,ci(this._lView[1],t=this._lView,t[B],2,null,null)}attachToAppRef(t){if(this._attachedToViewContainer)throw new Error("This view is already attached to a ViewContainer!");this._appRef=t}}class kT extends bi{constructor(t){super(t),this._view=t}detectChanges(){fg(this._view)}checkNoChanges(){!function(e){vs(!0);try{fg(e)}finally{vs(!1)}}(this._view)}get context(){return null}}class Fy extends yr{constructor(t){super(),this.ngModule=t}resolveComponentFactory(t){const n=He(t);return new vc(n,this.ngModule)}}function Oy(e){const t=[];for(let n in e)e.hasOwnProperty(n)&&t.push({propName:e[n],templateName:n});return t}const VT=new J("SCHEDULER_TOKEN",{providedIn:"root",factory:()=>pp});class vc extends Ay{constructor(t,n){super(),this.componentDef=t,this.ngModule=n,this.componentType=t.type,this.selector=t.selectors.map(Bb).join(","),this.ngContentSelectors=t.ngContentSelectors?t.ngContentSelectors:[],this.isBoundToModule=!!n}get inputs(){return Oy(this.componentDef.inputs)}get outputs(){return Oy(this.componentDef.outputs)}create(t,n,r,o){const i=(o=o||this.ngModule)?function(e,t){return{get:(n,r,o)=>{const i=e.get(n,yo,o);return i!==yo||r===yo?i:t.get(n,r,o)}}}(t,o.injector):t,s=i.get(aa,dh),a=i.get(Dc,null),u=s.createRenderer(null,this.componentDef),l=this.componentDef.selectors[0][0]||"div",c=r?function(e,t,n){if(he(e))return e.selectRootElement(t,n===ft.ShadowDom);let r="string"==typeof t?e.querySelector(t):t;return r.textContent="",r}(u,r,this.componentDef.encapsulation):yl(s.createRenderer(null,this.componentDef),l,function(e){const t=e.toLowerCase();return"svg"===t?lh:"math"===t?"http://www.w3.org/1998/MathML/":null}(l)),d=this.componentDef.onPush?576:528,f=function(e,t){return{components:[],scheduler:e||pp,clean:M0,playerHandler:t||null,flags:0}}(),h=zs(0,null,null,1,0,null,null,null,null,null),m=di(null,h,f,d,null,null,s,u,a,i);let _,y;Cs(m);try{const v=function(e,t,n,r,o,i){const s=n[1];n[20]=e;const u=Yr(s,20,2,"#host",null),l=u.mergedAttrs=t.hostAttrs;null!==l&&(Ks(u,l,!0),null!==e&&(Ts(o,e,l),null!==u.classes&&wl(o,e,u.classes),null!==u.styles&&Fp(o,e,u.styles)));const c=r.createRenderer(e,t),d=di(n,eg(t),null,t.onPush?64:16,n[20],u,r,c,i||null,null);return s.firstCreatePass&&(Rs(Qo(u,n),s,t.type),ug(s,u),lg(u,n.length,1)),Qs(n,d),n[20]=d}(c,this.componentDef,m,s,u);if(c)if(r)Ts(u,c,["ng-version",Py.full]);else{const{attrs:D,classes:I}=function(e){const t=[],n=[];let r=1,o=2;for(;r<e.length;){let i=e[r];if("string"==typeof i)2===o?""!==i&&t.push(i,e[++r]):8===o&&n.push(i);else{if(!Bt(o))break;o=i}r++}return{attrs:t,classes:n}}(this.componentDef.selectors[0]);D&&Ts(u,c,D),I&&I.length>0&&wl(u,c,I.join(" "))}if(y=xu(h,20),void 0!==n){const D=y.projection=[];for(let I=0;I<this.ngContentSelectors.length;I++){const T=n[I];D.push(null!=T?Array.from(T):null)}}_=function(e,t,n,r,o){const i=n[1],s=function(e,t,n){const r=Ee();e.firstCreatePass&&(n.providersResolver&&n.providersResolver(n),cg(e,r,t,Zr(e,t,1,null),n));const o=Ko(t,e,r.directiveStart,r);qe(o,t);const i=St(r,t);return i&&qe(i,t),o}(i,n,t);if(r.components.push(s),e[8]=s,o&&o.forEach(u=>u(s,t)),t.contentQueries){const u=Ee();t.contentQueries(1,s,u.directiveStart)}const a=Ee();return!i.firstCreatePass||null===t.hostBindings&&null===t.hostAttrs||(Ln(a.index),sg(n[1],a,0,a.directiveStart,a.directiveEnd,t),ag(t,s)),s}(v,this.componentDef,m,f,[eI]),fi(h,m,null)}finally{Es()}return new UT(this.componentType,_,mo(y,m),m,y)}}class UT extends class{}{constructor(t,n,r,o,i){super(),this.location=r,this._rootLView=o,this._tNode=i,this.instance=n,this.hostView=this.changeDetectorRef=new kT(o),this.componentType=t}get injector(){return new Vr(this._tNode,this._rootLView)}destroy(){this.hostView.destroy()}onDestroy(t){this.hostView.onDestroy(t)}}class dn{}class ky{}const _o=new Map;class Vy extends dn{constructor(t,n){super(),this._parent=n,this._bootstrapComponents=[],this.injector=this,this.destroyCbs=[],this.componentFactoryResolver=new Fy(this);const r=bt(t);this._bootstrapComponents=sn(r.bootstrap),this._r3Injector=vg(t,n,[{provide:dn,useValue:this},{provide:yr,useValue:this.componentFactoryResolver}],$(t)),this._r3Injector._resolveInjectorDefTypes(),this.instance=this.get(t)}get(t,n=re.THROW_IF_NOT_FOUND,r=R.Default){return t===re||t===dn||t===hi?this:this._r3Injector.get(t,n,r)}destroy(){const t=this._r3Injector;!t.destroyed&&t.destroy(),this.destroyCbs.forEach(n=>n()),this.destroyCbs=null}onDestroy(t){this.destroyCbs.push(t)}}class Ec extends ky{constructor(t){super(),this.moduleType=t,null!==bt(t)&&function(e){const t=new Set;!function n(r){const o=bt(r,!0),i=o.id;null!==i&&(function(e,t,n){if(t&&t!==n)throw new Error(`Duplicate module registered for ${e} - ${$(t)} vs ${$(t.name)}`)}(i,_o.get(i),r),_o.set(i,r));const s=sn(o.imports);for(const a of s)t.has(a)||(t.add(a),n(a))}(e)}(t)}create(t){return new Vy(this.moduleType,t)}}function wc(e){return t=>{setTimeout(e,void 0,t)}}const tt=class extends pn{constructor(t=!1){super(),this.__isAsync=t}emit(t){super.next(t)}subscribe(t,n,r){var u,l,c;let o=t,i=n||(()=>null),s=r;if(t&&"object"==typeof t){const d=t;o=null==(u=d.next)?void 0:u.bind(d),i=null==(l=d.error)?void 0:l.bind(d),s=null==(c=d.complete)?void 0:c.bind(d)}this.__isAsync&&(i=wc(i),o&&(o=wc(o)),s&&(s=wc(s)));const a=super.subscribe({next:o,error:i,complete:s});return t instanceof Et&&t.add(a),a}};Symbol;const cS=function(){return e=Ee(),t=C(),4&e.type?new fS(t,e,mo(e,t)):null;var e,t};let Sn=(()=>{class e{}return e.__NG_ELEMENT_ID__=cS,e})();const dS=Sn,fS=class extends dS{constructor(t,n,r){super(),this._declarationLView=t,this._declarationTContainer=n,this.elementRef=r}createEmbeddedView(t){const n=this._declarationTContainer.tViews,r=di(this._declarationLView,n,t,16,null,n.declTNode,null,null,null,null);r[17]=this._declarationLView[this._declarationTContainer.index];const i=this._declarationLView[19];return null!==i&&(r[19]=i.createEmbeddedView(n)),fi(n,r,t),new bi(r)}};const gS=function(){return function(e,t){let n;const r=t[e.index];if(Vt(r))n=r;else{let o;if(8&e.type)o=_e(r);else{const i=t[B];o=i.createComment("");const s=St(e,t);hr(i,Us(i,s),o,function(e,t){return he(e)?e.nextSibling(t):t.nextSibling}(i,s),!1)}t[e.index]=n=dg(r,t,o,e),Qs(t,n)}return new qy(n,e,t)}(Ee(),C())};let Wt=(()=>{class e{}return e.__NG_ELEMENT_ID__=gS,e})();const yS=Wt,qy=class extends yS{constructor(t,n,r){super(),this._lContainer=t,this._hostTNode=n,this._hostLView=r}get element(){return mo(this._hostTNode,this._hostLView)}get injector(){return new Vr(this._hostTNode,this._hostLView)}get parentInjector(){const t=As(this._hostTNode,this._hostLView);if(Sh(t)){const n=Lr(t,this._hostLView),r=kr(t);return new Vr(n[1].data[r+8],n)}return new Vr(null,this._hostLView)}clear(){for(;this.length>0;)this.remove(this.length-1)}get(t){const n=Wy(this._lContainer);return null!==n&&n[t]||null}get length(){return this._lContainer.length-10}createEmbeddedView(t,n,r){const o=t.createEmbeddedView(n||{});return this.insert(o,r),o}createComponent(t,n,r,o,i){const s=t&&!("function"==typeof t);let a;if(s)a=n;else{const d=n||{};a=d.index,r=d.injector,o=d.projectableNodes,i=d.ngModuleRef}const u=s?t:new vc(He(t)),l=r||this.parentInjector;if(!i&&null==u.ngModule&&l){const d=l.get(dn,null);d&&(i=d)}const c=u.create(l,o,void 0,i);return this.insert(c.hostView,a),c}insert(t,n){const r=t._lView,o=r[1];if(Vt(r[3])){const c=this.indexOf(t);if(-1!==c)this.detach(c);else{const d=r[3],f=new qy(d,d[6],d[3]);f.detach(f.indexOf(t))}}const i=this._adjustIndex(n),s=this._lContainer;!function(e,t,n,r){const o=10+r,i=n.length;r>0&&(n[o-1][4]=t),r<i-10?(t[4]=n[o],Ns(n,10+r,t)):(n.push(t),t[4]=null),t[3]=n;const s=t[17];null!==s&&n!==s&&function(e,t){const n=e[9];t[16]!==t[3][3][16]&&(e[2]=!0),null===n?e[9]=[t]:n.push(t)}(s,t);const a=t[19];null!==a&&a.insertView(e),t[2]|=128}(o,r,s,i);const a=Cl(i,s),u=r[B],l=Us(u,s[7]);return null!==l&&function(e,t,n,r,o,i){r[0]=o,r[6]=t,ci(e,r,n,1,o,i)}(o,s[6],u,r,l,a),t.attachToViewContainerRef(),Ns(bc(s),i,t),t}move(t,n){return this.insert(t,n)}indexOf(t){const n=Wy(this._lContainer);return null!==n?n.indexOf(t):-1}remove(t){const n=this._adjustIndex(t,-1),r=_l(this._lContainer,n);r&&(lr(bc(this._lContainer),n),Ep(r[1],r))}detach(t){const n=this._adjustIndex(t,-1),r=_l(this._lContainer,n);return r&&null!=lr(bc(this._lContainer),n)?new bi(r):null}_adjustIndex(t,n=0){return null==t?this.length+n:t}};function Wy(e){return e[8]}function bc(e){return e[8]||(e[8]=[])}const Mi=new J("Application Initializer");let vo=(()=>{class e{constructor(n){this.appInits=n,this.resolve=sa,this.reject=sa,this.initialized=!1,this.done=!1,this.donePromise=new Promise((r,o)=>{this.resolve=r,this.reject=o})}runInitializers(){if(this.initialized)return;const n=[],r=()=>{this.done=!0,this.resolve()};if(this.appInits)for(let o=0;o<this.appInits.length;o++){const i=this.appInits[o]();if(Xs(i))n.push(i);else if(ac(i)){const s=new Promise((a,u)=>{i.subscribe({complete:a,error:u})});n.push(s)}}Promise.all(n).then(()=>{r()}).catch(o=>{this.reject(o)}),0===n.length&&r(),this.initialized=!0}}return e.\u0275fac=function(n){return new(n||e)(A(Mi,8))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const Ai=new J("AppId"),eM={provide:Ai,useFactory:function(){return`${Vc()}${Vc()}${Vc()}`},deps:[]};function Vc(){return String.fromCharCode(97+Math.floor(25*Math.random()))}const g_=new J("Platform Initializer"),jc=new J("Platform ID"),m_=new J("appBootstrapListener");let ga=(()=>{class e{log(n){console.log(n)}warn(n){console.warn(n)}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const $n=new J("LocaleId"),y_=new J("DefaultCurrencyCode");class nM{constructor(t,n){this.ngModuleFactory=t,this.componentFactories=n}}const Bc=function(e){return new Ec(e)},rM=Bc,oM=function(e){return Promise.resolve(Bc(e))},D_=function(e){const t=Bc(e),r=sn(bt(e).declarations).reduce((o,i)=>{const s=He(i);return s&&o.push(new vc(s)),o},[]);return new nM(t,r)},iM=D_,sM=function(e){return Promise.resolve(D_(e))};let ma=(()=>{class e{constructor(){this.compileModuleSync=rM,this.compileModuleAsync=oM,this.compileModuleAndAllComponentsSync=iM,this.compileModuleAndAllComponentsAsync=sM}clearCache(){}clearCacheFor(n){}getModuleId(n){}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const lM=(()=>Promise.resolve(0))();function Uc(e){"undefined"==typeof Zone?lM.then(()=>{e&&e.apply(null,null)}):Zone.current.scheduleMicroTask("scheduleMicrotask",e)}class De{constructor({enableLongStackTrace:t=!1,shouldCoalesceEventChangeDetection:n=!1,shouldCoalesceRunChangeDetection:r=!1}){if(this.hasPendingMacrotasks=!1,this.hasPendingMicrotasks=!1,this.isStable=!0,this.onUnstable=new tt(!1),this.onMicrotaskEmpty=new tt(!1),this.onStable=new tt(!1),this.onError=new tt(!1),"undefined"==typeof Zone)throw new Error("In this configuration Angular requires Zone.js");Zone.assertZonePatched();const o=this;o._nesting=0,o._outer=o._inner=Zone.current,Zone.TaskTrackingZoneSpec&&(o._inner=o._inner.fork(new Zone.TaskTrackingZoneSpec)),t&&Zone.longStackTraceZoneSpec&&(o._inner=o._inner.fork(Zone.longStackTraceZoneSpec)),o.shouldCoalesceEventChangeDetection=!r&&n,o.shouldCoalesceRunChangeDetection=r,o.lastRequestAnimationFrameId=-1,o.nativeRequestAnimationFrame=function(){let e=X.requestAnimationFrame,t=X.cancelAnimationFrame;if("undefined"!=typeof Zone&&e&&t){const n=e[Zone.__symbol__("OriginalDelegate")];n&&(e=n);const r=t[Zone.__symbol__("OriginalDelegate")];r&&(t=r)}return{nativeRequestAnimationFrame:e,nativeCancelAnimationFrame:t}}().nativeRequestAnimationFrame,function(e){const t=()=>{!function(e){e.isCheckStableRunning||-1!==e.lastRequestAnimationFrameId||(e.lastRequestAnimationFrameId=e.nativeRequestAnimationFrame.call(X,()=>{e.fakeTopEventTask||(e.fakeTopEventTask=Zone.root.scheduleEventTask("fakeTopEventTask",()=>{e.lastRequestAnimationFrameId=-1,$c(e),e.isCheckStableRunning=!0,Hc(e),e.isCheckStableRunning=!1},void 0,()=>{},()=>{})),e.fakeTopEventTask.invoke()}),$c(e))}(e)};e._inner=e._inner.fork({name:"angular",properties:{isAngularZone:!0},onInvokeTask:(n,r,o,i,s,a)=>{try{return v_(e),n.invokeTask(o,i,s,a)}finally{(e.shouldCoalesceEventChangeDetection&&"eventTask"===i.type||e.shouldCoalesceRunChangeDetection)&&t(),C_(e)}},onInvoke:(n,r,o,i,s,a,u)=>{try{return v_(e),n.invoke(o,i,s,a,u)}finally{e.shouldCoalesceRunChangeDetection&&t(),C_(e)}},onHasTask:(n,r,o,i)=>{n.hasTask(o,i),r===o&&("microTask"==i.change?(e._hasPendingMicrotasks=i.microTask,$c(e),Hc(e)):"macroTask"==i.change&&(e.hasPendingMacrotasks=i.macroTask))},onHandleError:(n,r,o,i)=>(n.handleError(o,i),e.runOutsideAngular(()=>e.onError.emit(i)),!1)})}(o)}static isInAngularZone(){return!0===Zone.current.get("isAngularZone")}static assertInAngularZone(){if(!De.isInAngularZone())throw new Error("Expected to be in Angular Zone, but it is not!")}static assertNotInAngularZone(){if(De.isInAngularZone())throw new Error("Expected to not be in Angular Zone, but it is!")}run(t,n,r){return this._inner.run(t,n,r)}runTask(t,n,r,o){const i=this._inner,s=i.scheduleEventTask("NgZoneEvent: "+o,t,dM,sa,sa);try{return i.runTask(s,n,r)}finally{i.cancelTask(s)}}runGuarded(t,n,r){return this._inner.runGuarded(t,n,r)}runOutsideAngular(t){return this._outer.run(t)}}const dM={};function Hc(e){if(0==e._nesting&&!e.hasPendingMicrotasks&&!e.isStable)try{e._nesting++,e.onMicrotaskEmpty.emit(null)}finally{if(e._nesting--,!e.hasPendingMicrotasks)try{e.runOutsideAngular(()=>e.onStable.emit(null))}finally{e.isStable=!0}}}function $c(e){e.hasPendingMicrotasks=!!(e._hasPendingMicrotasks||(e.shouldCoalesceEventChangeDetection||e.shouldCoalesceRunChangeDetection)&&-1!==e.lastRequestAnimationFrameId)}function v_(e){e._nesting++,e.isStable&&(e.isStable=!1,e.onUnstable.emit(null))}function C_(e){e._nesting--,Hc(e)}class pM{constructor(){this.hasPendingMicrotasks=!1,this.hasPendingMacrotasks=!1,this.isStable=!0,this.onUnstable=new tt,this.onMicrotaskEmpty=new tt,this.onStable=new tt,this.onError=new tt}run(t,n,r){return t.apply(n,r)}runGuarded(t,n,r){return t.apply(n,r)}runOutsideAngular(t){return t()}runTask(t,n,r,o){return t.apply(n,r)}}let qc=(()=>{class e{constructor(n){this._ngZone=n,this._pendingCount=0,this._isZoneStable=!0,this._didWork=!1,this._callbacks=[],this.taskTrackingZone=null,this._watchAngularEvents(),n.run(()=>{this.taskTrackingZone="undefined"==typeof Zone?null:Zone.current.get("TaskTrackingZone")})}_watchAngularEvents(){this._ngZone.onUnstable.subscribe({next:()=>{this._didWork=!0,this._isZoneStable=!1}}),this._ngZone.runOutsideAngular(()=>{this._ngZone.onStable.subscribe({next:()=>{De.assertNotInAngularZone(),Uc(()=>{this._isZoneStable=!0,this._runCallbacksIfReady()})}})})}increasePendingRequestCount(){return this._pendingCount+=1,this._didWork=!0,this._pendingCount}decreasePendingRequestCount(){if(this._pendingCount-=1,this._pendingCount<0)throw new Error("pending async requests below zero");return this._runCallbacksIfReady(),this._pendingCount}isStable(){return this._isZoneStable&&0===this._pendingCount&&!this._ngZone.hasPendingMacrotasks}_runCallbacksIfReady(){if(this.isStable())Uc(()=>{for(;0!==this._callbacks.length;){let n=this._callbacks.pop();clearTimeout(n.timeoutId),n.doneCb(this._didWork)}this._didWork=!1});else{let n=this.getPendingTasks();this._callbacks=this._callbacks.filter(r=>!r.updateCb||!r.updateCb(n)||(clearTimeout(r.timeoutId),!1)),this._didWork=!0}}getPendingTasks(){return this.taskTrackingZone?this.taskTrackingZone.macroTasks.map(n=>({source:n.source,creationLocation:n.creationLocation,data:n.data})):[]}addCallback(n,r,o){let i=-1;r&&r>0&&(i=setTimeout(()=>{this._callbacks=this._callbacks.filter(s=>s.timeoutId!==i),n(this._didWork,this.getPendingTasks())},r)),this._callbacks.push({doneCb:n,timeoutId:i,updateCb:o})}whenStable(n,r,o){if(o&&!this.taskTrackingZone)throw new Error('Task tracking zone is required when passing an update callback to whenStable(). Is "zone.js/plugins/task-tracking" loaded?');this.addCallback(n,r,o),this._runCallbacksIfReady()}getPendingRequestCount(){return this._pendingCount}findProviders(n,r,o){return[]}}return e.\u0275fac=function(n){return new(n||e)(A(De))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),E_=(()=>{class e{constructor(){this._applications=new Map,Wc.addToWindow(this)}registerApplication(n,r){this._applications.set(n,r)}unregisterApplication(n){this._applications.delete(n)}unregisterAllApplications(){this._applications.clear()}getTestability(n){return this._applications.get(n)||null}getAllTestabilities(){return Array.from(this._applications.values())}getAllRootElements(){return Array.from(this._applications.keys())}findTestabilityInTree(n,r=!0){return Wc.findTestabilityInTree(this,n,r)}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class gM{addToWindow(t){}findTestabilityInTree(t,n,r){return null}}let Wc=new gM,w_=!0,b_=!1;let Gt;const T_=new J("AllowMultipleToken");class Gc{constructor(t,n){this.name=t,this.token=n}}function S_(e,t,n=[]){const r=`Platform: ${t}`,o=new J(r);return(i=[])=>{let s=M_();if(!s||s.injector.get(T_,!1))if(e)e(n.concat(i).concat({provide:o,useValue:!0}));else{const a=n.concat(i).concat({provide:o,useValue:!0},{provide:pi,useValue:"platform"});!function(e){if(Gt&&!Gt.destroyed&&!Gt.injector.get(T_,!1))throw new Error("There can be only one platform. Destroy the previous one to create a new one.");Gt=e.get(A_);const t=e.get(g_,null);t&&t.forEach(n=>n())}(re.create({providers:a,name:r}))}return function(e){const t=M_();if(!t)throw new Error("No platform exists!");if(!t.injector.get(e,null))throw new Error("A platform with a different configuration has been created. Please destroy it first.");return t}(o)}}function M_(){return Gt&&!Gt.destroyed?Gt:null}let A_=(()=>{class e{constructor(n){this._injector=n,this._modules=[],this._destroyListeners=[],this._destroyed=!1}bootstrapModuleFactory(n,r){const a=function(e,t){let n;return n="noop"===e?new pM:("zone.js"===e?void 0:e)||new De({enableLongStackTrace:(b_=!0,w_),shouldCoalesceEventChangeDetection:!!(null==t?void 0:t.ngZoneEventCoalescing),shouldCoalesceRunChangeDetection:!!(null==t?void 0:t.ngZoneRunCoalescing)}),n}(r?r.ngZone:void 0,{ngZoneEventCoalescing:r&&r.ngZoneEventCoalescing||!1,ngZoneRunCoalescing:r&&r.ngZoneRunCoalescing||!1}),u=[{provide:De,useValue:a}];return a.run(()=>{const l=re.create({providers:u,parent:this.injector,name:n.moduleType.name}),c=n.create(l),d=c.injector.get(fr,null);if(!d)throw new Error("No ErrorHandler. Is platform module (BrowserModule) included?");return a.runOutsideAngular(()=>{const f=a.onError.subscribe({next:h=>{d.handleError(h)}});c.onDestroy(()=>{zc(this._modules,c),f.unsubscribe()})}),function(e,t,n){try{const r=n();return Xs(r)?r.catch(o=>{throw t.runOutsideAngular(()=>e.handleError(o)),o}):r}catch(r){throw t.runOutsideAngular(()=>e.handleError(r)),r}}(d,a,()=>{const f=c.injector.get(vo);return f.runInitializers(),f.donePromise.then(()=>(function(e){dt(e,"Expected localeId to be defined"),"string"==typeof e&&(oy=e.toLowerCase().replace(/_/g,"-"))}(c.injector.get($n,ta)||ta),this._moduleDoBootstrap(c),c))})})}bootstrapModule(n,r=[]){const o=R_({},r);return function(e,t,n){const r=new Ec(n);return Promise.resolve(r)}(0,0,n).then(i=>this.bootstrapModuleFactory(i,o))}_moduleDoBootstrap(n){const r=n.injector.get(Co);if(n._bootstrapComponents.length>0)n._bootstrapComponents.forEach(o=>r.bootstrap(o));else{if(!n.instance.ngDoBootstrap)throw new Error(`The module ${$(n.instance.constructor)} was bootstrapped, but it does not declare "@NgModule.bootstrap" components nor a "ngDoBootstrap" method. Please define one of these.`);n.instance.ngDoBootstrap(r)}this._modules.push(n)}onDestroy(n){this._destroyListeners.push(n)}get injector(){return this._injector}destroy(){if(this._destroyed)throw new Error("The platform has already been destroyed!");this._modules.slice().forEach(n=>n.destroy()),this._destroyListeners.forEach(n=>n()),this._destroyed=!0}get destroyed(){return this._destroyed}}return e.\u0275fac=function(n){return new(n||e)(A(re))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function R_(e,t){return Array.isArray(t)?t.reduce(R_,e):P(P({},e),t)}let Co=(()=>{class e{constructor(n,r,o,i,s){this._zone=n,this._injector=r,this._exceptionHandler=o,this._componentFactoryResolver=i,this._initStatus=s,this._bootstrapListeners=[],this._views=[],this._runningTick=!1,this._stable=!0,this.componentTypes=[],this.components=[],this._onMicrotaskEmptySubscription=this._zone.onMicrotaskEmpty.subscribe({next:()=>{this._zone.run(()=>{this.tick()})}});const a=new fe(l=>{this._stable=this._zone.isStable&&!this._zone.hasPendingMacrotasks&&!this._zone.hasPendingMicrotasks,this._zone.runOutsideAngular(()=>{l.next(this._stable),l.complete()})}),u=new fe(l=>{let c;this._zone.runOutsideAngular(()=>{c=this._zone.onStable.subscribe(()=>{De.assertNotInAngularZone(),Uc(()=>{!this._stable&&!this._zone.hasPendingMacrotasks&&!this._zone.hasPendingMicrotasks&&(this._stable=!0,l.next(!0))})})});const d=this._zone.onUnstable.subscribe(()=>{De.assertInAngularZone(),this._stable&&(this._stable=!1,this._zone.runOutsideAngular(()=>{l.next(!1)}))});return()=>{c.unsubscribe(),d.unsubscribe()}});this.isStable=function(...e){const t=Bo(e),n=function(e,t){return"number"==typeof pu(e)?e.pop():1/0}(e),r=e;return r.length?1===r.length?gn(r[0]):jo(n)(Ve(r,t)):yn}(a,u.pipe(function(e={}){const{connector:t=(()=>new pn),resetOnError:n=!0,resetOnComplete:r=!0,resetOnRefCountZero:o=!0}=e;return i=>{let s=null,a=null,u=null,l=0,c=!1,d=!1;const f=()=>{null==a||a.unsubscribe(),a=null},h=()=>{f(),s=u=null,c=d=!1},m=()=>{const _=s;h(),null==_||_.unsubscribe()};return ke((_,y)=>{l++,!d&&!c&&f();const v=u=null!=u?u:t();y.add(()=>{l--,0===l&&!d&&!c&&(a=gu(m,o))}),v.subscribe(y),s||(s=new lu({next:D=>v.next(D),error:D=>{d=!0,f(),a=gu(h,n,D),v.error(D)},complete:()=>{c=!0,f(),a=gu(h,r),v.complete()}}),Ve(_).subscribe(s))})(i)}}()))}bootstrap(n,r){if(!this._initStatus.done)throw new Error("Cannot bootstrap as there are still asynchronous initializers running. Bootstrap components in the `ngDoBootstrap` method of the root module.");let o;o=n instanceof Ay?n:this._componentFactoryResolver.resolveComponentFactory(n),this.componentTypes.push(o.componentType);const i=function(e){return e.isBoundToModule}(o)?void 0:this._injector.get(dn),a=o.create(re.NULL,[],r||o.selector,i),u=a.location.nativeElement,l=a.injector.get(qc,null),c=l&&a.injector.get(E_);return l&&c&&c.registerApplication(u,l),a.onDestroy(()=>{this.detachView(a.hostView),zc(this.components,a),c&&c.unregisterApplication(u)}),this._loadComponent(a),a}tick(){if(this._runningTick)throw new Error("ApplicationRef.tick is called recursively");try{this._runningTick=!0;for(let n of this._views)n.detectChanges()}catch(n){this._zone.runOutsideAngular(()=>this._exceptionHandler.handleError(n))}finally{this._runningTick=!1}}attachView(n){const r=n;this._views.push(r),r.attachToAppRef(this)}detachView(n){const r=n;zc(this._views,r),r.detachFromAppRef()}_loadComponent(n){this.attachView(n.hostView),this.tick(),this.components.push(n),this._injector.get(m_,[]).concat(this._bootstrapListeners).forEach(o=>o(n))}ngOnDestroy(){this._views.slice().forEach(n=>n.destroy()),this._onMicrotaskEmptySubscription.unsubscribe()}get viewCount(){return this._views.length}}return e.\u0275fac=function(n){return new(n||e)(A(De),A(re),A(fr),A(yr),A(vo))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function zc(e,t){const n=e.indexOf(t);n>-1&&e.splice(n,1)}const RM=function(e){return function(e,t,n){if(ms(e)&&!n){const r=pt(e.index,t);return new bi(r,r)}return 47&e.type?new bi(t[16],t):null}(Ee(),C(),16==(16&e))};let Kc=(()=>{class e{}return e.__NG_ELEMENT_ID__=RM,e})();class L_{constructor(){}supports(t){return yi(t)}create(t){return new $M(t)}}const HM=(e,t)=>t;class $M{constructor(t){this.length=0,this._linkedRecords=null,this._unlinkedRecords=null,this._previousItHead=null,this._itHead=null,this._itTail=null,this._additionsHead=null,this._additionsTail=null,this._movesHead=null,this._movesTail=null,this._removalsHead=null,this._removalsTail=null,this._identityChangesHead=null,this._identityChangesTail=null,this._trackByFn=t||HM}forEachItem(t){let n;for(n=this._itHead;null!==n;n=n._next)t(n)}forEachOperation(t){let n=this._itHead,r=this._removalsHead,o=0,i=null;for(;n||r;){const s=!r||n&&n.currentIndex<j_(r,o,i)?n:r,a=j_(s,o,i),u=s.currentIndex;if(s===r)o--,r=r._nextRemoved;else if(n=n._next,null==s.previousIndex)o++;else{i||(i=[]);const l=a-o,c=u-o;if(l!=c){for(let f=0;f<l;f++){const h=f<i.length?i[f]:i[f]=0,m=h+f;c<=m&&m<l&&(i[f]=h+1)}i[s.previousIndex]=c-l}}a!==u&&t(s,a,u)}}forEachPreviousItem(t){let n;for(n=this._previousItHead;null!==n;n=n._nextPrevious)t(n)}forEachAddedItem(t){let n;for(n=this._additionsHead;null!==n;n=n._nextAdded)t(n)}forEachMovedItem(t){let n;for(n=this._movesHead;null!==n;n=n._nextMoved)t(n)}forEachRemovedItem(t){let n;for(n=this._removalsHead;null!==n;n=n._nextRemoved)t(n)}forEachIdentityChange(t){let n;for(n=this._identityChangesHead;null!==n;n=n._nextIdentityChange)t(n)}diff(t){if(null==t&&(t=[]),!yi(t))throw new Error(`Error trying to diff '${$(t)}'. Only arrays and iterables are allowed`);return this.check(t)?this:null}onDestroy(){}check(t){this._reset();let o,i,s,n=this._itHead,r=!1;if(Array.isArray(t)){this.length=t.length;for(let a=0;a<this.length;a++)i=t[a],s=this._trackByFn(a,i),null!==n&&Object.is(n.trackById,s)?(r&&(n=this._verifyReinsertion(n,i,s,a)),Object.is(n.item,i)||this._addIdentityChange(n,i)):(n=this._mismatch(n,i,s,a),r=!0),n=n._next}else o=0,function(e,t){if(Array.isArray(e))for(let n=0;n<e.length;n++)t(e[n]);else{const n=e[to()]();let r;for(;!(r=n.next()).done;)t(r.value)}}(t,a=>{s=this._trackByFn(o,a),null!==n&&Object.is(n.trackById,s)?(r&&(n=this._verifyReinsertion(n,a,s,o)),Object.is(n.item,a)||this._addIdentityChange(n,a)):(n=this._mismatch(n,a,s,o),r=!0),n=n._next,o++}),this.length=o;return this._truncate(n),this.collection=t,this.isDirty}get isDirty(){return null!==this._additionsHead||null!==this._movesHead||null!==this._removalsHead||null!==this._identityChangesHead}_reset(){if(this.isDirty){let t;for(t=this._previousItHead=this._itHead;null!==t;t=t._next)t._nextPrevious=t._next;for(t=this._additionsHead;null!==t;t=t._nextAdded)t.previousIndex=t.currentIndex;for(this._additionsHead=this._additionsTail=null,t=this._movesHead;null!==t;t=t._nextMoved)t.previousIndex=t.currentIndex;this._movesHead=this._movesTail=null,this._removalsHead=this._removalsTail=null,this._identityChangesHead=this._identityChangesTail=null}}_mismatch(t,n,r,o){let i;return null===t?i=this._itTail:(i=t._prev,this._remove(t)),null!==(t=null===this._unlinkedRecords?null:this._unlinkedRecords.get(r,null))?(Object.is(t.item,n)||this._addIdentityChange(t,n),this._reinsertAfter(t,i,o)):null!==(t=null===this._linkedRecords?null:this._linkedRecords.get(r,o))?(Object.is(t.item,n)||this._addIdentityChange(t,n),this._moveAfter(t,i,o)):t=this._addAfter(new qM(n,r),i,o),t}_verifyReinsertion(t,n,r,o){let i=null===this._unlinkedRecords?null:this._unlinkedRecords.get(r,null);return null!==i?t=this._reinsertAfter(i,t._prev,o):t.currentIndex!=o&&(t.currentIndex=o,this._addToMoves(t,o)),t}_truncate(t){for(;null!==t;){const n=t._next;this._addToRemovals(this._unlink(t)),t=n}null!==this._unlinkedRecords&&this._unlinkedRecords.clear(),null!==this._additionsTail&&(this._additionsTail._nextAdded=null),null!==this._movesTail&&(this._movesTail._nextMoved=null),null!==this._itTail&&(this._itTail._next=null),null!==this._removalsTail&&(this._removalsTail._nextRemoved=null),null!==this._identityChangesTail&&(this._identityChangesTail._nextIdentityChange=null)}_reinsertAfter(t,n,r){null!==this._unlinkedRecords&&this._unlinkedRecords.remove(t);const o=t._prevRemoved,i=t._nextRemoved;return null===o?this._removalsHead=i:o._nextRemoved=i,null===i?this._removalsTail=o:i._prevRemoved=o,this._insertAfter(t,n,r),this._addToMoves(t,r),t}_moveAfter(t,n,r){return this._unlink(t),this._insertAfter(t,n,r),this._addToMoves(t,r),t}_addAfter(t,n,r){return this._insertAfter(t,n,r),this._additionsTail=null===this._additionsTail?this._additionsHead=t:this._additionsTail._nextAdded=t,t}_insertAfter(t,n,r){const o=null===n?this._itHead:n._next;return t._next=o,t._prev=n,null===o?this._itTail=t:o._prev=t,null===n?this._itHead=t:n._next=t,null===this._linkedRecords&&(this._linkedRecords=new V_),this._linkedRecords.put(t),t.currentIndex=r,t}_remove(t){return this._addToRemovals(this._unlink(t))}_unlink(t){null!==this._linkedRecords&&this._linkedRecords.remove(t);const n=t._prev,r=t._next;return null===n?this._itHead=r:n._next=r,null===r?this._itTail=n:r._prev=n,t}_addToMoves(t,n){return t.previousIndex===n||(this._movesTail=null===this._movesTail?this._movesHead=t:this._movesTail._nextMoved=t),t}_addToRemovals(t){return null===this._unlinkedRecords&&(this._unlinkedRecords=new V_),this._unlinkedRecords.put(t),t.currentIndex=null,t._nextRemoved=null,null===this._removalsTail?(this._removalsTail=this._removalsHead=t,t._prevRemoved=null):(t._prevRemoved=this._removalsTail,this._removalsTail=this._removalsTail._nextRemoved=t),t}_addIdentityChange(t,n){return t.item=n,this._identityChangesTail=null===this._identityChangesTail?this._identityChangesHead=t:this._identityChangesTail._nextIdentityChange=t,t}}class qM{constructor(t,n){this.item=t,this.trackById=n,this.currentIndex=null,this.previousIndex=null,this._nextPrevious=null,this._prev=null,this._next=null,this._prevDup=null,this._nextDup=null,this._prevRemoved=null,this._nextRemoved=null,this._nextAdded=null,this._nextMoved=null,this._nextIdentityChange=null}}class WM{constructor(){this._head=null,this._tail=null}add(t){null===this._head?(this._head=this._tail=t,t._nextDup=null,t._prevDup=null):(this._tail._nextDup=t,t._prevDup=this._tail,t._nextDup=null,this._tail=t)}get(t,n){let r;for(r=this._head;null!==r;r=r._nextDup)if((null===n||n<=r.currentIndex)&&Object.is(r.trackById,t))return r;return null}remove(t){const n=t._prevDup,r=t._nextDup;return null===n?this._head=r:n._nextDup=r,null===r?this._tail=n:r._prevDup=n,null===this._head}}class V_{constructor(){this.map=new Map}put(t){const n=t.trackById;let r=this.map.get(n);r||(r=new WM,this.map.set(n,r)),r.add(t)}get(t,n){const o=this.map.get(t);return o?o.get(t,n):null}remove(t){const n=t.trackById;return this.map.get(n).remove(t)&&this.map.delete(n),t}get isEmpty(){return 0===this.map.size}clear(){this.map.clear()}}function j_(e,t,n){const r=e.previousIndex;if(null===r)return r;let o=0;return n&&r<n.length&&(o=n[r]),r+t+o}class B_{constructor(){}supports(t){return t instanceof Map||Xl(t)}create(){return new GM}}class GM{constructor(){this._records=new Map,this._mapHead=null,this._appendAfter=null,this._previousMapHead=null,this._changesHead=null,this._changesTail=null,this._additionsHead=null,this._additionsTail=null,this._removalsHead=null,this._removalsTail=null}get isDirty(){return null!==this._additionsHead||null!==this._changesHead||null!==this._removalsHead}forEachItem(t){let n;for(n=this._mapHead;null!==n;n=n._next)t(n)}forEachPreviousItem(t){let n;for(n=this._previousMapHead;null!==n;n=n._nextPrevious)t(n)}forEachChangedItem(t){let n;for(n=this._changesHead;null!==n;n=n._nextChanged)t(n)}forEachAddedItem(t){let n;for(n=this._additionsHead;null!==n;n=n._nextAdded)t(n)}forEachRemovedItem(t){let n;for(n=this._removalsHead;null!==n;n=n._nextRemoved)t(n)}diff(t){if(t){if(!(t instanceof Map||Xl(t)))throw new Error(`Error trying to diff '${$(t)}'. Only maps and objects are allowed`)}else t=new Map;return this.check(t)?this:null}onDestroy(){}check(t){this._reset();let n=this._mapHead;if(this._appendAfter=null,this._forEach(t,(r,o)=>{if(n&&n.key===o)this._maybeAddToChanges(n,r),this._appendAfter=n,n=n._next;else{const i=this._getOrCreateRecordForKey(o,r);n=this._insertBeforeOrAppend(n,i)}}),n){n._prev&&(n._prev._next=null),this._removalsHead=n;for(let r=n;null!==r;r=r._nextRemoved)r===this._mapHead&&(this._mapHead=null),this._records.delete(r.key),r._nextRemoved=r._next,r.previousValue=r.currentValue,r.currentValue=null,r._prev=null,r._next=null}return this._changesTail&&(this._changesTail._nextChanged=null),this._additionsTail&&(this._additionsTail._nextAdded=null),this.isDirty}_insertBeforeOrAppend(t,n){if(t){const r=t._prev;return n._next=t,n._prev=r,t._prev=n,r&&(r._next=n),t===this._mapHead&&(this._mapHead=n),this._appendAfter=t,t}return this._appendAfter?(this._appendAfter._next=n,n._prev=this._appendAfter):this._mapHead=n,this._appendAfter=n,null}_getOrCreateRecordForKey(t,n){if(this._records.has(t)){const o=this._records.get(t);this._maybeAddToChanges(o,n);const i=o._prev,s=o._next;return i&&(i._next=s),s&&(s._prev=i),o._next=null,o._prev=null,o}const r=new zM(t);return this._records.set(t,r),r.currentValue=n,this._addToAdditions(r),r}_reset(){if(this.isDirty){let t;for(this._previousMapHead=this._mapHead,t=this._previousMapHead;null!==t;t=t._next)t._nextPrevious=t._next;for(t=this._changesHead;null!==t;t=t._nextChanged)t.previousValue=t.currentValue;for(t=this._additionsHead;null!=t;t=t._nextAdded)t.previousValue=t.currentValue;this._changesHead=this._changesTail=null,this._additionsHead=this._additionsTail=null,this._removalsHead=null}}_maybeAddToChanges(t,n){Object.is(n,t.currentValue)||(t.previousValue=t.currentValue,t.currentValue=n,this._addToChanges(t))}_addToAdditions(t){null===this._additionsHead?this._additionsHead=this._additionsTail=t:(this._additionsTail._nextAdded=t,this._additionsTail=t)}_addToChanges(t){null===this._changesHead?this._changesHead=this._changesTail=t:(this._changesTail._nextChanged=t,this._changesTail=t)}_forEach(t,n){t instanceof Map?t.forEach(n):Object.keys(t).forEach(r=>n(t[r],r))}}class zM{constructor(t){this.key=t,this.previousValue=null,this.currentValue=null,this._nextPrevious=null,this._next=null,this._prev=null,this._nextAdded=null,this._nextRemoved=null,this._nextChanged=null}}function U_(){return new Ri([new L_])}let Ri=(()=>{class e{constructor(n){this.factories=n}static create(n,r){if(null!=r){const o=r.factories.slice();n=n.concat(o)}return new e(n)}static extend(n){return{provide:e,useFactory:r=>e.create(n,r||U_()),deps:[[e,new Bn,new at]]}}find(n){const r=this.factories.find(o=>o.supports(n));if(null!=r)return r;throw new Error(`Cannot find a differ supporting object '${n}' of type '${function(e){return e.name||typeof e}(n)}'`)}}return e.\u0275prov=q({token:e,providedIn:"root",factory:U_}),e})();function H_(){return new Eo([new B_])}let Eo=(()=>{class e{constructor(n){this.factories=n}static create(n,r){if(r){const o=r.factories.slice();n=n.concat(o)}return new e(n)}static extend(n){return{provide:e,useFactory:r=>e.create(n,r||H_()),deps:[[e,new Bn,new at]]}}find(n){const r=this.factories.find(o=>o.supports(n));if(r)return r;throw new Error(`Cannot find a differ supporting object '${n}'`)}}return e.\u0275prov=q({token:e,providedIn:"root",factory:H_}),e})();const KM=[new B_],ZM=new Ri([new L_]),JM=new Eo(KM),XM=S_(null,"core",[{provide:jc,useValue:"unknown"},{provide:A_,deps:[re]},{provide:E_,deps:[]},{provide:ga,deps:[]}]),oA=[{provide:Co,useClass:Co,deps:[De,re,fr,yr,vo]},{provide:VT,deps:[De],useFactory:function(e){let t=[];return e.onStable.subscribe(()=>{for(;t.length;)t.pop()()}),function(n){t.push(n)}}},{provide:vo,useClass:vo,deps:[[new at,Mi]]},{provide:ma,useClass:ma,deps:[]},eM,{provide:Ri,useFactory:function(){return ZM},deps:[]},{provide:Eo,useFactory:function(){return JM},deps:[]},{provide:$n,useFactory:function(e){return e||"undefined"!=typeof $localize&&$localize.locale||ta},deps:[[new Wr($n),new at,new Bn]]},{provide:y_,useValue:"USD"}];let sA=(()=>{class e{constructor(n){}}return e.\u0275fac=function(n){return new(n||e)(A(Co))},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({providers:oA}),e})(),Ra=null;function Gn(){return Ra}const je=new J("DocumentToken");let Er=(()=>{class e{historyGo(n){throw new Error("Not implemented")}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:function(){return A(TD)},providedIn:"platform"}),e})();const ex=new J("Location Initialized");let TD=(()=>{class e extends Er{constructor(n){super(),this._doc=n,this._init()}_init(){this.location=window.location,this._history=window.history}getBaseHrefFromDOM(){return Gn().getBaseHref(this._doc)}onPopState(n){const r=Gn().getGlobalEventTarget(this._doc,"window");return r.addEventListener("popstate",n,!1),()=>r.removeEventListener("popstate",n)}onHashChange(n){const r=Gn().getGlobalEventTarget(this._doc,"window");return r.addEventListener("hashchange",n,!1),()=>r.removeEventListener("hashchange",n)}get href(){return this.location.href}get protocol(){return this.location.protocol}get hostname(){return this.location.hostname}get port(){return this.location.port}get pathname(){return this.location.pathname}get search(){return this.location.search}get hash(){return this.location.hash}set pathname(n){this.location.pathname=n}pushState(n,r,o){SD()?this._history.pushState(n,r,o):this.location.hash=o}replaceState(n,r,o){SD()?this._history.replaceState(n,r,o):this.location.hash=o}forward(){this._history.forward()}back(){this._history.back()}historyGo(n=0){this._history.go(n)}getState(){return this._history.state}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:function(){return new TD(A(je))},providedIn:"platform"}),e})();function SD(){return!!window.history.pushState}function Ed(e,t){if(0==e.length)return t;if(0==t.length)return e;let n=0;return e.endsWith("/")&&n++,t.startsWith("/")&&n++,2==n?e+t.substring(1):1==n?e+t:e+"/"+t}function MD(e){const t=e.match(/#|\?|$/),n=t&&t.index||e.length;return e.slice(0,n-("/"===e[n-1]?1:0))+e.slice(n)}function An(e){return e&&"?"!==e[0]?"?"+e:e}let Mo=(()=>{class e{historyGo(n){throw new Error("Not implemented")}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:function(){return function(e){const t=A(je).location;return new AD(A(Er),t&&t.origin||"")}()},providedIn:"root"}),e})();const wd=new J("appBaseHref");let AD=(()=>{class e extends Mo{constructor(n,r){if(super(),this._platformLocation=n,this._removeListenerFns=[],null==r&&(r=this._platformLocation.getBaseHrefFromDOM()),null==r)throw new Error("No base href set. Please provide a value for the APP_BASE_HREF token or add a base element to the document.");this._baseHref=r}ngOnDestroy(){for(;this._removeListenerFns.length;)this._removeListenerFns.pop()()}onPopState(n){this._removeListenerFns.push(this._platformLocation.onPopState(n),this._platformLocation.onHashChange(n))}getBaseHref(){return this._baseHref}prepareExternalUrl(n){return Ed(this._baseHref,n)}path(n=!1){const r=this._platformLocation.pathname+An(this._platformLocation.search),o=this._platformLocation.hash;return o&&n?`${r}${o}`:r}pushState(n,r,o,i){const s=this.prepareExternalUrl(o+An(i));this._platformLocation.pushState(n,r,s)}replaceState(n,r,o,i){const s=this.prepareExternalUrl(o+An(i));this._platformLocation.replaceState(n,r,s)}forward(){this._platformLocation.forward()}back(){this._platformLocation.back()}historyGo(n=0){var r,o;null==(o=(r=this._platformLocation).historyGo)||o.call(r,n)}}return e.\u0275fac=function(n){return new(n||e)(A(Er),A(wd,8))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),rx=(()=>{class e extends Mo{constructor(n,r){super(),this._platformLocation=n,this._baseHref="",this._removeListenerFns=[],null!=r&&(this._baseHref=r)}ngOnDestroy(){for(;this._removeListenerFns.length;)this._removeListenerFns.pop()()}onPopState(n){this._removeListenerFns.push(this._platformLocation.onPopState(n),this._platformLocation.onHashChange(n))}getBaseHref(){return this._baseHref}path(n=!1){let r=this._platformLocation.hash;return null==r&&(r="#"),r.length>0?r.substring(1):r}prepareExternalUrl(n){const r=Ed(this._baseHref,n);return r.length>0?"#"+r:r}pushState(n,r,o,i){let s=this.prepareExternalUrl(o+An(i));0==s.length&&(s=this._platformLocation.pathname),this._platformLocation.pushState(n,r,s)}replaceState(n,r,o,i){let s=this.prepareExternalUrl(o+An(i));0==s.length&&(s=this._platformLocation.pathname),this._platformLocation.replaceState(n,r,s)}forward(){this._platformLocation.forward()}back(){this._platformLocation.back()}historyGo(n=0){var r,o;null==(o=(r=this._platformLocation).historyGo)||o.call(r,n)}}return e.\u0275fac=function(n){return new(n||e)(A(Er),A(wd,8))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),bd=(()=>{class e{constructor(n,r){this._subject=new tt,this._urlChangeListeners=[],this._platformStrategy=n;const o=this._platformStrategy.getBaseHref();this._platformLocation=r,this._baseHref=MD(RD(o)),this._platformStrategy.onPopState(i=>{this._subject.emit({url:this.path(!0),pop:!0,state:i.state,type:i.type})})}path(n=!1){return this.normalize(this._platformStrategy.path(n))}getState(){return this._platformLocation.getState()}isCurrentPathEqualTo(n,r=""){return this.path()==this.normalize(n+An(r))}normalize(n){return e.stripTrailingSlash(function(e,t){return e&&t.startsWith(e)?t.substring(e.length):t}(this._baseHref,RD(n)))}prepareExternalUrl(n){return n&&"/"!==n[0]&&(n="/"+n),this._platformStrategy.prepareExternalUrl(n)}go(n,r="",o=null){this._platformStrategy.pushState(o,"",n,r),this._notifyUrlChangeListeners(this.prepareExternalUrl(n+An(r)),o)}replaceState(n,r="",o=null){this._platformStrategy.replaceState(o,"",n,r),this._notifyUrlChangeListeners(this.prepareExternalUrl(n+An(r)),o)}forward(){this._platformStrategy.forward()}back(){this._platformStrategy.back()}historyGo(n=0){var r,o;null==(o=(r=this._platformStrategy).historyGo)||o.call(r,n)}onUrlChange(n){this._urlChangeListeners.push(n),this._urlChangeSubscription||(this._urlChangeSubscription=this.subscribe(r=>{this._notifyUrlChangeListeners(r.url,r.state)}))}_notifyUrlChangeListeners(n="",r){this._urlChangeListeners.forEach(o=>o(n,r))}subscribe(n,r,o){return this._subject.subscribe({next:n,error:r,complete:o})}}return e.normalizeQueryParams=An,e.joinWithSlash=Ed,e.stripTrailingSlash=MD,e.\u0275fac=function(n){return new(n||e)(A(Mo),A(Er))},e.\u0275prov=q({token:e,factory:function(){return new bd(A(Mo),A(Er))},providedIn:"root"}),e})();function RD(e){return e.replace(/\/index.html$/,"")}var ve=(()=>((ve=ve||{})[ve.Zero=0]="Zero",ve[ve.One=1]="One",ve[ve.Two=2]="Two",ve[ve.Few=3]="Few",ve[ve.Many=4]="Many",ve[ve.Other=5]="Other",ve))();const fx=function(e){return function(e){const t=function(e){return e.toLowerCase().replace(/_/g,"-")}(e);let n=ry(t);if(n)return n;const r=t.split("-")[0];if(n=ry(r),n)return n;if("en"===r)return T1;throw new Error(`Missing locale data for the locale "${e}".`)}(e)[b.PluralCase]};class Ba{}let Ux=(()=>{class e extends Ba{constructor(n){super(),this.locale=n}getPluralCategory(n,r){switch(fx(r||this.locale)(n)){case ve.Zero:return"zero";case ve.One:return"one";case ve.Two:return"two";case ve.Few:return"few";case ve.Many:return"many";default:return"other"}}}return e.\u0275fac=function(n){return new(n||e)(A($n))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class Wx{constructor(t,n,r,o){this.$implicit=t,this.ngForOf=n,this.index=r,this.count=o}get first(){return 0===this.index}get last(){return this.index===this.count-1}get even(){return this.index%2==0}get odd(){return!this.even}}let jD=(()=>{class e{constructor(n,r,o){this._viewContainer=n,this._template=r,this._differs=o,this._ngForOf=null,this._ngForOfDirty=!0,this._differ=null}set ngForOf(n){this._ngForOf=n,this._ngForOfDirty=!0}set ngForTrackBy(n){this._trackByFn=n}get ngForTrackBy(){return this._trackByFn}set ngForTemplate(n){n&&(this._template=n)}ngDoCheck(){if(this._ngForOfDirty){this._ngForOfDirty=!1;const n=this._ngForOf;if(!this._differ&&n)try{this._differ=this._differs.find(n).create(this.ngForTrackBy)}catch(r){throw new Error(`Cannot find a differ supporting object '${n}' of type '${function(e){return e.name||typeof e}(n)}'. NgFor only supports binding to Iterables such as Arrays.`)}}if(this._differ){const n=this._differ.diff(this._ngForOf);n&&this._applyChanges(n)}}_applyChanges(n){const r=[];n.forEachOperation((o,i,s)=>{if(null==o.previousIndex){const a=this._viewContainer.createEmbeddedView(this._template,new Wx(null,this._ngForOf,-1,-1),null===s?void 0:s),u=new BD(o,a);r.push(u)}else if(null==s)this._viewContainer.remove(null===i?void 0:i);else if(null!==i){const a=this._viewContainer.get(i);this._viewContainer.move(a,s);const u=new BD(o,a);r.push(u)}});for(let o=0;o<r.length;o++)this._perViewChange(r[o].view,r[o].record);for(let o=0,i=this._viewContainer.length;o<i;o++){const s=this._viewContainer.get(o);s.context.index=o,s.context.count=i,s.context.ngForOf=this._ngForOf}n.forEachIdentityChange(o=>{this._viewContainer.get(o.currentIndex).context.$implicit=o.item})}_perViewChange(n,r){n.context.$implicit=r.item}static ngTemplateContextGuard(n,r){return!0}}return e.\u0275fac=function(n){return new(n||e)(S(Wt),S(Sn),S(Ri))},e.\u0275dir=Ue({type:e,selectors:[["","ngFor","","ngForOf",""]],inputs:{ngForOf:"ngForOf",ngForTrackBy:"ngForTrackBy",ngForTemplate:"ngForTemplate"}}),e})();class BD{constructor(t,n){this.record=t,this.view=n}}let UD=(()=>{class e{constructor(n,r){this._viewContainer=n,this._context=new zx,this._thenTemplateRef=null,this._elseTemplateRef=null,this._thenViewRef=null,this._elseViewRef=null,this._thenTemplateRef=r}set ngIf(n){this._context.$implicit=this._context.ngIf=n,this._updateView()}set ngIfThen(n){HD("ngIfThen",n),this._thenTemplateRef=n,this._thenViewRef=null,this._updateView()}set ngIfElse(n){HD("ngIfElse",n),this._elseTemplateRef=n,this._elseViewRef=null,this._updateView()}_updateView(){this._context.$implicit?this._thenViewRef||(this._viewContainer.clear(),this._elseViewRef=null,this._thenTemplateRef&&(this._thenViewRef=this._viewContainer.createEmbeddedView(this._thenTemplateRef,this._context))):this._elseViewRef||(this._viewContainer.clear(),this._thenViewRef=null,this._elseTemplateRef&&(this._elseViewRef=this._viewContainer.createEmbeddedView(this._elseTemplateRef,this._context)))}static ngTemplateContextGuard(n,r){return!0}}return e.\u0275fac=function(n){return new(n||e)(S(Wt),S(Sn))},e.\u0275dir=Ue({type:e,selectors:[["","ngIf",""]],inputs:{ngIf:"ngIf",ngIfThen:"ngIfThen",ngIfElse:"ngIfElse"}}),e})();class zx{constructor(){this.$implicit=null,this.ngIf=null}}function HD(e,t){if(t&&!t.createEmbeddedView)throw new Error(`${e} must be a TemplateRef, but received '${$(t)}'.`)}let vN=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({providers:[{provide:Ba,useClass:Ux}]}),e})();let bN=(()=>{class e{}return e.\u0275prov=q({token:e,providedIn:"root",factory:()=>new IN(A(je),window)}),e})();class IN{constructor(t,n){this.document=t,this.window=n,this.offset=()=>[0,0]}setOffset(t){this.offset=Array.isArray(t)?()=>t:t}getScrollPosition(){return this.supportsScrolling()?[this.window.pageXOffset,this.window.pageYOffset]:[0,0]}scrollToPosition(t){this.supportsScrolling()&&this.window.scrollTo(t[0],t[1])}scrollToAnchor(t){if(!this.supportsScrolling())return;const n=function(e,t){const n=e.getElementById(t)||e.getElementsByName(t)[0];if(n)return n;if("function"==typeof e.createTreeWalker&&e.body&&(e.body.createShadowRoot||e.body.attachShadow)){const r=e.createTreeWalker(e.body,NodeFilter.SHOW_ELEMENT);let o=r.currentNode;for(;o;){const i=o.shadowRoot;if(i){const s=i.getElementById(t)||i.querySelector(`[name="${t}"]`);if(s)return s}o=r.nextNode()}}return null}(this.document,t);n&&(this.scrollToElement(n),this.attemptFocus(n))}setHistoryScrollRestoration(t){if(this.supportScrollRestoration()){const n=this.window.history;n&&n.scrollRestoration&&(n.scrollRestoration=t)}}scrollToElement(t){const n=t.getBoundingClientRect(),r=n.left+this.window.pageXOffset,o=n.top+this.window.pageYOffset,i=this.offset();this.window.scrollTo(r-i[0],o-i[1])}attemptFocus(t){return t.focus(),this.document.activeElement===t}supportScrollRestoration(){try{if(!this.supportsScrolling())return!1;const t=GD(this.window.history)||GD(Object.getPrototypeOf(this.window.history));return!(!t||!t.writable&&!t.set)}catch(t){return!1}}supportsScrolling(){try{return!!this.window&&!!this.window.scrollTo&&"pageXOffset"in this.window}catch(t){return!1}}}function GD(e){return Object.getOwnPropertyDescriptor(e,"scrollRestoration")}class Ld extends class extends class{}{constructor(){super(...arguments),this.supportsDOMEvents=!0}}{static makeCurrent(){var e;e=new Ld,Ra||(Ra=e)}onAndCancel(t,n,r){return t.addEventListener(n,r,!1),()=>{t.removeEventListener(n,r,!1)}}dispatchEvent(t,n){t.dispatchEvent(n)}remove(t){t.parentNode&&t.parentNode.removeChild(t)}createElement(t,n){return(n=n||this.getDefaultDocument()).createElement(t)}createHtmlDocument(){return document.implementation.createHTMLDocument("fakeTitle")}getDefaultDocument(){return document}isElementNode(t){return t.nodeType===Node.ELEMENT_NODE}isShadowRoot(t){return t instanceof DocumentFragment}getGlobalEventTarget(t,n){return"window"===n?window:"document"===n?t:"body"===n?t.body:null}getBaseHref(t){const n=(qi=qi||document.querySelector("base"),qi?qi.getAttribute("href"):null);return null==n?null:function(e){Ua=Ua||document.createElement("a"),Ua.setAttribute("href",e);const t=Ua.pathname;return"/"===t.charAt(0)?t:`/${t}`}(n)}resetBaseElement(){qi=null}getUserAgent(){return window.navigator.userAgent}getCookie(t){return function(e,t){t=encodeURIComponent(t);for(const n of e.split(";")){const r=n.indexOf("="),[o,i]=-1==r?[n,""]:[n.slice(0,r),n.slice(r+1)];if(o.trim()===t)return decodeURIComponent(i)}return null}(document.cookie,t)}}let Ua,qi=null;const zD=new J("TRANSITION_ID"),NN=[{provide:Mi,useFactory:function(e,t,n){return()=>{n.get(vo).donePromise.then(()=>{const r=Gn(),o=t.querySelectorAll(`style[ng-transition="${e}"]`);for(let i=0;i<o.length;i++)r.remove(o[i])})}},deps:[zD,je,re],multi:!0}];class Vd{static init(){var e;e=new Vd,Wc=e}addToWindow(t){X.getAngularTestability=(r,o=!0)=>{const i=t.findTestabilityInTree(r,o);if(null==i)throw new Error("Could not find testability for element.");return i},X.getAllAngularTestabilities=()=>t.getAllTestabilities(),X.getAllAngularRootElements=()=>t.getAllRootElements(),X.frameworkStabilizers||(X.frameworkStabilizers=[]),X.frameworkStabilizers.push(r=>{const o=X.getAllAngularTestabilities();let i=o.length,s=!1;const a=function(u){s=s||u,i--,0==i&&r(s)};o.forEach(function(u){u.whenStable(a)})})}findTestabilityInTree(t,n,r){if(null==n)return null;const o=t.getTestability(n);return null!=o?o:r?Gn().isShadowRoot(n)?this.findTestabilityInTree(t,n.host,!0):this.findTestabilityInTree(t,n.parentElement,!0):null}}let PN=(()=>{class e{build(){return new XMLHttpRequest}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const Wi=new J("EventManagerPlugins");let $a=(()=>{class e{constructor(n,r){this._zone=r,this._eventNameToPlugin=new Map,n.forEach(o=>o.manager=this),this._plugins=n.slice().reverse()}addEventListener(n,r,o){return this._findPluginFor(r).addEventListener(n,r,o)}addGlobalEventListener(n,r,o){return this._findPluginFor(r).addGlobalEventListener(n,r,o)}getZone(){return this._zone}_findPluginFor(n){const r=this._eventNameToPlugin.get(n);if(r)return r;const o=this._plugins;for(let i=0;i<o.length;i++){const s=o[i];if(s.supports(n))return this._eventNameToPlugin.set(n,s),s}throw new Error(`No event manager plugin found for event ${n}`)}}return e.\u0275fac=function(n){return new(n||e)(A(Wi),A(De))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class jd{constructor(t){this._doc=t}addGlobalEventListener(t,n,r){const o=Gn().getGlobalEventTarget(this._doc,t);if(!o)throw new Error(`Unsupported event target ${o} for event ${n}`);return this.addEventListener(o,n,r)}}let KD=(()=>{class e{constructor(){this._stylesSet=new Set}addStyles(n){const r=new Set;n.forEach(o=>{this._stylesSet.has(o)||(this._stylesSet.add(o),r.add(o))}),this.onStylesAdded(r)}onStylesAdded(n){}getAllStyles(){return Array.from(this._stylesSet)}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),Gi=(()=>{class e extends KD{constructor(n){super(),this._doc=n,this._hostNodes=new Map,this._hostNodes.set(n.head,[])}_addStylesToHost(n,r,o){n.forEach(i=>{const s=this._doc.createElement("style");s.textContent=i,o.push(r.appendChild(s))})}addHost(n){const r=[];this._addStylesToHost(this._stylesSet,n,r),this._hostNodes.set(n,r)}removeHost(n){const r=this._hostNodes.get(n);r&&r.forEach(YD),this._hostNodes.delete(n)}onStylesAdded(n){this._hostNodes.forEach((r,o)=>{this._addStylesToHost(n,o,r)})}ngOnDestroy(){this._hostNodes.forEach(n=>n.forEach(YD))}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function YD(e){Gn().remove(e)}const Bd={svg:"http://www.w3.org/2000/svg",xhtml:"http://www.w3.org/1999/xhtml",xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"},Ud=/%COMP%/g;function qa(e,t,n){for(let r=0;r<t.length;r++){let o=t[r];Array.isArray(o)?qa(e,o,n):(o=o.replace(Ud,e),n.push(o))}return n}function XD(e){return t=>{if("__ngUnwrap__"===t)return e;!1===e(t)&&(t.preventDefault(),t.returnValue=!1)}}let Hd=(()=>{class e{constructor(n,r,o){this.eventManager=n,this.sharedStylesHost=r,this.appId=o,this.rendererByCompId=new Map,this.defaultRenderer=new $d(n)}createRenderer(n,r){if(!n||!r)return this.defaultRenderer;switch(r.encapsulation){case ft.Emulated:{let o=this.rendererByCompId.get(r.id);return o||(o=new QN(this.eventManager,this.sharedStylesHost,r,this.appId),this.rendererByCompId.set(r.id,o)),o.applyToHost(n),o}case 1:case ft.ShadowDom:return new KN(this.eventManager,this.sharedStylesHost,n,r);default:if(!this.rendererByCompId.has(r.id)){const o=qa(r.id,r.styles,[]);this.sharedStylesHost.addStyles(o),this.rendererByCompId.set(r.id,this.defaultRenderer)}return this.defaultRenderer}}begin(){}end(){}}return e.\u0275fac=function(n){return new(n||e)(A($a),A(Gi),A(Ai))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();class $d{constructor(t){this.eventManager=t,this.data=Object.create(null),this.destroyNode=null}destroy(){}createElement(t,n){return n?document.createElementNS(Bd[n]||n,t):document.createElement(t)}createComment(t){return document.createComment(t)}createText(t){return document.createTextNode(t)}appendChild(t,n){t.appendChild(n)}insertBefore(t,n,r){t&&t.insertBefore(n,r)}removeChild(t,n){t&&t.removeChild(n)}selectRootElement(t,n){let r="string"==typeof t?document.querySelector(t):t;if(!r)throw new Error(`The selector "${t}" did not match any elements`);return n||(r.textContent=""),r}parentNode(t){return t.parentNode}nextSibling(t){return t.nextSibling}setAttribute(t,n,r,o){if(o){n=o+":"+n;const i=Bd[o];i?t.setAttributeNS(i,n,r):t.setAttribute(n,r)}else t.setAttribute(n,r)}removeAttribute(t,n,r){if(r){const o=Bd[r];o?t.removeAttributeNS(o,n):t.removeAttribute(`${r}:${n}`)}else t.removeAttribute(n)}addClass(t,n){t.classList.add(n)}removeClass(t,n){t.classList.remove(n)}setStyle(t,n,r,o){o&(yt.DashCase|yt.Important)?t.style.setProperty(n,r,o&yt.Important?"important":""):t.style[n]=r}removeStyle(t,n,r){r&yt.DashCase?t.style.removeProperty(n):t.style[n]=""}setProperty(t,n,r){t[n]=r}setValue(t,n){t.nodeValue=n}listen(t,n,r){return"string"==typeof t?this.eventManager.addGlobalEventListener(t,n,XD(r)):this.eventManager.addEventListener(t,n,XD(r))}}class QN extends $d{constructor(t,n,r,o){super(t),this.component=r;const i=qa(o+"-"+r.id,r.styles,[]);n.addStyles(i),this.contentAttr="_ngcontent-%COMP%".replace(Ud,o+"-"+r.id),this.hostAttr="_nghost-%COMP%".replace(Ud,o+"-"+r.id)}applyToHost(t){super.setAttribute(t,this.hostAttr,"")}createElement(t,n){const r=super.createElement(t,n);return super.setAttribute(r,this.contentAttr,""),r}}class KN extends $d{constructor(t,n,r,o){super(t),this.sharedStylesHost=n,this.hostEl=r,this.shadowRoot=r.attachShadow({mode:"open"}),this.sharedStylesHost.addHost(this.shadowRoot);const i=qa(o.id,o.styles,[]);for(let s=0;s<i.length;s++){const a=document.createElement("style");a.textContent=i[s],this.shadowRoot.appendChild(a)}}nodeOrShadowRoot(t){return t===this.hostEl?this.shadowRoot:t}destroy(){this.sharedStylesHost.removeHost(this.shadowRoot)}appendChild(t,n){return super.appendChild(this.nodeOrShadowRoot(t),n)}insertBefore(t,n,r){return super.insertBefore(this.nodeOrShadowRoot(t),n,r)}removeChild(t,n){return super.removeChild(this.nodeOrShadowRoot(t),n)}parentNode(t){return this.nodeOrShadowRoot(super.parentNode(this.nodeOrShadowRoot(t)))}}let YN=(()=>{class e extends jd{constructor(n){super(n)}supports(n){return!0}addEventListener(n,r,o){return n.addEventListener(r,o,!1),()=>this.removeEventListener(n,r,o)}removeEventListener(n,r,o){return n.removeEventListener(r,o)}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const nv=["alt","control","meta","shift"],rP={"\b":"Backspace","\t":"Tab","\x7f":"Delete","\x1b":"Escape",Del:"Delete",Esc:"Escape",Left:"ArrowLeft",Right:"ArrowRight",Up:"ArrowUp",Down:"ArrowDown",Menu:"ContextMenu",Scroll:"ScrollLock",Win:"OS"},rv={A:"1",B:"2",C:"3",D:"4",E:"5",F:"6",G:"7",H:"8",I:"9",J:"*",K:"+",M:"-",N:".",O:"/","`":"0","\x90":"NumLock"},oP={alt:e=>e.altKey,control:e=>e.ctrlKey,meta:e=>e.metaKey,shift:e=>e.shiftKey};let iP=(()=>{class e extends jd{constructor(n){super(n)}supports(n){return null!=e.parseEventName(n)}addEventListener(n,r,o){const i=e.parseEventName(r),s=e.eventCallback(i.fullKey,o,this.manager.getZone());return this.manager.getZone().runOutsideAngular(()=>Gn().onAndCancel(n,i.domEventName,s))}static parseEventName(n){const r=n.toLowerCase().split("."),o=r.shift();if(0===r.length||"keydown"!==o&&"keyup"!==o)return null;const i=e._normalizeKey(r.pop());let s="";if(nv.forEach(u=>{const l=r.indexOf(u);l>-1&&(r.splice(l,1),s+=u+".")}),s+=i,0!=r.length||0===i.length)return null;const a={};return a.domEventName=o,a.fullKey=s,a}static getEventFullKey(n){let r="",o=function(e){let t=e.key;if(null==t){if(t=e.keyIdentifier,null==t)return"Unidentified";t.startsWith("U+")&&(t=String.fromCharCode(parseInt(t.substring(2),16)),3===e.location&&rv.hasOwnProperty(t)&&(t=rv[t]))}return rP[t]||t}(n);return o=o.toLowerCase()," "===o?o="space":"."===o&&(o="dot"),nv.forEach(i=>{i!=o&&oP[i](n)&&(r+=i+".")}),r+=o,r}static eventCallback(n,r,o){return i=>{e.getEventFullKey(i)===n&&o.runGuarded(()=>r(i))}}static _normalizeKey(n){return"esc"===n?"escape":n}}return e.\u0275fac=function(n){return new(n||e)(A(je))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const hP=S_(XM,"browser",[{provide:jc,useValue:"browser"},{provide:g_,useValue:function(){Ld.makeCurrent(),Vd.init()},multi:!0},{provide:je,useFactory:function(){return e=document,Au=e,document;var e},deps:[]}]),pP=[[],{provide:pi,useValue:"root"},{provide:fr,useFactory:function(){return new fr},deps:[]},{provide:Wi,useClass:YN,multi:!0,deps:[je,De,jc]},{provide:Wi,useClass:iP,multi:!0,deps:[je]},[],{provide:Hd,useClass:Hd,deps:[$a,Gi,Ai]},{provide:aa,useExisting:Hd},{provide:KD,useExisting:Gi},{provide:Gi,useClass:Gi,deps:[je]},{provide:qc,useClass:qc,deps:[De]},{provide:$a,useClass:$a,deps:[Wi,De]},{provide:class{},useClass:PN,deps:[]},[]];let gP=(()=>{class e{constructor(n){if(n)throw new Error("BrowserModule has already been loaded. If you need access to common directives such as NgIf and NgFor from a lazy loaded module, import CommonModule instead.")}static withServerTransition(n){return{ngModule:e,providers:[{provide:Ai,useValue:n.appId},{provide:zD,useExisting:Ai},NN]}}}return e.\u0275fac=function(n){return new(n||e)(A(e,12))},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({providers:pP,imports:[vN,sA]}),e})();function H(...e){return Ve(e,Bo(e))}"undefined"!=typeof window&&window;class Xt extends pn{constructor(t){super(),this._value=t}get value(){return this.getValue()}_subscribe(t){const n=super._subscribe(t);return!n.closed&&t.next(this._value),n}getValue(){const{hasError:t,thrownError:n,_value:r}=this;if(t)throw n;return this._throwIfClosed(),r}next(t){super.next(this._value=t)}}const{isArray:wP}=Array,{getPrototypeOf:bP,prototype:IP,keys:TP}=Object;const{isArray:AP}=Array;function PP(...e){const t=Bo(e),n=function(e){return Y(pu(e))?e.pop():void 0}(e),{args:r,keys:o}=function(e){if(1===e.length){const t=e[0];if(wP(t))return{args:t,keys:null};if(function(e){return e&&"object"==typeof e&&bP(e)===IP}(t)){const n=TP(t);return{args:n.map(r=>t[r]),keys:n}}}return{args:e,keys:null}}(e);if(0===r.length)return Ve([],t);const i=new fe(function(e,t,n=Jn){return r=>{iv(t,()=>{const{length:o}=e,i=new Array(o);let s=o,a=o;for(let u=0;u<o;u++)iv(t,()=>{const l=Ve(e[u],t);let c=!1;l.subscribe(new Le(r,d=>{i[u]=d,c||(c=!0,a--),a||r.next(n(i.slice()))},()=>{--s||r.complete()}))},r)},r)}}(r,t,o?s=>function(e,t){return e.reduce((n,r,o)=>(n[r]=t[o],n),{})}(o,s):Jn));return n?i.pipe(function(e){return ae(t=>function(e,t){return AP(t)?e(...t):e(t)}(e,t))}(n)):i}function iv(e,t,n){e?mn(n,e,t):t()}const Wa=Ae(e=>function(){e(this),this.name="EmptyError",this.message="no elements in sequence"});function Qd(...e){return jo(1)(Ve(e,Bo(e)))}function sv(e){return new fe(t=>{gn(e()).subscribe(t)})}function av(){return ke((e,t)=>{let n=null;e._refCount++;const r=new Le(t,void 0,void 0,void 0,()=>{if(!e||e._refCount<=0||0<--e._refCount)return void(n=null);const o=e._connection,i=n;n=null,o&&(!i||o===i)&&o.unsubscribe(),t.unsubscribe()});e.subscribe(r),r.closed||(n=e.connect())})}class kP extends fe{constructor(t,n){super(),this.source=t,this.subjectFactory=n,this._subject=null,this._refCount=0,this._connection=null,xf(t)&&(this.lift=t.lift)}_subscribe(t){return this.getSubject().subscribe(t)}getSubject(){const t=this._subject;return(!t||t.isStopped)&&(this._subject=this.subjectFactory()),this._subject}_teardown(){this._refCount=0;const{_connection:t}=this;this._subject=this._connection=null,null==t||t.unsubscribe()}connect(){let t=this._connection;if(!t){t=this._connection=new Et;const n=this.getSubject();t.add(this.source.subscribe(new Le(n,void 0,()=>{this._teardown(),n.complete()},r=>{this._teardown(),n.error(r)},()=>this._teardown()))),t.closed&&(this._connection=null,t=Et.EMPTY)}return t}refCount(){return av()(this)}}function wr(e,t){return ke((n,r)=>{let o=null,i=0,s=!1;const a=()=>s&&!o&&r.complete();n.subscribe(new Le(r,u=>{null==o||o.unsubscribe();let l=0;const c=i++;gn(e(u,c)).subscribe(o=new Le(r,d=>r.next(t?t(u,d,c,l++):d),()=>{o=null,a()}))},()=>{s=!0,a()}))})}function VP(e,t,n,r,o){return(i,s)=>{let a=n,u=t,l=0;i.subscribe(new Le(s,c=>{const d=l++;u=a?e(u,c,d):(a=!0,c),r&&s.next(u)},o&&(()=>{a&&s.next(u),s.complete()})))}}function uv(e,t){return ke(VP(e,t,arguments.length>=2,!0))}function Ao(e,t){return ke((n,r)=>{let o=0;n.subscribe(new Le(r,i=>e.call(t,i,o++)&&r.next(i)))})}function Qn(e){return ke((t,n)=>{let i,r=null,o=!1;r=t.subscribe(new Le(n,void 0,void 0,s=>{i=gn(e(s,Qn(e)(t))),r?(r.unsubscribe(),r=null,i.subscribe(n)):o=!0})),o&&(r.unsubscribe(),r=null,i.subscribe(n))})}function zi(e,t){return Y(t)?Re(e,t,1):Re(e,1)}function Kd(e){return e<=0?()=>yn:ke((t,n)=>{let r=[];t.subscribe(new Le(n,o=>{r.push(o),e<r.length&&r.shift()},()=>{for(const o of r)n.next(o);n.complete()},void 0,()=>{r=null}))})}function lv(e=jP){return ke((t,n)=>{let r=!1;t.subscribe(new Le(n,o=>{r=!0,n.next(o)},()=>r?n.complete():n.error(e())))})}function jP(){return new Wa}function cv(e){return ke((t,n)=>{let r=!1;t.subscribe(new Le(n,o=>{r=!0,n.next(o)},()=>{r||n.next(e),n.complete()}))})}function Ro(e,t){const n=arguments.length>=2;return r=>r.pipe(e?Ao((o,i)=>e(o,i,r)):Jn,ls(1),n?cv(t):lv(()=>new Wa))}function Ct(e,t,n){const r=Y(e)||t||n?{next:e,error:t,complete:n}:e;return r?ke((o,i)=>{var s;null===(s=r.subscribe)||void 0===s||s.call(r);let a=!0;o.subscribe(new Le(i,u=>{var l;null===(l=r.next)||void 0===l||l.call(r,u),i.next(u)},()=>{var u;a=!1,null===(u=r.complete)||void 0===u||u.call(r),i.complete()},u=>{var l;a=!1,null===(l=r.error)||void 0===l||l.call(r,u),i.error(u)},()=>{var u,l;a&&(null===(u=r.unsubscribe)||void 0===u||u.call(r)),null===(l=r.finalize)||void 0===l||l.call(r)}))}):Jn}class xn{constructor(t,n){this.id=t,this.url=n}}class Yd extends xn{constructor(t,n,r="imperative",o=null){super(t,n),this.navigationTrigger=r,this.restoredState=o}toString(){return`NavigationStart(id: ${this.id}, url: '${this.url}')`}}class Qi extends xn{constructor(t,n,r){super(t,n),this.urlAfterRedirects=r}toString(){return`NavigationEnd(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}')`}}class dv extends xn{constructor(t,n,r){super(t,n),this.reason=r}toString(){return`NavigationCancel(id: ${this.id}, url: '${this.url}')`}}class HP extends xn{constructor(t,n,r){super(t,n),this.error=r}toString(){return`NavigationError(id: ${this.id}, url: '${this.url}', error: ${this.error})`}}class $P extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`RoutesRecognized(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class qP extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`GuardsCheckStart(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class WP extends xn{constructor(t,n,r,o,i){super(t,n),this.urlAfterRedirects=r,this.state=o,this.shouldActivate=i}toString(){return`GuardsCheckEnd(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state}, shouldActivate: ${this.shouldActivate})`}}class GP extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`ResolveStart(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class zP extends xn{constructor(t,n,r,o){super(t,n),this.urlAfterRedirects=r,this.state=o}toString(){return`ResolveEnd(id: ${this.id}, url: '${this.url}', urlAfterRedirects: '${this.urlAfterRedirects}', state: ${this.state})`}}class fv{constructor(t){this.route=t}toString(){return`RouteConfigLoadStart(path: ${this.route.path})`}}class hv{constructor(t){this.route=t}toString(){return`RouteConfigLoadEnd(path: ${this.route.path})`}}class QP{constructor(t){this.snapshot=t}toString(){return`ChildActivationStart(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class KP{constructor(t){this.snapshot=t}toString(){return`ChildActivationEnd(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class YP{constructor(t){this.snapshot=t}toString(){return`ActivationStart(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class ZP{constructor(t){this.snapshot=t}toString(){return`ActivationEnd(path: '${this.snapshot.routeConfig&&this.snapshot.routeConfig.path||""}')`}}class pv{constructor(t,n,r){this.routerEvent=t,this.position=n,this.anchor=r}toString(){return`Scroll(anchor: '${this.anchor}', position: '${this.position?`${this.position[0]}, ${this.position[1]}`:null}')`}}const G="primary";class JP{constructor(t){this.params=t||{}}has(t){return Object.prototype.hasOwnProperty.call(this.params,t)}get(t){if(this.has(t)){const n=this.params[t];return Array.isArray(n)?n[0]:n}return null}getAll(t){if(this.has(t)){const n=this.params[t];return Array.isArray(n)?n:[n]}return[]}get keys(){return Object.keys(this.params)}}function xo(e){return new JP(e)}const gv="ngNavigationCancelingError";function Zd(e){const t=Error("NavigationCancelingError: "+e);return t[gv]=!0,t}function eF(e,t,n){const r=n.path.split("/");if(r.length>e.length||"full"===n.pathMatch&&(t.hasChildren()||r.length<e.length))return null;const o={};for(let i=0;i<r.length;i++){const s=r[i],a=e[i];if(s.startsWith(":"))o[s.substring(1)]=a;else if(s!==a.path)return null}return{consumed:e.slice(0,r.length),posParams:o}}function fn(e,t){const n=e?Object.keys(e):void 0,r=t?Object.keys(t):void 0;if(!n||!r||n.length!=r.length)return!1;let o;for(let i=0;i<n.length;i++)if(o=n[i],!mv(e[o],t[o]))return!1;return!0}function mv(e,t){if(Array.isArray(e)&&Array.isArray(t)){if(e.length!==t.length)return!1;const n=[...e].sort(),r=[...t].sort();return n.every((o,i)=>r[i]===o)}return e===t}function yv(e){return Array.prototype.concat.apply([],e)}function _v(e){return e.length>0?e[e.length-1]:null}function Be(e,t){for(const n in e)e.hasOwnProperty(n)&&t(e[n],n)}function hn(e){return ac(e)?e:Xs(e)?Ve(Promise.resolve(e)):H(e)}const rF={exact:function Cv(e,t,n){if(!Ir(e.segments,t.segments)||!Ga(e.segments,t.segments,n)||e.numberOfChildren!==t.numberOfChildren)return!1;for(const r in t.children)if(!e.children[r]||!Cv(e.children[r],t.children[r],n))return!1;return!0},subset:Ev},Dv={exact:function(e,t){return fn(e,t)},subset:function(e,t){return Object.keys(t).length<=Object.keys(e).length&&Object.keys(t).every(n=>mv(e[n],t[n]))},ignored:()=>!0};function vv(e,t,n){return rF[n.paths](e.root,t.root,n.matrixParams)&&Dv[n.queryParams](e.queryParams,t.queryParams)&&!("exact"===n.fragment&&e.fragment!==t.fragment)}function Ev(e,t,n){return wv(e,t,t.segments,n)}function wv(e,t,n,r){if(e.segments.length>n.length){const o=e.segments.slice(0,n.length);return!(!Ir(o,n)||t.hasChildren()||!Ga(o,n,r))}if(e.segments.length===n.length){if(!Ir(e.segments,n)||!Ga(e.segments,n,r))return!1;for(const o in t.children)if(!e.children[o]||!Ev(e.children[o],t.children[o],r))return!1;return!0}{const o=n.slice(0,e.segments.length),i=n.slice(e.segments.length);return!!(Ir(e.segments,o)&&Ga(e.segments,o,r)&&e.children[G])&&wv(e.children[G],t,i,r)}}function Ga(e,t,n){return t.every((r,o)=>Dv[n](e[o].parameters,r.parameters))}class br{constructor(t,n,r){this.root=t,this.queryParams=n,this.fragment=r}get queryParamMap(){return this._queryParamMap||(this._queryParamMap=xo(this.queryParams)),this._queryParamMap}toString(){return uF.serialize(this)}}class K{constructor(t,n){this.segments=t,this.children=n,this.parent=null,Be(n,(r,o)=>r.parent=this)}hasChildren(){return this.numberOfChildren>0}get numberOfChildren(){return Object.keys(this.children).length}toString(){return za(this)}}class Ki{constructor(t,n){this.path=t,this.parameters=n}get parameterMap(){return this._parameterMap||(this._parameterMap=xo(this.parameters)),this._parameterMap}toString(){return Mv(this)}}function Ir(e,t){return e.length===t.length&&e.every((n,r)=>n.path===t[r].path)}class bv{}class Iv{parse(t){const n=new yF(t);return new br(n.parseRootSegment(),n.parseQueryParams(),n.parseFragment())}serialize(t){const n=`/${Yi(t.root,!0)}`,r=function(e){const t=Object.keys(e).map(n=>{const r=e[n];return Array.isArray(r)?r.map(o=>`${Qa(n)}=${Qa(o)}`).join("&"):`${Qa(n)}=${Qa(r)}`}).filter(n=>!!n);return t.length?`?${t.join("&")}`:""}(t.queryParams);var e;return`${n}${r}${"string"==typeof t.fragment?`#${e=t.fragment,encodeURI(e)}`:""}`}}const uF=new Iv;function za(e){return e.segments.map(t=>Mv(t)).join("/")}function Yi(e,t){if(!e.hasChildren())return za(e);if(t){const n=e.children[G]?Yi(e.children[G],!1):"",r=[];return Be(e.children,(o,i)=>{i!==G&&r.push(`${i}:${Yi(o,!1)}`)}),r.length>0?`${n}(${r.join("//")})`:n}{const n=function(e,t){let n=[];return Be(e.children,(r,o)=>{o===G&&(n=n.concat(t(r,o)))}),Be(e.children,(r,o)=>{o!==G&&(n=n.concat(t(r,o)))}),n}(e,(r,o)=>o===G?[Yi(e.children[G],!1)]:[`${o}:${Yi(r,!1)}`]);return 1===Object.keys(e.children).length&&null!=e.children[G]?`${za(e)}/${n[0]}`:`${za(e)}/(${n.join("//")})`}}function Tv(e){return encodeURIComponent(e).replace(/%40/g,"@").replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",")}function Qa(e){return Tv(e).replace(/%3B/gi,";")}function Jd(e){return Tv(e).replace(/\(/g,"%28").replace(/\)/g,"%29").replace(/%26/gi,"&")}function Ka(e){return decodeURIComponent(e)}function Sv(e){return Ka(e.replace(/\+/g,"%20"))}function Mv(e){return`${Jd(e.path)}${function(e){return Object.keys(e).map(t=>`;${Jd(t)}=${Jd(e[t])}`).join("")}(e.parameters)}`}const fF=/^[^\/()?;=#]+/;function Ya(e){const t=e.match(fF);return t?t[0]:""}const hF=/^[^=?&#]+/,gF=/^[^&#]+/;class yF{constructor(t){this.url=t,this.remaining=t}parseRootSegment(){return this.consumeOptional("/"),""===this.remaining||this.peekStartsWith("?")||this.peekStartsWith("#")?new K([],{}):new K([],this.parseChildren())}parseQueryParams(){const t={};if(this.consumeOptional("?"))do{this.parseQueryParam(t)}while(this.consumeOptional("&"));return t}parseFragment(){return this.consumeOptional("#")?decodeURIComponent(this.remaining):null}parseChildren(){if(""===this.remaining)return{};this.consumeOptional("/");const t=[];for(this.peekStartsWith("(")||t.push(this.parseSegment());this.peekStartsWith("/")&&!this.peekStartsWith("//")&&!this.peekStartsWith("/(");)this.capture("/"),t.push(this.parseSegment());let n={};this.peekStartsWith("/(")&&(this.capture("/"),n=this.parseParens(!0));let r={};return this.peekStartsWith("(")&&(r=this.parseParens(!1)),(t.length>0||Object.keys(n).length>0)&&(r[G]=new K(t,n)),r}parseSegment(){const t=Ya(this.remaining);if(""===t&&this.peekStartsWith(";"))throw new Error(`Empty path url segment cannot have parameters: '${this.remaining}'.`);return this.capture(t),new Ki(Ka(t),this.parseMatrixParams())}parseMatrixParams(){const t={};for(;this.consumeOptional(";");)this.parseParam(t);return t}parseParam(t){const n=Ya(this.remaining);if(!n)return;this.capture(n);let r="";if(this.consumeOptional("=")){const o=Ya(this.remaining);o&&(r=o,this.capture(r))}t[Ka(n)]=Ka(r)}parseQueryParam(t){const n=function(e){const t=e.match(hF);return t?t[0]:""}(this.remaining);if(!n)return;this.capture(n);let r="";if(this.consumeOptional("=")){const s=function(e){const t=e.match(gF);return t?t[0]:""}(this.remaining);s&&(r=s,this.capture(r))}const o=Sv(n),i=Sv(r);if(t.hasOwnProperty(o)){let s=t[o];Array.isArray(s)||(s=[s],t[o]=s),s.push(i)}else t[o]=i}parseParens(t){const n={};for(this.capture("(");!this.consumeOptional(")")&&this.remaining.length>0;){const r=Ya(this.remaining),o=this.remaining[r.length];if("/"!==o&&")"!==o&&";"!==o)throw new Error(`Cannot parse url '${this.url}'`);let i;r.indexOf(":")>-1?(i=r.substr(0,r.indexOf(":")),this.capture(i),this.capture(":")):t&&(i=G);const s=this.parseChildren();n[i]=1===Object.keys(s).length?s[G]:new K([],s),this.consumeOptional("//")}return n}peekStartsWith(t){return this.remaining.startsWith(t)}consumeOptional(t){return!!this.peekStartsWith(t)&&(this.remaining=this.remaining.substring(t.length),!0)}capture(t){if(!this.consumeOptional(t))throw new Error(`Expected "${t}".`)}}class Av{constructor(t){this._root=t}get root(){return this._root.value}parent(t){const n=this.pathFromRoot(t);return n.length>1?n[n.length-2]:null}children(t){const n=Xd(t,this._root);return n?n.children.map(r=>r.value):[]}firstChild(t){const n=Xd(t,this._root);return n&&n.children.length>0?n.children[0].value:null}siblings(t){const n=ef(t,this._root);return n.length<2?[]:n[n.length-2].children.map(o=>o.value).filter(o=>o!==t)}pathFromRoot(t){return ef(t,this._root).map(n=>n.value)}}function Xd(e,t){if(e===t.value)return t;for(const n of t.children){const r=Xd(e,n);if(r)return r}return null}function ef(e,t){if(e===t.value)return[t];for(const n of t.children){const r=ef(e,n);if(r.length)return r.unshift(t),r}return[]}class Nn{constructor(t,n){this.value=t,this.children=n}toString(){return`TreeNode(${this.value})`}}function No(e){const t={};return e&&e.children.forEach(n=>t[n.value.outlet]=n),t}class Rv extends Av{constructor(t,n){super(t),this.snapshot=n,tf(this,t)}toString(){return this.snapshot.toString()}}function xv(e,t){const n=function(e,t){const s=new Za([],{},{},"",{},G,t,null,e.root,-1,{});return new Pv("",new Nn(s,[]))}(e,t),r=new Xt([new Ki("",{})]),o=new Xt({}),i=new Xt({}),s=new Xt({}),a=new Xt(""),u=new Po(r,o,s,a,i,G,t,n.root);return u.snapshot=n.root,new Rv(new Nn(u,[]),n)}class Po{constructor(t,n,r,o,i,s,a,u){this.url=t,this.params=n,this.queryParams=r,this.fragment=o,this.data=i,this.outlet=s,this.component=a,this._futureSnapshot=u}get routeConfig(){return this._futureSnapshot.routeConfig}get root(){return this._routerState.root}get parent(){return this._routerState.parent(this)}get firstChild(){return this._routerState.firstChild(this)}get children(){return this._routerState.children(this)}get pathFromRoot(){return this._routerState.pathFromRoot(this)}get paramMap(){return this._paramMap||(this._paramMap=this.params.pipe(ae(t=>xo(t)))),this._paramMap}get queryParamMap(){return this._queryParamMap||(this._queryParamMap=this.queryParams.pipe(ae(t=>xo(t)))),this._queryParamMap}toString(){return this.snapshot?this.snapshot.toString():`Future(${this._futureSnapshot})`}}function Nv(e,t="emptyOnly"){const n=e.pathFromRoot;let r=0;if("always"!==t)for(r=n.length-1;r>=1;){const o=n[r],i=n[r-1];if(o.routeConfig&&""===o.routeConfig.path)r--;else{if(i.component)break;r--}}return function(e){return e.reduce((t,n)=>({params:P(P({},t.params),n.params),data:P(P({},t.data),n.data),resolve:P(P({},t.resolve),n._resolvedData)}),{params:{},data:{},resolve:{}})}(n.slice(r))}class Za{constructor(t,n,r,o,i,s,a,u,l,c,d){this.url=t,this.params=n,this.queryParams=r,this.fragment=o,this.data=i,this.outlet=s,this.component=a,this.routeConfig=u,this._urlSegment=l,this._lastPathIndex=c,this._resolve=d}get root(){return this._routerState.root}get parent(){return this._routerState.parent(this)}get firstChild(){return this._routerState.firstChild(this)}get children(){return this._routerState.children(this)}get pathFromRoot(){return this._routerState.pathFromRoot(this)}get paramMap(){return this._paramMap||(this._paramMap=xo(this.params)),this._paramMap}get queryParamMap(){return this._queryParamMap||(this._queryParamMap=xo(this.queryParams)),this._queryParamMap}toString(){return`Route(url:'${this.url.map(r=>r.toString()).join("/")}', path:'${this.routeConfig?this.routeConfig.path:""}')`}}class Pv extends Av{constructor(t,n){super(n),this.url=t,tf(this,n)}toString(){return Fv(this._root)}}function tf(e,t){t.value._routerState=e,t.children.forEach(n=>tf(e,n))}function Fv(e){const t=e.children.length>0?` { ${e.children.map(Fv).join(", ")} } `:"";return`${e.value}${t}`}function nf(e){if(e.snapshot){const t=e.snapshot,n=e._futureSnapshot;e.snapshot=n,fn(t.queryParams,n.queryParams)||e.queryParams.next(n.queryParams),t.fragment!==n.fragment&&e.fragment.next(n.fragment),fn(t.params,n.params)||e.params.next(n.params),function(e,t){if(e.length!==t.length)return!1;for(let n=0;n<e.length;++n)if(!fn(e[n],t[n]))return!1;return!0}(t.url,n.url)||e.url.next(n.url),fn(t.data,n.data)||e.data.next(n.data)}else e.snapshot=e._futureSnapshot,e.data.next(e._futureSnapshot.data)}function rf(e,t){const n=fn(e.params,t.params)&&function(e,t){return Ir(e,t)&&e.every((n,r)=>fn(n.parameters,t[r].parameters))}(e.url,t.url);return n&&!(!e.parent!=!t.parent)&&(!e.parent||rf(e.parent,t.parent))}function Zi(e,t,n){if(n&&e.shouldReuseRoute(t.value,n.value.snapshot)){const r=n.value;r._futureSnapshot=t.value;const o=function(e,t,n){return t.children.map(r=>{for(const o of n.children)if(e.shouldReuseRoute(r.value,o.value.snapshot))return Zi(e,r,o);return Zi(e,r)})}(e,t,n);return new Nn(r,o)}{if(e.shouldAttach(t.value)){const i=e.retrieve(t.value);if(null!==i){const s=i.route;return s.value._futureSnapshot=t.value,s.children=t.children.map(a=>Zi(e,a)),s}}const r=function(e){return new Po(new Xt(e.url),new Xt(e.params),new Xt(e.queryParams),new Xt(e.fragment),new Xt(e.data),e.outlet,e.component,e)}(t.value),o=t.children.map(i=>Zi(e,i));return new Nn(r,o)}}function Ja(e){return"object"==typeof e&&null!=e&&!e.outlets&&!e.segmentPath}function Ji(e){return"object"==typeof e&&null!=e&&e.outlets}function of(e,t,n,r,o){let i={};return r&&Be(r,(s,a)=>{i[a]=Array.isArray(s)?s.map(u=>`${u}`):`${s}`}),new br(n.root===e?t:Ov(n.root,e,t),i,o)}function Ov(e,t,n){const r={};return Be(e.children,(o,i)=>{r[i]=o===t?n:Ov(o,t,n)}),new K(e.segments,r)}class kv{constructor(t,n,r){if(this.isAbsolute=t,this.numberOfDoubleDots=n,this.commands=r,t&&r.length>0&&Ja(r[0]))throw new Error("Root segment cannot have matrix parameters");const o=r.find(Ji);if(o&&o!==_v(r))throw new Error("{outlets:{}} has to be the last command")}toRoot(){return this.isAbsolute&&1===this.commands.length&&"/"==this.commands[0]}}class sf{constructor(t,n,r){this.segmentGroup=t,this.processChildren=n,this.index=r}}function Lv(e,t,n){if(e||(e=new K([],{})),0===e.segments.length&&e.hasChildren())return Xa(e,t,n);const r=function(e,t,n){let r=0,o=t;const i={match:!1,pathIndex:0,commandIndex:0};for(;o<e.segments.length;){if(r>=n.length)return i;const s=e.segments[o],a=n[r];if(Ji(a))break;const u=`${a}`,l=r<n.length-1?n[r+1]:null;if(o>0&&void 0===u)break;if(u&&l&&"object"==typeof l&&void 0===l.outlets){if(!jv(u,l,s))return i;r+=2}else{if(!jv(u,{},s))return i;r++}o++}return{match:!0,pathIndex:o,commandIndex:r}}(e,t,n),o=n.slice(r.commandIndex);if(r.match&&r.pathIndex<e.segments.length){const i=new K(e.segments.slice(0,r.pathIndex),{});return i.children[G]=new K(e.segments.slice(r.pathIndex),e.children),Xa(i,0,o)}return r.match&&0===o.length?new K(e.segments,{}):r.match&&!e.hasChildren()?af(e,t,n):r.match?Xa(e,0,o):af(e,t,n)}function Xa(e,t,n){if(0===n.length)return new K(e.segments,{});{const r=function(e){return Ji(e[0])?e[0].outlets:{[G]:e}}(n),o={};return Be(r,(i,s)=>{"string"==typeof i&&(i=[i]),null!==i&&(o[s]=Lv(e.children[s],t,i))}),Be(e.children,(i,s)=>{void 0===r[s]&&(o[s]=i)}),new K(e.segments,o)}}function af(e,t,n){const r=e.segments.slice(0,t);let o=0;for(;o<n.length;){const i=n[o];if(Ji(i)){const u=AF(i.outlets);return new K(r,u)}if(0===o&&Ja(n[0])){r.push(new Ki(e.segments[t].path,Vv(n[0]))),o++;continue}const s=Ji(i)?i.outlets[G]:`${i}`,a=o<n.length-1?n[o+1]:null;s&&a&&Ja(a)?(r.push(new Ki(s,Vv(a))),o+=2):(r.push(new Ki(s,{})),o++)}return new K(r,{})}function AF(e){const t={};return Be(e,(n,r)=>{"string"==typeof n&&(n=[n]),null!==n&&(t[r]=af(new K([],{}),0,n))}),t}function Vv(e){const t={};return Be(e,(n,r)=>t[r]=`${n}`),t}function jv(e,t,n){return e==n.path&&fn(t,n.parameters)}class xF{constructor(t,n,r,o){this.routeReuseStrategy=t,this.futureState=n,this.currState=r,this.forwardEvent=o}activate(t){const n=this.futureState._root,r=this.currState?this.currState._root:null;this.deactivateChildRoutes(n,r,t),nf(this.futureState.root),this.activateChildRoutes(n,r,t)}deactivateChildRoutes(t,n,r){const o=No(n);t.children.forEach(i=>{const s=i.value.outlet;this.deactivateRoutes(i,o[s],r),delete o[s]}),Be(o,(i,s)=>{this.deactivateRouteAndItsChildren(i,r)})}deactivateRoutes(t,n,r){const o=t.value,i=n?n.value:null;if(o===i)if(o.component){const s=r.getContext(o.outlet);s&&this.deactivateChildRoutes(t,n,s.children)}else this.deactivateChildRoutes(t,n,r);else i&&this.deactivateRouteAndItsChildren(n,r)}deactivateRouteAndItsChildren(t,n){this.routeReuseStrategy.shouldDetach(t.value.snapshot)?this.detachAndStoreRouteSubtree(t,n):this.deactivateRouteAndOutlet(t,n)}detachAndStoreRouteSubtree(t,n){const r=n.getContext(t.value.outlet),o=r&&t.value.component?r.children:n,i=No(t);for(const s of Object.keys(i))this.deactivateRouteAndItsChildren(i[s],o);if(r&&r.outlet){const s=r.outlet.detach(),a=r.children.onOutletDeactivated();this.routeReuseStrategy.store(t.value.snapshot,{componentRef:s,route:t,contexts:a})}}deactivateRouteAndOutlet(t,n){const r=n.getContext(t.value.outlet),o=r&&t.value.component?r.children:n,i=No(t);for(const s of Object.keys(i))this.deactivateRouteAndItsChildren(i[s],o);r&&r.outlet&&(r.outlet.deactivate(),r.children.onOutletDeactivated(),r.attachRef=null,r.resolver=null,r.route=null)}activateChildRoutes(t,n,r){const o=No(n);t.children.forEach(i=>{this.activateRoutes(i,o[i.value.outlet],r),this.forwardEvent(new ZP(i.value.snapshot))}),t.children.length&&this.forwardEvent(new KP(t.value.snapshot))}activateRoutes(t,n,r){const o=t.value,i=n?n.value:null;if(nf(o),o===i)if(o.component){const s=r.getOrCreateContext(o.outlet);this.activateChildRoutes(t,n,s.children)}else this.activateChildRoutes(t,n,r);else if(o.component){const s=r.getOrCreateContext(o.outlet);if(this.routeReuseStrategy.shouldAttach(o.snapshot)){const a=this.routeReuseStrategy.retrieve(o.snapshot);this.routeReuseStrategy.store(o.snapshot,null),s.children.onOutletReAttached(a.contexts),s.attachRef=a.componentRef,s.route=a.route.value,s.outlet&&s.outlet.attach(a.componentRef,a.route.value),nf(a.route.value),this.activateChildRoutes(t,null,s.children)}else{const a=function(e){for(let t=e.parent;t;t=t.parent){const n=t.routeConfig;if(n&&n._loadedConfig)return n._loadedConfig;if(n&&n.component)return null}return null}(o.snapshot),u=a?a.module.componentFactoryResolver:null;s.attachRef=null,s.route=o,s.resolver=u,s.outlet&&s.outlet.activateWith(o,u),this.activateChildRoutes(t,null,s.children)}}else this.activateChildRoutes(t,null,r)}}class uf{constructor(t,n){this.routes=t,this.module=n}}function Kn(e){return"function"==typeof e}function Tr(e){return e instanceof br}const Xi=Symbol("INITIAL_VALUE");function es(){return wr(e=>PP(e.map(t=>t.pipe(ls(1),function(...e){const t=Bo(e);return ke((n,r)=>{(t?Qd(e,n,t):Qd(e,n)).subscribe(r)})}(Xi)))).pipe(uv((t,n)=>{let r=!1;return n.reduce((o,i,s)=>o!==Xi?o:(i===Xi&&(r=!0),r||!1!==i&&s!==n.length-1&&!Tr(i)?o:i),t)},Xi),Ao(t=>t!==Xi),ae(t=>Tr(t)?t:!0===t),ls(1)))}class VF{constructor(){this.outlet=null,this.route=null,this.resolver=null,this.children=new ts,this.attachRef=null}}class ts{constructor(){this.contexts=new Map}onChildOutletCreated(t,n){const r=this.getOrCreateContext(t);r.outlet=n,this.contexts.set(t,r)}onChildOutletDestroyed(t){const n=this.getContext(t);n&&(n.outlet=null,n.attachRef=null)}onOutletDeactivated(){const t=this.contexts;return this.contexts=new Map,t}onOutletReAttached(t){this.contexts=t}getOrCreateContext(t){let n=this.getContext(t);return n||(n=new VF,this.contexts.set(t,n)),n}getContext(t){return this.contexts.get(t)||null}}let lf=(()=>{class e{constructor(n,r,o,i,s){this.parentContexts=n,this.location=r,this.resolver=o,this.changeDetector=s,this.activated=null,this._activatedRoute=null,this.activateEvents=new tt,this.deactivateEvents=new tt,this.attachEvents=new tt,this.detachEvents=new tt,this.name=i||G,n.onChildOutletCreated(this.name,this)}ngOnDestroy(){this.parentContexts.onChildOutletDestroyed(this.name)}ngOnInit(){if(!this.activated){const n=this.parentContexts.getContext(this.name);n&&n.route&&(n.attachRef?this.attach(n.attachRef,n.route):this.activateWith(n.route,n.resolver||null))}}get isActivated(){return!!this.activated}get component(){if(!this.activated)throw new Error("Outlet is not activated");return this.activated.instance}get activatedRoute(){if(!this.activated)throw new Error("Outlet is not activated");return this._activatedRoute}get activatedRouteData(){return this._activatedRoute?this._activatedRoute.snapshot.data:{}}detach(){if(!this.activated)throw new Error("Outlet is not activated");this.location.detach();const n=this.activated;return this.activated=null,this._activatedRoute=null,this.detachEvents.emit(n.instance),n}attach(n,r){this.activated=n,this._activatedRoute=r,this.location.insert(n.hostView),this.attachEvents.emit(n.instance)}deactivate(){if(this.activated){const n=this.component;this.activated.destroy(),this.activated=null,this._activatedRoute=null,this.deactivateEvents.emit(n)}}activateWith(n,r){if(this.isActivated)throw new Error("Cannot activate an already activated outlet");this._activatedRoute=n;const s=(r=r||this.resolver).resolveComponentFactory(n._futureSnapshot.routeConfig.component),a=this.parentContexts.getOrCreateContext(this.name).children,u=new jF(n,a,this.location.injector);this.activated=this.location.createComponent(s,this.location.length,u),this.changeDetector.markForCheck(),this.activateEvents.emit(this.activated.instance)}}return e.\u0275fac=function(n){return new(n||e)(S(ts),S(Wt),S(yr),function(e){return function(e,t){if("class"===t)return e.classes;if("style"===t)return e.styles;const n=e.attrs;if(n){const r=n.length;let o=0;for(;o<r;){const i=n[o];if(Ih(i))break;if(0===i)o+=2;else if("number"==typeof i)for(o++;o<r&&"string"==typeof n[o];)o++;else{if(i===t)return n[o+1];o+=2}}}return null}(Ee(),e)}("name"),S(Kc))},e.\u0275dir=Ue({type:e,selectors:[["router-outlet"]],outputs:{activateEvents:"activate",deactivateEvents:"deactivate",attachEvents:"attach",detachEvents:"detach"},exportAs:["outlet"]}),e})();class jF{constructor(t,n,r){this.route=t,this.childContexts=n,this.parent=r}get(t,n){return t===Po?this.route:t===ts?this.childContexts:this.parent.get(t,n)}}let Bv=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275cmp=Ar({type:e,selectors:[["ng-component"]],decls:1,vars:0,template:function(n,r){1&n&&Ne(0,"router-outlet")},directives:[lf],encapsulation:2}),e})();function Uv(e,t=""){for(let n=0;n<e.length;n++){const r=e[n];BF(r,UF(t,r))}}function BF(e,t){e.children&&Uv(e.children,t)}function UF(e,t){return t?e||t.path?e&&!t.path?`${e}/`:!e&&t.path?t.path:`${e}/${t.path}`:"":e}function cf(e){const t=e.children&&e.children.map(cf),n=t?lt(P({},e),{children:t}):P({},e);return!n.component&&(t||n.loadChildren)&&n.outlet&&n.outlet!==G&&(n.component=Bv),n}function Ft(e){return e.outlet||G}function Hv(e,t){const n=e.filter(r=>Ft(r)===t);return n.push(...e.filter(r=>Ft(r)!==t)),n}const $v={matched:!1,consumedSegments:[],lastChild:0,parameters:{},positionalParamSegments:{}};function eu(e,t,n){var a;if(""===t.path)return"full"===t.pathMatch&&(e.hasChildren()||n.length>0)?P({},$v):{matched:!0,consumedSegments:[],lastChild:0,parameters:{},positionalParamSegments:{}};const o=(t.matcher||eF)(n,e,t);if(!o)return P({},$v);const i={};Be(o.posParams,(u,l)=>{i[l]=u.path});const s=o.consumed.length>0?P(P({},i),o.consumed[o.consumed.length-1].parameters):i;return{matched:!0,consumedSegments:o.consumed,lastChild:o.consumed.length,parameters:s,positionalParamSegments:null!=(a=o.posParams)?a:{}}}function tu(e,t,n,r,o="corrected"){if(n.length>0&&function(e,t,n){return n.some(r=>nu(e,t,r)&&Ft(r)!==G)}(e,n,r)){const s=new K(t,function(e,t,n,r){const o={};o[G]=r,r._sourceSegment=e,r._segmentIndexShift=t.length;for(const i of n)if(""===i.path&&Ft(i)!==G){const s=new K([],{});s._sourceSegment=e,s._segmentIndexShift=t.length,o[Ft(i)]=s}return o}(e,t,r,new K(n,e.children)));return s._sourceSegment=e,s._segmentIndexShift=t.length,{segmentGroup:s,slicedSegments:[]}}if(0===n.length&&function(e,t,n){return n.some(r=>nu(e,t,r))}(e,n,r)){const s=new K(e.segments,function(e,t,n,r,o,i){const s={};for(const a of r)if(nu(e,n,a)&&!o[Ft(a)]){const u=new K([],{});u._sourceSegment=e,u._segmentIndexShift="legacy"===i?e.segments.length:t.length,s[Ft(a)]=u}return P(P({},o),s)}(e,t,n,r,e.children,o));return s._sourceSegment=e,s._segmentIndexShift=t.length,{segmentGroup:s,slicedSegments:n}}const i=new K(e.segments,e.children);return i._sourceSegment=e,i._segmentIndexShift=t.length,{segmentGroup:i,slicedSegments:n}}function nu(e,t,n){return(!(e.hasChildren()||t.length>0)||"full"!==n.pathMatch)&&""===n.path}function qv(e,t,n,r){return!!(Ft(e)===r||r!==G&&nu(t,n,e))&&("**"===e.path||eu(t,e,n).matched)}function Wv(e,t,n){return 0===t.length&&!e.children[n]}class ns{constructor(t){this.segmentGroup=t||null}}class Gv{constructor(t){this.urlTree=t}}function ru(e){return new fe(t=>t.error(new ns(e)))}function zv(e){return new fe(t=>t.error(new Gv(e)))}function GF(e){return new fe(t=>t.error(new Error(`Only absolute redirects can have named outlets. redirectTo: '${e}'`)))}class KF{constructor(t,n,r,o,i){this.configLoader=n,this.urlSerializer=r,this.urlTree=o,this.config=i,this.allowRedirects=!0,this.ngModule=t.get(dn)}apply(){const t=tu(this.urlTree.root,[],[],this.config).segmentGroup,n=new K(t.segments,t.children);return this.expandSegmentGroup(this.ngModule,this.config,n,G).pipe(ae(i=>this.createUrlTree(df(i),this.urlTree.queryParams,this.urlTree.fragment))).pipe(Qn(i=>{if(i instanceof Gv)return this.allowRedirects=!1,this.match(i.urlTree);throw i instanceof ns?this.noMatchError(i):i}))}match(t){return this.expandSegmentGroup(this.ngModule,this.config,t.root,G).pipe(ae(o=>this.createUrlTree(df(o),t.queryParams,t.fragment))).pipe(Qn(o=>{throw o instanceof ns?this.noMatchError(o):o}))}noMatchError(t){return new Error(`Cannot match any routes. URL Segment: '${t.segmentGroup}'`)}createUrlTree(t,n,r){const o=t.segments.length>0?new K([],{[G]:t}):t;return new br(o,n,r)}expandSegmentGroup(t,n,r,o){return 0===r.segments.length&&r.hasChildren()?this.expandChildren(t,n,r).pipe(ae(i=>new K([],i))):this.expandSegment(t,r,n,r.segments,o,!0)}expandChildren(t,n,r){const o=[];for(const i of Object.keys(r.children))"primary"===i?o.unshift(i):o.push(i);return Ve(o).pipe(zi(i=>{const s=r.children[i],a=Hv(n,i);return this.expandSegmentGroup(t,a,s,i).pipe(ae(u=>({segment:u,outlet:i})))}),uv((i,s)=>(i[s.outlet]=s.segment,i),{}),function(e,t){const n=arguments.length>=2;return r=>r.pipe(e?Ao((o,i)=>e(o,i,r)):Jn,Kd(1),n?cv(t):lv(()=>new Wa))}())}expandSegment(t,n,r,o,i,s){return Ve(r).pipe(zi(a=>this.expandSegmentAgainstRoute(t,n,r,a,o,i,s).pipe(Qn(l=>{if(l instanceof ns)return H(null);throw l}))),Ro(a=>!!a),Qn((a,u)=>{if(a instanceof Wa||"EmptyError"===a.name){if(Wv(n,o,i))return H(new K([],{}));throw new ns(n)}throw a}))}expandSegmentAgainstRoute(t,n,r,o,i,s,a){return qv(o,n,i,s)?void 0===o.redirectTo?this.matchSegmentAgainstRoute(t,n,o,i,s):a&&this.allowRedirects?this.expandSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s):ru(n):ru(n)}expandSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s){return"**"===o.path?this.expandWildCardWithParamsAgainstRouteUsingRedirect(t,r,o,s):this.expandRegularSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s)}expandWildCardWithParamsAgainstRouteUsingRedirect(t,n,r,o){const i=this.applyRedirectCommands([],r.redirectTo,{});return r.redirectTo.startsWith("/")?zv(i):this.lineralizeSegments(r,i).pipe(Re(s=>{const a=new K(s,{});return this.expandSegment(t,a,n,s,o,!1)}))}expandRegularSegmentAgainstRouteUsingRedirect(t,n,r,o,i,s){const{matched:a,consumedSegments:u,lastChild:l,positionalParamSegments:c}=eu(n,o,i);if(!a)return ru(n);const d=this.applyRedirectCommands(u,o.redirectTo,c);return o.redirectTo.startsWith("/")?zv(d):this.lineralizeSegments(o,d).pipe(Re(f=>this.expandSegment(t,n,r,f.concat(i.slice(l)),s,!1)))}matchSegmentAgainstRoute(t,n,r,o,i){if("**"===r.path)return r.loadChildren?(r._loadedConfig?H(r._loadedConfig):this.configLoader.load(t.injector,r)).pipe(ae(f=>(r._loadedConfig=f,new K(o,{})))):H(new K(o,{}));const{matched:s,consumedSegments:a,lastChild:u}=eu(n,r,o);if(!s)return ru(n);const l=o.slice(u);return this.getChildConfig(t,r,o).pipe(Re(d=>{const f=d.module,h=d.routes,{segmentGroup:m,slicedSegments:_}=tu(n,a,l,h),y=new K(m.segments,m.children);if(0===_.length&&y.hasChildren())return this.expandChildren(f,h,y).pipe(ae(T=>new K(a,T)));if(0===h.length&&0===_.length)return H(new K(a,{}));const v=Ft(r)===i;return this.expandSegment(f,y,h,_,v?G:i,!0).pipe(ae(I=>new K(a.concat(I.segments),I.children)))}))}getChildConfig(t,n,r){return n.children?H(new uf(n.children,t)):n.loadChildren?void 0!==n._loadedConfig?H(n._loadedConfig):this.runCanLoadGuards(t.injector,n,r).pipe(Re(o=>{return o?this.configLoader.load(t.injector,n).pipe(ae(i=>(n._loadedConfig=i,i))):(e=n,new fe(t=>t.error(Zd(`Cannot load children because the guard of the route "path: '${e.path}'" returned false`))));var e})):H(new uf([],t))}runCanLoadGuards(t,n,r){const o=n.canLoad;return o&&0!==o.length?H(o.map(s=>{const a=t.get(s);let u;if((e=a)&&Kn(e.canLoad))u=a.canLoad(n,r);else{if(!Kn(a))throw new Error("Invalid CanLoad guard");u=a(n,r)}var e;return hn(u)})).pipe(es(),Ct(s=>{if(!Tr(s))return;const a=Zd(`Redirecting to "${this.urlSerializer.serialize(s)}"`);throw a.url=s,a}),ae(s=>!0===s)):H(!0)}lineralizeSegments(t,n){let r=[],o=n.root;for(;;){if(r=r.concat(o.segments),0===o.numberOfChildren)return H(r);if(o.numberOfChildren>1||!o.children[G])return GF(t.redirectTo);o=o.children[G]}}applyRedirectCommands(t,n,r){return this.applyRedirectCreatreUrlTree(n,this.urlSerializer.parse(n),t,r)}applyRedirectCreatreUrlTree(t,n,r,o){const i=this.createSegmentGroup(t,n.root,r,o);return new br(i,this.createQueryParams(n.queryParams,this.urlTree.queryParams),n.fragment)}createQueryParams(t,n){const r={};return Be(t,(o,i)=>{if("string"==typeof o&&o.startsWith(":")){const a=o.substring(1);r[i]=n[a]}else r[i]=o}),r}createSegmentGroup(t,n,r,o){const i=this.createSegments(t,n.segments,r,o);let s={};return Be(n.children,(a,u)=>{s[u]=this.createSegmentGroup(t,a,r,o)}),new K(i,s)}createSegments(t,n,r,o){return n.map(i=>i.path.startsWith(":")?this.findPosParam(t,i,o):this.findOrReturn(i,r))}findPosParam(t,n,r){const o=r[n.path.substring(1)];if(!o)throw new Error(`Cannot redirect to '${t}'. Cannot find '${n.path}'.`);return o}findOrReturn(t,n){let r=0;for(const o of n){if(o.path===t.path)return n.splice(r),o;r++}return t}}function df(e){const t={};for(const r of Object.keys(e.children)){const i=df(e.children[r]);(i.segments.length>0||i.hasChildren())&&(t[r]=i)}return function(e){if(1===e.numberOfChildren&&e.children[G]){const t=e.children[G];return new K(e.segments.concat(t.segments),t.children)}return e}(new K(e.segments,t))}class Qv{constructor(t){this.path=t,this.route=this.path[this.path.length-1]}}class ou{constructor(t,n){this.component=t,this.route=n}}function JF(e,t,n){const r=e._root;return rs(r,t?t._root:null,n,[r.value])}function iu(e,t,n){const r=function(e){if(!e)return null;for(let t=e.parent;t;t=t.parent){const n=t.routeConfig;if(n&&n._loadedConfig)return n._loadedConfig}return null}(t);return(r?r.module.injector:n).get(e)}function rs(e,t,n,r,o={canDeactivateChecks:[],canActivateChecks:[]}){const i=No(t);return e.children.forEach(s=>{(function(e,t,n,r,o={canDeactivateChecks:[],canActivateChecks:[]}){const i=e.value,s=t?t.value:null,a=n?n.getContext(e.value.outlet):null;if(s&&i.routeConfig===s.routeConfig){const u=function(e,t,n){if("function"==typeof n)return n(e,t);switch(n){case"pathParamsChange":return!Ir(e.url,t.url);case"pathParamsOrQueryParamsChange":return!Ir(e.url,t.url)||!fn(e.queryParams,t.queryParams);case"always":return!0;case"paramsOrQueryParamsChange":return!rf(e,t)||!fn(e.queryParams,t.queryParams);default:return!rf(e,t)}}(s,i,i.routeConfig.runGuardsAndResolvers);u?o.canActivateChecks.push(new Qv(r)):(i.data=s.data,i._resolvedData=s._resolvedData),rs(e,t,i.component?a?a.children:null:n,r,o),u&&a&&a.outlet&&a.outlet.isActivated&&o.canDeactivateChecks.push(new ou(a.outlet.component,s))}else s&&os(t,a,o),o.canActivateChecks.push(new Qv(r)),rs(e,null,i.component?a?a.children:null:n,r,o)})(s,i[s.value.outlet],n,r.concat([s.value]),o),delete i[s.value.outlet]}),Be(i,(s,a)=>os(s,n.getContext(a),o)),o}function os(e,t,n){const r=No(e),o=e.value;Be(r,(i,s)=>{os(i,o.component?t?t.children.getContext(s):null:t,n)}),n.canDeactivateChecks.push(new ou(o.component&&t&&t.outlet&&t.outlet.isActivated?t.outlet.component:null,o))}class dO{}function Kv(e){return new fe(t=>t.error(e))}class hO{constructor(t,n,r,o,i,s){this.rootComponentType=t,this.config=n,this.urlTree=r,this.url=o,this.paramsInheritanceStrategy=i,this.relativeLinkResolution=s}recognize(){const t=tu(this.urlTree.root,[],[],this.config.filter(s=>void 0===s.redirectTo),this.relativeLinkResolution).segmentGroup,n=this.processSegmentGroup(this.config,t,G);if(null===n)return null;const r=new Za([],Object.freeze({}),Object.freeze(P({},this.urlTree.queryParams)),this.urlTree.fragment,{},G,this.rootComponentType,null,this.urlTree.root,-1,{}),o=new Nn(r,n),i=new Pv(this.url,o);return this.inheritParamsAndData(i._root),i}inheritParamsAndData(t){const n=t.value,r=Nv(n,this.paramsInheritanceStrategy);n.params=Object.freeze(r.params),n.data=Object.freeze(r.data),t.children.forEach(o=>this.inheritParamsAndData(o))}processSegmentGroup(t,n,r){return 0===n.segments.length&&n.hasChildren()?this.processChildren(t,n):this.processSegment(t,n,n.segments,r)}processChildren(t,n){const r=[];for(const i of Object.keys(n.children)){const s=n.children[i],a=Hv(t,i),u=this.processSegmentGroup(a,s,i);if(null===u)return null;r.push(...u)}const o=Yv(r);return o.sort((t,n)=>t.value.outlet===G?-1:n.value.outlet===G?1:t.value.outlet.localeCompare(n.value.outlet)),o}processSegment(t,n,r,o){for(const i of t){const s=this.processSegmentAgainstRoute(i,n,r,o);if(null!==s)return s}return Wv(n,r,o)?[]:null}processSegmentAgainstRoute(t,n,r,o){if(t.redirectTo||!qv(t,n,r,o))return null;let i,s=[],a=[];if("**"===t.path){const h=r.length>0?_v(r).parameters:{};i=new Za(r,h,Object.freeze(P({},this.urlTree.queryParams)),this.urlTree.fragment,Xv(t),Ft(t),t.component,t,Zv(n),Jv(n)+r.length,eC(t))}else{const h=eu(n,t,r);if(!h.matched)return null;s=h.consumedSegments,a=r.slice(h.lastChild),i=new Za(s,h.parameters,Object.freeze(P({},this.urlTree.queryParams)),this.urlTree.fragment,Xv(t),Ft(t),t.component,t,Zv(n),Jv(n)+s.length,eC(t))}const u=(e=t).children?e.children:e.loadChildren?e._loadedConfig.routes:[],{segmentGroup:l,slicedSegments:c}=tu(n,s,a,u.filter(h=>void 0===h.redirectTo),this.relativeLinkResolution);var e;if(0===c.length&&l.hasChildren()){const h=this.processChildren(u,l);return null===h?null:[new Nn(i,h)]}if(0===u.length&&0===c.length)return[new Nn(i,[])];const d=Ft(t)===o,f=this.processSegment(u,l,c,d?G:o);return null===f?null:[new Nn(i,f)]}}function mO(e){const t=e.value.routeConfig;return t&&""===t.path&&void 0===t.redirectTo}function Yv(e){const t=[],n=new Set;for(const r of e){if(!mO(r)){t.push(r);continue}const o=t.find(i=>r.value.routeConfig===i.value.routeConfig);void 0!==o?(o.children.push(...r.children),n.add(o)):t.push(r)}for(const r of n){const o=Yv(r.children);t.push(new Nn(r.value,o))}return t.filter(r=>!n.has(r))}function Zv(e){let t=e;for(;t._sourceSegment;)t=t._sourceSegment;return t}function Jv(e){let t=e,n=t._segmentIndexShift?t._segmentIndexShift:0;for(;t._sourceSegment;)t=t._sourceSegment,n+=t._segmentIndexShift?t._segmentIndexShift:0;return n-1}function Xv(e){return e.data||{}}function eC(e){return e.resolve||{}}function ff(e){return wr(t=>{const n=e(t);return n?Ve(n).pipe(ae(()=>t)):H(t)})}class bO extends class{shouldDetach(t){return!1}store(t,n){}shouldAttach(t){return!1}retrieve(t){return null}shouldReuseRoute(t,n){return t.routeConfig===n.routeConfig}}{}const hf=new J("ROUTES");class tC{constructor(t,n,r,o){this.injector=t,this.compiler=n,this.onLoadStartListener=r,this.onLoadEndListener=o}load(t,n){if(n._loader$)return n._loader$;this.onLoadStartListener&&this.onLoadStartListener(n);const o=this.loadModuleFactory(n.loadChildren).pipe(ae(i=>{this.onLoadEndListener&&this.onLoadEndListener(n);const s=i.create(t);return new uf(yv(s.injector.get(hf,void 0,R.Self|R.Optional)).map(cf),s)}),Qn(i=>{throw n._loader$=void 0,i}));return n._loader$=new kP(o,()=>new pn).pipe(av()),n._loader$}loadModuleFactory(t){return hn(t()).pipe(Re(n=>n instanceof ky?H(n):Ve(this.compiler.compileModuleAsync(n))))}}class TO{shouldProcessUrl(t){return!0}extract(t){return t}merge(t,n){return t}}function SO(e){throw e}function MO(e,t,n){return t.parse("/")}function nC(e,t){return H(null)}const AO={paths:"exact",fragment:"ignored",matrixParams:"ignored",queryParams:"exact"},RO={paths:"subset",fragment:"ignored",matrixParams:"ignored",queryParams:"subset"};let ot=(()=>{class e{constructor(n,r,o,i,s,a,u){this.rootComponentType=n,this.urlSerializer=r,this.rootContexts=o,this.location=i,this.config=u,this.lastSuccessfulNavigation=null,this.currentNavigation=null,this.disposed=!1,this.navigationId=0,this.currentPageId=0,this.isNgZoneEnabled=!1,this.events=new pn,this.errorHandler=SO,this.malformedUriErrorHandler=MO,this.navigated=!1,this.lastSuccessfulId=-1,this.hooks={beforePreactivation:nC,afterPreactivation:nC},this.urlHandlingStrategy=new TO,this.routeReuseStrategy=new bO,this.onSameUrlNavigation="ignore",this.paramsInheritanceStrategy="emptyOnly",this.urlUpdateStrategy="deferred",this.relativeLinkResolution="corrected",this.canceledNavigationResolution="replace",this.ngModule=s.get(dn),this.console=s.get(ga);const d=s.get(De);this.isNgZoneEnabled=d instanceof De&&De.isInAngularZone(),this.resetConfig(u),this.currentUrlTree=new br(new K([],{}),{},null),this.rawUrlTree=this.currentUrlTree,this.browserUrlTree=this.currentUrlTree,this.configLoader=new tC(s,a,f=>this.triggerEvent(new fv(f)),f=>this.triggerEvent(new hv(f))),this.routerState=xv(this.currentUrlTree,this.rootComponentType),this.transitions=new Xt({id:0,targetPageId:0,currentUrlTree:this.currentUrlTree,currentRawUrl:this.currentUrlTree,extractedUrl:this.urlHandlingStrategy.extract(this.currentUrlTree),urlAfterRedirects:this.urlHandlingStrategy.extract(this.currentUrlTree),rawUrl:this.currentUrlTree,extras:{},resolve:null,reject:null,promise:Promise.resolve(!0),source:"imperative",restoredState:null,currentSnapshot:this.routerState.snapshot,targetSnapshot:null,currentRouterState:this.routerState,targetRouterState:null,guards:{canActivateChecks:[],canDeactivateChecks:[]},guardsResult:null}),this.navigations=this.setupNavigations(this.transitions),this.processNavigations()}get browserPageId(){var n;return null==(n=this.location.getState())?void 0:n.\u0275routerPageId}setupNavigations(n){const r=this.events;return n.pipe(Ao(o=>0!==o.id),ae(o=>lt(P({},o),{extractedUrl:this.urlHandlingStrategy.extract(o.rawUrl)})),wr(o=>{let i=!1,s=!1;return H(o).pipe(Ct(a=>{this.currentNavigation={id:a.id,initialUrl:a.currentRawUrl,extractedUrl:a.extractedUrl,trigger:a.source,extras:a.extras,previousNavigation:this.lastSuccessfulNavigation?lt(P({},this.lastSuccessfulNavigation),{previousNavigation:null}):null}}),wr(a=>{const u=this.browserUrlTree.toString(),l=!this.navigated||a.extractedUrl.toString()!==u||u!==this.currentUrlTree.toString();if(("reload"===this.onSameUrlNavigation||l)&&this.urlHandlingStrategy.shouldProcessUrl(a.rawUrl))return su(a.source)&&(this.browserUrlTree=a.extractedUrl),H(a).pipe(wr(d=>{const f=this.transitions.getValue();return r.next(new Yd(d.id,this.serializeUrl(d.extractedUrl),d.source,d.restoredState)),f!==this.transitions.getValue()?yn:Promise.resolve(d)}),function(e,t,n,r){return wr(o=>function(e,t,n,r,o){return new KF(e,t,n,r,o).apply()}(e,t,n,o.extractedUrl,r).pipe(ae(i=>lt(P({},o),{urlAfterRedirects:i}))))}(this.ngModule.injector,this.configLoader,this.urlSerializer,this.config),Ct(d=>{this.currentNavigation=lt(P({},this.currentNavigation),{finalUrl:d.urlAfterRedirects})}),function(e,t,n,r,o){return Re(i=>function(e,t,n,r,o="emptyOnly",i="legacy"){try{const s=new hO(e,t,n,r,o,i).recognize();return null===s?Kv(new dO):H(s)}catch(s){return Kv(s)}}(e,t,i.urlAfterRedirects,n(i.urlAfterRedirects),r,o).pipe(ae(s=>lt(P({},i),{targetSnapshot:s}))))}(this.rootComponentType,this.config,d=>this.serializeUrl(d),this.paramsInheritanceStrategy,this.relativeLinkResolution),Ct(d=>{if("eager"===this.urlUpdateStrategy){if(!d.extras.skipLocationChange){const h=this.urlHandlingStrategy.merge(d.urlAfterRedirects,d.rawUrl);this.setBrowserUrl(h,d)}this.browserUrlTree=d.urlAfterRedirects}const f=new $P(d.id,this.serializeUrl(d.extractedUrl),this.serializeUrl(d.urlAfterRedirects),d.targetSnapshot);r.next(f)}));if(l&&this.rawUrlTree&&this.urlHandlingStrategy.shouldProcessUrl(this.rawUrlTree)){const{id:f,extractedUrl:h,source:m,restoredState:_,extras:y}=a,v=new Yd(f,this.serializeUrl(h),m,_);r.next(v);const D=xv(h,this.rootComponentType).snapshot;return H(lt(P({},a),{targetSnapshot:D,urlAfterRedirects:h,extras:lt(P({},y),{skipLocationChange:!1,replaceUrl:!1})}))}return this.rawUrlTree=a.rawUrl,a.resolve(null),yn}),ff(a=>{const{targetSnapshot:u,id:l,extractedUrl:c,rawUrl:d,extras:{skipLocationChange:f,replaceUrl:h}}=a;return this.hooks.beforePreactivation(u,{navigationId:l,appliedUrlTree:c,rawUrlTree:d,skipLocationChange:!!f,replaceUrl:!!h})}),Ct(a=>{const u=new qP(a.id,this.serializeUrl(a.extractedUrl),this.serializeUrl(a.urlAfterRedirects),a.targetSnapshot);this.triggerEvent(u)}),ae(a=>lt(P({},a),{guards:JF(a.targetSnapshot,a.currentSnapshot,this.rootContexts)})),function(e,t){return Re(n=>{const{targetSnapshot:r,currentSnapshot:o,guards:{canActivateChecks:i,canDeactivateChecks:s}}=n;return 0===s.length&&0===i.length?H(lt(P({},n),{guardsResult:!0})):function(e,t,n,r){return Ve(e).pipe(Re(o=>function(e,t,n,r,o){const i=t&&t.routeConfig?t.routeConfig.canDeactivate:null;return i&&0!==i.length?H(i.map(a=>{const u=iu(a,t,o);let l;if(function(e){return e&&Kn(e.canDeactivate)}(u))l=hn(u.canDeactivate(e,t,n,r));else{if(!Kn(u))throw new Error("Invalid CanDeactivate guard");l=hn(u(e,t,n,r))}return l.pipe(Ro())})).pipe(es()):H(!0)}(o.component,o.route,n,t,r)),Ro(o=>!0!==o,!0))}(s,r,o,e).pipe(Re(a=>a&&function(e){return"boolean"==typeof e}(a)?function(e,t,n,r){return Ve(t).pipe(zi(o=>Qd(function(e,t){return null!==e&&t&&t(new QP(e)),H(!0)}(o.route.parent,r),function(e,t){return null!==e&&t&&t(new YP(e)),H(!0)}(o.route,r),function(e,t,n){const r=t[t.length-1],i=t.slice(0,t.length-1).reverse().map(s=>function(e){const t=e.routeConfig?e.routeConfig.canActivateChild:null;return t&&0!==t.length?{node:e,guards:t}:null}(s)).filter(s=>null!==s).map(s=>sv(()=>H(s.guards.map(u=>{const l=iu(u,s.node,n);let c;if(function(e){return e&&Kn(e.canActivateChild)}(l))c=hn(l.canActivateChild(r,e));else{if(!Kn(l))throw new Error("Invalid CanActivateChild guard");c=hn(l(r,e))}return c.pipe(Ro())})).pipe(es())));return H(i).pipe(es())}(e,o.path,n),function(e,t,n){const r=t.routeConfig?t.routeConfig.canActivate:null;if(!r||0===r.length)return H(!0);const o=r.map(i=>sv(()=>{const s=iu(i,t,n);let a;if(function(e){return e&&Kn(e.canActivate)}(s))a=hn(s.canActivate(t,e));else{if(!Kn(s))throw new Error("Invalid CanActivate guard");a=hn(s(t,e))}return a.pipe(Ro())}));return H(o).pipe(es())}(e,o.route,n))),Ro(o=>!0!==o,!0))}(r,i,e,t):H(a)),ae(a=>lt(P({},n),{guardsResult:a})))})}(this.ngModule.injector,a=>this.triggerEvent(a)),Ct(a=>{if(Tr(a.guardsResult)){const l=Zd(`Redirecting to "${this.serializeUrl(a.guardsResult)}"`);throw l.url=a.guardsResult,l}const u=new WP(a.id,this.serializeUrl(a.extractedUrl),this.serializeUrl(a.urlAfterRedirects),a.targetSnapshot,!!a.guardsResult);this.triggerEvent(u)}),Ao(a=>!!a.guardsResult||(this.restoreHistory(a),this.cancelNavigationTransition(a,""),!1)),ff(a=>{if(a.guards.canActivateChecks.length)return H(a).pipe(Ct(u=>{const l=new GP(u.id,this.serializeUrl(u.extractedUrl),this.serializeUrl(u.urlAfterRedirects),u.targetSnapshot);this.triggerEvent(l)}),wr(u=>{let l=!1;return H(u).pipe(function(e,t){return Re(n=>{const{targetSnapshot:r,guards:{canActivateChecks:o}}=n;if(!o.length)return H(n);let i=0;return Ve(o).pipe(zi(s=>function(e,t,n,r){return function(e,t,n,r){const o=Object.keys(e);if(0===o.length)return H({});const i={};return Ve(o).pipe(Re(s=>function(e,t,n,r){const o=iu(e,t,r);return hn(o.resolve?o.resolve(t,n):o(t,n))}(e[s],t,n,r).pipe(Ct(a=>{i[s]=a}))),Kd(1),Re(()=>Object.keys(i).length===o.length?H(i):yn))}(e._resolve,e,t,r).pipe(ae(i=>(e._resolvedData=i,e.data=P(P({},e.data),Nv(e,n).resolve),null)))}(s.route,r,e,t)),Ct(()=>i++),Kd(1),Re(s=>i===o.length?H(n):yn))})}(this.paramsInheritanceStrategy,this.ngModule.injector),Ct({next:()=>l=!0,complete:()=>{l||(this.restoreHistory(u),this.cancelNavigationTransition(u,"At least one route resolver didn't emit any value."))}}))}),Ct(u=>{const l=new zP(u.id,this.serializeUrl(u.extractedUrl),this.serializeUrl(u.urlAfterRedirects),u.targetSnapshot);this.triggerEvent(l)}))}),ff(a=>{const{targetSnapshot:u,id:l,extractedUrl:c,rawUrl:d,extras:{skipLocationChange:f,replaceUrl:h}}=a;return this.hooks.afterPreactivation(u,{navigationId:l,appliedUrlTree:c,rawUrlTree:d,skipLocationChange:!!f,replaceUrl:!!h})}),ae(a=>{const u=function(e,t,n){const r=Zi(e,t._root,n?n._root:void 0);return new Rv(r,t)}(this.routeReuseStrategy,a.targetSnapshot,a.currentRouterState);return lt(P({},a),{targetRouterState:u})}),Ct(a=>{this.currentUrlTree=a.urlAfterRedirects,this.rawUrlTree=this.urlHandlingStrategy.merge(a.urlAfterRedirects,a.rawUrl),this.routerState=a.targetRouterState,"deferred"===this.urlUpdateStrategy&&(a.extras.skipLocationChange||this.setBrowserUrl(this.rawUrlTree,a),this.browserUrlTree=a.urlAfterRedirects)}),((e,t,n)=>ae(r=>(new xF(t,r.targetRouterState,r.currentRouterState,n).activate(e),r)))(this.rootContexts,this.routeReuseStrategy,a=>this.triggerEvent(a)),Ct({next(){i=!0},complete(){i=!0}}),function(e){return ke((t,n)=>{try{t.subscribe(n)}finally{n.add(e)}})}(()=>{var a;i||s||this.cancelNavigationTransition(o,`Navigation ID ${o.id} is not equal to the current navigation id ${this.navigationId}`),(null==(a=this.currentNavigation)?void 0:a.id)===o.id&&(this.currentNavigation=null)}),Qn(a=>{if(s=!0,function(e){return e&&e[gv]}(a)){const u=Tr(a.url);u||(this.navigated=!0,this.restoreHistory(o,!0));const l=new dv(o.id,this.serializeUrl(o.extractedUrl),a.message);r.next(l),u?setTimeout(()=>{const c=this.urlHandlingStrategy.merge(a.url,this.rawUrlTree),d={skipLocationChange:o.extras.skipLocationChange,replaceUrl:"eager"===this.urlUpdateStrategy||su(o.source)};this.scheduleNavigation(c,"imperative",null,d,{resolve:o.resolve,reject:o.reject,promise:o.promise})},0):o.resolve(!1)}else{this.restoreHistory(o,!0);const u=new HP(o.id,this.serializeUrl(o.extractedUrl),a);r.next(u);try{o.resolve(this.errorHandler(a))}catch(l){o.reject(l)}}return yn}))}))}resetRootComponentType(n){this.rootComponentType=n,this.routerState.root.component=this.rootComponentType}setTransition(n){this.transitions.next(P(P({},this.transitions.value),n))}initialNavigation(){this.setUpLocationChangeListener(),0===this.navigationId&&this.navigateByUrl(this.location.path(!0),{replaceUrl:!0})}setUpLocationChangeListener(){this.locationSubscription||(this.locationSubscription=this.location.subscribe(n=>{const r="popstate"===n.type?"popstate":"hashchange";"popstate"===r&&setTimeout(()=>{var a;const o={replaceUrl:!0},i=(null==(a=n.state)?void 0:a.navigationId)?n.state:null;if(i){const u=P({},i);delete u.navigationId,delete u.\u0275routerPageId,0!==Object.keys(u).length&&(o.state=u)}const s=this.parseUrl(n.url);this.scheduleNavigation(s,r,i,o)},0)}))}get url(){return this.serializeUrl(this.currentUrlTree)}getCurrentNavigation(){return this.currentNavigation}triggerEvent(n){this.events.next(n)}resetConfig(n){Uv(n),this.config=n.map(cf),this.navigated=!1,this.lastSuccessfulId=-1}ngOnDestroy(){this.dispose()}dispose(){this.transitions.complete(),this.locationSubscription&&(this.locationSubscription.unsubscribe(),this.locationSubscription=void 0),this.disposed=!0}createUrlTree(n,r={}){const{relativeTo:o,queryParams:i,fragment:s,queryParamsHandling:a,preserveFragment:u}=r,l=o||this.routerState.root,c=u?this.currentUrlTree.fragment:s;let d=null;switch(a){case"merge":d=P(P({},this.currentUrlTree.queryParams),i);break;case"preserve":d=this.currentUrlTree.queryParams;break;default:d=i||null}return null!==d&&(d=this.removeEmptyProps(d)),function(e,t,n,r,o){if(0===n.length)return of(t.root,t.root,t,r,o);const i=function(e){if("string"==typeof e[0]&&1===e.length&&"/"===e[0])return new kv(!0,0,e);let t=0,n=!1;const r=e.reduce((o,i,s)=>{if("object"==typeof i&&null!=i){if(i.outlets){const a={};return Be(i.outlets,(u,l)=>{a[l]="string"==typeof u?u.split("/"):u}),[...o,{outlets:a}]}if(i.segmentPath)return[...o,i.segmentPath]}return"string"!=typeof i?[...o,i]:0===s?(i.split("/").forEach((a,u)=>{0==u&&"."===a||(0==u&&""===a?n=!0:".."===a?t++:""!=a&&o.push(a))}),o):[...o,i]},[]);return new kv(n,t,r)}(n);if(i.toRoot())return of(t.root,new K([],{}),t,r,o);const s=function(e,t,n){if(e.isAbsolute)return new sf(t.root,!0,0);if(-1===n.snapshot._lastPathIndex){const i=n.snapshot._urlSegment;return new sf(i,i===t.root,0)}const r=Ja(e.commands[0])?0:1;return function(e,t,n){let r=e,o=t,i=n;for(;i>o;){if(i-=o,r=r.parent,!r)throw new Error("Invalid number of '../'");o=r.segments.length}return new sf(r,!1,o-i)}(n.snapshot._urlSegment,n.snapshot._lastPathIndex+r,e.numberOfDoubleDots)}(i,t,e),a=s.processChildren?Xa(s.segmentGroup,s.index,i.commands):Lv(s.segmentGroup,s.index,i.commands);return of(s.segmentGroup,a,t,r,o)}(l,this.currentUrlTree,n,d,null!=c?c:null)}navigateByUrl(n,r={skipLocationChange:!1}){const o=Tr(n)?n:this.parseUrl(n),i=this.urlHandlingStrategy.merge(o,this.rawUrlTree);return this.scheduleNavigation(i,"imperative",null,r)}navigate(n,r={skipLocationChange:!1}){return function(e){for(let t=0;t<e.length;t++){const n=e[t];if(null==n)throw new Error(`The requested path contains ${n} segment at index ${t}`)}}(n),this.navigateByUrl(this.createUrlTree(n,r),r)}serializeUrl(n){return this.urlSerializer.serialize(n)}parseUrl(n){let r;try{r=this.urlSerializer.parse(n)}catch(o){r=this.malformedUriErrorHandler(o,this.urlSerializer,n)}return r}isActive(n,r){let o;if(o=!0===r?P({},AO):!1===r?P({},RO):r,Tr(n))return vv(this.currentUrlTree,n,o);const i=this.parseUrl(n);return vv(this.currentUrlTree,i,o)}removeEmptyProps(n){return Object.keys(n).reduce((r,o)=>{const i=n[o];return null!=i&&(r[o]=i),r},{})}processNavigations(){this.navigations.subscribe(n=>{this.navigated=!0,this.lastSuccessfulId=n.id,this.currentPageId=n.targetPageId,this.events.next(new Qi(n.id,this.serializeUrl(n.extractedUrl),this.serializeUrl(this.currentUrlTree))),this.lastSuccessfulNavigation=this.currentNavigation,n.resolve(!0)},n=>{this.console.warn(`Unhandled Navigation Error: ${n}`)})}scheduleNavigation(n,r,o,i,s){var v,D,I;if(this.disposed)return Promise.resolve(!1);const a=this.transitions.value,u=su(r)&&a&&!su(a.source),l=a.rawUrl.toString()===n.toString(),c=a.id===(null==(v=this.currentNavigation)?void 0:v.id);if(u&&l&&c)return Promise.resolve(!0);let f,h,m;s?(f=s.resolve,h=s.reject,m=s.promise):m=new Promise((T,j)=>{f=T,h=j});const _=++this.navigationId;let y;return"computed"===this.canceledNavigationResolution?(0===this.currentPageId&&(o=this.location.getState()),y=o&&o.\u0275routerPageId?o.\u0275routerPageId:i.replaceUrl||i.skipLocationChange?null!=(D=this.browserPageId)?D:0:(null!=(I=this.browserPageId)?I:0)+1):y=0,this.setTransition({id:_,targetPageId:y,source:r,restoredState:o,currentUrlTree:this.currentUrlTree,currentRawUrl:this.rawUrlTree,rawUrl:n,extras:i,resolve:f,reject:h,promise:m,currentSnapshot:this.routerState.snapshot,currentRouterState:this.routerState}),m.catch(T=>Promise.reject(T))}setBrowserUrl(n,r){const o=this.urlSerializer.serialize(n),i=P(P({},r.extras.state),this.generateNgRouterState(r.id,r.targetPageId));this.location.isCurrentPathEqualTo(o)||r.extras.replaceUrl?this.location.replaceState(o,"",i):this.location.go(o,"",i)}restoreHistory(n,r=!1){var o,i;if("computed"===this.canceledNavigationResolution){const s=this.currentPageId-n.targetPageId;"popstate"!==n.source&&"eager"!==this.urlUpdateStrategy&&this.currentUrlTree!==(null==(o=this.currentNavigation)?void 0:o.finalUrl)||0===s?this.currentUrlTree===(null==(i=this.currentNavigation)?void 0:i.finalUrl)&&0===s&&(this.resetState(n),this.browserUrlTree=n.currentUrlTree,this.resetUrlToCurrentUrlTree()):this.location.historyGo(s)}else"replace"===this.canceledNavigationResolution&&(r&&this.resetState(n),this.resetUrlToCurrentUrlTree())}resetState(n){this.routerState=n.currentRouterState,this.currentUrlTree=n.currentUrlTree,this.rawUrlTree=this.urlHandlingStrategy.merge(this.currentUrlTree,n.rawUrl)}resetUrlToCurrentUrlTree(){this.location.replaceState(this.urlSerializer.serialize(this.rawUrlTree),"",this.generateNgRouterState(this.lastSuccessfulId,this.currentPageId))}cancelNavigationTransition(n,r){const o=new dv(n.id,this.serializeUrl(n.extractedUrl),r);this.triggerEvent(o),n.resolve(!1)}generateNgRouterState(n,r){return"computed"===this.canceledNavigationResolution?{navigationId:n,\u0275routerPageId:r}:{navigationId:n}}}return e.\u0275fac=function(n){ic()},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function su(e){return"imperative"!==e}class rC{}class oC{preload(t,n){return H(null)}}let iC=(()=>{class e{constructor(n,r,o,i){this.router=n,this.injector=o,this.preloadingStrategy=i,this.loader=new tC(o,r,u=>n.triggerEvent(new fv(u)),u=>n.triggerEvent(new hv(u)))}setUpPreloading(){this.subscription=this.router.events.pipe(Ao(n=>n instanceof Qi),zi(()=>this.preload())).subscribe(()=>{})}preload(){const n=this.injector.get(dn);return this.processRoutes(n,this.router.config)}ngOnDestroy(){this.subscription&&this.subscription.unsubscribe()}processRoutes(n,r){const o=[];for(const i of r)if(i.loadChildren&&!i.canLoad&&i._loadedConfig){const s=i._loadedConfig;o.push(this.processRoutes(s.module,s.routes))}else i.loadChildren&&!i.canLoad?o.push(this.preloadConfig(n,i)):i.children&&o.push(this.processRoutes(n,i.children));return Ve(o).pipe(jo(),ae(i=>{}))}preloadConfig(n,r){return this.preloadingStrategy.preload(r,()=>(r._loadedConfig?H(r._loadedConfig):this.loader.load(n.injector,r)).pipe(Re(i=>(r._loadedConfig=i,this.processRoutes(i.module,i.routes)))))}}return e.\u0275fac=function(n){return new(n||e)(A(ot),A(ma),A(re),A(rC))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})(),mf=(()=>{class e{constructor(n,r,o={}){this.router=n,this.viewportScroller=r,this.options=o,this.lastId=0,this.lastSource="imperative",this.restoredId=0,this.store={},o.scrollPositionRestoration=o.scrollPositionRestoration||"disabled",o.anchorScrolling=o.anchorScrolling||"disabled"}init(){"disabled"!==this.options.scrollPositionRestoration&&this.viewportScroller.setHistoryScrollRestoration("manual"),this.routerEventsSubscription=this.createScrollEvents(),this.scrollEventsSubscription=this.consumeScrollEvents()}createScrollEvents(){return this.router.events.subscribe(n=>{n instanceof Yd?(this.store[this.lastId]=this.viewportScroller.getScrollPosition(),this.lastSource=n.navigationTrigger,this.restoredId=n.restoredState?n.restoredState.navigationId:0):n instanceof Qi&&(this.lastId=n.id,this.scheduleScrollEvent(n,this.router.parseUrl(n.urlAfterRedirects).fragment))})}consumeScrollEvents(){return this.router.events.subscribe(n=>{n instanceof pv&&(n.position?"top"===this.options.scrollPositionRestoration?this.viewportScroller.scrollToPosition([0,0]):"enabled"===this.options.scrollPositionRestoration&&this.viewportScroller.scrollToPosition(n.position):n.anchor&&"enabled"===this.options.anchorScrolling?this.viewportScroller.scrollToAnchor(n.anchor):"disabled"!==this.options.scrollPositionRestoration&&this.viewportScroller.scrollToPosition([0,0]))})}scheduleScrollEvent(n,r){this.router.triggerEvent(new pv(n,"popstate"===this.lastSource?this.store[this.restoredId]:null,r))}ngOnDestroy(){this.routerEventsSubscription&&this.routerEventsSubscription.unsubscribe(),this.scrollEventsSubscription&&this.scrollEventsSubscription.unsubscribe()}}return e.\u0275fac=function(n){ic()},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();const Sr=new J("ROUTER_CONFIGURATION"),sC=new J("ROUTER_FORROOT_GUARD"),OO=[bd,{provide:bv,useClass:Iv},{provide:ot,useFactory:function(e,t,n,r,o,i,s={},a,u){const l=new ot(null,e,t,n,r,o,yv(i));return a&&(l.urlHandlingStrategy=a),u&&(l.routeReuseStrategy=u),function(e,t){e.errorHandler&&(t.errorHandler=e.errorHandler),e.malformedUriErrorHandler&&(t.malformedUriErrorHandler=e.malformedUriErrorHandler),e.onSameUrlNavigation&&(t.onSameUrlNavigation=e.onSameUrlNavigation),e.paramsInheritanceStrategy&&(t.paramsInheritanceStrategy=e.paramsInheritanceStrategy),e.relativeLinkResolution&&(t.relativeLinkResolution=e.relativeLinkResolution),e.urlUpdateStrategy&&(t.urlUpdateStrategy=e.urlUpdateStrategy),e.canceledNavigationResolution&&(t.canceledNavigationResolution=e.canceledNavigationResolution)}(s,l),s.enableTracing&&l.events.subscribe(c=>{var d,f;null==(d=console.group)||d.call(console,`Router Event: ${c.constructor.name}`),console.log(c.toString()),console.log(c),null==(f=console.groupEnd)||f.call(console)}),l},deps:[bv,ts,bd,re,ma,hf,Sr,[class{},new at],[class{},new at]]},ts,{provide:Po,useFactory:function(e){return e.routerState.root},deps:[ot]},iC,oC,class{preload(t,n){return n().pipe(Qn(()=>H(null)))}},{provide:Sr,useValue:{enableTracing:!1}}];function kO(){return new Gc("Router",ot)}let aC=(()=>{class e{constructor(n,r){}static forRoot(n,r){return{ngModule:e,providers:[OO,uC(n),{provide:sC,useFactory:jO,deps:[[ot,new at,new Bn]]},{provide:Sr,useValue:r||{}},{provide:Mo,useFactory:VO,deps:[Er,[new Wr(wd),new at],Sr]},{provide:mf,useFactory:LO,deps:[ot,bN,Sr]},{provide:rC,useExisting:r&&r.preloadingStrategy?r.preloadingStrategy:oC},{provide:Gc,multi:!0,useFactory:kO},[yf,{provide:Mi,multi:!0,useFactory:$O,deps:[yf]},{provide:lC,useFactory:qO,deps:[yf]},{provide:m_,multi:!0,useExisting:lC}]]}}static forChild(n){return{ngModule:e,providers:[uC(n)]}}}return e.\u0275fac=function(n){return new(n||e)(A(sC,8),A(ot,8))},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({}),e})();function LO(e,t,n){return n.scrollOffset&&t.setOffset(n.scrollOffset),new mf(e,t,n)}function VO(e,t,n={}){return n.useHash?new rx(e,t):new AD(e,t)}function jO(e){return"guarded"}function uC(e){return[{provide:ew,multi:!0,useValue:e},{provide:hf,multi:!0,useValue:e}]}let yf=(()=>{class e{constructor(n){this.injector=n,this.initNavigation=!1,this.destroyed=!1,this.resultOfPreactivationDone=new pn}appInitializer(){return this.injector.get(ex,Promise.resolve(null)).then(()=>{if(this.destroyed)return Promise.resolve(!0);let r=null;const o=new Promise(a=>r=a),i=this.injector.get(ot),s=this.injector.get(Sr);return"disabled"===s.initialNavigation?(i.setUpLocationChangeListener(),r(!0)):"enabled"===s.initialNavigation||"enabledBlocking"===s.initialNavigation?(i.hooks.afterPreactivation=()=>this.initNavigation?H(null):(this.initNavigation=!0,r(!0),this.resultOfPreactivationDone),i.initialNavigation()):r(!0),o})}bootstrapListener(n){const r=this.injector.get(Sr),o=this.injector.get(iC),i=this.injector.get(mf),s=this.injector.get(ot),a=this.injector.get(Co);n===a.components[0]&&(("enabledNonBlocking"===r.initialNavigation||void 0===r.initialNavigation)&&s.initialNavigation(),o.setUpPreloading(),i.init(),s.resetRootComponentType(a.componentTypes[0]),this.resultOfPreactivationDone.next(null),this.resultOfPreactivationDone.complete())}ngOnDestroy(){this.destroyed=!0}}return e.\u0275fac=function(n){return new(n||e)(A(re))},e.\u0275prov=q({token:e,factory:e.\u0275fac}),e})();function $O(e){return e.appInitializer.bind(e)}function qO(e){return e.bootstrapListener.bind(e)}const lC=new J("Router Initializer");function cC(e,t,n,r,o,i,s){try{var a=e[i](s),u=a.value}catch(l){return void n(l)}a.done?t(u):Promise.resolve(u).then(r,o)}function Ot(e){return function(){var t=this,n=arguments;return new Promise(function(r,o){var i=e.apply(t,n);function s(u){cC(i,r,o,s,a,"next",u)}function a(u){cC(i,r,o,s,a,"throw",u)}s(void 0)})}}function zO(e,t){if(1&e&&(p(0,"option",69),E(1),g()),2&e){const n=t.$implicit;be("value",t.index),z(1),Pe(n)}}function QO(e,t){if(1&e&&(p(0,"option",69),E(1),g()),2&e){const n=t.$implicit;be("value",n),z(1),Pe(n)}}function KO(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt();z(2),Pe(n),z(2),Pe(o.actions_per_country_data.actions[r])}}function YO(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),p(5,"td"),E(6),g(),p(7,"td"),E(8),g(),g()),2&e){const n=t.$implicit;z(2),Pe(n.month),z(2),Pe(n.day),z(2),Pe(n.hour),z(2),Pe(n.requests_amount)}}function ZO(e,t){if(1&e&&(p(0,"div",56),p(1,"p"),E(2),g(),p(3,"table",57),p(4,"thead"),p(5,"tr"),p(6,"th",58),E(7,"Month"),g(),p(8,"th",58),E(9,"Day"),g(),p(10,"th",58),E(11,"Hour"),g(),p(12,"th",58),E(13,"Requests amount"),g(),g(),g(),p(14,"tbody"),Ge(15,YO,9,4,"tr",59),g(),g(),g()),2&e){const n=Dt();z(2),gr("Average: ",n.server_load_data.avg,""),z(13),be("ngForOf",n.server_load_data.statistics)}}function JO(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),g()),2&e){const n=t.$implicit;z(2),Pe(n)}}function XO(e,t){if(1&e&&(p(0,"div",56),p(1,"p"),E(2),g(),p(3,"table",57),p(4,"thead"),p(5,"tr"),p(6,"th",58),E(7,"Card ID"),g(),g(),g(),p(8,"tbody"),Ge(9,JO,3,1,"tr",59),g(),g(),g()),2&e){const n=Dt();z(2),gr("Amount: ",n.unpayed_carts.list.length,""),z(7),be("ngForOf",n.unpayed_carts.list)}}function ek(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt(2);z(2),Pe(n),z(2),Pe(o.repeat_purchases.amount[r])}}function tk(e,t){if(1&e&&(p(0,"div",56),p(1,"p"),E(2),g(),p(3,"table",57),p(4,"thead"),p(5,"tr"),p(6,"th",58),E(7,"Users's IP"),g(),p(8,"th",58),E(9,"Amount"),g(),g(),g(),p(10,"tbody"),Ge(11,ek,5,2,"tr",59),g(),g(),g()),2&e){const n=Dt();z(2),gr("Total amount: ",n.repeat_purchases.total_amount,""),z(9),be("ngForOf",n.repeat_purchases.ip_list)}}function nk(e,t){if(1&e&&(p(0,"td"),E(1),g()),2&e){const n=Dt().index,r=Dt(2);z(1),gr("00:00 - ",n*(24/r.time_pattern.amount.length)+24/r.time_pattern.amount.length,":00")}}function rk(e,t){if(1&e&&(p(0,"td"),E(1),g()),2&e){const n=Dt().index,r=Dt(2);z(1),dc("",24/r.time_pattern.amount.length*(n-1)+24/r.time_pattern.amount.length,":00 - ",n*(24/r.time_pattern.amount.length)+24/r.time_pattern.amount.length,":00")}}function ok(e,t){if(1&e&&(p(0,"tr"),Ge(1,nk,2,1,"td",70),Ge(2,rk,2,2,"td",70),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.first;z(1),be("ngIf",r),z(1),be("ngIf",!r),z(2),Pe(n)}}function ik(e,t){if(1&e&&(p(0,"div",56),p(1,"table",57),p(2,"thead"),p(3,"tr"),p(4,"th",58),E(5,"Time period"),g(),p(6,"th",58),E(7,"Amount"),g(),g(),g(),p(8,"tbody"),Ge(9,ok,5,3,"tr",59),g(),g(),g()),2&e){const n=Dt();z(9),be("ngForOf",n.time_pattern.amount)}}function sk(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt();z(2),Pe(n),z(2),Pe(o.pattern_view.actions[r])}}function ak(e,t){if(1&e&&(p(0,"tr"),p(1,"td"),E(2),g(),p(3,"td"),E(4),g(),g()),2&e){const n=t.$implicit,r=t.index,o=Dt();z(2),Pe(n),z(2),Pe(o.pattern_buy.purchases[r])}}const uk=[{path:"",component:(()=>{class e{constructor(n){this.router=n}ngOnInit(){}ngAfterViewInit(){this.upload_button=document.getElementById("upload_button"),this.spinner=document.getElementById("spinner"),this.warning_message=document.getElementById("warn_message")}upload_logs(){var n=this;this.disable_upload_button(),this.spinner.classList.remove("invisible"),this.warning_message.classList.add("invisible");let r=document.getElementById("formElement");r.onsubmit=function(){var o=Ot(function*(i){i.preventDefault();let u=yield fetch("/api/upload",{method:"POST",body:new FormData(r)}),a=u.ok?yield u.json():{status:"failed"};"accepted"==a.status&&(a=yield n.wait_for_job(a.job_id)),"done"==a.status&&n.router.navigate(["dashboard"]),"failed"==a.status&&(n.warning_message.classList.remove("invisible"),n.spinner.classList.add("invisible"),n.enable_upload_button())});return function(i){return o.apply(this,arguments)}}()}wait_for_job(n){return Ot(function*(){for(;;){yield new Promise(o=>setTimeout(o,1e3));let r=yield fetch(`/api/jobs/${n}`,{method:"GET"});if(!r.ok)return{status:"failed"};let i=yield r.json();if("done"==i.status||"failed"==i.status)return i}})()}enable_upload_button(){this.upload_button.classList.remove("disabled")}disable_upload_button(){this.upload_button.classList.add("disabled")}}return e.\u0275fac=function(n){return new(n||e)(S(ot))},e.\u0275cmp=Ar({type:e,selectors:[["app-upload-page"]],decls:19,vars:0,consts:[["xmlns","http://www.w3.org/2000/svg",2,"display","none"],["id","exclamation-triangle-fill","fill","currentColor","viewBox","0 0 16 16"],["d","M8.982 1.566a1.13 1.13 0 0 0-1.96 0L.165 13.233c-.457.778.091 1.767.98 1.767h13.713c.889 0 1.438-.99.98-1.767L8.982 1.566zM8 5c.535 0 .954.462.9.995l-.35 3.507a.552.552 0 0 1-1.1 0L7.1 5.995A.905.905 0 0 1 8 5zm.002 6a1 1 0 1 1 0 2 1 1 0 0 1 0-2z"],[1,"container","vh-100","d-flex","justify-content-center","align-items-center"],[1,"row","row-cols-1","justify-content-center"],[1,"col","text-center"],[1,"display-5","pb-3"],["id","formElement"],[1,"col"],["id","formFileLg","name","file","type","file",1,"form-control","form-control-lg",3,"change"],[1,"col","text-center","mt-3","d-flex","justify-content-center","align-items-center"],["type","submit","value","Proceed","id","upload_button",1,"btn","btn-primary","btn-lg","ms-5","disabled",3,"click"],["role","status","id","spinner",1,"spinner-border","text-primary","ms-3","invisible"],["role","alert","id","warn_message",1,"alert","alert-danger","d-flex","col-md-auto","align-items-center","mt-3","invisible"],["width","24","height","24","role","img","aria-label","Danger:",1,"bi","flex-shrink-0","me-2"],[0,"xlink","href","#exclamation-triangle-fill"]],template:function(n,r){1&n&&(ju(),p(0,"svg",0),p(1,"symbol",1),Ne(2,"path",2),g(),g(),Bu(),p(3,"div",3),p(4,"div",4),p(5,"div",5),p(6,"h2",6),E(7,"Choose log file to continue"),g(),g(),p(8,"form",7),p(9,"div",8),p(10,"input",9),Ie("change",function(){return r.enable_upload_button()}),g(),g(),p(11,"div",10),p(12,"input",11),Ie("click",function(){return r.upload_logs()}),g(),Ne(13,"div",12),g(),g(),p(14,"div",13),ju(),p(15,"svg",14),Ne(16,"use",15),g(),Bu(),p(17,"div"),E(18," File has wrong content. Upload only logs files "),g(),g(),g(),g())},styles:[""]}),e})()},{path:"dashboard",component:(()=>{class e{constructor(n){this.router=n,this.category_index=0,this.server_load_data={loaded:!1},this.actions_per_country_data={country:[],actions:[]},this.unpayed_carts={loaded:!1,list:[]},this.repeat_purchases={loaded:!1,ip_list:[],amount:[]},this.time_pattern={loaded:!1,amount:[]},this.pattern_view={country:[],actions:[]},this.pattern_buy={category:[],purchases:[]},this.overall_reports=null,this.category_reports={query:null,result:null}}ngOnInit(){!this.check_db()||(this.get_categories(),this.get_filename(),setTimeout(this.getOverallStatistics,1e3))}ngAfterViewInit(){}getOverallStatistics(){return Ot(function*(){let r=yield(yield fetch("/api/overall_statistics",{method:"GET"})).json(),o=r.countries,i=r.items_views,s=r.payed_carts,a=r.unique_users;document.getElementById("countries").style.setProperty("--num",o),document.getElementById("items_views").style.setProperty("--num",i),document.getElementById("payed_carts").style.setProperty("--num",s),document.getElementById("unique_users").style.setProperty("--num",a)})()}check_db(){var n=this;return Ot(function*(){return 204!=(yield fetch("api/check_db",{method:"GET"})).status||(n.router.navigate([""]),!1)})()}get_categories(){var n=this;return Ot(function*(){let o=yield(yield fetch("/api/categories",{method:"GET"})).json();n.categories=Object.keys(o),n.items=Object.values(o)})()}get_filename(){return Ot(function*(){let o=(yield(yield fetch("/api/uploaded_filename",{method:"GET"})).json()).filename;document.getElementById("filename").textContent=o})()}update_items_list(){let n=document.getElementById("category_select"),r=document.getElementById("item_select");this.category_index=n.options[n.selectedIndex].value,r.removeAttribute("disabled"),document.getElementById("rep_time_pattern_button").removeAttribute("disabled")}enable_reports_buttons(){document.getElementById("rep_pattern_view_button").removeAttribute("disabled"),document.getElementById("rep_pattern_buy_button").removeAttribute("disabled")}check_for_button_unlock(n){let r=document.getElementById(`rep${n}_date1`).value,o=document.getElementById(`rep${n}_date2`).value,i=document.getElementById(`rep${n}_button`);r&&o?i.removeAttribute("disabled"):i.setAttribute("disabled","true")}debug(){let n={canned_food:["midii","pate_of_tuna"],caviar:["squash_caviar","black_caviar"],fresh_fish:["tuna","codfish","herring","salmon","crucian"],frozen_fish:["shark","pike","peljad"],semi_manufactures:["soup_set","squid_rings","salmon_cutlet"]};this.categories=Object.keys(n),this.items=Object.values(n),this.server_load_data={avg:"57.2857142857142857",statistics:[{day:1,hour:0,requests_amount:55},{day:1,hour:1,requests_amount:67},{day:1,hour:2,requests_amount:62},{day:1,hour:3,requests_amount:57},{day:1,hour:4,requests_amount:62},{day:1,hour:5,requests_amount:69},{day:1,hour:6,requests_amount:29}]}}fetch_reports(n,r={}){return Ot(function*(){let o=new URLSearchParams(Object.assign({names:n.join(",")},r)),i=yield fetch(`/api/reports?${o}`,{method:"GET"}),s=yield i.json();if(!i.ok)throw new Error(s.error);return s})()}get_overall_reports(){return this.overall_reports||(this.overall_reports=this.fetch_reports(["server_load_per_hour","rep_actions_per_country"]).catch(n=>{throw this.overall_reports=null,n})),this.overall_reports}get_category_reports(){let n=this.categories[this.category_index],r=document.getElementById("k_select"),o=24/r.options[r.selectedIndex].value,i=document.getElementById("item_select"),s=i.selectedIndex>0?i.options[i.selectedIndex].value:"",a=s?["rep_time_pattern","rep_pattern_view","rep_pattern_buy"]:["rep_time_pattern"],u=`${a}|${n}|${s}|${o}`;return this.category_reports.query!=u&&(this.category_reports={query:u,result:this.fetch_reports(a,{category:n,item:s,k:o}).catch(l=>{throw this.category_reports={query:null,result:null},l})}),this.category_reports.result}rep_server_load(){var n=this;return Ot(function*(){let o=(yield n.get_overall_reports()).server_load_per_hour;o.error||(o.loaded=!0,n.server_load_data=o)})()}rep_actions_per_country(){var n=this;return Ot(function*(){let o=(yield n.get_overall_reports()).rep_actions_per_country;o.error||(n.actions_per_country_data.country=Object.keys(o),n.actions_per_country_data.actions=Object.values(o))})()}rep_unpayed_carts(){var n=this;return Ot(function*(){let r={date_1:document.getElementById("rep1_date1").value,date_2:document.getElementById("rep1_date2").value},o=(yield n.fetch_reports(["rep_unpayed_carts"],r)).rep_unpayed_carts;o.error||(n.unpayed_carts={list:o,loaded:!0})})()}rep_repeat_purchases(){var n=this;return Ot(function*(){let r={date_1:document.getElementById("rep2_date1").value,date_2:document.getElementById("rep2_date2").value},i=(yield n.fetch_reports(["rep_repeated_payments"],r)).rep_repeated_payments;i.error||(n.repeat_purchases={ip_list:Object.keys(i.data),amount:Object.values(i.data),loaded:!0,total_amount:i.amount})})()}rep_time_pattern(){var n=this;return Ot(function*(){let a=(yield n.get_category_reports()).rep_time_pattern;if(!a.error){n.time_pattern.amount=[];for(let u of Object.values(a))n.time_pattern.amount.push(u);n.time_pattern.loaded=!0}})()}rep_pattern_view(){var n=this;return Ot(function*(){let a=(yield n.get_category_reports()).rep_pattern_view;a.error||(n.pattern_view.country=Object.keys(a),n.pattern_view.actions=Object.values(a))})()}rep_pattern_buy(){var n=this;return Ot(function*(){let a=(yield n.get_category_reports()).rep_pattern_buy;a.error||(n.pattern_buy.category=Object.keys(a),n.pattern_buy.purchases=Object.values(a))})()}}return e.\u0275fac=function(n){return new(n||e)(S(ot))},e.\u0275cmp=Ar({type:e,selectors:[["app-dashboard"]],decls:247,vars:9,consts:[[1,"container"],[1,"d-flex","align-items-center","justify-content-between"],["aria-label","breadcrumb",1,"fs-4","mt-3"],[1,"breadcrumb"],[1,"breadcrumb-item"],["href","#"],["aria-current","page",1,"breadcrumb-item","active"],["id","filename",1,"fs-5","ps-2",2,"color","#5f676e"],[1,"card"],[1,"card-header"],[1,"card-body"],[1,"fs-5","py-1","hstack"],[1,"pe-4"],["id","countries",1,"animated","fw-bold"],[1,"pe-4","text-nowrap"],["id","items_views",1,"animated","fw-bold"],["id","payed_carts",1,"animated","fw-bold"],["id","unique_users",1,"animated","fw-bold"],[1,"fw-light","mt-3"],[1,"row"],[1,"col-sm-6","mt-3"],[1,"card","text-white","bg-secondary"],[1,"card-title"],[1,"card-text"],["data-bs-toggle","modal","data-bs-target","#server_load_Modal",1,"btn","btn-light",3,"click"],["data-bs-toggle","modal","data-bs-target","#actions_per_country_Modal",1,"btn","btn-light",3,"click"],[1,""],[1,"table","table-borderless","d-block"],[1,"fw-normal"],["type","date","id","rep1_date1",3,"change"],["type","date","id","rep1_date2",3,"change"],["id","rep1_button","data-bs-toggle","modal","data-bs-target","#unpayed_carts_Modal","disabled","",1,"btn","btn-primary",3,"click"],["type","date","id","rep2_date1",3,"change"],["type","date","id","rep2_date2",3,"change"],["id","rep2_button","data-bs-toggle","modal","data-bs-target","#repeat_purchases_Modal","disabled","",1,"btn","btn-primary",3,"click"],["id","category_select",1,"form-select","mt-1",3,"change"],["selected","","disabled",""],[3,"value",4,"ngFor","ngForOf"],["id","item_select","disabled","",1,"form-select","mt-2",3,"change"],[1,"d-inline-flex","align-items-center"],["id","rep_time_pattern_button","data-bs-toggle","modal","data-bs-target","#time_pattern_Modal","disabled","",1,"btn","btn-primary","text-nowrap","me-2",3,"click"],["id","k_select",1,"form-select"],["value","2"],["value","4","selected",""],["value","6"],[1,"card-title","mt-2"],["id","rep_pattern_view_button","data-bs-toggle","modal","data-bs-target","#pattern_view_Modal","disabled","",1,"btn","btn-primary",3,"click"],[1,"card-text","mt-2"],["id","rep_pattern_buy_button","data-bs-toggle","modal","data-bs-target","#pattern_buy_Modal","disabled","",1,"btn","btn-primary",3,"click"],[1,"fw-light","mt-5"],["id","actions_per_country_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],[1,"modal-dialog","modal-dialog-scrollable"],[1,"modal-content"],[1,"modal-header"],[1,"modal-title"],["type","button","data-bs-dismiss","modal","aria-label","Close",1,"btn-close"],[1,"modal-body"],[1,"table","mt-2"],["scope","col"],[4,"ngFor","ngForOf"],[1,"modal-footer"],["type","button","data-bs-dismiss","modal",1,"btn","btn-secondary"],["id","server_load_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["class","modal-body",4,"ngIf"],["id","unpayed_carts_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","repeat_purchases_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","time_pattern_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","pattern_view_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],["id","pattern_buy_Modal","tabindex","-1","aria-labelledby","exampleModalLabel","aria-hidden","true",1,"modal","fade"],[3,"value"],[4,"ngIf"]],template:function(n,r){1&n&&(p(0,"div",0),p(1,"div",1),p(2,"nav",2),p(3,"ol",3),p(4,"li",4),p(5,"a",5),E(6,"Uploading logs"),g(),g(),p(7,"li",6),E(8,"Dashboard"),g(),g(),g(),p(9,"span",7),E(10,"filename_placeholder"),g(),g(),p(11,"div",8),p(12,"h5",9),E(13,"Overall"),g(),p(14,"div",10),p(15,"div",11),p(16,"span",12),E(17,"Countries:"),g(),Ne(18,"span",13),g(),p(19,"div",11),p(20,"span",14),E(21,"Category / Items views:"),g(),Ne(22,"span",15),g(),p(23,"div",11),p(24,"span",12),E(25,"Payed carts:"),g(),Ne(26,"span",16),g(),p(27,"div",11),p(28,"span",12),E(29,"Unique users:"),g(),Ne(30,"span",17),g(),g(),g(),p(31,"h3",18),E(32,"Reports section"),g(),Ne(33,"hr"),p(34,"div",19),p(35,"div",20),p(36,"div",21),p(37,"div",10),p(38,"h5",22),E(39,"Server load"),g(),p(40,"p",23),E(41,"Check server load statistics per hour"),g(),p(42,"button",24),Ie("click",function(){return r.rep_server_load()}),E(43,"View data"),g(),g(),g(),g(),p(44,"div",20),p(45,"div",21),p(46,"div",10),p(47,"h5",22),E(48,"Actions per country"),g(),p(49,"p",23),E(50,"Report that shows number of users actions groupped by country"),g(),p(51,"button",25),Ie("click",function(){return r.rep_actions_per_country()}),E(52,"View data"),g(),g(),g(),g(),g(),p(53,"div",19),p(54,"div",20),p(55,"div",8),p(56,"div",10),p(57,"h5",22),E(58,"Unpayed carts"),g(),p(59,"p",23),E(60,"Report that shows number of unpayed carts for a certain period"),g(),p(61,"div",26),p(62,"table",27),p(63,"tbody"),p(64,"tr"),p(65,"th"),p(66,"span",28),E(67,"Date from"),g(),g(),p(68,"th"),p(69,"input",29),Ie("change",function(){return r.check_for_button_unlock(1)}),g(),g(),g(),p(70,"tr"),p(71,"th"),p(72,"span",28),E(73,"Date to"),g(),g(),p(74,"th"),p(75,"input",30),Ie("change",function(){return r.check_for_button_unlock(1)}),g(),g(),g(),g(),g(),p(76,"button",31),Ie("click",function(){return r.rep_unpayed_carts()}),E(77,"View data"),g(),g(),g(),g(),g(),p(78,"div",20),p(79,"div",8),p(80,"div",10),p(81,"h5",22),E(82,"Repeat purchases"),g(),p(83,"p",23),E(84,"Report that shows number of repeat purchases for a certain period"),g(),p(85,"div",26),p(86,"table",27),p(87,"tbody"),p(88,"tr"),p(89,"th"),p(90,"span",28),E(91,"Date from"),g(),g(),p(92,"th"),p(93,"input",32),Ie("change",function(){return r.check_for_button_unlock(2)}),g(),g(),g(),p(94,"tr"),p(95,"th"),p(96,"span",28),E(97,"Date to"),g(),g(),p(98,"th"),p(99,"input",33),Ie("change",function(){return r.check_for_button_unlock(2)}),g(),g(),g(),g(),g(),p(100,"button",34),Ie("click",function(){return r.rep_repeat_purchases()}),E(101,"View data"),g(),g(),g(),g(),g(),g(),p(102,"div",19),p(103,"div",20),p(104,"div",8),p(105,"div",10),p(106,"h5",22),E(107,"Reports on categories and goods"),g(),p(108,"p",22),E(109,"Before generating reports you need to specify the following:"),g(),p(110,"select",35),Ie("change",function(){return r.update_items_list()}),p(111,"option",36),E(112,"Category"),g(),Ge(113,zO,2,2,"option",37),g(),p(114,"select",38),Ie("change",function(){return r.enable_reports_buttons()}),p(115,"option",36),E(116,"Item"),g(),Ge(117,QO,2,2,"option",37),g(),g(),g(),g(),p(118,"div",20),p(119,"div",8),p(120,"div",10),p(121,"p",23),E(122,"At what time of day is specified category most often viewed"),g(),p(123,"div",39),p(124,"button",40),Ie("click",function(){return r.rep_time_pattern()}),E(125,"View data"),g(),p(126,"select",41),p(127,"option",42),E(128,"2"),g(),p(129,"option",43),E(130,"4"),g(),p(131,"option",44),E(132,"6"),g(),g(),g(),p(133,"p",45),E(134,"Users from which country are most often interested in products from certain category"),g(),p(135,"button",46),Ie("click",function(){return r.rep_pattern_view()}),E(136,"View data"),g(),p(137,"p",47),E(138,"Products from which category are most often bought together with a product from a given category"),g(),p(139,"button",48),Ie("click",function(){return r.rep_pattern_buy()}),E(140,"View data"),g(),g(),g(),g(),g(),p(141,"h3",49),E(142,"2021"),g(),p(143,"div",50),p(144,"div",51),p(145,"div",52),p(146,"div",53),p(147,"h5",54),E(148,"Actions per country"),g(),Ne(149,"button",55),g(),p(150,"div",56),p(151,"table",57),p(152,"thead"),p(153,"tr"),p(154,"th",58),E(155,"Country"),g(),p(156,"th",58),E(157,"Actions"),g(),g(),g(),p(158,"tbody"),Ge(159,KO,5,2,"tr",59),g(),g(),g(),p(160,"div",60),p(161,"button",61),E(162,"Close"),g(),g(),g(),g(),g(),p(163,"div",62),p(164,"div",51),p(165,"div",52),p(166,"div",53),p(167,"h5",54),E(168,"Server Load per hour"),g(),Ne(169,"button",55),g(),Ge(170,ZO,16,2,"div",63),p(171,"div",60),p(172,"button",61),E(173,"Close"),g(),g(),g(),g(),g(),p(174,"div",64),p(175,"div",51),p(176,"div",52),p(177,"div",53),p(178,"h5",54),E(179,"Unpayed carts"),g(),Ne(180,"button",55),g(),Ge(181,XO,10,2,"div",63),p(182,"div",60),p(183,"button",61),E(184,"Close"),g(),g(),g(),g(),g(),p(185,"div",65),p(186,"div",51),p(187,"div",52),p(188,"div",53),p(189,"h5",54),E(190,"Repeat purchases"),g(),Ne(191,"button",55),g(),Ge(192,tk,12,2,"div",63),p(193,"div",60),p(194,"button",61),E(195,"Close"),g(),g(),g(),g(),g(),p(196,"div",66),p(197,"div",51),p(198,"div",52),p(199,"div",53),p(200,"h5",54),E(201,"Time pattern report"),g(),Ne(202,"button",55),g(),Ge(203,ik,10,1,"div",63),p(204,"div",60),p(205,"button",61),E(206,"Close"),g(),g(),g(),g(),g(),p(207,"div",67),p(208,"div",51),p(209,"div",52),p(210,"div",53),p(211,"h5",54),E(212,"Country actions specified report"),g(),Ne(213,"button",55),g(),p(214,"div",56),p(215,"table",57),p(216,"thead"),p(217,"tr"),p(218,"th",58),E(219,"Country"),g(),p(220,"th",58),E(221,"Actions"),g(),g(),g(),p(222,"tbody"),Ge(223,sk,5,2,"tr",59),g(),g(),g(),p(224,"div",60),p(225,"button",61),E(226,"Close"),g(),g(),g(),g(),g(),p(227,"div",68),p(228,"div",51),p(229,"div",52),p(230,"div",53),p(231,"h5",54),E(232,"Pattern buy report"),g(),Ne(233,"button",55),g(),p(234,"div",56),p(235,"table",57),p(236,"thead"),p(237,"tr"),p(238,"th",58),E(239,"Category"),g(),p(240,"th",58),E(241,"Purchases"),g(),g(),g(),p(242,"tbody"),Ge(243,ak,5,2,"tr",59),g(),g(),g(),p(244,"div",60),p(245,"button",61),E(246,"Close"),g(),g(),g(),g(),g(),g()),2&n&&(z(113),be("ngForOf",r.categories),z(4),be("ngForOf",r.items[r.category_index]),z(42),be("ngForOf",r.actions_per_country_data.country),z(11),be("ngIf",r.server_load_data.loaded),z(11),be("ngIf",r.unpayed_carts.loaded),z(11),be("ngIf",r.repeat_purchases.loaded),z(11),be("ngIf",r.time_pattern.loaded),z(20),be("ngForOf",r.pattern_view.country),z(20),be("ngForOf",r.pattern_buy.category))},directives:[jD,UD],styles:['@property --num{syntax: "<integer>"; initial-value: 0; inherits: false;}.animated[_ngcontent-%COMP%]{transition:--num 1s;counter-reset:num var(--num)}.animated[_ngcontent-%COMP%]:after{content:counter(num)}']}),e})()}];let lk=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275mod=tr({type:e}),e.\u0275inj=Dn({imports:[[aC.forRoot(uk)],aC]}),e})(),ck=(()=>{class e{constructor(){this.title="app"}}return e.\u0275fac=function(n){return new(n||e)},e.\u0275cmp=Ar({type:e,selectors:[["app-root"]],decls:1,vars:0,template:function(n,r){1&n&&Ne(0,"router-outlet")},directives:[lf],styles:[""]}),e})(),dk=(()=>{class e{}return e.\u0275fac=function(n){return new(n||e)},e.\u0275mod=tr({type:e,bootstrap:[ck]}),e.\u0275inj=Dn({providers:[],imports:[[gP,lk]]}),e})();(function(){if(b_)throw new Error("Cannot enable prod mode after platform setup.");w_=!1})(),hP().bootstrapModule(dk).catch(e=>console.error(e))}},Y=>{Y(Y.s=240)}]);
\ No newline at end of file